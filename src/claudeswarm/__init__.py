@@ -39,6 +39,7 @@ __all__ = [
     "agent_cards",
     "tasks",
     "delegation",
+    "scoring",
     "learning",
     "conflict_resolution",
     "context",
@@ -17,15 +17,20 @@ Phase: Phase 2
 from __future__ import annotations
 
 import json
-import secrets
+import os
+import re
 import threading
+import uuid
 from collections import defaultdict
-from dataclasses import asdict, dataclass
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from .file_lock import FileLock, FileLockTimeout
 from .logging_config import get_logger
-from .messaging import MessageType, broadcast_message, send_message
+from .messaging import Message, MessageLogger, MessageType, broadcast_message, send_message
+from .project import get_messages_log_path, get_project_root
 from .utils import load_json, save_json
 from .validators import (
     ValidationError,
@@ -47,6 +52,26 @@ __all__ = [
 # Configure logging
 logger = get_logger(__name__)
 
+PENDING_ACKS_FILENAME = "PENDING_ACKS.json"
+
+# PENDING_ACKS.json starts with the earliest due time, the version and the
+# message log cursor, so "is anything due?" and the version check only read
+# the first few bytes
+NEXT_DUE_HEADER_BYTES = 256
+_HEADER_PATTERN = re.compile(
+    rb'^\s*\{\s*"next_due_at":\s*(?:null|"([^"]*)"),\s*"version":\s*(\d+)'
+    rb'(?:,\s*"log_cursor":\s*\[\s*(\d+),\s*(\d+)\s*\])?'
+)
+
+# Exclusive lock guarding every PENDING_ACKS.json write
+ACK_LOCK_TIMEOUT_SECONDS = 5.0
+
+# Records appended to agent_messages.log. An ACK receipt or an expiry
+# (escalated after max retries) closes the pending ACK with that msg_id.
+ACK_RECORD = "ack"
+ACK_EXPIRED_RECORD = "ack_expired"
+_ACK_RECORD_MARKER = b'"record": "ack'  # Cheap prefilter before json.loads
+
 
 @dataclass
 class PendingAck:
@@ -87,6 +112,13 @@ class PendingAck:
         """Get next_retry_at as datetime object."""
         return datetime.fromisoformat(self.next_retry_at)
 
+    def get_due_datetime(self) -> datetime:
+        """Get the retry due time, treating a missing or invalid time as due now."""
+        try:
+            return self.get_next_retry_datetime()
+        except ValueError:
+            return datetime.min
+
 
 class AckSystem:
     """Main acknowledgment system for Claude Swarm.
@@ -112,14 +144,25 @@ class AckSystem:
     MAX_ESCALATIONS_PER_MINUTE = 5
     ESCALATION_WINDOW_SECONDS = 60
 
-    def __init__(self, pending_file: Path | None = None):
+    def __init__(self, pending_file: Path | None = None, log_file: Path | None = None):
         """Initialize ACK system.
 
         Args:
-            pending_file: Path to PENDING_ACKS.json (default: ./PENDING_ACKS.json)
+            pending_file: Path to PENDING_ACKS.json (default: in the project root)
+            log_file: Message log carrying ACK receipts
+                (default: agent_messages.log next to pending_file)
         """
-        self.pending_file = pending_file or Path("./PENDING_ACKS.json")
+        self.pending_file = pending_file or get_project_root() / PENDING_ACKS_FILENAME
+        self.lock_file = self.pending_file.with_name(self.pending_file.name + ".lock")
+        self.log_file = log_file or get_messages_log_path(self.pending_file.parent)
+        self._message_logger = MessageLogger(log_file=self.log_file)
         self._lock = threading.Lock()
+
+        # Pending view derived from the snapshot plus the log tail
+        self._view: dict[str, PendingAck] = {}
+        self._view_version: int | None = None
+        self._view_cursor: tuple[int, int] | None = None
+
         self._ensure_pending_file()
 
         # Rate limiting tracking: agent_id -> list of timestamps
@@ -134,34 +177,246 @@ class AckSystem:
         self.ESCALATION_TTL_SECONDS = 3600
 
     def _ensure_pending_file(self) -> None:
-        """Ensure PENDING_ACKS.json exists with version tracking."""
-        if not self.pending_file.exists():
-            save_json(self.pending_file, {"version": 0, "pending_acks": []})
-            logger.info(f"Created pending ACKs file at {self.pending_file}")
+        """Ensure PENDING_ACKS.json exists with version tracking.
+
+        New files are written by _write_pending_acks(), so they carry the
+        header and a log cursor from the start and the header-only fast
+        paths work before the first ACK is tracked. Files written before
+        ACK receipts moved to the message log have no log cursor; they are
+        stamped with the current end of the log, since no receipt for their
+        ACKs can be in the log yet.
+        """
+        header = self._read_header()
+        if header is not None and header[2] is not None:
+            return
 
-    def _load_pending_acks(self) -> tuple[list[PendingAck], int]:
-        """Load pending ACKs from file with version number.
+        with FileLock(self.lock_file, timeout=ACK_LOCK_TIMEOUT_SECONDS, shared=False):
+            if not self.pending_file.exists():
+                self._write_pending_acks([], 0, None)
+                logger.info(f"Created pending ACKs file at {self.pending_file}")
+                return
+
+            # Re-check under the lock: another process may have upgraded it
+            header = self._read_header()
+            if header is None or header[2] is None:
+                acks, version, cursor = self._load_snapshot()
+                self._write_pending_acks(acks, version + 1, cursor)
+
+    def _load_snapshot(self) -> tuple[list[PendingAck], int, tuple[int, int] | None]:
+        """Load the PENDING_ACKS.json snapshot as written.
 
         Returns:
-            Tuple of (list of PendingAck objects, version number)
+            Tuple of (list of PendingAck objects, version number, log cursor
+            or None if the file has none)
         """
         try:
             data = load_json(self.pending_file)
             # Support legacy files without version field
             version = data.get("version", 0)
             acks_data = data.get("pending_acks", [])
-            return [PendingAck.from_dict(ack) for ack in acks_data], version
+            cursor = data.get("log_cursor")
+            return (
+                [PendingAck.from_dict(ack) for ack in acks_data],
+                version,
+                tuple(cursor) if cursor else None,
+            )
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Error loading pending ACKs: {e}")
-            return [], 0
+            return [], 0, None
+
+    def _load_pending_acks(self) -> tuple[list[PendingAck], int]:
+        """Load pending ACKs from file with version number.
+
+        The snapshot is brought up to date with the ACK records appended to
+        the message log since its cursor.
+
+        Returns:
+            Tuple of (list of PendingAck objects, version number)
+        """
+        acks, version, cursor = self._load_snapshot()
+        if acks and cursor is not None:
+            records, _ = self._read_log_records(cursor)
+            acks = self._apply_records(acks, records)
+        return acks, version
+
+    def _read_log_records(
+        self, cursor: tuple[int, int] | None
+    ) -> tuple[list[dict], tuple[int, int]]:
+        """Read ACK records appended to the message log after a cursor.
+
+        This is the incremental half of the pending view: only the log tail
+        past the cursor is read, and only complete lines are consumed. If
+        the log was rotated since the cursor was taken, the rest of the
+        rotated file is read first.
+
+        Args:
+            cursor: (inode, offset) of the log position already applied,
+                or None to start at the current end of the log
+
+        Returns:
+            Tuple of (ACK records in log order, cursor after the last record)
+        """
+        records: list[dict] = []
+        try:
+            with open(self.log_file, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if cursor is None:
+                    return records, (stat.st_ino, stat.st_size)
+
+                inode, offset = cursor
+                if stat.st_ino != inode:
+                    rotated = self.log_file.with_suffix(".log.old")
+                    try:
+                        with open(rotated, "rb") as old:
+                            if os.fstat(old.fileno()).st_ino == inode:
+                                records.extend(self._parse_log_records(old, offset)[0])
+                            else:
+                                logger.warning(f"ACK records before {self.log_file} rotation lost")
+                    except FileNotFoundError:
+                        logger.warning(f"ACK records before {self.log_file} rotation lost")
+                    offset = 0
+                elif offset > stat.st_size:
+                    # Truncated in place
+                    offset = 0
+
+                tail, offset = self._parse_log_records(f, offset)
+                records.extend(tail)
+                return records, (stat.st_ino, offset)
+        except FileNotFoundError:
+            return records, (0, 0)
+
+    @staticmethod
+    def _parse_log_records(f, offset: int) -> tuple[list[dict], int]:
+        """Parse ACK records from complete lines of an open log file.
+
+        Args:
+            f: Log file opened in binary mode
+            offset: Byte offset to start reading from
+
+        Returns:
+            Tuple of (ACK records, offset just past the last complete line)
+        """
+        f.seek(offset)
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        records = []
+        for line in data[:end].splitlines():
+            if _ACK_RECORD_MARKER not in line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("record") in (ACK_RECORD, ACK_EXPIRED_RECORD):
+                records.append(entry)
+        return records, offset + end
+
+    @staticmethod
+    def _close_acks(pending: dict[str, PendingAck], records: list[dict]) -> None:
+        """Remove the pending ACKs closed by log records, in place.
+
+        Receipts only count when they come from the expected recipient, so a
+        spoofed record cannot close someone else's ACK. Applying a record
+        twice is harmless.
+
+        Args:
+            pending: msg_id -> PendingAck to update
+            records: ACK records in log order
+        """
+        for record in records:
+            ack = pending.get(record.get("msg_id"))
+            if ack is None:
+                continue
+            if record["record"] == ACK_EXPIRED_RECORD or record.get("agent_id") == ack.recipient_id:
+                del pending[ack.msg_id]
+
+    def _apply_records(self, acks: list[PendingAck], records: list[dict]) -> list[PendingAck]:
+        """Return the ACKs still pending after applying log records."""
+        if not records:
+            return acks
+        pending = {ack.msg_id: ack for ack in acks}
+        self._close_acks(pending, records)
+        return list(pending.values())
+
+    def _pending_view(self) -> dict[str, PendingAck]:
+        """Get the current pending ACKs, maintained incrementally.
+
+        The snapshot is re-parsed only when its version changes; otherwise
+        only new log records are read and reduced into the cached view.
+        Callers must not mutate the returned ACKs.
+
+        Returns:
+            msg_id -> PendingAck
+        """
+        header = self._read_header()
+        if header is None or header[1] != self._view_version:
+            acks, version, cursor = self._load_snapshot()
+            self._view = {ack.msg_id: ack for ack in acks}
+            self._view_version = version if header is not None else None
+            self._view_cursor = cursor
+
+        if self._view and self._view_cursor is not None:
+            records, self._view_cursor = self._read_log_records(self._view_cursor)
+            self._close_acks(self._view, records)
+        return self._view
+
+    def _read_header(self) -> tuple[str | None, int, tuple[int, int] | None] | None:
+        """Read the header of PENDING_ACKS.json.
+
+        Returns:
+            Tuple of (next_due_at or None if nothing is pending, version,
+            log cursor or None), or None if the file is missing or has no
+            header (e.g. written by older versions)
+        """
+        try:
+            with open(self.pending_file, "rb") as f:
+                head = f.read(NEXT_DUE_HEADER_BYTES)
+        except FileNotFoundError:
+            return None
+
+        match = _HEADER_PATTERN.match(head)
+        if match is None:
+            return None
+        next_due_at = match.group(1).decode() if match.group(1) is not None else None
+        cursor = (int(match.group(3)), int(match.group(4))) if match.group(3) else None
+        return next_due_at, int(match.group(2)), cursor
+
+    def _write_pending_acks(
+        self, acks: list[PendingAck], version: int, cursor: tuple[int, int] | None
+    ) -> None:
+        """Write a compacted snapshot in due-time order. Caller must hold the file lock.
+
+        ACK records logged since the snapshot's cursor are applied first, so
+        the written snapshot never resurrects an acknowledged message. ACKs
+        are written sorted by due time (a valid min-heap snapshot), with the
+        earliest due time, the version and the new log cursor as the first
+        keys so readers can peek at them without loading every ACK.
+
+        Args:
+            acks: List of PendingAck objects to write
+            version: Version number to record
+            cursor: Log cursor of the snapshot being replaced
+        """
+        records, cursor = self._read_log_records(cursor)
+        acks = sorted(self._apply_records(acks, records), key=PendingAck.get_due_datetime)
+        data = {
+            "next_due_at": acks[0].next_retry_at if acks else None,
+            "version": version,
+            "log_cursor": list(cursor),
+            "pending_acks": [ack.to_dict() for ack in acks],
+        }
+        save_json(self.pending_file, data)
+        logger.debug(f"Saved pending ACKs with version {version}")
 
     def _save_pending_acks(
         self, acks: list[PendingAck], expected_version: int | None = None
     ) -> bool:
         """Save pending ACKs to file with optimistic locking.
 
-        Uses version-based optimistic locking to prevent race conditions.
-        If expected_version is provided, only saves if current version matches.
+        The version check is a compare-and-swap under an exclusive lock on
+        PENDING_ACKS.json.lock: only the header is read to get the current
+        version. If expected_version is provided, only saves if the current
+        version matches.
 
         Args:
             acks: List of PendingAck objects to save
@@ -169,26 +424,80 @@ class AckSystem:
 
         Returns:
             True if save succeeded, False if version mismatch occurred
+
+        Raises:
+            FileLockTimeout: If the lock cannot be acquired
         """
-        # If version checking is enabled, verify version matches
-        if expected_version is not None:
-            current_acks, current_version = self._load_pending_acks()
-            if current_version != expected_version:
-                logger.debug(
-                    f"Version mismatch: expected {expected_version}, "
-                    f"found {current_version}. Aborting save."
-                )
-                return False
-            new_version = current_version + 1
-        else:
-            # No version check requested, just increment from current
-            _, current_version = self._load_pending_acks()
-            new_version = current_version + 1
+        try:
+            with FileLock(self.lock_file, timeout=ACK_LOCK_TIMEOUT_SECONDS, shared=False):
+                header = self._read_header()
+                if header is not None:
+                    _, current_version, cursor = header
+                else:
+                    _, current_version, cursor = self._load_snapshot()
 
-        data = {"version": new_version, "pending_acks": [ack.to_dict() for ack in acks]}
-        save_json(self.pending_file, data)
-        logger.debug(f"Saved pending ACKs with version {new_version}")
-        return True
+                if expected_version is not None and current_version != expected_version:
+                    logger.debug(
+                        f"Version mismatch: expected {expected_version}, "
+                        f"found {current_version}. Aborting save."
+                    )
+                    return False
+
+                self._write_pending_acks(acks, current_version + 1, cursor)
+                return True
+        except FileLockTimeout:
+            logger.error(f"Timeout acquiring lock on {self.lock_file}")
+            raise
+
+    def _update_pending_acks(self, update: Callable[[list[PendingAck]], bool]) -> bool:
+        """Apply an in-place update to the pending ACKs with a single write.
+
+        Loads, updates and writes under the exclusive lock, so there is no
+        version conflict to retry.
+
+        Args:
+            update: Mutates the ACK list; returns False to skip the write
+
+        Returns:
+            Whatever update returned
+
+        Raises:
+            FileLockTimeout: If the lock cannot be acquired
+        """
+        try:
+            with FileLock(self.lock_file, timeout=ACK_LOCK_TIMEOUT_SECONDS, shared=False):
+                acks, version, cursor = self._load_snapshot()
+                records, cursor = self._read_log_records(cursor)
+                acks = self._apply_records(acks, records)
+                if not update(acks):
+                    return False
+                self._write_pending_acks(acks, version + 1, cursor)
+                return True
+        except FileLockTimeout:
+            logger.error(f"Timeout acquiring lock on {self.lock_file}")
+            raise
+
+    def _peek_next_due(self) -> datetime | None:
+        """Get the earliest retry due time without loading every ACK.
+
+        Reads only the header written by _write_pending_acks(). Files
+        without the header fall back to a full load.
+
+        Returns:
+            Earliest due time, or None if nothing is pending
+        """
+        header = self._read_header()
+        if header is None:
+            acks, _ = self._load_pending_acks()
+            return min((ack.get_due_datetime() for ack in acks), default=None)
+
+        next_due_at = header[0]
+        if next_due_at is None:
+            return None
+        try:
+            return datetime.fromisoformat(next_due_at)
+        except ValueError:
+            return datetime.min
 
     def send_with_ack(
         self,
@@ -228,96 +537,65 @@ class AckSystem:
         # Prefix content with [REQUIRES-ACK]
         ack_content = f"[REQUIRES-ACK] {content}"
 
-        # Calculate next retry time
-        next_retry = datetime.now() + timedelta(seconds=timeout)
+        # Pre-generate the message ID so the pending ACK is recorded, complete,
+        # with a single write BEFORE sending (avoids racing a fast ACK)
+        now = datetime.now()
+        msg_id = str(uuid.uuid4())
+        try:
+            message = Message(
+                sender_id=sender_id,
+                timestamp=now,
+                msg_type=msg_type,
+                content=ack_content,
+                recipients=[recipient_id],
+                msg_id=msg_id,
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid input: {e}") from e
 
-        # Create pending ACK entry BEFORE sending (to avoid race condition)
-        # We'll use a temporary msg_id that we'll update after send
-        # Use cryptographically secure random ID to prevent prediction attacks
-        temp_msg_id = f"temp-{secrets.token_hex(16)}"  # nosec B311
         pending_ack = PendingAck(
-            msg_id=temp_msg_id,
+            msg_id=msg_id,
             sender_id=sender_id,
             recipient_id=recipient_id,
-            message={},  # Will be filled after send
-            sent_at=datetime.now().isoformat(),
+            message=message.to_dict(),
+            sent_at=now.isoformat(),
             retry_count=0,
-            next_retry_at=next_retry.isoformat(),
+            next_retry_at=(now + timedelta(seconds=timeout)).isoformat(),
         )
 
-        # Add to tracking BEFORE sending
-        with self._lock:
-            acks, version = self._load_pending_acks()
+        def _append(acks: list[PendingAck]) -> bool:
             acks.append(pending_ack)
-            self._save_pending_acks(acks, expected_version=version)
-
-        # Helper function to clean up orphaned ACK with retry
-        def _cleanup_orphaned_ack(msg_id: str, max_retries: int = 3) -> None:
-            """Clean up orphaned ACK entry with retry on version conflict."""
-            for attempt in range(max_retries):
-                with self._lock:
-                    acks, version = self._load_pending_acks()
-                    original_count = len(acks)
-                    acks = [ack for ack in acks if ack.msg_id != msg_id]
-                    if len(acks) < original_count:
-                        if self._save_pending_acks(acks, expected_version=version):
-                            logger.debug(f"Cleaned up orphaned ACK {msg_id}")
-                            return
-                        # Version conflict, retry
-                        logger.debug(
-                            f"Version conflict cleaning up ACK {msg_id}, "
-                            f"retry {attempt + 1}/{max_retries}"
-                        )
-                    else:
-                        # ACK not found (already cleaned up), we're done
-                        return
-            logger.warning(f"Failed to clean up orphaned ACK {msg_id} after {max_retries} retries")
+            return True
+
+        def _remove(acks: list[PendingAck]) -> bool:
+            count = len(acks)
+            acks[:] = [ack for ack in acks if ack.msg_id != msg_id]
+            return len(acks) < count
+
+        with self._lock:
+            self._update_pending_acks(_append)
 
         # Send the message
         try:
-            message = send_message(sender_id, recipient_id, msg_type, ack_content)
-
-            if not message:
-                logger.error(f"Failed to send message from {sender_id} to {recipient_id}")
-                # Clean up the pending ACK since send failed
-                _cleanup_orphaned_ack(temp_msg_id)
-                return None
-
-            # Update the pending ACK with actual message info
-            # Retry on version conflict to ensure update succeeds
-            update_success = False
-            for attempt in range(3):
-                with self._lock:
-                    acks, version = self._load_pending_acks()
-                    for ack in acks:
-                        if ack.msg_id == temp_msg_id:
-                            ack.msg_id = message.msg_id
-                            ack.message = message.to_dict()
-                            break
-                    if self._save_pending_acks(acks, expected_version=version):
-                        update_success = True
-                        break
-                    logger.debug(f"Version conflict updating ACK, retry {attempt + 1}/3")
-
-            if not update_success:
-                logger.warning(
-                    f"Failed to update ACK {temp_msg_id} -> {message.msg_id}, "
-                    f"message sent but may not be tracked properly"
-                )
-
-            logger.info(
-                f"Message {message.msg_id} sent with ACK requirement: "
-                f"{sender_id} -> {recipient_id}"
+            sent = send_message(
+                sender_id, recipient_id, msg_type, ack_content, msg_id=msg_id, requires_ack=True
             )
-
-            return message.msg_id
-
         except Exception as e:
             logger.error(f"Exception while sending message: {e}")
-            # Clean up the pending ACK with retry
-            _cleanup_orphaned_ack(temp_msg_id)
+            # Clean up the pending ACK since send failed
+            with self._lock:
+                self._update_pending_acks(_remove)
             raise
 
+        if not sent:
+            logger.error(f"Failed to send message from {sender_id} to {recipient_id}")
+            with self._lock:
+                self._update_pending_acks(_remove)
+            return None
+
+        logger.info(f"Message {msg_id} sent with ACK requirement: {sender_id} -> {recipient_id}")
+        return msg_id
+
     def _check_rate_limit(self, agent_id: str) -> bool:
         """Check if agent has exceeded ACK rate limit.
 
@@ -351,7 +629,9 @@ class AckSystem:
     def receive_ack(self, msg_id: str, agent_id: str) -> bool:
         """Process received acknowledgment for a message.
 
-        Matches the ACK to a pending entry and removes it from tracking.
+        Matches the ACK to a pending entry and appends an ACK receipt to the
+        message log; the entry drops out of the pending view as soon as the
+        receipt is read back, and out of PENDING_ACKS.json at its next write.
         Includes rate limiting to prevent DoS attacks.
 
         Args:
@@ -359,7 +639,7 @@ class AckSystem:
             agent_id: ID of agent acknowledging
 
         Returns:
-            True if ACK was matched and removed, False if not found or rate limited
+            True if ACK was matched and recorded, False if not found or rate limited
         """
         with self._lock:
             # Check rate limit first to prevent DoS
@@ -367,34 +647,34 @@ class AckSystem:
                 logger.warning(f"ACK rejected due to rate limiting: agent {agent_id}")
                 return False
 
-            acks, version = self._load_pending_acks()
+            ack = self._pending_view().get(msg_id)
+            if ack is None:
+                logger.warning(f"No pending ACK found for message {msg_id}")
+                return False
 
-            # Find matching pending ACK
-            for i, ack in enumerate(acks):
-                if ack.msg_id == msg_id:
-                    # SECURITY: Verify acknowledger is the expected recipient
-                    # This prevents ACK spoofing where any agent could acknowledge
-                    # any message by providing the correct msg_id
-                    if ack.recipient_id != agent_id:
-                        logger.warning(
-                            f"ACK spoofing attempt detected: agent {agent_id} tried to "
-                            f"acknowledge message {msg_id} intended for {ack.recipient_id}"
-                        )
-                        # Reject the spoofed ACK - do not remove from pending
-                        return False
-
-                    # Remove from pending
-                    acks.pop(i)
-                    self._save_pending_acks(acks, expected_version=version)
-
-                    logger.info(
-                        f"ACK received for message {msg_id} from {agent_id}, "
-                        f"removed from pending"
-                    )
-                    return True
+            # SECURITY: Verify acknowledger is the expected recipient
+            # This prevents ACK spoofing where any agent could acknowledge
+            # any message by providing the correct msg_id
+            if ack.recipient_id != agent_id:
+                logger.warning(
+                    f"ACK spoofing attempt detected: agent {agent_id} tried to "
+                    f"acknowledge message {msg_id} intended for {ack.recipient_id}"
+                )
+                # Reject the spoofed ACK - do not remove from pending
+                return False
 
-            logger.warning(f"No pending ACK found for message {msg_id}")
-            return False
+            receipt = {
+                "record": ACK_RECORD,
+                "msg_id": msg_id,
+                "agent_id": agent_id,
+                "timestamp": datetime.now().isoformat(),
+            }
+            if not self._message_logger.log_records([receipt]):
+                return False
+
+            del self._view[msg_id]
+            logger.info(f"ACK received for message {msg_id} from {agent_id}, removed from pending")
+            return True
 
     def check_pending_acks(self, agent_id: str | None = None) -> list[PendingAck]:
         """Check for messages awaiting acknowledgment.
@@ -405,89 +685,171 @@ class AckSystem:
         Returns:
             List of pending acknowledgments
         """
-        acks, _ = self._load_pending_acks()
+        with self._lock:
+            acks = [replace(ack) for ack in self._pending_view().values()]
 
         if agent_id:
             acks = [ack for ack in acks if ack.sender_id == agent_id]
 
         return acks
 
+    def rebuild_from_log(self) -> int:
+        """Rebuild PENDING_ACKS.json from the message log after a crash.
+
+        Replays the log (including the rotated .old file): messages sent
+        with requires_ack open a pending ACK, ACK receipts and expiry
+        records close it. ACKs still in the snapshot keep their retry
+        state; recovered ones restart their retry schedule from the time
+        the message was logged.
+
+        Returns:
+            Number of pending ACKs after the rebuild
+        """
+        with self._lock:
+            with FileLock(self.lock_file, timeout=ACK_LOCK_TIMEOUT_SECONDS, shared=False):
+                acks, version, _ = self._load_snapshot()
+                pending = {ack.msg_id: ack for ack in acks}
+                records: list[dict] = []
+                cursor: tuple[int, int] | None = None
+
+                for path in (self.log_file.with_suffix(".log.old"), self.log_file):
+                    try:
+                        with open(path, "rb") as f:
+                            if path == self.log_file:
+                                cursor = (os.fstat(f.fileno()).st_ino, 0)
+                            data = f.read()
+                    except FileNotFoundError:
+                        continue
+
+                    # Only complete lines; a partial write is picked up later
+                    end = data.rfind(b"\n") + 1
+                    if path == self.log_file:
+                        cursor = (cursor[0], end)
+                    for line in data[:end].splitlines():
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        if entry.get("record") in (ACK_RECORD, ACK_EXPIRED_RECORD):
+                            records.append(entry)
+                        elif entry.get("requires_ack") and entry.get("msg_id") not in pending:
+                            ack = self._recover_ack(entry)
+                            if ack is not None:
+                                pending[ack.msg_id] = ack
+
+                # Message IDs are unique, so records apply regardless of order
+                self._close_acks(pending, records)
+                self._write_pending_acks(list(pending.values()), version + 1, cursor)
+
+            self._view_version = None
+            logger.info(f"Rebuilt {len(pending)} pending ACKs from {self.log_file}")
+            return len(pending)
+
+    def _recover_ack(self, entry: dict) -> PendingAck | None:
+        """Recreate a PendingAck from a logged requires_ack message."""
+        try:
+            message = Message.from_log_dict(entry)
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Skipping unreadable requires_ack entry: {e}")
+            return None
+        if len(message.recipients) != 1:
+            return None
+
+        next_retry = message.timestamp + timedelta(seconds=self.RETRY_DELAYS[0])
+        return PendingAck(
+            msg_id=message.msg_id,
+            sender_id=message.sender_id,
+            recipient_id=message.recipients[0],
+            message=message.to_dict(),
+            sent_at=message.timestamp.isoformat(),
+            retry_count=0,
+            next_retry_at=next_retry.isoformat(),
+        )
+
     def process_retries(self) -> int:
         """Process pending ACKs and retry/escalate as needed.
 
         This should be called periodically (e.g., every 10 seconds)
         to check for timed-out messages and trigger retries or escalation.
 
-        Uses optimistic locking to prevent race conditions with receive_ack().
-        If version conflict detected, retries the entire operation.
+        The common "nothing due" case only peeks at the file header. When
+        ACKs are due, the whole batch is claimed with a single versioned
+        write, and the retries and escalations are sent afterwards, so a
+        version conflict never causes a message to be sent twice.
 
         Returns:
             Number of messages retried or escalated
         """
+        next_due = self._peek_next_due()
+        if next_due is None or next_due > datetime.now():
+            return 0
+
         max_attempts = 5  # Maximum retry attempts for version conflicts
 
         for attempt in range(max_attempts):
             now = datetime.now()
-            processed_count = 0
+            # (ack to retry or None, ack to escalate or None) per due ACK
+            batch: list[tuple[PendingAck | None, PendingAck | None]] = []
+            remaining = []
 
-            # Load ACKs with version - hold lock only during load
             with self._lock:
                 acks, version = self._load_pending_acks()
 
-            # Process ACKs outside the lock (this can take seconds)
-            updated_acks = []
-
-            for ack in acks:
-                next_retry_dt = ack.get_next_retry_datetime()
-
-                # Check if retry is needed
-                if now >= next_retry_dt:
-                    if ack.retry_count < self.MAX_RETRIES:
-                        # Retry the message (this can take time)
-                        self._retry_message(ack)
+                for ack in acks:
+                    if now < ack.get_due_datetime():
+                        # Not yet time to retry
+                        remaining.append(ack)
+                    elif ack.retry_count < self.MAX_RETRIES:
+                        retry = replace(ack)
                         ack.retry_count += 1
-
-                        # Check if this was the last retry
                         if ack.retry_count >= self.MAX_RETRIES:
-                            # Max retries reached, escalate immediately
-                            self._escalate_message(ack)
-                            # Don't add back to pending
+                            # Last retry, escalate immediately after it
+                            batch.append((retry, ack))
                         else:
                             # Calculate next retry time with exponential backoff
                             delay = self.RETRY_DELAYS[ack.retry_count]
                             ack.next_retry_at = (now + timedelta(seconds=delay)).isoformat()
-                            updated_acks.append(ack)
-
-                        processed_count += 1
+                            remaining.append(ack)
+                            batch.append((retry, None))
                     else:
                         # Max retries already exceeded, escalate
-                        self._escalate_message(ack)
-                        processed_count += 1
-                        # Don't add back to pending
-                else:
-                    # Not yet time to retry
-                    updated_acks.append(ack)
-
-            # Try to save - hold lock only during save
-            with self._lock:
-                if self._save_pending_acks(updated_acks, expected_version=version):
-                    # Save succeeded
-                    logger.debug(f"process_retries: saved on attempt {attempt + 1}")
-                    return processed_count
-                else:
-                    # Version conflict - another process modified the file
-                    logger.info(
-                        f"process_retries: version conflict on attempt {attempt + 1}, "
-                        f"retrying..."
-                    )
-                    # Loop will retry with fresh data
+                        batch.append((None, ack))
+
+                if not batch:
+                    # The header pointed at ACKs acknowledged since; compact
+                    self._save_pending_acks(remaining, expected_version=version)
+                    return 0
+                saved = self._save_pending_acks(remaining, expected_version=version)
+
+            if saved:
+                logger.debug(f"process_retries: saved on attempt {attempt + 1}")
+                break
+            # Version conflict - another process modified the file
+            logger.info(f"process_retries: version conflict on attempt {attempt + 1}, retrying...")
+        else:
+            # All retry attempts failed
+            logger.error(
+                f"process_retries: failed to save after {max_attempts} attempts "
+                f"due to version conflicts"
+            )
+            return 0
+
+        expired = []
+        for retry, escalation in batch:
+            if retry is not None:
+                self._retry_message(retry)
+            if escalation is not None:
+                self._escalate_message(escalation)
+                expired.append(
+                    {
+                        "record": ACK_EXPIRED_RECORD,
+                        "msg_id": escalation.msg_id,
+                        "timestamp": now.isoformat(),
+                    }
+                )
+        self._message_logger.log_records(expired)
 
-        # If we get here, all retry attempts failed
-        logger.error(
-            f"process_retries: failed to save after {max_attempts} attempts "
-            f"due to version conflicts"
-        )
-        return 0
+        return len(batch)
 
     def _retry_message(self, ack: PendingAck) -> None:
         """Retry sending a message.
@@ -28,10 +28,11 @@ from __future__ import annotations
 
 import json
 import threading
-import time
+from collections.abc import Mapping
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from .file_lock import FileLock, FileLockTimeout
@@ -41,6 +42,7 @@ from .project import get_project_root
 __all__ = [
     "AgentCard",
     "AgentCardRegistry",
+    "CardIndex",
     "get_agent_cards_path",
     "SkillMatch",
     "CardNotFoundError",
@@ -180,6 +182,22 @@ class AgentCard:
         # Skill exists but no rate - return default
         return 0.5
 
+    def get_skill_proficiencies(self) -> dict[str, float]:
+        """Get the proficiency of every skill the agent has.
+
+        Returns:
+            Lowercase skill name -> proficiency, matching get_skill_proficiency
+        """
+        rates: dict[str, float] = {}
+        for rate_skill, rate in self.success_rates.items():
+            rates.setdefault(rate_skill.lower(), rate)
+
+        proficiencies = {}
+        for skill in self.skills:
+            skill_lower = skill.lower()
+            proficiencies.setdefault(skill_lower, rates.get(skill_lower, 0.5))
+        return proficiencies
+
     def has_tool(self, tool: str) -> bool:
         """Check if agent has access to a specific tool.
 
@@ -257,6 +275,60 @@ def get_agent_cards_path(project_root: Path | None = None) -> Path:
     return root / AGENT_CARDS_FILENAME
 
 
+@dataclass(frozen=True)
+class CardIndex:
+    """Read-only snapshot of the registry with inverted indexes.
+
+    Attributes:
+        cards: agent_id -> AgentCard, in file order
+        skills: Lowercase skill -> (agent_id, proficiency) pairs,
+            sorted by proficiency descending, then file order
+        tools: Tool name -> agent_ids that have it
+    """
+
+    cards: Mapping[str, AgentCard]
+    skills: Mapping[str, tuple[tuple[str, float], ...]]
+    tools: Mapping[str, frozenset[str]]
+
+    @classmethod
+    def build(cls, cards: dict[str, AgentCard]) -> CardIndex:
+        """Build the indexes for a set of cards.
+
+        Args:
+            cards: Dictionary mapping agent_id to AgentCard
+
+        Returns:
+            CardIndex over the cards
+        """
+        skills: dict[str, list[tuple[str, float]]] = {}
+        tools: dict[str, set[str]] = {}
+        for agent_id, card in cards.items():
+            for skill, proficiency in card.get_skill_proficiencies().items():
+                skills.setdefault(skill, []).append((agent_id, proficiency))
+            for tool in card.tools:
+                tools.setdefault(tool, set()).add(agent_id)
+
+        for postings in skills.values():
+            postings.sort(key=lambda x: x[1], reverse=True)
+
+        return cls(
+            cards=MappingProxyType(cards),
+            skills=MappingProxyType({s: tuple(p) for s, p in skills.items()}),
+            tools=MappingProxyType({t: frozenset(a) for t, a in tools.items()}),
+        )
+
+    def agents_with_skill(self, skill: str) -> tuple[tuple[str, float], ...]:
+        """Get agents that have a skill, best first.
+
+        Args:
+            skill: Skill name (case-insensitive)
+
+        Returns:
+            (agent_id, proficiency) pairs
+        """
+        return self.skills.get(skill.lower(), ())
+
+
 class AgentCardRegistry:
     """Registry for managing agent cards.
 
@@ -273,15 +345,24 @@ class AgentCardRegistry:
         self.project_root = get_project_root(project_root)
         self.cards_path = get_agent_cards_path(self.project_root)
         self._lock = threading.Lock()
-        self._cache: dict[str, AgentCard] | None = None
-        self._cache_time: float = 0.0
-        self._cache_ttl: float = 5.0  # Cache TTL in seconds
+        self._cache: CardIndex | None = None
+        self._cache_generation: tuple[int, int, int] | None = None
 
     def _read_cards(self) -> dict[str, AgentCard]:
         """Read all cards from file with locking.
 
         Returns:
-            Dictionary mapping agent_id to AgentCard
+            Dictionary mapping agent_id to AgentCard (empty if unreadable)
+        """
+        cards = self._try_read_cards()
+        return cards if cards is not None else {}
+
+    def _try_read_cards(self) -> dict[str, AgentCard] | None:
+        """Read all cards from file with locking, reporting failures.
+
+        Returns:
+            Dictionary mapping agent_id to AgentCard, or None if the file
+            exists but could not be read (lock timeout, invalid JSON, ...)
         """
         if not self.cards_path.exists():
             return {}
@@ -303,13 +384,13 @@ class AgentCardRegistry:
 
         except FileLockTimeout:
             logger.error(f"Timeout acquiring lock on {self.cards_path}")
-            return {}
+            return None
         except (json.JSONDecodeError, KeyError) as e:
             logger.warning(f"Invalid JSON in cards file: {e}")
-            return {}
+            return None
         except Exception as e:
             logger.error(f"Error reading cards file: {e}")
-            return {}
+            return None
 
     def _write_cards(self, cards: dict[str, AgentCard]) -> None:
         """Write all cards to file with locking.
@@ -346,22 +427,54 @@ class AgentCardRegistry:
         # Invalidate cache
         self._cache = None
 
-    def _get_cached_cards(self) -> dict[str, AgentCard]:
-        """Get cards from cache or read from file.
+    def _file_generation(self) -> tuple[int, int, int] | None:
+        """Get a cheap change marker for the cards file.
+
+        Every write replaces the file, so the inode, mtime and size change
+        whenever the cards do, in this process or any other.
 
         Returns:
-            Dictionary mapping agent_id to AgentCard
+            (inode, mtime_ns, size), or None if the file does not exist
         """
-        now = time.time()
+        try:
+            stat = self.cards_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _get_index(self) -> CardIndex:
+        """Get the card index from cache or rebuild it from file.
+
+        The cache stays valid until the cards file changes, which costs
+        one stat() per lookup to detect. Failed reads are not cached, so
+        the next lookup tries again.
+
+        Returns:
+            CardIndex over the current cards
+        """
+        # Stat before reading: a write racing the read only causes a re-read
+        generation = self._file_generation()
 
         with self._lock:
-            if self._cache is not None and (now - self._cache_time) < self._cache_ttl:
-                return self._cache.copy()
+            if self._cache is not None and generation == self._cache_generation:
+                return self._cache
 
-            cards = self._read_cards()
-            self._cache = cards
-            self._cache_time = now
-            return cards.copy()
+            cards = self._try_read_cards()
+            if cards is None:
+                self._cache = None
+                return CardIndex.build({})
+
+            self._cache = CardIndex.build(cards)
+            self._cache_generation = generation
+            return self._cache
+
+    def _get_cached_cards(self) -> Mapping[str, AgentCard]:
+        """Get cards from cache or read from file.
+
+        Returns:
+            Read-only mapping of agent_id to AgentCard
+        """
+        return self._get_index().cards
 
     def register_agent(
         self,
@@ -510,17 +623,19 @@ class AgentCardRegistry:
         Returns:
             List of matching AgentCards
         """
-        cards = self._get_cached_cards()
-        result = list(cards.values())
+        index = self._get_index()
+        result = list(index.cards.values())
 
         if availability is not None:
             result = [c for c in result if c.availability == availability]
 
         if skill is not None:
-            result = [c for c in result if c.has_skill(skill)]
+            with_skill = {agent_id for agent_id, _ in index.agents_with_skill(skill)}
+            result = [c for c in result if c.agent_id in with_skill]
 
         if tool is not None:
-            result = [c for c in result if c.has_tool(tool)]
+            with_tool = index.tools.get(tool, frozenset())
+            result = [c for c in result if c.agent_id in with_tool]
 
         return result
 
@@ -577,19 +692,27 @@ class AgentCardRegistry:
         Returns:
             List of (AgentCard, proficiency) tuples, sorted by proficiency
         """
-        cards = self._get_cached_cards()
+        index = self._get_index()
         matches = []
 
-        for card in cards.values():
+        postings = index.agents_with_skill(skill)
+
+        for agent_id, proficiency in postings:
+            if proficiency < min_proficiency or proficiency <= 0.0:
+                break
+            card = index.cards[agent_id]
             if available_only and not card.is_available():
                 continue
+            matches.append((card, proficiency))
 
-            proficiency = card.get_skill_proficiency(skill)
-            if proficiency >= min_proficiency:
-                matches.append((card, proficiency))
+        # Zero-proficiency agents, including those without the skill, follow in file order
+        if min_proficiency <= 0.0:
+            positive = {agent_id for agent_id, proficiency in postings if proficiency > 0.0}
+            for agent_id, card in index.cards.items():
+                if agent_id in positive or (available_only and not card.is_available()):
+                    continue
+                matches.append((card, 0.0))
 
-        # Sort by proficiency descending
-        matches.sort(key=lambda x: x[1], reverse=True)
         return matches
 
     def update_skill_success(
@@ -18,24 +18,14 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import NoReturn
 
-from claudeswarm.agent_cards import AgentCardRegistry
 from claudeswarm.config import (
     ConfigValidationError,
     _find_config_file,
     get_config,
     load_config,
 )
-from claudeswarm.conflict_resolution import ConflictResolver
-from claudeswarm.context import ContextDecision, ContextStore
-from claudeswarm.delegation import DelegationManager
-from claudeswarm.discovery import list_active_agents, refresh_registry
-from claudeswarm.learning import LearningSystem
-from claudeswarm.locking import LockManager
 from claudeswarm.logging_config import get_logger, setup_logging
-from claudeswarm.memory import MemoryStore
-from claudeswarm.monitoring import start_monitoring
 from claudeswarm.project import find_project_root
-from claudeswarm.tasks import TaskManager, TaskPriority, TaskStatus
 from claudeswarm.validators import (
     ValidationError,
     validate_agent_id,
@@ -196,7 +186,13 @@ def _get_safe_editor() -> str | None:
 
 
 def cmd_acquire_file_lock(args: argparse.Namespace) -> None:
-    """Acquire a lock on a file."""
+    """Acquire a lock on a file (through claudeswarmd when it is running)."""
+    from claudeswarm.daemon_client import (
+        DaemonRequestError,
+        DaemonUnavailableError,
+        daemon_request,
+    )
+
     try:
         # Auto-detect and validate agent_id if not provided
         validated_agent_id = _require_agent_id(args)
@@ -216,13 +212,34 @@ def cmd_acquire_file_lock(args: argparse.Namespace) -> None:
         print(f"Validation error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    manager = LockManager(project_root=args.project_root)
+    try:
+        result = daemon_request(
+            "acquire_lock",
+            {
+                "filepath": str(validated_filepath),
+                "agent_id": validated_agent_id,
+                "reason": reason,
+            },
+            project_root=args.project_root,
+        )
+        success = result["acquired"]
+        conflict = result["conflict"]
+        if conflict:
+            conflict["locked_at"] = datetime.fromisoformat(conflict["locked_at"])
+    except DaemonRequestError as e:
+        print(f"Failed to acquire lock on: {args.filepath} ({e})", file=sys.stderr)
+        sys.exit(1)
+    except DaemonUnavailableError:
+        from claudeswarm.locking import LockManager
 
-    success, conflict = manager.acquire_lock(
-        filepath=str(validated_filepath),
-        agent_id=validated_agent_id,
-        reason=reason,
-    )
+        manager = LockManager(project_root=args.project_root)
+
+        success, lock_conflict = manager.acquire_lock(
+            filepath=str(validated_filepath),
+            agent_id=validated_agent_id,
+            reason=reason,
+        )
+        conflict = vars(lock_conflict) if lock_conflict else None
 
     if success:
         print(f"Lock acquired on: {args.filepath}")
@@ -233,19 +250,25 @@ def cmd_acquire_file_lock(args: argparse.Namespace) -> None:
     else:
         if conflict:
             print(f"Lock conflict on: {args.filepath}", file=sys.stderr)
-            print(f"  Currently held by: {conflict.current_holder}", file=sys.stderr)
+            print(f"  Currently held by: {conflict['current_holder']}", file=sys.stderr)
             print(
-                f"  Locked at: {conflict.locked_at.strftime('%Y-%m-%d %H:%M:%S UTC')}",
+                f"  Locked at: {conflict['locked_at'].strftime('%Y-%m-%d %H:%M:%S UTC')}",
                 file=sys.stderr,
             )
-            print(f"  Reason: {conflict.reason}", file=sys.stderr)
+            print(f"  Reason: {conflict['reason']}", file=sys.stderr)
         else:
             print(f"Failed to acquire lock on: {args.filepath}", file=sys.stderr)
         sys.exit(1)
 
 
 def cmd_release_file_lock(args: argparse.Namespace) -> None:
-    """Release a lock on a file."""
+    """Release a lock on a file (through claudeswarmd when it is running)."""
+    from claudeswarm.daemon_client import (
+        DaemonRequestError,
+        DaemonUnavailableError,
+        daemon_request,
+    )
+
     try:
         # Auto-detect and validate agent_id if not provided
         validated_agent_id = _require_agent_id(args)
@@ -256,12 +279,24 @@ def cmd_release_file_lock(args: argparse.Namespace) -> None:
         print(f"Validation error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    manager = LockManager(project_root=args.project_root)
+    try:
+        result = daemon_request(
+            "release_lock",
+            {"filepath": str(validated_filepath), "agent_id": validated_agent_id},
+            project_root=args.project_root,
+        )
+        success = result["released"]
+    except DaemonRequestError:
+        success = False
+    except DaemonUnavailableError:
+        from claudeswarm.locking import LockManager
 
-    success = manager.release_lock(
-        filepath=str(validated_filepath),
-        agent_id=validated_agent_id,
-    )
+        manager = LockManager(project_root=args.project_root)
+
+        success = manager.release_lock(
+            filepath=str(validated_filepath),
+            agent_id=validated_agent_id,
+        )
 
     if success:
         print(f"Lock released on: {args.filepath}")
@@ -274,6 +309,8 @@ def cmd_release_file_lock(args: argparse.Namespace) -> None:
 
 def cmd_who_has_lock(args: argparse.Namespace) -> None:
     """Check who has a lock on a file."""
+    from claudeswarm.locking import LockManager
+
     try:
         # Validate filepath
         validated_filepath = validate_file_path(
@@ -307,6 +344,8 @@ def cmd_who_has_lock(args: argparse.Namespace) -> None:
 
 def cmd_list_all_locks(args: argparse.Namespace) -> None:
     """List all active locks."""
+    from claudeswarm.locking import LockManager
+
     manager = LockManager(project_root=args.project_root)
 
     locks = manager.list_all_locks(include_stale=args.include_stale)
@@ -339,6 +378,8 @@ def cmd_discover_agents(args: argparse.Namespace) -> None:
     """Discover active Claude Code agents."""
     import time
 
+    from claudeswarm.discovery import refresh_registry
+
     # Validate stale_threshold
     try:
         if args.stale_threshold < MIN_STALE_THRESHOLD or args.stale_threshold > MAX_STALE_THRESHOLD:
@@ -431,6 +472,8 @@ def cmd_discover_agents(args: argparse.Namespace) -> None:
 
 def cmd_list_agents(args: argparse.Namespace) -> None:
     """List active agents from registry."""
+    from claudeswarm.discovery import list_active_agents
+
     try:
         agents = list_active_agents()
 
@@ -473,6 +516,16 @@ def _detect_current_agent() -> tuple[str | None, dict | None]:
         # Invalid pane ID format - cannot proceed safely
         return None, None
 
+    # A running daemon answers from its cached registry
+    from claudeswarm.daemon_client import DaemonError, daemon_request
+
+    try:
+        result = daemon_request("whoami", {"pane_id": tmux_pane_id})
+        if result.get("agent_id"):
+            return result["agent_id"], result["agent"]
+    except DaemonError:
+        pass
+
     # Load registry
     registry_path = get_active_agents_path()
     if not registry_path.exists():
@@ -561,6 +614,11 @@ def cmd_send_message(args: argparse.Namespace) -> None:
         0: Success - message sent
         1: Failure - validation error, recipient not found, or send failed
     """
+    from claudeswarm.daemon_client import (
+        DaemonRequestError,
+        DaemonUnavailableError,
+        daemon_request,
+    )
     from claudeswarm.messaging import MessageType, send_message
     from claudeswarm.validators import sanitize_message_content
 
@@ -602,15 +660,31 @@ def cmd_send_message(args: argparse.Namespace) -> None:
                 sys.exit(1)
 
         # Send message (messaging layer validates recipient exists via _get_agent_pane)
-        message = send_message(
-            sender_id=validated_sender,
-            recipient_id=validated_recipient,
-            message_type=msg_type,
-            content=sanitized_content,
-        )
+        try:
+            result = daemon_request(
+                "send_message",
+                {
+                    "sender_id": validated_sender,
+                    "recipient_id": validated_recipient,
+                    "msg_type": msg_type.name,
+                    "content": sanitized_content,
+                },
+            )
+            message_data = result["message"]
+        except DaemonRequestError as e:
+            logger.error(f"send_message failed: {e}")
+            message_data = None
+        except DaemonUnavailableError:
+            message = send_message(
+                sender_id=validated_sender,
+                recipient_id=validated_recipient,
+                message_type=msg_type,
+                content=sanitized_content,
+            )
+            message_data = message.to_dict() if message else None
 
-        if message:
-            delivered = message.to_dict().get("delivery_status", {}).get(validated_recipient, False)
+        if message_data:
+            delivered = message_data.get("delivery_status", {}).get(validated_recipient, False)
             if delivered:
                 print(f"[DELIVERED] Message sent to {args.recipient_id}")
             else:
@@ -619,7 +693,7 @@ def cmd_send_message(args: argparse.Namespace) -> None:
             if args.json:
                 # Serialize JSON and fail hard if serialization fails
                 try:
-                    json_output = json.dumps(message.to_dict(), indent=2)
+                    json_output = json.dumps(message_data, indent=2)
                     print(json_output)
                 except (TypeError, ValueError) as e:
                     print(f"Error: Could not format JSON output: {e}", file=sys.stderr)
@@ -754,6 +828,8 @@ def cmd_broadcast_message(args: argparse.Namespace) -> None:
 
 def cmd_cleanup_stale_locks(args: argparse.Namespace) -> None:
     """Clean up stale locks."""
+    from claudeswarm.locking import LockManager
+
     manager = LockManager(project_root=args.project_root)
 
     count = manager.cleanup_stale_locks()
@@ -764,6 +840,8 @@ def cmd_cleanup_stale_locks(args: argparse.Namespace) -> None:
 
 def cmd_start_monitoring(args: argparse.Namespace) -> None:
     """Start the monitoring dashboard."""
+    from claudeswarm.monitoring import start_monitoring
+
     try:
         start_monitoring(
             filter_type=args.filter_type, filter_agent=args.filter_agent, use_tmux=not args.no_tmux
@@ -1043,6 +1121,8 @@ def _discover_agents_for_onboarding(args: argparse.Namespace) -> list:
     Exit Codes:
         1: Error during discovery or no agents found
     """
+    from claudeswarm.discovery import refresh_registry
+
     print("Step 1: Discovering active agents in current project...")
     try:
         # refresh_registry() discovers agents filtered by current project
@@ -1322,45 +1402,23 @@ def cmd_onboard(args: argparse.Namespace) -> None:
     sys.exit(0)
 
 
-def cmd_check_messages(args: argparse.Namespace) -> None:
-    """Check messages for the current agent.
+def _collect_messages_direct(
+    agent_id: str, new_only: bool, quiet: bool, project_root: Path | None
+) -> tuple[bool, list[dict]]:
+    """Read an agent's messages straight from agent_messages.log.
 
-    Reads messages from the agent_messages.log file and filters for messages
-    sent to this agent. Works in sandboxed environments by reading from file
-    instead of relying on tmux delivery.
-
-    Flags:
-        --new-only: Only show messages since last check (unread)
-        --quiet: Compact output suitable for hooks (one line per message)
+    Used by check-messages when claudeswarmd is not running. Marks the
+    returned messages as read.
 
-    Exit Codes:
-        0: Success
-        1: Error (not an agent, file not found, etc.)
+    Returns:
+        Tuple of (log exists, messages oldest first)
     """
     from claudeswarm.project import get_messages_log_path, get_project_root
 
-    # Auto-detect current agent (or use explicit agent-id for testing)
-    agent_id = getattr(args, "agent_id", None)
-    if not agent_id:
-        detected_id, _ = _detect_current_agent()
-        if detected_id:
-            agent_id = detected_id
-        else:
-            if not getattr(args, "quiet", False):
-                print("Error: Could not auto-detect agent identity", file=sys.stderr)
-                print("Please run 'claudeswarm whoami' to verify registration", file=sys.stderr)
-            sys.exit(1)
-
-    # Get flags
-    new_only = getattr(args, "new_only", False)
-    quiet = getattr(args, "quiet", False)
-
     # Read messages log
     messages_log = get_messages_log_path()
     if not messages_log.exists():
-        if not quiet:
-            print("No messages found (log file doesn't exist)")
-        sys.exit(0)
+        return False, []
 
     try:
         with open(messages_log, encoding="utf-8") as f:
@@ -1371,7 +1429,7 @@ def cmd_check_messages(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     # Load last read timestamp if using --new-only
-    project_root = get_project_root(getattr(args, "project_root", None))
+    project_root = get_project_root(project_root)
     last_read_file = project_root / ".swarm" / "last_read_messages.json"
     last_read_timestamp = None
     if new_only:
@@ -1420,6 +1478,90 @@ def cmd_check_messages(args: argparse.Namespace) -> None:
         except OSError:
             pass  # Ignore errors saving last read file
 
+    return True, my_messages
+
+
+def cmd_check_messages(args: argparse.Namespace) -> None:
+    """Check messages for the current agent.
+
+    Reads messages from the agent_messages.log file and filters for messages
+    sent to this agent. Works in sandboxed environments by reading from file
+    instead of relying on tmux delivery.
+
+    Flags:
+        --new-only: Only show messages since last check (unread)
+        --quiet: Compact output suitable for hooks (one line per message)
+
+    Exit Codes:
+        0: Success
+        1: Error (not an agent, file not found, etc.)
+    """
+    from claudeswarm import inbox_probe
+    from claudeswarm.project import (
+        get_active_agents_path,
+        get_messages_log_path,
+        get_project_root,
+    )
+
+    # Get flags
+    new_only = getattr(args, "new_only", False)
+    quiet = getattr(args, "quiet", False)
+    project_root = getattr(args, "project_root", None)
+
+    # Auto-detect current agent (or use explicit agent-id for testing)
+    agent_id = getattr(args, "agent_id", None)
+    pane_id = None if agent_id else os.environ.get("TMUX_PANE")
+    if pane_id:
+        root = get_project_root(project_root)
+
+        # Hook fast path: nothing was appended to the log since this pane's
+        # agent last checked, so there is nothing to parse
+        if new_only:
+            unchanged_agent_id = inbox_probe.probe_no_new_messages(root, pane_id)
+            if unchanged_agent_id:
+                if not quiet:
+                    print(f"No new messages for {unchanged_agent_id}")
+                sys.exit(0)
+
+        # Stamp before reading so concurrent writes invalidate the saved state
+        registry_stamp = inbox_probe.file_stamp(get_active_agents_path(root))
+        log_stamp = inbox_probe.file_stamp(get_messages_log_path(root))
+        agent_id = inbox_probe.cached_agent_id(root, pane_id)
+
+    if not agent_id:
+        detected_id, _ = _detect_current_agent()
+        if detected_id:
+            agent_id = detected_id
+        else:
+            if not getattr(args, "quiet", False):
+                print("Error: Could not auto-detect agent identity", file=sys.stderr)
+                print("Please run 'claudeswarm whoami' to verify registration", file=sys.stderr)
+            sys.exit(1)
+
+    from claudeswarm.daemon_client import DaemonError, daemon_request
+
+    # Prefer the daemon's incremental index; fall back to reading the log
+    served_by_daemon = False
+    try:
+        result = daemon_request(
+            "check_messages",
+            {"agent_id": agent_id, "new_only": new_only},
+            project_root=project_root,
+        )
+        log_exists, my_messages = result["log_exists"], result["messages"]
+        served_by_daemon = True
+    except DaemonError:
+        log_exists, my_messages = _collect_messages_direct(agent_id, new_only, quiet, project_root)
+
+    # Everything up to log_stamp is now marked read for this pane's agent
+    if pane_id:
+        inbox_probe.save_pane_state(root, pane_id, agent_id, registry_stamp, log_stamp)
+
+    if not log_exists:
+        if not quiet:
+            print("No messages found (log file doesn't exist)")
+        sys.exit(0)
+
     # Display messages
     if not my_messages:
         if not quiet:
@@ -1460,7 +1602,10 @@ def cmd_check_messages(args: argparse.Namespace) -> None:
         if len(my_messages) > limit:
             print(f"({len(my_messages) - limit} older messages not shown. Use --limit to see more)")
 
-    # Process pending ACK retries (runs periodically via check-messages hook)
+    # Process pending ACK retries (runs periodically via check-messages hook;
+    # a running daemon does this in the background instead)
+    if served_by_daemon:
+        sys.exit(0)
     try:
         from claudeswarm.ack import process_pending_retries
 
@@ -2226,6 +2371,8 @@ def _ensure_hook_in_settings(settings_file: Path) -> None:
 
 def cmd_cards_list(args: argparse.Namespace) -> None:
     """List all registered agent cards."""
+    from claudeswarm.agent_cards import AgentCardRegistry
+
     try:
         registry = AgentCardRegistry(project_root=args.project_root)
         cards = registry.list_cards()
@@ -2261,6 +2408,8 @@ def cmd_cards_list(args: argparse.Namespace) -> None:
 
 def cmd_cards_get(args: argparse.Namespace) -> None:
     """Get a specific agent card."""
+    from claudeswarm.agent_cards import AgentCardRegistry
+
     try:
         registry = AgentCardRegistry(project_root=args.project_root)
         card = registry.get_card(args.agent_id)
@@ -2292,6 +2441,8 @@ def cmd_cards_get(args: argparse.Namespace) -> None:
 
 def cmd_cards_register(args: argparse.Namespace) -> None:
     """Register a new agent card."""
+    from claudeswarm.agent_cards import AgentCardRegistry
+
     try:
         validated_agent_id = _require_agent_id(args)
         skills = args.skills.split(",") if args.skills else []
@@ -2319,6 +2470,8 @@ def cmd_cards_register(args: argparse.Namespace) -> None:
 
 def cmd_cards_update(args: argparse.Namespace) -> None:
     """Update an agent card."""
+    from claudeswarm.agent_cards import AgentCardRegistry
+
     try:
         validated_agent_id = _require_agent_id(args)
 
@@ -2357,11 +2510,15 @@ def cmd_cards_update(args: argparse.Namespace) -> None:
 
 def cmd_tasks_list(args: argparse.Namespace) -> None:
     """List all tasks."""
+    from claudeswarm.tasks import TaskManager, TaskPriority, TaskStatus
+
     try:
         manager = TaskManager(project_root=args.project_root)
         tasks = manager.list_tasks(
             status=TaskStatus(args.status) if args.status else None,
             assigned_to=args.assignee,
+            include_terminal=args.archived,
+            include_archived=args.archived,
         )
 
         if args.json:
@@ -2392,6 +2549,8 @@ def cmd_tasks_list(args: argparse.Namespace) -> None:
 
 def cmd_tasks_get(args: argparse.Namespace) -> None:
     """Get a specific task."""
+    from claudeswarm.tasks import TaskManager
+
     try:
         manager = TaskManager(project_root=args.project_root)
         task = manager.get_task(args.task_id)
@@ -2427,6 +2586,8 @@ def cmd_tasks_get(args: argparse.Namespace) -> None:
 
 def cmd_tasks_create(args: argparse.Namespace) -> None:
     """Create a new task."""
+    from claudeswarm.tasks import TaskManager, TaskPriority
+
     try:
         validated_agent_id = _require_agent_id(args, "creator")
 
@@ -2457,6 +2618,8 @@ def cmd_tasks_create(args: argparse.Namespace) -> None:
 
 def cmd_tasks_update(args: argparse.Namespace) -> None:
     """Update a task's status."""
+    from claudeswarm.tasks import TaskManager, TaskStatus
+
     try:
         manager = TaskManager(project_root=args.project_root)
         task = manager.get_task(args.task_id)
@@ -2488,8 +2651,26 @@ def cmd_tasks_update(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def cmd_tasks_archive(args: argparse.Namespace) -> None:
+    """Move old terminal tasks into the compressed task archive."""
+    from claudeswarm.tasks import TaskManager
+
+    try:
+        manager = TaskManager(project_root=args.project_root)
+        archived = manager.archive_tasks(older_than_days=args.older_than_days)
+        print(f"Archived {archived} task(s) to {manager.archive_dir}")
+        sys.exit(0)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def cmd_delegate(args: argparse.Namespace) -> None:
     """Delegate a task to the best-matched agent."""
+    from claudeswarm.delegation import DelegationManager
+    from claudeswarm.tasks import TaskManager
+
     try:
         manager = TaskManager(project_root=args.project_root)
         task = manager.get_task(args.task_id)
@@ -2520,6 +2701,10 @@ def cmd_delegate(args: argparse.Namespace) -> None:
 
 def cmd_find_agent(args: argparse.Namespace) -> None:
     """Find the best agent for a task or skill."""
+    from claudeswarm.agent_cards import AgentCardRegistry
+    from claudeswarm.delegation import DelegationManager
+    from claudeswarm.tasks import TaskManager
+
     try:
         delegation_manager = DelegationManager(project_root=args.project_root)
 
@@ -2584,6 +2769,8 @@ def cmd_find_agent(args: argparse.Namespace) -> None:
 
 def cmd_context_list(args: argparse.Namespace) -> None:
     """List all shared contexts."""
+    from claudeswarm.context import ContextStore
+
     try:
         store = ContextStore(project_root=args.project_root)
         contexts = store.list_contexts()
@@ -2611,6 +2798,8 @@ def cmd_context_list(args: argparse.Namespace) -> None:
 
 def cmd_context_get(args: argparse.Namespace) -> None:
     """Get a specific context."""
+    from claudeswarm.context import ContextStore
+
     try:
         store = ContextStore(project_root=args.project_root)
         ctx = store.get_context(args.context_id)
@@ -2644,6 +2833,8 @@ def cmd_context_get(args: argparse.Namespace) -> None:
 
 def cmd_context_create(args: argparse.Namespace) -> None:
     """Create a new shared context."""
+    from claudeswarm.context import ContextStore
+
     try:
         validated_agent_id = _require_agent_id(args, "creator")
         related = args.related.split(",") if args.related else []
@@ -2669,6 +2860,8 @@ def cmd_context_create(args: argparse.Namespace) -> None:
 
 def cmd_context_add_decision(args: argparse.Namespace) -> None:
     """Add a decision to a context."""
+    from claudeswarm.context import ContextDecision, ContextStore
+
     try:
         validated_agent_id = _require_agent_id(args, "by")
 
@@ -2701,6 +2894,8 @@ def cmd_context_add_decision(args: argparse.Namespace) -> None:
 
 def cmd_memory_get(args: argparse.Namespace) -> None:
     """Get an agent's memory."""
+    from claudeswarm.memory import MemoryStore
+
     try:
         validated_agent_id = _require_agent_id(args)
 
@@ -2741,6 +2936,8 @@ def cmd_memory_get(args: argparse.Namespace) -> None:
 
 def cmd_memory_clear(args: argparse.Namespace) -> None:
     """Clear an agent's memory."""
+    from claudeswarm.memory import MemoryStore
+
     try:
         validated_agent_id = _require_agent_id(args)
 
@@ -2757,6 +2954,8 @@ def cmd_memory_clear(args: argparse.Namespace) -> None:
 
 def cmd_learning_stats(args: argparse.Namespace) -> None:
     """Show learning statistics for an agent."""
+    from claudeswarm.learning import LearningSystem
+
     try:
         validated_agent_id = _require_agent_id(args)
 
@@ -2791,8 +2990,31 @@ def cmd_learning_stats(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def cmd_learning_backfill(args: argparse.Namespace) -> None:
+    """Recompute learned task timings from task history."""
+    from claudeswarm.learning import LearningSystem
+
+    try:
+        system = LearningSystem(project_root=args.project_root)
+        count = system.backfill_timing()
+
+        if args.json:
+            print(json.dumps({"tasks_replayed": count}))
+        else:
+            print(f"Backfilled timing from {count} task(s)")
+
+        sys.exit(0)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def cmd_conflict_resolve(args: argparse.Namespace) -> None:
     """Resolve a file lock conflict."""
+    from claudeswarm.conflict_resolution import ConflictResolver
+    from claudeswarm.locking import LockManager
+
     try:
         resolver = ConflictResolver(project_root=args.project_root)
 
@@ -3339,6 +3561,11 @@ def main() -> NoReturn:
         help="Filter by status",
     )
     tasks_list_parser.add_argument("--assignee", help="Filter by assignee")
+    tasks_list_parser.add_argument(
+        "--archived",
+        action="store_true",
+        help="Include terminal and archived tasks",
+    )
     tasks_list_parser.add_argument("--json", action="store_true", help="Output as JSON")
     tasks_list_parser.set_defaults(func=cmd_tasks_list)
 
@@ -3396,6 +3623,20 @@ def main() -> NoReturn:
     tasks_update_parser.add_argument("--assignee", help="New assignee agent ID")
     tasks_update_parser.set_defaults(func=cmd_tasks_update)
 
+    # tasks archive
+    tasks_archive_parser = tasks_subparsers.add_parser(
+        "archive",
+        help="Archive old completed/failed/cancelled tasks",
+    )
+    tasks_archive_parser.add_argument(
+        "--older-than-days",
+        dest="older_than_days",
+        type=float,
+        default=None,
+        help="Minimum age in days of tasks to archive (default: 7)",
+    )
+    tasks_archive_parser.set_defaults(func=cmd_tasks_archive)
+
     # delegate command
     delegate_parser = subparsers.add_parser(
         "delegate",
@@ -3525,6 +3766,14 @@ def main() -> NoReturn:
     learning_stats_parser.add_argument("--json", action="store_true", help="Output as JSON")
     learning_stats_parser.set_defaults(func=cmd_learning_stats)
 
+    # learning backfill
+    learning_backfill_parser = learning_subparsers.add_parser(
+        "backfill",
+        help="Recompute task timings from task history",
+    )
+    learning_backfill_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    learning_backfill_parser.set_defaults(func=cmd_learning_backfill)
+
     # resolve-conflict command
     resolve_conflict_parser = subparsers.add_parser(
         "resolve-conflict",
@@ -3620,6 +3869,7 @@ A2A Protocol Commands (autonomous coordination):
     memory clear         Clear an agent's memory
 
     learning stats       Show learning statistics for an agent
+    learning backfill    Recompute task timings from task history
 
 Configuration Commands:
     config init          Create default configuration file
@@ -24,7 +24,9 @@ The system uses a negotiation protocol where:
 from __future__ import annotations
 
 import json
+import os
 import threading
+from collections import Counter
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -34,6 +36,7 @@ from typing import Any
 from .file_lock import FileLock, FileLockTimeout
 from .locking import LockConflict, LockManager
 from .logging_config import get_logger
+from .messaging import MessageType, send_message
 from .project import get_project_root
 from .tasks import Task, TaskManager, TaskPriority
 
@@ -48,12 +51,33 @@ __all__ = [
 ]
 
 # Constants
-CONFLICT_LOG_FILENAME = "CONFLICT_LOG.json"
+CONFLICT_LOG_FILENAME = "CONFLICT_LOG.jsonl"
+LEGACY_CONFLICT_LOG_FILENAME = "CONFLICT_LOG.json"
 CONFLICT_LOCK_TIMEOUT_SECONDS = 5.0
-MAX_CONFLICT_LOG_ENTRIES = 500
+MAX_CONFLICT_LOG_ENTRIES = 500  # Conflicts kept in the log and in memory
+CONFLICT_LOG_COMPACT_AT = 4 * MAX_CONFLICT_LOG_ENTRIES  # Log events before compacting
 NEGOTIATION_TIMEOUT_SECONDS = 30.0
 MAX_NEGOTIATION_ROUNDS = 5
 
+# Task priority rank (lower is more urgent)
+PRIORITY_RANK = {
+    TaskPriority.CRITICAL: 0,
+    TaskPriority.HIGH: 1,
+    TaskPriority.NORMAL: 2,
+    TaskPriority.LOW: 3,
+}
+# A requester preempts the lock holder when its task outranks the holder's
+# by at least this many levels (3 = CRITICAL over LOW)
+PREEMPTION_MIN_PRIORITY_GAP = 3
+
+# Conflict log event types
+EVENT_DETECTED = "detected"  # Carries the full conflict
+EVENT_NEGOTIATED = "negotiated"  # Carries one negotiation message
+EVENT_RESOLVED = "resolved"  # Carries the new status and resolution
+EVENT_SNAPSHOT = "snapshot"  # Full conflict, written when the log is compacted
+
+ACTIVE_STATUSES = ("pending", "resolving")
+
 # Configure logging
 logger = get_logger(__name__)
 
@@ -241,17 +265,57 @@ def get_conflict_log_path(project_root: Path | None = None) -> Path:
         project_root: Optional project root directory
 
     Returns:
-        Path to CONFLICT_LOG.json
+        Path to CONFLICT_LOG.jsonl
     """
     root = get_project_root(project_root)
     return root / CONFLICT_LOG_FILENAME
 
 
+@dataclass(frozen=True)
+class _IndexedConflict:
+    """What a conflict currently contributes to the indexes and statistics."""
+
+    status: str
+    conflict_type: str
+    agents: tuple[str, ...]
+    resource: str
+    strategy: str | None
+    resolution_seconds: float | None
+
+    @classmethod
+    def of(cls, conflict: Conflict) -> _IndexedConflict:
+        """Capture the indexed fields of a conflict."""
+        strategy = None
+        resolution_seconds = None
+        if conflict.status == "resolved" and conflict.resolution:
+            strategy = conflict.resolution.strategy_used.value
+            try:
+                detected = datetime.fromisoformat(conflict.detected_at)
+                resolved_at = datetime.fromisoformat(conflict.resolution.resolved_at)
+                resolution_seconds = (resolved_at - detected).total_seconds()
+            except (ValueError, TypeError):
+                pass
+        return cls(
+            status=conflict.status,
+            conflict_type=conflict.conflict_type.value,
+            agents=tuple(conflict.agents_involved),
+            resource=conflict.resource,
+            strategy=strategy,
+            resolution_seconds=resolution_seconds,
+        )
+
+
 class ConflictResolver:
     """Resolves conflicts between agents autonomously.
 
     Implements a hierarchy of resolution strategies and manages
     the negotiation protocol between agents.
+
+    Conflicts are persisted as append-only events in CONFLICT_LOG.jsonl.
+    Each resolver replays the log into memory once and then only reads
+    events appended since its last look, keeping unresolved conflicts
+    indexed by resource and by agent and the statistics up to date as
+    events arrive.
     """
 
     def __init__(self, project_root: Path | None = None):
@@ -262,65 +326,244 @@ class ConflictResolver:
         """
         self.project_root = get_project_root(project_root)
         self.log_path = get_conflict_log_path(self.project_root)
+        self.legacy_log_path = self.project_root / LEGACY_CONFLICT_LOG_FILENAME
+        self.lock_path = self.log_path.with_name(self.log_path.name + ".lock")
         self.lock_manager = LockManager(project_root=self.project_root)
         self.task_manager = TaskManager(self.project_root)
         self._lock = threading.Lock()
         self._active_conflicts: dict[str, Conflict] = {}
         self._pending_negotiations: dict[str, list[NegotiationMessage]] = {}
 
-    def _read_log(self) -> list[Conflict]:
-        """Read conflict log from file.
+        # In-memory view of the conflict log (guarded by self._lock)
+        self._conflicts: dict[str, Conflict] = {}
+        self._indexed: dict[str, _IndexedConflict] = {}
+        self._active_by_resource: dict[str, dict[str, None]] = {}
+        self._active_by_agent: dict[str, dict[str, None]] = {}
+        self._status_counts: Counter[str] = Counter()
+        self._strategy_counts: Counter[str] = Counter()
+        self._type_counts: Counter[str] = Counter()
+        self._resolution_seconds_total = 0.0
+        self._resolution_count = 0
+        self._log_inode: int | None = None
+        self._log_offset = 0
+        self._log_events = 0
+
+    def _reset_view(self) -> None:
+        """Forget the in-memory view so the log is replayed from the start."""
+        self._conflicts.clear()
+        self._indexed.clear()
+        self._active_by_resource.clear()
+        self._active_by_agent.clear()
+        self._status_counts.clear()
+        self._strategy_counts.clear()
+        self._type_counts.clear()
+        self._resolution_seconds_total = 0.0
+        self._resolution_count = 0
+        self._log_inode = None
+        self._log_offset = 0
+        self._log_events = 0
+
+    def _index(self, conflict: Conflict) -> None:
+        """Add a conflict's contribution to the indexes and statistics."""
+        entry = _IndexedConflict.of(conflict)
+        self._indexed[conflict.conflict_id] = entry
+        self._status_counts[entry.status] += 1
+        self._type_counts[entry.conflict_type] += 1
+        if entry.strategy:
+            self._strategy_counts[entry.strategy] += 1
+        if entry.resolution_seconds is not None:
+            self._resolution_seconds_total += entry.resolution_seconds
+            self._resolution_count += 1
+        if entry.status in ACTIVE_STATUSES:
+            self._active_by_resource.setdefault(entry.resource, {})[conflict.conflict_id] = None
+            for agent in entry.agents:
+                self._active_by_agent.setdefault(agent, {})[conflict.conflict_id] = None
+
+    def _unindex(self, conflict_id: str) -> None:
+        """Remove a conflict's contribution from the indexes and statistics."""
+        entry = self._indexed.pop(conflict_id, None)
+        if entry is None:
+            return
+        self._status_counts[entry.status] -= 1
+        self._type_counts[entry.conflict_type] -= 1
+        if entry.strategy:
+            self._strategy_counts[entry.strategy] -= 1
+        if entry.resolution_seconds is not None:
+            self._resolution_seconds_total -= entry.resolution_seconds
+            self._resolution_count -= 1
+        if entry.status in ACTIVE_STATUSES:
+            for index, key in [(self._active_by_resource, entry.resource)] + [
+                (self._active_by_agent, agent) for agent in entry.agents
+            ]:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.pop(conflict_id, None)
+                    if not ids:
+                        del index[key]
+
+    def _apply_event(self, event: dict[str, Any]) -> None:
+        """Fold one log event into the in-memory view (caller holds self._lock)."""
+        kind = event.get("event")
+        if kind in (EVENT_DETECTED, EVENT_SNAPSHOT):
+            conflict = Conflict.from_dict(event["conflict"])
+            self._unindex(conflict.conflict_id)
+            self._conflicts.pop(conflict.conflict_id, None)
+            self._conflicts[conflict.conflict_id] = conflict
+            self._index(conflict)
+            while len(self._conflicts) > MAX_CONFLICT_LOG_ENTRIES:
+                oldest = next(iter(self._conflicts))
+                self._unindex(oldest)
+                del self._conflicts[oldest]
+            return
+
+        conflict = self._conflicts.get(event.get("conflict_id", ""))
+        if conflict is None:
+            # Aged out of the retained window
+            return
+        self._unindex(conflict.conflict_id)
+        if kind == EVENT_NEGOTIATED:
+            conflict.negotiations.append(NegotiationMessage.from_dict(event["negotiation"]))
+        elif kind == EVENT_RESOLVED:
+            conflict.status = event.get("status", "resolved")
+            resolution = event.get("resolution")
+            conflict.resolution = Resolution.from_dict(resolution) if resolution else None
+        else:
+            logger.warning(f"Skipping unknown conflict log event: {kind}")
+        self._index(conflict)
 
-        Returns:
-            List of conflicts
-        """
-        if not self.log_path.exists():
-            return []
+    def _migrate_legacy_log(self) -> None:
+        """Convert a CONFLICT_LOG.json file from older versions to the event log."""
+        if self.log_path.exists() or not self.legacy_log_path.exists():
+            return
 
         try:
-            with FileLock(self.log_path, timeout=CONFLICT_LOCK_TIMEOUT_SECONDS, shared=True):
-                with open(self.log_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                return [Conflict.from_dict(c) for c in data.get("conflicts", [])]
+            with open(self.legacy_log_path, encoding="utf-8") as f:
+                data = json.load(f)
+            conflicts = [Conflict.from_dict(c) for c in data.get("conflicts", [])]
+        except Exception as e:
+            logger.warning(f"Could not migrate legacy conflict log: {e}")
+            return
 
+        try:
+            with FileLock(self.lock_path, timeout=CONFLICT_LOCK_TIMEOUT_SECONDS, shared=False):
+                if self.log_path.exists():
+                    return
+                self._rewrite_log(conflicts[-MAX_CONFLICT_LOG_ENTRIES:])
         except FileLockTimeout:
-            logger.error(f"Timeout acquiring lock on {self.log_path}")
-            return []
-        except Exception as e:
-            logger.warning(f"Error reading conflict log: {e}")
-            return []
+            logger.error(f"Timeout acquiring lock on {self.lock_path}")
+            return
+
+        self.legacy_log_path.replace(self.legacy_log_path.with_suffix(".json.migrated"))
+        logger.info(f"Migrated {len(conflicts)} conflict(s) to {self.log_path.name}")
+
+    def _refresh(self) -> None:
+        """Apply events appended to the log since the last refresh (caller holds self._lock).
+
+        The log is only replayed from the start when it was replaced by a
+        compaction or truncated; otherwise just the new tail is read. A
+        trailing line without a newline is an append still in progress and
+        is left for the next refresh.
+        """
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            if self._log_inode is not None:
+                self._reset_view()
+            return
+
+        with f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != self._log_inode or stat.st_size < self._log_offset:
+                self._reset_view()
+                self._log_inode = stat.st_ino
+            if stat.st_size == self._log_offset:
+                return
+
+            f.seek(self._log_offset)
+            data = f.read(stat.st_size - self._log_offset)
+
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply_event(json.loads(line))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping invalid conflict log entry: {e}")
+            self._log_events += 1
+        self._log_offset += complete
+
+    def _rewrite_log(self, conflicts: list[Conflict]) -> None:
+        """Atomically replace the log with one snapshot event per conflict.
+
+        Caller holds the file lock.
+        """
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.log_path.with_suffix(".jsonl.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for conflict in conflicts:
+                event = {"event": EVENT_SNAPSHOT, "conflict": conflict.to_dict()}
+                f.write(json.dumps(event) + "\n")
+        temp_path.replace(self.log_path)
 
-    def _write_log(self, conflicts: list[Conflict]) -> None:
-        """Write conflict log to file.
+    def _append_events(
+        self, events: list[dict[str, Any]], ensure_recorded: Conflict | None = None
+    ) -> None:
+        """Append events to the conflict log and fold them into the view.
+
+        Once the log holds CONFLICT_LOG_COMPACT_AT events it is rewritten
+        as one snapshot per retained conflict.
 
         Args:
-            conflicts: List of conflicts
+            events: Log events to append
+            ensure_recorded: Conflict the events refer to. If it is not in the
+                retained log, its full state is recorded instead of the events.
+                Checked under the same lock as the append.
         """
+        self._migrate_legacy_log()
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Trim if too long
-        if len(conflicts) > MAX_CONFLICT_LOG_ENTRIES:
-            conflicts = conflicts[-MAX_CONFLICT_LOG_ENTRIES:]
+        with self._lock:
+            try:
+                with FileLock(self.lock_path, timeout=CONFLICT_LOCK_TIMEOUT_SECONDS, shared=False):
+                    self._refresh()
+                    if (
+                        ensure_recorded is not None
+                        and ensure_recorded.conflict_id not in self._conflicts
+                    ):
+                        events = [{"event": EVENT_DETECTED, "conflict": ensure_recorded.to_dict()}]
+                    payload = "".join(json.dumps(event) + "\n" for event in events)
+                    with open(self.log_path, "a", encoding="utf-8") as f:
+                        f.write(payload)
+                    self._refresh()
+
+                    if self._log_events >= CONFLICT_LOG_COMPACT_AT:
+                        self._rewrite_log(list(self._conflicts.values()))
+                        self._reset_view()
+                        self._refresh()
+
+            except FileLockTimeout:
+                logger.error(f"Timeout acquiring write lock on {self.lock_path}")
+                raise
+            except Exception as e:
+                logger.error(f"Error writing conflict log: {e}")
+                raise
 
-        data = {
-            "version": "1.0",
-            "updated_at": datetime.now(UTC).isoformat(),
-            "conflicts": [c.to_dict() for c in conflicts],
-        }
+    def _read_log(self) -> list[Conflict]:
+        """Read the retained conflicts from the log.
 
-        try:
-            with FileLock(self.log_path, timeout=CONFLICT_LOCK_TIMEOUT_SECONDS, shared=False):
-                temp_path = self.log_path.with_suffix(".json.tmp")
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2)
-                temp_path.replace(self.log_path)
+        Returns:
+            List of conflicts, oldest first
+        """
+        self._migrate_legacy_log()
+        with self._lock:
+            self._refresh()
+            return [self._copy(c) for c in self._conflicts.values()]
 
-        except FileLockTimeout:
-            logger.error(f"Timeout acquiring write lock on {self.log_path}")
-            raise
-        except Exception as e:
-            logger.error(f"Error writing conflict log: {e}")
-            raise
+    @staticmethod
+    def _copy(conflict: Conflict) -> Conflict:
+        """Detach a conflict from the in-memory view."""
+        return Conflict.from_dict(conflict.to_dict())
 
     def _record_conflict(self, conflict: Conflict) -> None:
         """Record a conflict to the log.
@@ -328,26 +571,43 @@ class ConflictResolver:
         Args:
             conflict: Conflict to record
         """
-        with self._lock:
-            conflicts = self._read_log()
-            conflicts.append(conflict)
-            self._write_log(conflicts)
+        self._append_events([{"event": EVENT_DETECTED, "conflict": conflict.to_dict()}])
 
     def _update_conflict(self, conflict: Conflict) -> None:
-        """Update an existing conflict in the log.
+        """Record a conflict's new status and resolution in the log.
 
         Args:
             conflict: Conflict to update
         """
-        with self._lock:
-            conflicts = self._read_log()
-            for i, c in enumerate(conflicts):
-                if c.conflict_id == conflict.conflict_id:
-                    conflicts[i] = conflict
-                    break
-            else:
-                conflicts.append(conflict)
-            self._write_log(conflicts)
+        self._append_events(
+            [
+                {
+                    "event": EVENT_RESOLVED,
+                    "conflict_id": conflict.conflict_id,
+                    "status": conflict.status,
+                    "resolution": conflict.resolution.to_dict() if conflict.resolution else None,
+                }
+            ],
+            ensure_recorded=conflict,
+        )
+
+    def _record_negotiation(self, conflict: Conflict, message: NegotiationMessage) -> None:
+        """Record a negotiation message in the log.
+
+        Args:
+            conflict: Conflict being negotiated
+            message: Negotiation message
+        """
+        self._append_events(
+            [
+                {
+                    "event": EVENT_NEGOTIATED,
+                    "conflict_id": conflict.conflict_id,
+                    "negotiation": message.to_dict(),
+                }
+            ],
+            ensure_recorded=conflict,
+        )
 
     def detect_file_lock_conflict(
         self,
@@ -407,15 +667,8 @@ class ConflictResolver:
         if not requesting_task or not holding_task:
             return None
 
-        priority_order = {
-            TaskPriority.CRITICAL: 0,
-            TaskPriority.HIGH: 1,
-            TaskPriority.NORMAL: 2,
-            TaskPriority.LOW: 3,
-        }
-
-        req_priority = priority_order.get(requesting_task.priority, 2)
-        hold_priority = priority_order.get(holding_task.priority, 2)
+        req_priority = PRIORITY_RANK.get(requesting_task.priority, 2)
+        hold_priority = PRIORITY_RANK.get(holding_task.priority, 2)
 
         if req_priority < hold_priority:
             # Requesting agent has higher priority
@@ -441,6 +694,10 @@ class ConflictResolver:
             winner=winner,
             loser_action=loser_action,
             reason=reason,
+            metadata={
+                "requesting_priority": requesting_task.priority.value,
+                "holding_priority": holding_task.priority.value,
+            },
         )
 
     def resolve_by_seniority(
@@ -560,23 +817,106 @@ class ConflictResolver:
         filepath: str,
         requesting_agent: str,
         lock_conflict: LockConflict,
+        preempt: bool = True,
     ) -> Resolution:
         """Handle a file lock conflict automatically.
 
         This is the main entry point for handling lock conflicts.
         It detects the conflict, applies resolution strategies,
-        and returns the result.
+        and returns the result. When the requester's task outranks the
+        holder's by PREEMPTION_MIN_PRIORITY_GAP, the lock is handed over
+        straight away (see execute_preemption).
 
         Args:
             filepath: Path to the contested file
             requesting_agent: Agent that tried to acquire lock
             lock_conflict: The lock conflict
+            preempt: Whether to execute priority preemption
 
         Returns:
-            Resolution with winner and loser action
+            Resolution with winner and loser action; metadata["preempted"]
+            is True if the requester now holds the lock
         """
         conflict = self.detect_file_lock_conflict(filepath, requesting_agent, lock_conflict)
-        return self.resolve_conflict(conflict)
+        resolution = self.resolve_conflict(conflict)
+        if preempt and self.should_preempt(conflict, resolution):
+            self.execute_preemption(conflict, resolution)
+        return resolution
+
+    def should_preempt(self, conflict: Conflict, resolution: Resolution) -> bool:
+        """Check whether a resolution warrants taking the lock from its holder.
+
+        Args:
+            conflict: The resolved conflict
+            resolution: Its resolution
+
+        Returns:
+            True for file lock conflicts won by the requester on task
+            priority with a gap of at least PREEMPTION_MIN_PRIORITY_GAP
+        """
+        if conflict.conflict_type != ConflictType.FILE_LOCK:
+            return False
+        if len(conflict.agents_involved) < 2 or resolution.winner != conflict.agents_involved[0]:
+            return False
+        if resolution.strategy_used != ResolutionStrategy.PRIORITY:
+            return False
+
+        try:
+            requesting = PRIORITY_RANK[TaskPriority(resolution.metadata["requesting_priority"])]
+            holding = PRIORITY_RANK[TaskPriority(resolution.metadata["holding_priority"])]
+        except (KeyError, ValueError):
+            return False
+        return holding - requesting >= PREEMPTION_MIN_PRIORITY_GAP
+
+    def execute_preemption(self, conflict: Conflict, resolution: Resolution) -> bool:
+        """Transfer a contested lock to the winner and notify both agents.
+
+        The lock is handed over atomically by the LockManager, so the
+        winner does not have to wait for the holder to release it or for
+        it to go stale. The outcome is recorded on the resolution and in
+        the conflict log.
+
+        Args:
+            conflict: The resolved file lock conflict (requester first)
+            resolution: Resolution naming the requester as winner
+
+        Returns:
+            True if the lock was transferred
+        """
+        winner, loser = conflict.agents_involved[0], conflict.agents_involved[1]
+        filepath = conflict.resource
+
+        transferred = self.lock_manager.transfer_lock(
+            filepath,
+            from_agent=loser,
+            to_agent=winner,
+            reason=f"Preempted {loser}: {resolution.reason}",
+        )
+        resolution.metadata["preempted"] = transferred
+
+        if transferred:
+            notices = {
+                loser: (
+                    f"Your lock on {filepath} was transferred to {winner} "
+                    f"({resolution.reason}). Stop editing it and re-acquire the lock later."
+                ),
+                winner: (
+                    f"Lock on {filepath} transferred to you from {loser} "
+                    f"({resolution.reason}). You can proceed."
+                ),
+            }
+            notified = []
+            for agent_id, content in notices.items():
+                if send_message(winner, agent_id, MessageType.CONFLICT, content):
+                    notified.append(agent_id)
+            resolution.metadata["notified"] = notified
+            logger.info(f"Preempted lock on {filepath}: {loser} -> {winner}")
+        else:
+            logger.info(f"Could not preempt lock on {filepath} held by {loser}")
+
+        conflict.resolution = resolution
+        self._update_conflict(conflict)
+        return transferred
 
     def negotiate(
         self,
@@ -593,6 +933,7 @@ class ConflictResolver:
             Resolution if negotiation concludes, None if ongoing
         """
         conflict.negotiations.append(message)
+        self._record_negotiation(conflict, message)
 
         # Get messages from both agents
         agent_messages: dict[str, list[NegotiationMessage]] = {}
@@ -671,14 +1012,40 @@ class ConflictResolver:
 
         return resolution
 
-    def get_active_conflicts(self) -> list[Conflict]:
+    def get_active_conflicts(
+        self,
+        resource: str | None = None,
+        agent_id: str | None = None,
+    ) -> list[Conflict]:
         """Get all active (unresolved) conflicts.
 
+        Served from the in-memory index of unresolved conflicts.
+
+        Args:
+            resource: Only conflicts over this resource
+            agent_id: Only conflicts involving this agent
+
         Returns:
-            List of active conflicts
+            List of active conflicts, oldest first
         """
-        conflicts = self._read_log()
-        return [c for c in conflicts if c.status in ("pending", "resolving")]
+        self._migrate_legacy_log()
+        with self._lock:
+            self._refresh()
+            if resource is not None:
+                ids = list(self._active_by_resource.get(resource, ()))
+                if agent_id is not None:
+                    ids = [i for i in ids if i in self._active_by_agent.get(agent_id, {})]
+            elif agent_id is not None:
+                ids = list(self._active_by_agent.get(agent_id, ()))
+            else:
+                ids = [
+                    conflict_id
+                    for conflict_id, entry in self._indexed.items()
+                    if entry.status in ACTIVE_STATUSES
+                ]
+            conflicts = [self._conflicts[i] for i in ids]
+            conflicts.sort(key=lambda c: c.detected_at)
+            return [self._copy(c) for c in conflicts]
 
     def get_conflict_history(
         self,
@@ -694,76 +1061,47 @@ class ConflictResolver:
             limit: Maximum number of results
 
         Returns:
-            List of conflicts
+            List of conflicts, most recent first
         """
-        conflicts = self._read_log()
-
-        if agent_id:
-            conflicts = [c for c in conflicts if agent_id in c.agents_involved]
-
-        if resource:
-            conflicts = [c for c in conflicts if c.resource == resource]
-
-        # Most recent first
-        conflicts.reverse()
-
-        return conflicts[:limit]
+        self._migrate_legacy_log()
+        history = []
+        with self._lock:
+            self._refresh()
+            for conflict_id in reversed(self._conflicts):
+                if len(history) >= limit:
+                    break
+                entry = self._indexed[conflict_id]
+                if agent_id and agent_id not in entry.agents:
+                    continue
+                if resource and entry.resource != resource:
+                    continue
+                history.append(self._copy(self._conflicts[conflict_id]))
+        return history
 
     def get_conflict_stats(self) -> dict[str, Any]:
         """Get conflict resolution statistics.
 
+        The counters are maintained as log events are applied, so the
+        conflicts are not rescanned.
+
         Returns:
             Dictionary with statistics
         """
-        conflicts = self._read_log()
-
-        if not conflicts:
+        self._migrate_legacy_log()
+        with self._lock:
+            self._refresh()
+            statuses = self._status_counts
+            avg_time = (
+                self._resolution_seconds_total / self._resolution_count
+                if self._resolution_count
+                else 0
+            )
             return {
-                "total_conflicts": 0,
-                "resolved": 0,
-                "pending": 0,
-                "escalated": 0,
-                "resolution_strategies": {},
-                "conflict_types": {},
-                "avg_resolution_time_seconds": 0,
+                "total_conflicts": len(self._conflicts),
+                "resolved": statuses["resolved"],
+                "pending": sum(statuses[s] for s in ACTIVE_STATUSES),
+                "escalated": statuses["escalated"],
+                "resolution_strategies": {k: v for k, v in self._strategy_counts.items() if v},
+                "conflict_types": {k: v for k, v in self._type_counts.items() if v},
+                "avg_resolution_time_seconds": round(avg_time, 2),
             }
-
-        resolved = [c for c in conflicts if c.status == "resolved"]
-        pending = [c for c in conflicts if c.status in ("pending", "resolving")]
-        escalated = [c for c in conflicts if c.status == "escalated"]
-
-        # Count strategies used
-        strategy_counts: dict[str, int] = {}
-        for c in resolved:
-            if c.resolution:
-                strategy = c.resolution.strategy_used.value
-                strategy_counts[strategy] = strategy_counts.get(strategy, 0) + 1
-
-        # Count conflict types
-        type_counts: dict[str, int] = {}
-        for c in conflicts:
-            ctype = c.conflict_type.value
-            type_counts[ctype] = type_counts.get(ctype, 0) + 1
-
-        # Calculate average resolution time
-        resolution_times = []
-        for c in resolved:
-            if c.resolution:
-                try:
-                    detected = datetime.fromisoformat(c.detected_at)
-                    resolved_at = datetime.fromisoformat(c.resolution.resolved_at)
-                    resolution_times.append((resolved_at - detected).total_seconds())
-                except (ValueError, TypeError):
-                    pass
-
-        avg_time = sum(resolution_times) / len(resolution_times) if resolution_times else 0
-
-        return {
-            "total_conflicts": len(conflicts),
-            "resolved": len(resolved),
-            "pending": len(pending),
-            "escalated": len(escalated),
-            "resolution_strategies": strategy_counts,
-            "conflict_types": type_counts,
-            "avg_resolution_time_seconds": round(avg_time, 2),
-        }
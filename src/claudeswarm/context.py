@@ -9,6 +9,7 @@ Context enables:
 - Tracking files touched in a context
 - Linking related contexts
 - Summarizing work done
+- Ranked full-text search over contexts and their decisions
 
 Example context:
     {
@@ -24,13 +25,22 @@ Example context:
 
 from __future__ import annotations
 
+import bisect
+import copy
 import json
+import math
+import os
+import re
 import threading
+import time
 import uuid
-from dataclasses import asdict, dataclass, field
+from collections import Counter
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
 from .file_lock import FileLock, FileLockTimeout
 from .logging_config import get_logger
@@ -39,16 +49,30 @@ from .project import get_project_root
 __all__ = [
     "SharedContext",
     "ContextDecision",
+    "ContextSearchIndex",
     "ContextStore",
+    "get_context_shard_dir",
     "get_contexts_path",
 ]
 
 # Constants
-CONTEXTS_FILENAME = "CONTEXTS.json"
+CONTEXTS_FILENAME = "CONTEXTS.json"  # Listing index
+CONTEXT_SHARD_DIR = ".contexts"  # One file per context
+CONTEXT_INDEX_VERSION = "2.0"
 CONTEXT_LOCK_TIMEOUT_SECONDS = 5.0
 MAX_DECISIONS_PER_CONTEXT = 100
 MAX_FILES_PER_CONTEXT = 200
 
+# BM25 ranking parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Files changed within this window of a scan may be rewritten again with
+# the same timestamp, so such scans are not trusted for the next search
+RACY_WINDOW_NS = 50_000_000
+
 # Configure logging
 logger = get_logger(__name__)
 
@@ -93,7 +117,8 @@ class SharedContext:
         summary: Brief summary of what the context is about
         status: Current status (active, completed, archived)
         decisions: List of decisions made
-        files_touched: Files modified in this context
+        files_touched: Files modified in this context, oldest first, no duplicates
+            (read-only; use add_file)
         related_contexts: Related context IDs
         agents_involved: Agents that have contributed
         tasks: Task IDs associated with this context
@@ -110,7 +135,6 @@ class SharedContext:
     summary: str = ""
     status: str = "active"  # active, completed, archived
     decisions: list[ContextDecision] = field(default_factory=list)
-    files_touched: list[str] = field(default_factory=list)
     related_contexts: list[str] = field(default_factory=list)
     agents_involved: list[str] = field(default_factory=list)
     tasks: list[str] = field(default_factory=list)
@@ -120,6 +144,13 @@ class SharedContext:
     updated_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
     created_by: str = ""
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Ordered set backing files_touched (dicts keep insertion order)
+    _files: dict[str, None] = field(default_factory=dict, repr=False)
+
+    @property
+    def files_touched(self) -> tuple[str, ...]:
+        """Files modified in this context, oldest first, no duplicates."""
+        return tuple(self._files)
 
     def add_decision(
         self,
@@ -177,10 +208,10 @@ class SharedContext:
         if ".." in Path(normalized).parts:
             raise ValueError(f"Path traversal not allowed: {filepath}")
 
-        if normalized not in self.files_touched:
-            if len(self.files_touched) >= MAX_FILES_PER_CONTEXT:
-                self.files_touched = self.files_touched[-(MAX_FILES_PER_CONTEXT - 1) :]
-            self.files_touched.append(normalized)
+        if normalized not in self._files:
+            while len(self._files) >= MAX_FILES_PER_CONTEXT:
+                del self._files[next(iter(self._files))]
+            self._files[normalized] = None
 
         if agent_id:
             self._touch(agent_id)
@@ -245,6 +276,7 @@ class SharedContext:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         data = asdict(self)
+        data["files_touched"] = list(data.pop("_files"))
         # Convert decisions
         data["decisions"] = [
             d.to_dict() if isinstance(d, ContextDecision) else d for d in self.decisions
@@ -266,7 +298,7 @@ class SharedContext:
             summary=data.get("summary", ""),
             status=data.get("status", "active"),
             decisions=decisions,
-            files_touched=data.get("files_touched", []),
+            _files=dict.fromkeys(data.get("files_touched", [])),
             related_contexts=data.get("related_contexts", []),
             agents_involved=data.get("agents_involved", []),
             tasks=data.get("tasks", []),
@@ -279,8 +311,141 @@ class SharedContext:
         )
 
 
+def _copy_context(ctx: SharedContext) -> SharedContext:
+    """Copy a context so callers cannot mutate an indexed snapshot.
+
+    Cheaper than copy.deepcopy, which matters when returning search results.
+    """
+    return replace(
+        ctx,
+        decisions=[
+            replace(
+                d,
+                alternatives_considered=list(d.alternatives_considered),
+                metadata=copy.deepcopy(d.metadata),
+            )
+            for d in ctx.decisions
+        ],
+        _files=dict(ctx._files),
+        related_contexts=list(ctx.related_contexts),
+        agents_involved=list(ctx.agents_involved),
+        tasks=list(ctx.tasks),
+        messages=list(ctx.messages),
+        metadata=copy.deepcopy(ctx.metadata),
+    )
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric search terms."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class ContextSearchIndex:
+    """Inverted token index with BM25 ranking.
+
+    Documents are identified by any hashable key and can be added, replaced
+    or removed individually, so the index is kept current without
+    re-tokenizing everything. A query term also matches the indexed terms
+    it is a prefix of, so "auth" finds "authentication".
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._postings: dict[str, dict[Hashable, int]] = {}
+        self._doc_terms: dict[Hashable, Counter[str]] = {}
+        self._doc_lengths: dict[Hashable, int] = {}
+        self._total_length = 0
+        self._vocabulary: list[str] = []  # Sorted, for prefix lookups
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        """Check whether a document is indexed."""
+        return doc_id in self._doc_terms
+
+    def add(self, doc_id: Hashable, text: str) -> None:
+        """Index a document, replacing any previous version.
+
+        Args:
+            doc_id: Document key
+            text: Document text
+        """
+        self.remove(doc_id)
+        terms = Counter(_tokenize(text))
+        if not terms:
+            return
+
+        length = sum(terms.values())
+        self._doc_terms[doc_id] = terms
+        self._doc_lengths[doc_id] = length
+        self._total_length += length
+        for term, count in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._vocabulary, term)
+            postings[doc_id] = count
+
+    def remove(self, doc_id: Hashable) -> None:
+        """Remove a document from the index if present.
+
+        Args:
+            doc_id: Document key
+        """
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, term)]
+
+    def _expand(self, term: str) -> list[str]:
+        """Get the indexed terms starting with a query term."""
+        start = bisect.bisect_left(self._vocabulary, term)
+        end = start
+        while end < len(self._vocabulary) and self._vocabulary[end].startswith(term):
+            end += 1
+        return self._vocabulary[start:end]
+
+    def search(self, query: str, limit: int | None = None) -> list[tuple[Hashable, float]]:
+        """Rank documents against a query.
+
+        Args:
+            query: Free-text query
+            limit: Optional maximum number of results
+
+        Returns:
+            (doc_id, score) pairs, best match first
+        """
+        doc_count = len(self._doc_terms)
+        if doc_count == 0:
+            return []
+
+        average_length = self._total_length / doc_count
+        scores: dict[Hashable, float] = {}
+        for query_term in set(_tokenize(query)):
+            for term in self._expand(query_term):
+                postings = self._postings[term]
+                df = len(postings)
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                for doc_id, tf in postings.items():
+                    norm = 1 - BM25_B + BM25_B * self._doc_lengths[doc_id] / average_length
+                    weight = tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * weight
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked if limit is None else ranked[:limit]
+
+
 def get_contexts_path(project_root: Path | None = None) -> Path:
-    """Get the path to the contexts file.
+    """Get the path to the contexts index file.
 
     Args:
         project_root: Optional project root directory
@@ -292,11 +457,39 @@ def get_contexts_path(project_root: Path | None = None) -> Path:
     return root / CONTEXTS_FILENAME
 
 
+def get_context_shard_dir(project_root: Path | None = None) -> Path:
+    """Get the directory holding one file per context.
+
+    Args:
+        project_root: Optional project root directory
+
+    Returns:
+        Path to the .contexts directory
+    """
+    root = get_project_root(project_root)
+    return root / CONTEXT_SHARD_DIR
+
+
+def _index_entry(ctx: SharedContext) -> dict[str, Any]:
+    """Build the listing index entry for a context."""
+    return {"name": ctx.name, "status": ctx.status}
+
+
 class ContextStore:
     """Store for managing shared contexts.
 
     Provides thread-safe CRUD operations for contexts with
     file-based persistence.
+
+    Each context lives in its own file under .contexts/ with its own lock,
+    so agents working in different contexts never contend. CONTEXTS.json
+    is a small index of names and statuses used for listing; it is only
+    rewritten when a context is created, deleted, updated wholesale or
+    changes status.
+
+    Searches are served from an in-memory ContextSearchIndex. Writes made
+    through this store update it in place; context files changed by other
+    processes are detected by their stat and re-indexed on the next search.
     """
 
     def __init__(self, project_root: Path | None = None):
@@ -307,50 +500,262 @@ class ContextStore:
         """
         self.project_root = get_project_root(project_root)
         self.contexts_path = get_contexts_path(self.project_root)
+        self.shard_dir = get_context_shard_dir(self.project_root)
         self._lock = threading.Lock()
+        self._search_index: ContextSearchIndex | None = None
+        self._search_contexts: dict[str, SharedContext] = {}
+        self._search_files: dict[str, tuple[str, tuple[int, int, int]]] = {}
+        self._search_generation: tuple[int, int] | None = None
+        self._migrate_legacy_contexts()
 
-    def _read_contexts(self) -> dict[str, SharedContext]:
-        """Read all contexts from file.
+    def _get_shard_path(self, context_id: str) -> Path:
+        """Get the path to a context's file.
+
+        Context IDs are percent-encoded so that any ID maps to a single
+        file name inside the shard directory.
+
+        Args:
+            context_id: Context identifier
 
         Returns:
-            Dictionary mapping context_id to SharedContext
+            Path to the context's shard
         """
-        if not self.contexts_path.exists():
-            return {}
+        name = quote(context_id, safe="")
+        if name.startswith("."):
+            name = "%2E" + name[1:]
+        return self.shard_dir / f"{name}.json"
+
+    def _shard_paths(self) -> list[Path]:
+        """List the context files in the shard directory."""
+        if not self.shard_dir.exists():
+            return []
+        return sorted(self.shard_dir.glob("*.json"))
+
+    def _migrate_legacy_contexts(self) -> None:
+        """Split a single-file CONTEXTS.json from older versions into shards."""
+        if self.shard_dir.exists() or not self.contexts_path.exists():
+            return
 
         try:
-            with FileLock(self.contexts_path, timeout=CONTEXT_LOCK_TIMEOUT_SECONDS, shared=True):
-                with open(self.contexts_path, encoding="utf-8") as f:
-                    data = json.load(f)
+            with open(self.contexts_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CONTEXT_INDEX_VERSION:
+                return
+            contexts = {
+                ctx_id: SharedContext.from_dict(ctx_data)
+                for ctx_id, ctx_data in data.get("contexts", {}).items()
+            }
+        except Exception as e:
+            logger.warning(f"Could not migrate legacy contexts: {e}")
+            return
 
-                return {
-                    ctx_id: SharedContext.from_dict(ctx_data)
-                    for ctx_id, ctx_data in data.get("contexts", {}).items()
-                }
+        with self._lock:
+            self._write_contexts(contexts)
+        logger.info(f"Migrated {len(contexts)} context(s) to {self.shard_dir}")
 
+    def _read_shard(self, path: Path) -> SharedContext | None:
+        """Parse a context file (caller holds its lock).
+
+        Returns:
+            SharedContext, or None if the file is missing, empty or invalid
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        if not content:
+            return None
+        try:
+            return SharedContext.from_dict(json.loads(content))
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Invalid context data in {path.name}: {e}")
+            return None
+
+    def _write_shard(self, path: Path, ctx: SharedContext) -> None:
+        """Atomically write a context file (caller holds its lock).
+
+        Also refreshes the context in the search index, if one is built.
+        """
+        data = ctx.to_dict()
+        temp_path = path.with_suffix(".json.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        temp_path.replace(path)
+
+        if self._search_index is not None:
+            stat = path.stat()
+            # Index a fresh copy that callers' objects cannot alias
+            self._index_context(ctx.context_id, SharedContext.from_dict(data))
+            self._search_files[path.name] = (
+                ctx.context_id,
+                (stat.st_ino, stat.st_mtime_ns, stat.st_size),
+            )
+
+    def _load_shard(self, path: Path) -> SharedContext | None:
+        """Read a context file under a shared lock.
+
+        Args:
+            path: Path to the context's shard
+
+        Returns:
+            SharedContext if stored and readable, None otherwise
+        """
+        try:
+            with FileLock(path, timeout=CONTEXT_LOCK_TIMEOUT_SECONDS, shared=True):
+                return self._read_shard(path)
         except FileLockTimeout:
-            logger.error(f"Timeout acquiring lock on {self.contexts_path}")
-            return {}
+            logger.error(f"Timeout acquiring lock on {path}")
+            return None
         except Exception as e:
-            logger.warning(f"Error reading contexts: {e}")
+            logger.warning(f"Error reading context file {path.name}: {e}")
+            return None
+
+    def _load_context(self, context_id: str) -> SharedContext | None:
+        """Read one context.
+
+        Args:
+            context_id: Context identifier
+
+        Returns:
+            SharedContext if found, None otherwise
+        """
+        path = self._get_shard_path(context_id)
+        if not path.exists():
+            return None
+        return self._load_shard(path)
+
+    def _put_context(self, ctx: SharedContext) -> None:
+        """Write a context, replacing any stored version, and index it.
+
+        Args:
+            ctx: Context to store
+        """
+        path = self._get_shard_path(ctx.context_id)
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            try:
+                with FileLock(path, timeout=CONTEXT_LOCK_TIMEOUT_SECONDS, shared=False):
+                    self._write_shard(path, ctx)
+                    self._update_index({ctx.context_id: ctx})
+            except FileLockTimeout:
+                logger.error(f"Timeout acquiring write lock on {path}")
+                raise
+
+    def _update_context(
+        self,
+        context_id: str,
+        update: Callable[[SharedContext], None],
+        reindex: bool = False,
+    ) -> SharedContext | None:
+        """Read-modify-write one context under its own lock.
+
+        Args:
+            context_id: Context identifier
+            update: Function applied to the context in place
+            reindex: Whether the change affects the listing index entry
+
+        Returns:
+            Updated SharedContext, or None if the context does not exist
+        """
+        path = self._get_shard_path(context_id)
+        if not path.exists():
+            return None
+
+        with self._lock:
+            try:
+                with FileLock(path, timeout=CONTEXT_LOCK_TIMEOUT_SECONDS, shared=False):
+                    ctx = self._read_shard(path)
+                    if ctx is None:
+                        return None
+                    update(ctx)
+                    self._write_shard(path, ctx)
+                    if reindex:
+                        self._update_index({context_id: ctx})
+            except FileLockTimeout:
+                logger.error(f"Timeout acquiring write lock on {path}")
+                raise
+
+        return ctx
+
+    def _read_index(self) -> dict[str, dict[str, Any]]:
+        """Read the listing index.
+
+        Rebuilds the index from the context files if it is missing or
+        outdated.
+
+        Returns:
+            Dictionary mapping context_id to its index entry
+        """
+        if self.contexts_path.exists():
+            try:
+                with FileLock(
+                    self.contexts_path, timeout=CONTEXT_LOCK_TIMEOUT_SECONDS, shared=True
+                ):
+                    with open(self.contexts_path, encoding="utf-8") as f:
+                        content = f.read()
+                if content:
+                    data = json.loads(content)
+                    if data.get("version") == CONTEXT_INDEX_VERSION:
+                        return data.get("contexts", {})
+            except FileLockTimeout:
+                logger.error(f"Timeout acquiring lock on {self.contexts_path}")
+                return {}
+            except Exception as e:
+                logger.warning(f"Error reading contexts index: {e}")
+
+        contexts = self._read_contexts()
+        if not contexts:
             return {}
+        with self._lock:
+            self._update_index(contexts, replace=True)
+        return {ctx_id: _index_entry(ctx) for ctx_id, ctx in contexts.items()}
 
-    def _write_contexts(self, contexts: dict[str, SharedContext]) -> None:
-        """Write all contexts to file.
+    def _update_index(
+        self,
+        contexts: dict[str, SharedContext | None],
+        replace: bool = False,
+    ) -> None:
+        """Write index entries for the given contexts.
+
+        A missing or outdated index is left for _read_index to rebuild from
+        the context files, so this never reads shards under the index lock.
 
         Args:
-            contexts: Dictionary mapping context_id to SharedContext
+            contexts: Changed contexts, None for deleted ones
+            replace: Drop entries for contexts not in ``contexts``
         """
         self.contexts_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
-            "version": "1.0",
-            "updated_at": datetime.now(UTC).isoformat(),
-            "contexts": {ctx_id: ctx.to_dict() for ctx_id, ctx in contexts.items()},
-        }
-
         try:
             with FileLock(self.contexts_path, timeout=CONTEXT_LOCK_TIMEOUT_SECONDS, shared=False):
+                index: dict[str, dict[str, Any]] | None = {} if replace else None
+                if index is None and self.contexts_path.exists():
+                    with open(self.contexts_path, encoding="utf-8") as f:
+                        content = f.read()
+                    if content:
+                        data = json.loads(content)
+                        if data.get("version") == CONTEXT_INDEX_VERSION:
+                            index = data.get("contexts", {})
+                if index is None:
+                    # No usable index: only start a new one if no other context exists
+                    written = {self._get_shard_path(ctx_id).name for ctx_id in contexts}
+                    if any(path.name not in written for path in self._shard_paths()):
+                        return
+                    index = {}
+
+                for ctx_id, ctx in contexts.items():
+                    if ctx is None:
+                        index.pop(ctx_id, None)
+                    else:
+                        index[ctx_id] = _index_entry(ctx)
+
+                data = {
+                    "version": CONTEXT_INDEX_VERSION,
+                    "updated_at": datetime.now(UTC).isoformat(),
+                    "contexts": index,
+                }
                 temp_path = self.contexts_path.with_suffix(".json.tmp")
                 with open(temp_path, "w", encoding="utf-8") as f:
                     json.dump(data, f, indent=2)
@@ -359,10 +764,56 @@ class ContextStore:
         except FileLockTimeout:
             logger.error(f"Timeout acquiring write lock on {self.contexts_path}")
             raise
+        except Exception as e:
+            logger.error(f"Error writing contexts index: {e}")
+            raise
+
+    def _read_contexts(self) -> dict[str, SharedContext]:
+        """Read all contexts from their files.
+
+        Returns:
+            Dictionary mapping context_id to SharedContext
+        """
+        contexts = {}
+        for path in self._shard_paths():
+            ctx = self._load_shard(path)
+            if ctx is not None:
+                contexts[ctx.context_id] = ctx
+        return contexts
+
+    def _write_contexts(self, contexts: dict[str, SharedContext]) -> None:
+        """Replace all contexts.
+
+        Files of contexts not in ``contexts`` are removed.
+
+        Args:
+            contexts: Dictionary mapping context_id to SharedContext
+        """
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        # Bulk rewrite: rebuild the search index on the next search
+        self._search_index = None
+
+        try:
+            paths = set()
+            for ctx_id, ctx in contexts.items():
+                path = self._get_shard_path(ctx_id)
+                paths.add(path)
+                with FileLock(path, timeout=CONTEXT_LOCK_TIMEOUT_SECONDS, shared=False):
+                    self._write_shard(path, ctx)
+
+            for path in self._shard_paths():
+                if path not in paths:
+                    path.unlink(missing_ok=True)
+
+        except FileLockTimeout:
+            logger.error(f"Timeout acquiring write lock in {self.shard_dir}")
+            raise
         except Exception as e:
             logger.error(f"Error writing contexts: {e}")
             raise
 
+        self._update_index(contexts, replace=True)
+
     def create_context(
         self,
         name: str,
@@ -397,10 +848,7 @@ class ContextStore:
             related_contexts=related_contexts or [],
         )
 
-        with self._lock:
-            contexts = self._read_contexts()
-            contexts[context_id] = ctx
-            self._write_contexts(contexts)
+        self._put_context(ctx)
 
         logger.info(f"Created context {context_id}: {name}")
         return ctx
@@ -414,8 +862,7 @@ class ContextStore:
         Returns:
             SharedContext if found, None otherwise
         """
-        contexts = self._read_contexts()
-        return contexts.get(context_id)
+        return self._load_context(context_id)
 
     def update_context(self, context: SharedContext) -> None:
         """Update a context.
@@ -424,11 +871,7 @@ class ContextStore:
             context: Context to update
         """
         context.updated_at = datetime.now(UTC).isoformat()
-
-        with self._lock:
-            contexts = self._read_contexts()
-            contexts[context.context_id] = context
-            self._write_contexts(contexts)
+        self._put_context(context)
 
     def delete_context(self, context_id: str) -> bool:
         """Delete a context.
@@ -439,14 +882,25 @@ class ContextStore:
         Returns:
             True if deleted, False if not found
         """
-        with self._lock:
-            contexts = self._read_contexts()
-
-            if context_id not in contexts:
-                return False
+        path = self._get_shard_path(context_id)
+        if not path.exists():
+            return False
 
-            del contexts[context_id]
-            self._write_contexts(contexts)
+        with self._lock:
+            try:
+                with FileLock(path, timeout=CONTEXT_LOCK_TIMEOUT_SECONDS, shared=False):
+                    if self._read_shard(path) is None:
+                        path.unlink(missing_ok=True)
+                        return False
+                    path.unlink()
+                    self._update_index({context_id: None})
+            except FileLockTimeout:
+                logger.error(f"Timeout acquiring write lock on {path}")
+                raise
+
+            if self._search_index is not None:
+                self._index_context(context_id, None)
+                self._search_files.pop(path.name, None)
 
         logger.info(f"Deleted context {context_id}")
         return True
@@ -459,6 +913,9 @@ class ContextStore:
     ) -> list[SharedContext]:
         """List contexts with optional filtering.
 
+        The status filters are applied to the index first, so only the
+        files of matching contexts are read.
+
         Args:
             status: Filter by status
             agent_id: Filter by involved agent
@@ -467,8 +924,16 @@ class ContextStore:
         Returns:
             List of matching contexts
         """
-        contexts = self._read_contexts()
-        result = list(contexts.values())
+        result = []
+        for ctx_id, entry in self._read_index().items():
+            entry_status = entry.get("status")
+            if status is not None and entry_status != status:
+                continue
+            if not include_archived and entry_status == "archived":
+                continue
+            ctx = self._load_context(ctx_id)
+            if ctx is not None:
+                result.append(ctx)
 
         if status is not None:
             result = [c for c in result if c.status == status]
@@ -512,18 +977,14 @@ class ContextStore:
         Returns:
             Created ContextDecision or None if context not found
         """
-        with self._lock:
-            contexts = self._read_contexts()
-
-            if context_id not in contexts:
-                return None
-
-            ctx = contexts[context_id]
-            ctx_decision = ctx.add_decision(decision, by, reason, alternatives)
-            self._write_contexts(contexts)
+        ctx = self._update_context(
+            context_id, lambda c: c.add_decision(decision, by, reason, alternatives)
+        )
+        if ctx is None:
+            return None
 
         logger.debug(f"Added decision to context {context_id}: {decision[:50]}...")
-        return ctx_decision
+        return ctx.decisions[-1]
 
     def touch_file(
         self,
@@ -541,17 +1002,8 @@ class ContextStore:
         Returns:
             True if recorded, False if context not found
         """
-        with self._lock:
-            contexts = self._read_contexts()
-
-            if context_id not in contexts:
-                return False
-
-            ctx = contexts[context_id]
-            ctx.add_file(filepath, agent_id)
-            self._write_contexts(contexts)
-
-        return True
+        ctx = self._update_context(context_id, lambda c: c.add_file(filepath, agent_id))
+        return ctx is not None
 
     def link_contexts(self, context_id: str, related_id: str) -> bool:
         """Link two contexts as related.
@@ -565,17 +1017,17 @@ class ContextStore:
         Returns:
             True if linked, False if either context not found
         """
-        with self._lock:
-            contexts = self._read_contexts()
-
-            if context_id not in contexts or related_id not in contexts:
-                return False
-
-            contexts[context_id].add_related_context(related_id)
-            contexts[related_id].add_related_context(context_id)
-            self._write_contexts(contexts)
-
-        return True
+        if not (
+            self._get_shard_path(context_id).exists() and self._get_shard_path(related_id).exists()
+        ):
+            return False
+
+        if self._update_context(context_id, lambda c: c.add_related_context(related_id)) is None:
+            return False
+        return (
+            self._update_context(related_id, lambda c: c.add_related_context(context_id))
+            is not None
+        )
 
     def get_or_create_context(
         self,
@@ -622,14 +1074,9 @@ class ContextStore:
         Returns:
             True if completed, False if not found
         """
-        with self._lock:
-            contexts = self._read_contexts()
-
-            if context_id not in contexts:
-                return False
-
-            contexts[context_id].complete(by, summary)
-            self._write_contexts(contexts)
+        ctx = self._update_context(context_id, lambda c: c.complete(by, summary), reindex=True)
+        if ctx is None:
+            return False
 
         logger.info(f"Completed context {context_id}")
         return True
@@ -643,44 +1090,166 @@ class ContextStore:
         Returns:
             True if archived, False if not found
         """
-        with self._lock:
-            contexts = self._read_contexts()
-
-            if context_id not in contexts:
-                return False
-
-            contexts[context_id].archive()
-            self._write_contexts(contexts)
+        ctx = self._update_context(context_id, lambda c: c.archive(), reindex=True)
+        if ctx is None:
+            return False
 
         logger.info(f"Archived context {context_id}")
         return True
 
+    def _index_context(self, context_id: str, ctx: SharedContext | None) -> None:
+        """Replace a context's documents in the search index.
+
+        The context is indexed as one document for its name, summary and
+        notes plus one document per decision.
+
+        Args:
+            context_id: Context identifier
+            ctx: Context owned by the index, or None if it was deleted
+        """
+        index = self._search_index
+        old = self._search_contexts.pop(context_id, None)
+        if old is not None:
+            index.remove((context_id, None))
+            for position in range(len(old.decisions)):
+                index.remove((context_id, position))
+
+        if ctx is None:
+            return
+
+        self._search_contexts[context_id] = ctx
+        index.add((context_id, None), " ".join((ctx.name, ctx.summary, ctx.notes)))
+        for position, decision in enumerate(ctx.decisions):
+            text = " ".join((decision.decision, decision.reason, *decision.alternatives_considered))
+            index.add((context_id, position), text)
+
+    def _get_search_index(self) -> tuple[ContextSearchIndex, dict[str, SharedContext]]:
+        """Get the search index, re-indexing context files that changed.
+
+        Every write replaces a context file inside the shard directory,
+        which changes the directory's mtime. Only when it differs from the
+        last scan are the files stat'ed, and only changed ones are re-read.
+
+        Returns:
+            (index, contexts the index was built from)
+        """
+        # Stat before scanning so a concurrent write invalidates this scan
+        try:
+            stat = self.shard_dir.stat()
+            generation = (stat.st_ino, stat.st_mtime_ns)
+        except FileNotFoundError:
+            generation = None
+
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = ContextSearchIndex()
+                self._search_contexts = {}
+                self._search_files = {}
+            elif generation is not None and generation == self._search_generation:
+                return self._search_index, self._search_contexts
+
+            scanned = {}
+            if generation is not None:
+                with os.scandir(self.shard_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json"):
+                            file_stat = entry.stat()
+                            scanned[entry.name] = (
+                                file_stat.st_ino,
+                                file_stat.st_mtime_ns,
+                                file_stat.st_size,
+                            )
+
+            for name in [name for name in self._search_files if name not in scanned]:
+                self._index_context(self._search_files.pop(name)[0], None)
+
+            for name, file_generation in scanned.items():
+                known = self._search_files.get(name)
+                if known is not None and known[1] == file_generation:
+                    continue
+                ctx = self._load_shard(self.shard_dir / name)
+                if known is not None:
+                    self._index_context(known[0], None)
+                    del self._search_files[name]
+                if ctx is not None:
+                    self._index_context(ctx.context_id, ctx)
+                    self._search_files[name] = (ctx.context_id, file_generation)
+
+            # A write in the same timestamp tick as this scan would leave the
+            # mtime unchanged, so only trust scans of settled directories
+            if generation is not None and time.time_ns() - generation[1] < RACY_WINDOW_NS:
+                generation = None
+            self._search_generation = generation
+            return self._search_index, self._search_contexts
+
     def search_contexts(
         self,
         query: str,
         include_archived: bool = False,
+        limit: int | None = None,
     ) -> list[SharedContext]:
         """Search contexts by query.
 
-        Searches in name, summary, and notes.
+        Searches in name, summary, notes and decisions. Results are ranked
+        by BM25 relevance, summed over the context and its decisions, with
+        ties broken by most recent update.
 
         Args:
             query: Search query (case-insensitive)
             include_archived: Include archived contexts
+            limit: Optional maximum number of results
 
         Returns:
-            List of matching contexts
+            List of matching contexts, best match first
         """
-        query_lower = query.lower()
-        contexts = self.list_contexts(include_archived=include_archived)
+        index, contexts = self._get_search_index()
 
-        return [
-            c
-            for c in contexts
-            if query_lower in c.name.lower()
-            or query_lower in c.summary.lower()
-            or query_lower in c.notes.lower()
-        ]
+        scores: dict[str, float] = {}
+        for (context_id, _), score in index.search(query):
+            if include_archived or contexts[context_id].status != "archived":
+                scores[context_id] = scores.get(context_id, 0.0) + score
+
+        ranked = sorted(
+            scores,
+            key=lambda context_id: (scores[context_id], contexts[context_id].updated_at),
+            reverse=True,
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [_copy_context(contexts[context_id]) for context_id in ranked]
+
+    def search_decisions(
+        self,
+        query: str,
+        include_archived: bool = False,
+        limit: int | None = 10,
+    ) -> list[tuple[str, ContextDecision]]:
+        """Search decisions across contexts.
+
+        Matches decision text, reasons and alternatives considered, so
+        agents can find earlier decisions before redoing the work.
+
+        Args:
+            query: Search query (case-insensitive)
+            include_archived: Include decisions from archived contexts
+            limit: Optional maximum number of results
+
+        Returns:
+            (context_id, decision) pairs, best match first
+        """
+        index, contexts = self._get_search_index()
+
+        results = []
+        for (context_id, position), _ in index.search(query):
+            if position is None:
+                continue
+            ctx = contexts[context_id]
+            if not include_archived and ctx.status == "archived":
+                continue
+            results.append((context_id, copy.deepcopy(ctx.decisions[position])))
+            if limit is not None and len(results) >= limit:
+                break
+        return results
 
     def get_context_summary(self, context_id: str) -> dict[str, Any] | None:
         """Get a summary of a context.
@@ -13,7 +13,14 @@ communicate their current work, blockers, and coordination needs.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import random
+import re
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -40,6 +47,59 @@ __all__ = [
 COORDINATION_FILENAME = "COORDINATION.md"
 LOCK_TIMEOUT = 10  # seconds
 
+# Writers queue behind the current COORDINATION.md lock holder for up to
+# this long (kept below LOCK_TIMEOUT, after which the holder's lock would be
+# treated as stale), polling with jittered exponential backoff
+LOCK_WAIT_SECONDS = 5.0
+LOCK_WAIT_INITIAL_DELAY_SECONDS = 0.01
+LOCK_WAIT_MAX_DELAY_SECONDS = 0.25
+
+# Level-2 headers (## Section Name) start a section
+_SECTION_HEADER = re.compile(rb"^## ", re.MULTILINE)
+
+
+@dataclass
+class _PendingAppend:
+    """Lines waiting to be appended to a section by the next writer."""
+
+    section_name: str
+    lines: list[str]
+    done: bool = False
+    error: BaseException | None = None
+
+
+@dataclass
+class _WriteQueue:
+    """Per-file write serialization and append coalescing for one process.
+
+    Threads share an agent ID, which the lock manager lets through, so
+    writer serializes them. Whichever thread holds writer applies every
+    append queued so far in a single write.
+    """
+
+    writer: threading.Lock = field(default_factory=threading.Lock)
+    mutex: threading.Lock = field(default_factory=threading.Lock)
+    pending: list[_PendingAppend] = field(default_factory=list)
+
+
+_write_queues: dict[Path, _WriteQueue] = {}
+_write_queues_lock = threading.Lock()
+
+
+def _get_write_queue(filepath: Path) -> _WriteQueue:
+    """Get the process-wide write queue for a coordination file."""
+    key = filepath.resolve()
+    with _write_queues_lock:
+        if key not in _write_queues:
+            _write_queues[key] = _WriteQueue()
+        return _write_queues[key]
+
+
+def _lock_wait_delay(attempt: int) -> float:
+    """Backoff delay before the next lock attempt, with ±25% jitter."""
+    delay = min(LOCK_WAIT_INITIAL_DELAY_SECONDS * (2**attempt), LOCK_WAIT_MAX_DELAY_SECONDS)
+    return delay * (0.75 + 0.5 * random.random())
+
 
 @dataclass
 class CoordinationSection:
@@ -70,6 +130,7 @@ class CoordinationFile:
         project_root: Path | None = None,
         agent_id: str | None = None,
         lock_manager: LockManager | None = None,
+        lock_wait: float = LOCK_WAIT_SECONDS,
     ):
         """Initialize the coordination file manager.
 
@@ -77,12 +138,21 @@ class CoordinationFile:
             project_root: Root directory of the project (defaults to current directory)
             agent_id: Unique identifier of the agent (required for locking)
             lock_manager: Custom lock manager instance (creates default if not provided)
+            lock_wait: Seconds to wait for another agent's lock before giving up
         """
         self.project_root = project_root or Path.cwd()
         self.filepath = self.project_root / COORDINATION_FILENAME
         self.agent_id = agent_id or "default-agent"
         self.lock_manager = lock_manager or LockManager(project_root=self.project_root)
 
+        self.lock_wait = lock_wait
+        self._queue = _get_write_queue(self.filepath)
+
+        # Section name -> (content start, content end) byte span, valid for
+        # the file identified by the (inode, mtime_ns, size) key
+        self._section_index_key: tuple[int, int, int] | None = None
+        self._section_index: dict[str, tuple[int, int]] = {}
+
     @staticmethod
     def get_template(project_name: str = "Project") -> str:
         """Generate the coordination file template.
@@ -219,6 +289,122 @@ class CoordinationFile:
 
         return "\n".join(result)
 
+    @staticmethod
+    def _scan_sections(data: bytes) -> dict[str, tuple[int, int]]:
+        """Find the byte span of every section's content.
+
+        Mirrors _parse_sections: a section runs from the line after its
+        header to the next level-2 header, and a repeated name keeps the
+        last occurrence.
+
+        Args:
+            data: Raw file content
+
+        Returns:
+            Dictionary mapping section names to (start, end) byte offsets
+        """
+        spans: dict[str, tuple[int, int]] = {}
+        headers = list(_SECTION_HEADER.finditer(data))
+        for i, match in enumerate(headers):
+            line_end = data.find(b"\n", match.start())
+            if line_end == -1:
+                line_end = len(data)
+            name = data[match.end() : line_end].decode("utf-8").strip()
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(data)
+            spans[name] = (min(line_end + 1, len(data)), end)
+        return spans
+
+    def _read_indexed(self) -> tuple[bytes, dict[str, tuple[int, int]]]:
+        """Read the file with its section span map.
+
+        The span map is cached and only rebuilt when the file changes.
+
+        Returns:
+            Tuple of (raw content, section name -> content byte span)
+
+        Raises:
+            FileNotFoundError: If coordination file doesn't exist
+        """
+        try:
+            with open(self.filepath, "rb") as f:
+                stat = os.fstat(f.fileno())
+                data = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Coordination file not found at {self.filepath}. " "Call init_file() first."
+            ) from None
+
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if key != self._section_index_key:
+            self._section_index = self._scan_sections(data)
+            self._section_index_key = key
+        return data, self._section_index
+
+    def _write_indexed(self, data: bytes, spans: dict[str, tuple[int, int]]) -> None:
+        """Write the file atomically and cache its section span map.
+
+        Args:
+            data: New raw content
+            spans: Section spans of the new content
+        """
+        atomic_write(self.filepath, data.decode("utf-8"))
+        stat = self.filepath.stat()
+        self._section_index = spans
+        self._section_index_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _acquire_file_lock(self, reason: str, deadline: float) -> None:
+        """Acquire the COORDINATION.md lock, queuing behind its holder.
+
+        Args:
+            reason: Reason for the update (for lock tracking)
+            deadline: time.monotonic() value after which to give up
+
+        Raises:
+            RuntimeError: If lock cannot be acquired before the deadline
+        """
+        attempt = 0
+        while True:
+            success, conflict = self.lock_manager.acquire_lock(
+                str(self.filepath), self.agent_id, reason=reason, timeout=LOCK_TIMEOUT
+            )
+            if success:
+                return
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError(
+                    f"Cannot acquire lock on {self.filepath} within {self.lock_wait}s. "
+                    f"Locked by {conflict.current_holder if conflict else 'unknown'}: "
+                    f"{conflict.reason if conflict else 'unknown reason'}"
+                )
+            time.sleep(min(_lock_wait_delay(attempt), remaining))
+            attempt += 1
+
+    @contextmanager
+    def _locked(self, reason: str) -> Iterator[None]:
+        """Hold the COORDINATION.md lock for the duration of the block.
+
+        Waits up to lock_wait seconds for other threads and agents.
+
+        Args:
+            reason: Reason for the update (for lock tracking)
+
+        Raises:
+            RuntimeError: If lock cannot be acquired before the deadline
+        """
+        deadline = time.monotonic() + self.lock_wait
+        if not self._queue.writer.acquire(timeout=max(self.lock_wait, 0)):
+            raise RuntimeError(f"Cannot acquire lock on {self.filepath} within {self.lock_wait}s")
+        try:
+            self._acquire_file_lock(reason, deadline)
+            try:
+                yield
+            finally:
+                # Always release lock
+                self.lock_manager.release_lock(str(self.filepath), self.agent_id)
+        finally:
+            self._queue.writer.release()
+
     def read_file(self) -> str:
         """Read the coordination file content.
 
@@ -245,13 +431,16 @@ class CoordinationFile:
             Section content as string, or None if section doesn't exist
         """
         try:
-            content = self.read_file()
-            sections = self._parse_sections(content)
-            section = sections.get(section_name)
-            return section.content if section else None
+            data, spans = self._read_indexed()
         except FileNotFoundError:
             return None
 
+        span = spans.get(section_name)
+        if span is None:
+            return None
+        start, end = span
+        return data[start:end].decode("utf-8").strip()
+
     def update_section(
         self, section_name: str, new_content: str, reason: str = "updating section"
     ) -> bool:
@@ -269,19 +458,7 @@ class CoordinationFile:
             FileNotFoundError: If coordination file doesn't exist
             RuntimeError: If lock cannot be acquired
         """
-        # Acquire lock
-        success, conflict = self.lock_manager.acquire_lock(
-            str(self.filepath), self.agent_id, reason=reason, timeout=LOCK_TIMEOUT
-        )
-
-        if not success:
-            raise RuntimeError(
-                f"Cannot acquire lock on {self.filepath}. "
-                f"Locked by {conflict.current_holder if conflict else 'unknown'}: "
-                f"{conflict.reason if conflict else 'unknown reason'}"
-            )
-
-        try:
+        with self._locked(reason):
             # Read current content
             content = self.read_file()
 
@@ -304,10 +481,6 @@ class CoordinationFile:
             atomic_write(self.filepath, new_file_content)
             return True
 
-        finally:
-            # Always release lock
-            self.lock_manager.release_lock(str(self.filepath), self.agent_id)
-
     def append_to_section(self, section_name: str, line: str, reason: str = "appending") -> bool:
         """Append a line to a section atomically.
 
@@ -319,13 +492,134 @@ class CoordinationFile:
         Returns:
             True if append succeeded, False otherwise
         """
-        current_content = self.get_section(section_name) or ""
-        if current_content:
-            new_content = f"{current_content}\n{line}"
-        else:
-            new_content = line
+        return self.append_lines(section_name, [line], reason=reason)
 
-        return self.update_section(section_name, new_content, reason=reason)
+    def append_lines(
+        self, section_name: str, lines: Sequence[str], reason: str = "appending"
+    ) -> bool:
+        """Append lines to a section with one locked read and write.
+
+        Only the target section's byte span is spliced; the rest of the file
+        is written back untouched. A missing section is added at the end.
+
+        Appends queued by other threads of this process while the lock is
+        busy are coalesced: the next writer applies all of them in a single
+        write.
+
+        Args:
+            section_name: Name of the section
+            lines: Lines to append, in order
+            reason: Reason for the update (for lock tracking)
+
+        Returns:
+            True if append succeeded, False otherwise
+
+        Raises:
+            FileNotFoundError: If coordination file doesn't exist
+            RuntimeError: If lock cannot be acquired before the deadline
+        """
+        if not lines:
+            return True
+
+        queue = self._queue
+        entry = _PendingAppend(section_name, list(lines))
+        with queue.mutex:
+            queue.pending.append(entry)
+
+        try:
+            deadline = time.monotonic() + self.lock_wait
+            if not queue.writer.acquire(timeout=max(self.lock_wait, 0)):
+                raise RuntimeError(
+                    f"Cannot acquire lock on {self.filepath} within {self.lock_wait}s"
+                )
+            try:
+                # An earlier writer may have applied this append already, in
+                # which case the file lock is not needed at all
+                if not entry.done:
+                    self._acquire_file_lock(reason, deadline)
+                    try:
+                        self._flush_pending()
+                    finally:
+                        self.lock_manager.release_lock(str(self.filepath), self.agent_id)
+            finally:
+                queue.writer.release()
+        except RuntimeError:
+            if not entry.done:
+                with queue.mutex:
+                    if entry in queue.pending:
+                        queue.pending.remove(entry)
+                raise
+            # Otherwise another writer applied it; report that outcome
+
+        if entry.error is not None:
+            raise entry.error
+        return True
+
+    def _flush_pending(self) -> None:
+        """Apply every queued append. Caller must hold the lock."""
+        queue = self._queue
+        with queue.mutex:
+            batch, queue.pending = queue.pending, []
+        try:
+            self._apply_appends(batch)
+        except BaseException as e:
+            for pending in batch:
+                pending.error = e
+            raise
+        finally:
+            for pending in batch:
+                pending.done = True
+
+    def _apply_appends(self, batch: list[_PendingAppend]) -> None:
+        """Splice a batch of appends into the file with one write.
+
+        Lines for the same section keep their queue order. Caller must hold
+        the lock.
+
+        Args:
+            batch: Queued appends to apply
+        """
+        by_section: dict[str, list[str]] = {}
+        for pending in batch:
+            by_section.setdefault(pending.section_name, []).extend(pending.lines)
+
+        data, spans = self._read_indexed()
+        for section_name, lines in by_section.items():
+            data = self._splice_lines(data, spans.get(section_name), section_name, lines)
+            spans = self._scan_sections(data)
+        self._write_indexed(data, spans)
+
+    @staticmethod
+    def _splice_lines(
+        data: bytes, span: tuple[int, int] | None, section_name: str, lines: list[str]
+    ) -> bytes:
+        """Insert lines at the end of a section's content.
+
+        Args:
+            data: Raw file content
+            span: Section content byte span, or None to add the section
+            section_name: Name of the section
+            lines: Lines to append
+
+        Returns:
+            New raw content
+        """
+        text = "\n".join(lines).encode("utf-8")
+        if span is None:
+            return (
+                data.rstrip() + b"\n\n## " + section_name.encode("utf-8") + b"\n\n" + text + b"\n"
+            )
+
+        start, end = span
+        region = data[start:end]
+        body = region.rstrip()
+        if body.strip():
+            new_region = body + b"\n" + text + region[len(body) :]
+        else:
+            # Empty section; the header may be the last line without a newline
+            lead = b"\n" if start == len(data) and not data.endswith(b"\n") else b""
+            new_region = lead + b"\n" + text + (b"\n\n" if end < len(data) else b"\n")
+        return data[:start] + new_region + data[end:]
 
 
 # Module-level convenience functions using default instance
@@ -494,16 +788,18 @@ def get_decisions(project_root: Path | None = None) -> list[str]:
 
 def add_current_work(
     agent: str,
-    task: str,
+    task: str | Sequence[str],
     status: str = "In Progress",
     agent_id: str | None = None,
     project_root: Path | None = None,
 ) -> bool:
-    """Add a new work item to the Current Work table.
+    """Add work items to the Current Work table.
+
+    Several tasks are added as one row each, with a single locked write.
 
     Args:
         agent: Agent name
-        task: Task description
+        task: Task description, or several task descriptions
         status: Task status (default: "In Progress")
         agent_id: Agent identifier for locking
         project_root: Root directory of the project
@@ -512,13 +808,14 @@ def add_current_work(
         True if added successfully
     """
     today = datetime.now(UTC).strftime("%Y-%m-%d")
-    new_row = f"| {agent} | {task} | {status} | {today} |"
+    tasks = [task] if isinstance(task, str) else task
+    new_rows = [f"| {agent} | {item} | {status} | {today} |" for item in tasks]
 
     coord = _get_default_coordination(project_root=project_root)
     if agent_id:
         coord.agent_id = agent_id
 
-    return coord.append_to_section("Current Work", new_row, reason="adding work item")
+    return coord.append_lines("Current Work", new_rows, reason="adding work item")
 
 
 def add_blocked_item(
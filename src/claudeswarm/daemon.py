@@ -0,0 +1,485 @@
+"""Optional persistent swarm daemon (claudeswarmd).
+
+Every claudeswarm invocation otherwise starts a fresh interpreter, re-reads
+the registry, message log and lock directory, and throws its caches away on
+exit. claudeswarmd keeps one process per project that holds:
+- The agent registry, reloaded only when ACTIVE_AGENTS.json changes
+- A per-recipient index of agent_messages.log, tailed incrementally
+- Read cursors (last_read_messages.json) for check-messages --new-only
+- A LockManager and MessagingSystem (rate limits survive between commands)
+
+The CLI reaches it over a Unix domain socket speaking the JSON-lines
+protocol described in claudeswarm.daemon_client, and falls back to direct
+file access whenever the daemon is not running. All state still lives in
+the usual files, so daemon and direct clients can be mixed freely.
+
+The daemon also processes pending ACK retries in the background, which
+the check-messages hook would otherwise do on every call.
+
+Example usage:
+    $ claudeswarmd                # serve the current project (foreground)
+    $ claudeswarmd --status       # check whether a daemon is running
+    $ claudeswarmd --stop         # ask the running daemon to exit
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .ack import AckSystem
+from .daemon_client import DaemonError, daemon_request
+from .locking import LockManager
+from .logging_config import get_logger, setup_logging
+from .messaging import MessageType, MessagingSystem
+from .project import (
+    get_active_agents_path,
+    get_daemon_socket_path,
+    get_messages_log_path,
+    get_project_root,
+)
+from .validators import validate_agent_id, validate_tmux_pane_id
+
+__all__ = [
+    "SwarmDaemon",
+    "main",
+]
+
+# Constants
+PROTOCOL_VERSION = 1
+MAX_REQUEST_BYTES = 1024 * 1024  # Longest accepted request line
+MAX_INDEXED_MESSAGES_PER_RECIPIENT = 1000
+ACK_RETRY_INTERVAL_SECONDS = 5.0
+
+# Configure logging
+logger = get_logger(__name__)
+
+
+class _MessageIndex:
+    """Per-recipient view of agent_messages.log with read cursors.
+
+    The log is tailed from the last offset on every query and replayed from
+    the start only when it was rotated or truncated, mirroring what
+    check-messages sees when it reads the whole file.
+    """
+
+    def __init__(self, log_path: Path, last_read_path: Path):
+        self.log_path = log_path
+        self.last_read_path = last_read_path
+        self._lock = threading.Lock()
+        self._inode: int | None = None
+        self._offset = 0
+        self._seq = 0
+        self._by_recipient: dict[str, deque[tuple[int, dict[str, Any]]]] = {}
+        self._last_read: dict[str, str] = {}
+        self._last_read_stamp: tuple[int, int] | None = None
+
+    def _reset(self) -> None:
+        self._inode = None
+        self._offset = 0
+        self._by_recipient.clear()
+
+    def _refresh(self) -> bool:
+        """Index messages appended since the last query (caller holds the lock).
+
+        Returns:
+            True if the log exists
+        """
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            self._reset()
+            return False
+
+        with f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                self._reset()
+                self._inode = stat.st_ino
+            if stat.st_size == self._offset:
+                return True
+            f.seek(self._offset)
+            data = f.read(stat.st_size - self._offset)
+
+        # A trailing partial line is an append still in progress
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            try:
+                msg = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(msg, dict):
+                continue
+            self._seq += 1
+            for recipient in set(msg.get("recipients") or ()):
+                self._by_recipient.setdefault(
+                    recipient, deque(maxlen=MAX_INDEXED_MESSAGES_PER_RECIPIENT)
+                ).append((self._seq, msg))
+        self._offset += complete
+        return True
+
+    def _load_last_read(self) -> None:
+        """Reload read cursors if another process changed the file."""
+        try:
+            stat = self.last_read_path.stat()
+        except FileNotFoundError:
+            self._last_read, self._last_read_stamp = {}, None
+            return
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._last_read_stamp:
+            return
+        try:
+            with open(self.last_read_path, encoding="utf-8") as f:
+                self._last_read = json.load(f)
+            self._last_read_stamp = stamp
+        except (OSError, json.JSONDecodeError):
+            self._last_read = {}
+
+    def _save_last_read(self) -> None:
+        try:
+            self.last_read_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.last_read_path, "w", encoding="utf-8") as f:
+                json.dump(self._last_read, f, indent=2)
+            stat = self.last_read_path.stat()
+            self._last_read_stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass  # Ignore errors saving last read file, like check-messages
+
+    def collect(self, agent_id: str, new_only: bool) -> tuple[bool, list[dict[str, Any]]]:
+        """Get an agent's messages and mark them as read.
+
+        Args:
+            agent_id: Recipient to collect messages for
+            new_only: Only messages newer than the agent's read cursor
+
+        Returns:
+            Tuple of (log exists, messages oldest first)
+        """
+        with self._lock:
+            if not self._refresh():
+                return False, []
+
+            self._load_last_read()
+            last_read = self._last_read.get(agent_id) if new_only else None
+
+            messages = []
+            previous = None
+            for seq, msg in heapq.merge(
+                self._by_recipient.get(agent_id, ()),
+                self._by_recipient.get("all", ()),
+                key=lambda item: item[0],
+            ):
+                if seq == previous:
+                    continue
+                previous = seq
+                if last_read and msg.get("timestamp", "") <= last_read:
+                    continue
+                messages.append(msg)
+
+            if messages:
+                self._last_read[agent_id] = max(msg.get("timestamp", "") for msg in messages)
+                self._save_last_read()
+            return True, messages
+
+
+class SwarmDaemon:
+    """Serves claudeswarm commands for one project from memory.
+
+    Attributes:
+        project_root: Project served by this daemon
+        socket_path: Unix socket the daemon listens on
+    """
+
+    def __init__(self, project_root: Path | None = None, socket_path: Path | None = None):
+        """Initialize the daemon state.
+
+        Args:
+            project_root: Project root directory
+            socket_path: Socket path (default: get_daemon_socket_path)
+        """
+        self.project_root = get_project_root(project_root)
+        self.socket_path = socket_path or get_daemon_socket_path(self.project_root)
+        self.registry_path = get_active_agents_path(self.project_root)
+        self.lock_manager = LockManager(project_root=self.project_root)
+        self.messaging = MessagingSystem(log_file=get_messages_log_path(self.project_root))
+        self.ack_system = AckSystem(pending_file=self.project_root / "PENDING_ACKS.json")
+        self.inbox = _MessageIndex(
+            get_messages_log_path(self.project_root),
+            self.project_root / ".swarm" / "last_read_messages.json",
+        )
+        self._agents: list[dict[str, Any]] = []
+        self._registry_stamp: tuple[int, int] | None = None
+        self._registry_lock = threading.Lock()
+        self._server: socketserver.ThreadingUnixStreamServer | None = None
+        self._stopped = threading.Event()
+        self._handlers: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+            "ping": self._ping,
+            "whoami": self._whoami,
+            "check_messages": self._check_messages,
+            "acquire_lock": self._acquire_lock,
+            "release_lock": self._release_lock,
+            "send_message": self._send_message,
+            "shutdown": self._shutdown,
+        }
+
+    # ------------------------------------------------------------------
+    # RPC methods
+    # ------------------------------------------------------------------
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch one decoded request and build its response.
+
+        Args:
+            request: Request object with id, method and params
+
+        Returns:
+            Response object
+        """
+        request_id = request.get("id")
+        handler = self._handlers.get(request.get("method", ""))
+        if handler is None:
+            return {
+                "id": request_id,
+                "ok": False,
+                "error": f"Unknown method: {request.get('method')}",
+            }
+
+        try:
+            result = handler(request.get("params") or {})
+        except Exception as e:
+            logger.debug(f"Daemon request {request.get('method')} failed: {e}")
+            return {"id": request_id, "ok": False, "error": str(e)}
+        return {"id": request_id, "ok": True, "result": result}
+
+    def _ping(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "protocol": PROTOCOL_VERSION,
+            "pid": os.getpid(),
+            "project_root": str(self.project_root),
+        }
+
+    def _registry_agents(self) -> list[dict[str, Any]]:
+        """Get registry entries, re-reading the file only when it changed."""
+        with self._registry_lock:
+            try:
+                stat = self.registry_path.stat()
+            except FileNotFoundError:
+                self._agents, self._registry_stamp = [], None
+                return self._agents
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp != self._registry_stamp:
+                try:
+                    with open(self.registry_path, encoding="utf-8") as f:
+                        self._agents = json.load(f).get("agents", [])
+                    self._registry_stamp = stamp
+                except (OSError, json.JSONDecodeError):
+                    self._agents = []
+            return self._agents
+
+    def _whoami(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Map a tmux pane ID to the active agent registered for it.
+
+        Applies the same status and PID checks as the CLI's own detection.
+        A miss returns agent_id None so the CLI can try its tmux fallback.
+        """
+        pane_id = validate_tmux_pane_id(params["pane_id"])
+        for agent in self._registry_agents():
+            if agent.get("tmux_pane_id") != pane_id or agent.get("status") != "active":
+                continue
+            pid = agent.get("pid")
+            if pid:
+                try:
+                    os.kill(pid, 0)
+                except ProcessLookupError:
+                    continue
+                except OSError:
+                    pass
+            return {"agent_id": agent.get("id"), "agent": agent}
+        return {"agent_id": None, "agent": None}
+
+    def _check_messages(self, params: dict[str, Any]) -> dict[str, Any]:
+        agent_id = validate_agent_id(params["agent_id"])
+        log_exists, messages = self.inbox.collect(agent_id, bool(params.get("new_only")))
+        return {"log_exists": log_exists, "messages": messages}
+
+    def _acquire_lock(self, params: dict[str, Any]) -> dict[str, Any]:
+        acquired, conflict = self.lock_manager.acquire_lock(
+            filepath=params["filepath"],
+            agent_id=params["agent_id"],
+            reason=params.get("reason", ""),
+        )
+        return {
+            "acquired": acquired,
+            "conflict": (
+                {
+                    "filepath": conflict.filepath,
+                    "current_holder": conflict.current_holder,
+                    "locked_at": conflict.locked_at.isoformat(),
+                    "reason": conflict.reason,
+                }
+                if conflict
+                else None
+            ),
+        }
+
+    def _release_lock(self, params: dict[str, Any]) -> dict[str, Any]:
+        released = self.lock_manager.release_lock(params["filepath"], params["agent_id"])
+        return {"released": released}
+
+    def _send_message(self, params: dict[str, Any]) -> dict[str, Any]:
+        message = self.messaging.send_message(
+            params["sender_id"],
+            params["recipient_id"],
+            MessageType[params["msg_type"]],
+            params["content"],
+        )
+        return {"message": message.to_dict()}
+
+    def _shutdown(self, params: dict[str, Any]) -> dict[str, Any]:
+        threading.Thread(target=self.stop, daemon=True).start()
+        return {}
+
+    # ------------------------------------------------------------------
+    # Server lifecycle
+    # ------------------------------------------------------------------
+
+    def _process_retries(self) -> None:
+        """Process pending ACK retries until the daemon stops."""
+        while not self._stopped.wait(ACK_RETRY_INTERVAL_SECONDS):
+            try:
+                retried = self.ack_system.process_retries()
+                if retried:
+                    logger.info(f"Processed {retried} pending message retries")
+            except Exception as e:
+                logger.debug(f"ACK processing skipped: {e}")
+
+    def serve_forever(self) -> None:
+        """Bind the socket and serve requests until stop() is called.
+
+        Raises:
+            RuntimeError: If another daemon is already serving the socket
+        """
+        if self.socket_path.exists():
+            try:
+                daemon_request("ping", project_root=self.project_root, timeout=1.0)
+            except DaemonError:
+                self.socket_path.unlink(missing_ok=True)  # Left behind by a dead daemon
+            else:
+                raise RuntimeError(f"A daemon is already serving {self.socket_path}")
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                while True:
+                    line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+                    if not line:
+                        return
+                    if len(line) > MAX_REQUEST_BYTES:
+                        response = {"id": None, "ok": False, "error": "Request too large"}
+                    else:
+                        try:
+                            request = json.loads(line)
+                            if not isinstance(request, dict):
+                                raise ValueError("request must be a JSON object")
+                        except ValueError as e:
+                            response = {"id": None, "ok": False, "error": f"Bad request: {e}"}
+                        else:
+                            response = daemon.handle(request)
+                    self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+
+        # Only the owning user may talk to the daemon
+        old_umask = os.umask(0o177)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), Handler)
+        finally:
+            os.umask(old_umask)
+        self._server.daemon_threads = True
+
+        retry_thread = threading.Thread(target=self._process_retries, daemon=True)
+        retry_thread.start()
+        logger.info(f"claudeswarmd serving {self.project_root} on {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._stopped.set()
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            logger.info("claudeswarmd stopped")
+
+    def stop(self) -> None:
+        """Stop serving (safe to call from any thread)."""
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the claudeswarmd command.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="claudeswarmd",
+        description="Serve claudeswarm commands for a project from a persistent process",
+    )
+    parser.add_argument("--project-root", type=Path, help="Project root to serve")
+    parser.add_argument("--status", action="store_true", help="Report whether a daemon is running")
+    parser.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    parser.add_argument("--log-level", default="INFO", help="Logging level (default: INFO)")
+    args = parser.parse_args(argv)
+
+    project_root = get_project_root(args.project_root)
+
+    if args.status or args.stop:
+        method = "shutdown" if args.stop else "ping"
+        try:
+            result = daemon_request(method, project_root=project_root, timeout=5.0)
+        except DaemonError as e:
+            print(f"No daemon running for {project_root} ({e})", file=sys.stderr)
+            return 1
+        if args.stop:
+            print(f"Stopping daemon for {project_root}")
+        else:
+            print(f"claudeswarmd running for {result['project_root']} (PID: {result['pid']})")
+        return 0
+
+    setup_logging(level=args.log_level.upper())
+
+    # Helpers that resolve paths on their own (ACK retries) must see the
+    # served project, not the daemon's working directory
+    os.environ["CLAUDESWARM_ROOT"] = str(project_root)
+
+    daemon = SwarmDaemon(project_root)
+    # stop() waits for serve_forever(), so it must not run on the serving thread
+    signal.signal(
+        signal.SIGTERM,
+        lambda signum, frame: threading.Thread(target=daemon.stop, daemon=True).start(),
+    )
+    try:
+        daemon.serve_forever()
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Client side of the claudeswarmd Unix-socket protocol.
+
+The CLI uses this module to hand hot commands (check-messages,
+acquire-file-lock, release-file-lock, send-message) to a running
+claudeswarmd. It deliberately imports nothing beyond the standard library
+and claudeswarm.project, so asking "is a daemon running?" costs a single
+lstat() on the hook path. Sockets not owned by the current user are never
+used.
+
+Protocol (one JSON object per line, UTF-8):
+    request:  {"id": 1, "method": "acquire_lock", "params": {...}}
+    response: {"id": 1, "ok": true, "result": {...}}
+              {"id": 1, "ok": false, "error": "..."}
+
+Callers treat DaemonUnavailableError as "fall back to direct file access".
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+from pathlib import Path
+from typing import Any
+
+from .project import get_daemon_socket_path
+
+__all__ = [
+    "DaemonError",
+    "DaemonUnavailableError",
+    "DaemonRequestError",
+    "daemon_request",
+    "DISABLE_DAEMON_ENV",
+]
+
+# Set to a non-empty value to bypass the daemon entirely
+DISABLE_DAEMON_ENV = "CLAUDESWARM_NO_DAEMON"
+
+# Connecting to a live daemon is local; give up quickly otherwise
+DAEMON_CONNECT_TIMEOUT_SECONDS = 0.5
+DAEMON_REQUEST_TIMEOUT_SECONDS = 30.0
+
+
+class DaemonError(Exception):
+    """Base exception for daemon client errors."""
+
+    pass
+
+
+class DaemonUnavailableError(DaemonError):
+    """Raised when no daemon is serving the project (use direct access)."""
+
+    pass
+
+
+class DaemonRequestError(DaemonError):
+    """Raised when the daemon ran a request and it failed."""
+
+    pass
+
+
+def daemon_request(
+    method: str,
+    params: dict[str, Any] | None = None,
+    project_root: Path | None = None,
+    timeout: float = DAEMON_REQUEST_TIMEOUT_SECONDS,
+) -> dict[str, Any]:
+    """Send one request to the project's daemon and wait for the reply.
+
+    Args:
+        method: RPC method name
+        params: Method parameters (must be JSON-serializable)
+        project_root: Project root the daemon serves
+        timeout: Seconds to wait for the reply
+
+    Returns:
+        The result object from the daemon
+
+    Raises:
+        DaemonUnavailableError: If the daemon is disabled, not running, or
+            the connection broke before a reply arrived
+        DaemonRequestError: If the daemon reported an error for the request
+    """
+    if os.environ.get(DISABLE_DAEMON_ENV):
+        raise DaemonUnavailableError(f"Daemon disabled via {DISABLE_DAEMON_ENV}")
+
+    try:
+        socket_path = get_daemon_socket_path(project_root)
+        st = os.lstat(socket_path)
+    except OSError as e:
+        raise DaemonUnavailableError(f"No daemon socket: {e}") from e
+
+    # Only talk to a socket created by this user; anything else could be
+    # another user impersonating the daemon
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        raise DaemonUnavailableError(f"Refusing untrusted daemon socket at {socket_path}")
+
+    request = {"id": 1, "method": method, "params": params or {}}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(DAEMON_CONNECT_TIMEOUT_SECONDS)
+            sock.connect(str(socket_path))
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError as e:
+        raise DaemonUnavailableError(f"Cannot reach daemon at {socket_path}: {e}") from e
+
+    if not line:
+        raise DaemonUnavailableError("Daemon closed the connection without replying")
+    try:
+        response = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise DaemonUnavailableError(f"Invalid reply from daemon: {e}") from e
+
+    if not response.get("ok"):
+        raise DaemonRequestError(response.get("error", "Unknown daemon error"))
+    return response.get("result") or {}
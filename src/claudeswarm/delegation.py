@@ -23,18 +23,23 @@ Example usage:
 
 from __future__ import annotations
 
+import copy
 import json
+import os
 import re
 import threading
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .agent_cards import AgentCard, AgentCardRegistry
 from .file_lock import FileLock, FileLockTimeout
+from .learning import LearningSystem
 from .logging_config import get_logger
 from .project import get_project_root
+from .scoring import AgentSkillMatrix, solve_assignment
 from .tasks import Task, TaskManager, TaskPriority
 
 __all__ = [
@@ -43,14 +48,23 @@ __all__ = [
     "SkillRequirement",
     "find_best_agent",
     "get_delegation_history_path",
+    "get_delegation_summary_path",
     "DelegationError",
     "NoSuitableAgentError",
 ]
 
 # Constants
-DELEGATION_HISTORY_FILENAME = "DELEGATION_HISTORY.json"
+DELEGATION_HISTORY_FILENAME = "DELEGATION_HISTORY.jsonl"
+LEGACY_DELEGATION_HISTORY_FILENAME = "DELEGATION_HISTORY.json"
+DELEGATION_SUMMARY_FILENAME = "DELEGATION_SUMMARY.json"
+DELEGATION_SUMMARY_VERSION = "1.0"
 DELEGATION_LOCK_TIMEOUT_SECONDS = 5.0
 MAX_DELEGATION_HISTORY = 1000  # Max entries to keep
+DELEGATION_HISTORY_ROTATE_AT = 2 * MAX_DELEGATION_HISTORY  # Log entries before trimming
+RETIRED_COUNTERS_KEY = "retired"  # Log header holding counters of trimmed entries
+DEFAULT_MAX_TASKS_PER_AGENT = 5  # Concurrent task cap used by batch delegation
+LOAD_BALANCE_PENALTY = 0.1  # Score penalty per task an agent already holds
+UNASSIGNED_COST = 1e6  # Assignment cost for leaving a task undelegated
 
 # Skill extraction patterns
 FILE_EXTENSION_SKILLS = {
@@ -102,6 +116,33 @@ KEYWORD_SKILLS = {
     "setup": ["configuration", "setup"],
 }
 
+# Compiled keyword matcher, built once from KEYWORD_SKILLS.
+# The lookahead reports a match at every position (so overlapping keywords
+# are all seen), and longer keywords are tried first. A keyword found at a
+# position implies every keyword contained in it is also present in the
+# text, so each match expands to those contained keywords. Together this
+# gives exactly the set of keywords for which ``keyword in text`` holds.
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(KEYWORD_SKILLS, key=len, reverse=True)) + "))"
+)
+_KEYWORD_CLOSURE = {
+    keyword: frozenset(other for other in KEYWORD_SKILLS if other in keyword)
+    for keyword in KEYWORD_SKILLS
+}
+
+# Pattern: requires [skill], needs [skill], [skill] expertise
+_SKILL_MENTION_PATTERN = re.compile(r"(?:requires?|needs?|expertise in|experience with)\s+(\w+)")
+
+SKILL_EXTRACTION_CACHE_SIZE = 1024
+
+# Score adjustment per task priority
+PRIORITY_BOOSTS = {
+    TaskPriority.CRITICAL: 0.1,
+    TaskPriority.HIGH: 0.05,
+    TaskPriority.NORMAL: 0.0,
+    TaskPriority.LOW: -0.05,
+}
+
 # Configure logging
 logger = get_logger(__name__)
 
@@ -192,17 +233,31 @@ def get_delegation_history_path(project_root: Path | None = None) -> Path:
         project_root: Optional project root directory
 
     Returns:
-        Path to DELEGATION_HISTORY.json
+        Path to DELEGATION_HISTORY.jsonl
     """
     root = get_project_root(project_root)
     return root / DELEGATION_HISTORY_FILENAME
 
 
+def get_delegation_summary_path(project_root: Path | None = None) -> Path:
+    """Get the path to the per-agent delegation summary file.
+
+    Args:
+        project_root: Optional project root directory
+
+    Returns:
+        Path to DELEGATION_SUMMARY.json
+    """
+    root = get_project_root(project_root)
+    return root / DELEGATION_SUMMARY_FILENAME
+
+
 def extract_skills_from_task(task: Task) -> list[SkillRequirement]:
     """Extract skill requirements from a task.
 
     Analyzes the task objective, constraints, and files to determine
-    what skills are needed.
+    what skills are needed. Results are cached on the task's objective,
+    constraints and files, so re-scoring the same task is free.
 
     Args:
         task: The task to analyze
@@ -210,35 +265,44 @@ def extract_skills_from_task(task: Task) -> list[SkillRequirement]:
     Returns:
         List of skill requirements
     """
+    skills = _extract_skills(task.objective, tuple(task.constraints), tuple(task.files))
+    return [SkillRequirement(skill=skill, importance=importance) for skill, importance in skills]
+
+
+@lru_cache(maxsize=SKILL_EXTRACTION_CACHE_SIZE)
+def _extract_skills(
+    objective: str,
+    constraints: tuple[str, ...],
+    files: tuple[str, ...],
+) -> tuple[tuple[str, float], ...]:
+    """Extract (skill, importance) pairs, most important first."""
     skills: dict[str, float] = {}  # skill -> max importance
 
     # Extract skills from files
-    for filepath in task.files:
+    for filepath in files:
         ext = Path(filepath).suffix.lower()
         if ext in FILE_EXTENSION_SKILLS:
             for skill in FILE_EXTENSION_SKILLS[ext]:
                 skills[skill] = max(skills.get(skill, 0), 0.8)
 
     # Extract skills from objective and constraints
-    text = f"{task.objective} {' '.join(task.constraints)}".lower()
+    text = f"{objective} {' '.join(constraints)}".lower()
+
+    found: set[str] = set()
+    for match in _KEYWORD_PATTERN.finditer(text):
+        found |= _KEYWORD_CLOSURE[match.group(1)]
 
     for keyword, keyword_skills in KEYWORD_SKILLS.items():
-        if keyword in text:
+        if keyword in found:
             for skill in keyword_skills:
                 skills[skill] = max(skills.get(skill, 0), 0.7)
 
     # Check for explicit skill mentions in objective
-    # Pattern: requires [skill], needs [skill], [skill] expertise
-    skill_pattern = r"(?:requires?|needs?|expertise in|experience with)\s+(\w+)"
-    for match in re.finditer(skill_pattern, text):
+    for match in _SKILL_MENTION_PATTERN.finditer(text):
         skill = match.group(1)
         skills[skill] = max(skills.get(skill, 0), 1.0)
 
-    # Convert to SkillRequirement objects
-    return [
-        SkillRequirement(skill=skill, importance=importance)
-        for skill, importance in sorted(skills.items(), key=lambda x: -x[1])
-    ]
+    return tuple(sorted(skills.items(), key=lambda x: -x[1]))
 
 
 def calculate_agent_score(
@@ -296,9 +360,10 @@ def calculate_agent_score(
         base_score = 0.5
 
     # Specialization bonus
+    specializations = {s.lower() for s in agent.specializations}
     specialization_bonus = 0.0
     for req in requirements:
-        if req.skill.lower() in [s.lower() for s in agent.specializations]:
+        if req.skill.lower() in specializations:
             specialization_bonus += 0.05 * req.importance
 
     # Cap specialization bonus
@@ -308,6 +373,45 @@ def calculate_agent_score(
     return final_score, skill_matches
 
 
+def _new_summary() -> dict[str, Any]:
+    """Create an empty delegation summary."""
+    return {
+        "version": DELEGATION_SUMMARY_VERSION,
+        "log_entries": 0,
+        "log_size": 0,
+        "agents": {},
+    }
+
+
+def _apply_to_summary(summary: dict[str, Any], result: DelegationResult) -> None:
+    """Fold one delegation result into the per-agent counters."""
+    if result.agent_id is None:
+        return
+
+    counters = summary["agents"].setdefault(
+        result.agent_id,
+        {
+            "total": 0,
+            "successful": 0,
+            "failed": 0,
+            "score_total": 0.0,
+            "score_count": 0,
+            "skill_counts": {},
+        },
+    )
+    counters["total"] += 1
+    if not result.success:
+        counters["failed"] += 1
+        return
+
+    counters["successful"] += 1
+    if result.match_score > 0:
+        counters["score_total"] += result.match_score
+        counters["score_count"] += 1
+    for skill in result.skill_matches:
+        counters["skill_counts"][skill] = counters["skill_counts"].get(skill, 0) + 1
+
+
 class DelegationManager:
     """Manages task delegation between agents.
 
@@ -326,25 +430,115 @@ class DelegationManager:
         """
         self.project_root = get_project_root(project_root)
         self.history_path = get_delegation_history_path(self.project_root)
+        self.legacy_history_path = self.project_root / LEGACY_DELEGATION_HISTORY_FILENAME
+        self.summary_path = get_delegation_summary_path(self.project_root)
         self.card_registry = AgentCardRegistry(self.project_root)
         self.task_manager = TaskManager(self.project_root)
         self._lock = threading.Lock()
+        self._matrix: AgentSkillMatrix | None = None
+        self._matrix_key: tuple | None = None
+
+    def _get_skill_matrix(self, agents: list[AgentCard]) -> AgentSkillMatrix:
+        """Get the compiled skill matrix for a list of agents.
+
+        The matrix is reused while the same cards (by identity and
+        last update) are passed in.
+
+        Args:
+            agents: Agent cards to score
+
+        Returns:
+            AgentSkillMatrix with one row per agent, in order
+        """
+        key = tuple((id(a), a.agent_id, a.updated_at, a.availability) for a in agents)
+        if self._matrix is None or key != self._matrix_key:
+            self._matrix = AgentSkillMatrix(agents)
+            self._matrix_key = key
+        return self._matrix
+
+    def _needs_migration(self) -> bool:
+        """Check for a legacy history file that the JSONL log doesn't replace yet."""
+        try:
+            if os.path.getsize(self.history_path) > 0:
+                return False
+        except FileNotFoundError:
+            pass
+        return self.legacy_history_path.exists()
+
+    def _migrate_legacy_history(self) -> None:
+        """Convert a DELEGATION_HISTORY.json file from older versions to the JSONL log.
+
+        Runs under the history lock and re-checks both files inside it, so
+        concurrent callers migrate exactly once.
+        """
+        if not self._needs_migration():
+            return
+
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with FileLock(self.history_path, timeout=DELEGATION_LOCK_TIMEOUT_SECONDS, shared=False):
+                if not self._needs_migration():
+                    return
+
+                try:
+                    with open(self.legacy_history_path, encoding="utf-8") as f:
+                        data = json.load(f)
+                    history = [
+                        DelegationResult.from_dict(entry) for entry in data.get("history", [])
+                    ]
+                except Exception as e:
+                    logger.warning(f"Could not migrate legacy delegation history: {e}")
+                    return
+
+                self._replace_log(history)
+                self.legacy_history_path.replace(
+                    self.legacy_history_path.with_suffix(".json.migrated")
+                )
+        except FileLockTimeout:
+            logger.error(f"Timeout acquiring lock on {self.history_path}")
+            return
+
+        logger.info(f"Migrated {len(history)} delegation(s) to {self.history_path.name}")
+
+    def _read_log(self) -> tuple[dict[str, Any], list[DelegationResult]]:
+        """Parse the history log (caller holds the lock).
+
+        Returns:
+            Tuple of (counters carried over from rotated-out entries, entries)
+        """
+        retired: dict[str, Any] = {}
+        history = []
+        with open(self.history_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                    if RETIRED_COUNTERS_KEY in data:
+                        retired = data[RETIRED_COUNTERS_KEY]
+                        continue
+                    history.append(DelegationResult.from_dict(data))
+                except (json.JSONDecodeError, TypeError) as e:
+                    logger.warning(f"Skipping invalid delegation history entry: {e}")
+        return retired, history
 
     def _read_history(self) -> list[DelegationResult]:
-        """Read delegation history from file.
+        """Read delegation history from the log.
 
         Returns:
-            List of delegation results
+            List of delegation results, oldest first (at most MAX_DELEGATION_HISTORY)
         """
+        self._migrate_legacy_history()
+
         if not self.history_path.exists():
             return []
 
         try:
             with FileLock(self.history_path, timeout=DELEGATION_LOCK_TIMEOUT_SECONDS, shared=True):
-                with open(self.history_path, encoding="utf-8") as f:
-                    data = json.load(f)
+                _, history = self._read_log()
 
-                return [DelegationResult.from_dict(entry) for entry in data.get("history", [])]
+            return history[-MAX_DELEGATION_HISTORY:]
 
         except FileLockTimeout:
             logger.error(f"Timeout acquiring lock on {self.history_path}")
@@ -353,32 +547,57 @@ class DelegationManager:
             logger.warning(f"Error reading delegation history: {e}")
             return []
 
+    def _rewrite_log(
+        self, history: list[DelegationResult], retired: dict[str, Any] | None = None
+    ) -> int:
+        """Atomically replace the log contents (caller holds the lock).
+
+        Args:
+            history: Entries to keep
+            retired: Per-agent counters of entries dropped from the log, stored
+                as the first line so the summary can always be rebuilt
+
+        Returns:
+            Size of the new log in bytes
+        """
+        temp_path = self.history_path.with_suffix(".jsonl.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            if retired:
+                f.write(json.dumps({RETIRED_COUNTERS_KEY: retired}) + "\n")
+            for result in history:
+                f.write(json.dumps(result.to_dict()) + "\n")
+        temp_path.replace(self.history_path)
+        return self.history_path.stat().st_size
+
+    def _replace_log(self, history: list[DelegationResult]) -> None:
+        """Replace the log and rebuild the summary from it (caller holds the lock).
+
+        Entries beyond MAX_DELEGATION_HISTORY are dropped from the log but
+        still counted in the summary.
+        """
+        summary = _new_summary()
+        for result in history[:-MAX_DELEGATION_HISTORY]:
+            _apply_to_summary(summary, result)
+        retired = copy.deepcopy(summary["agents"])
+
+        history = history[-MAX_DELEGATION_HISTORY:]
+        for result in history:
+            _apply_to_summary(summary, result)
+        summary["log_entries"] = len(history)
+        summary["log_size"] = self._rewrite_log(history, retired)
+        self._write_summary(summary)
+
     def _write_history(self, history: list[DelegationResult]) -> None:
-        """Write delegation history to file.
+        """Replace the delegation history and rebuild the summary from it.
 
         Args:
             history: List of delegation results
         """
         self.history_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Trim history if too long
-        if len(history) > MAX_DELEGATION_HISTORY:
-            history = history[-MAX_DELEGATION_HISTORY:]
-
-        data = {
-            "version": "1.0",
-            "updated_at": datetime.now(UTC).isoformat(),
-            "history": [result.to_dict() for result in history],
-        }
-
         try:
-            with FileLock(
-                self.history_path, timeout=DELEGATION_LOCK_TIMEOUT_SECONDS, shared=False
-            ):
-                temp_path = self.history_path.with_suffix(".json.tmp")
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2)
-                temp_path.replace(self.history_path)
+            with FileLock(self.history_path, timeout=DELEGATION_LOCK_TIMEOUT_SECONDS, shared=False):
+                self._replace_log(history)
 
         except FileLockTimeout:
             logger.error(f"Timeout acquiring write lock on {self.history_path}")
@@ -387,16 +606,136 @@ class DelegationManager:
             logger.error(f"Error writing delegation history: {e}")
             raise
 
+    def _read_summary(self) -> dict[str, Any] | None:
+        """Read the per-agent summary file.
+
+        Returns:
+            Summary dictionary, or None if missing or unreadable
+        """
+        try:
+            with open(self.summary_path, encoding="utf-8") as f:
+                summary = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Invalid delegation summary, will rebuild: {e}")
+            return None
+
+        if summary.get("version") != DELEGATION_SUMMARY_VERSION:
+            return None
+        return summary
+
+    def _write_summary(self, summary: dict[str, Any]) -> None:
+        """Atomically write the per-agent summary file (caller holds the lock)."""
+        summary["updated_at"] = datetime.now(UTC).isoformat()
+        temp_path = self.summary_path.with_suffix(".json.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f)
+        temp_path.replace(self.summary_path)
+
     def _record_delegation(self, result: DelegationResult) -> None:
         """Record a delegation result to history.
 
         Args:
             result: Delegation result to record
         """
+        self._record_delegations([result])
+
+    def _record_delegations(self, results: list[DelegationResult]) -> None:
+        """Append delegation results to the log and update the summary.
+
+        The log is append-only; once it holds DELEGATION_HISTORY_ROTATE_AT
+        entries it is trimmed back to the newest MAX_DELEGATION_HISTORY.
+        Per-agent counters in the summary keep counting across rotations:
+        the counters of trimmed entries are carried in the log's first line.
+
+        Args:
+            results: Delegation results to record
+        """
+        if not results:
+            return
+
+        self._migrate_legacy_history()
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+
         with self._lock:
-            history = self._read_history()
-            history.append(result)
-            self._write_history(history)
+            try:
+                with FileLock(
+                    self.history_path, timeout=DELEGATION_LOCK_TIMEOUT_SECONDS, shared=False
+                ):
+                    summary = self._read_summary()
+                    if summary is None or summary.get("log_size") != os.path.getsize(
+                        self.history_path
+                    ):
+                        summary = self._rebuild_summary()
+
+                    with open(self.history_path, "a", encoding="utf-8") as f:
+                        for result in results:
+                            f.write(json.dumps(result.to_dict()) + "\n")
+                            _apply_to_summary(summary, result)
+                    summary["log_entries"] += len(results)
+
+                    if summary["log_entries"] >= DELEGATION_HISTORY_ROTATE_AT:
+                        retired, history = self._read_log()
+                        carried = {"agents": retired}
+                        for result in history[:-MAX_DELEGATION_HISTORY]:
+                            _apply_to_summary(carried, result)
+                        history = history[-MAX_DELEGATION_HISTORY:]
+                        summary["log_size"] = self._rewrite_log(history, retired)
+                        summary["log_entries"] = len(history)
+                    else:
+                        summary["log_size"] = os.path.getsize(self.history_path)
+
+                    self._write_summary(summary)
+
+            except FileLockTimeout:
+                logger.error(f"Timeout acquiring write lock on {self.history_path}")
+                raise
+
+    def _rebuild_summary(self) -> dict[str, Any]:
+        """Recompute the summary from the log (caller holds the lock)."""
+        retired, history = self._read_log() if self.history_path.exists() else ({}, [])
+        summary = _new_summary()
+        summary["agents"] = retired
+        for result in history:
+            _apply_to_summary(summary, result)
+        summary["log_entries"] = len(history)
+        summary["log_size"] = (
+            os.path.getsize(self.history_path) if self.history_path.exists() else 0
+        )
+        return summary
+
+    def _get_summary(self) -> dict[str, Any]:
+        """Get an up-to-date summary, rebuilding it if it lags behind the log.
+
+        Returns:
+            Summary dictionary
+        """
+        self._migrate_legacy_history()
+
+        summary = self._read_summary()
+        try:
+            log_size = os.path.getsize(self.history_path)
+        except FileNotFoundError:
+            log_size = 0
+
+        if summary is not None and summary.get("log_size") == log_size:
+            return summary
+        if log_size == 0:
+            return _new_summary()
+
+        with self._lock:
+            try:
+                with FileLock(
+                    self.history_path, timeout=DELEGATION_LOCK_TIMEOUT_SECONDS, shared=False
+                ):
+                    summary = self._rebuild_summary()
+                    self._write_summary(summary)
+            except FileLockTimeout:
+                logger.error(f"Timeout acquiring lock on {self.history_path}")
+                return _new_summary()
+
+        return summary
 
     def find_best_agent(
         self,
@@ -424,43 +763,36 @@ class DelegationManager:
             logger.warning("No active agents available for delegation")
             return None, 0.0, {}
 
-        # Filter by exclusions
-        agents = [a for a in agents if a.agent_id not in exclude_agents]
+        # Filter by exclusions and required tools
+        candidates = [
+            a.agent_id not in exclude_agents and all(a.has_tool(t) for t in required_tools)
+            for a in agents
+        ]
 
-        # Filter by required tools
-        if required_tools:
-            agents = [a for a in agents if all(a.has_tool(t) for t in required_tools)]
-
-        if not agents:
+        if not any(candidates):
             logger.warning("No agents match the required criteria")
             return None, 0.0, {}
 
         # Extract skill requirements
         requirements = extract_skills_from_task(task)
+        priority_boost = PRIORITY_BOOSTS.get(task.priority, 0.0)
 
-        # Calculate priority boost
-        priority_boost = {
-            TaskPriority.CRITICAL: 0.1,
-            TaskPriority.HIGH: 0.05,
-            TaskPriority.NORMAL: 0.0,
-            TaskPriority.LOW: -0.05,
-        }.get(task.priority, 0.0)
-
-        # Score each agent
-        scored_agents = []
-        for agent in agents:
-            score, skill_matches = calculate_agent_score(agent, requirements, priority_boost)
-            if score > 0:
-                scored_agents.append((agent, score, skill_matches))
-
-        if not scored_agents:
+        # Score every agent in one pass over the skill matrix
+        matrix = self._get_skill_matrix(agents)
+        scores = matrix.score(requirements, priority_boost)
+
+        best_index = None
+        for index, (candidate, score) in enumerate(zip(candidates, scores, strict=True)):
+            if candidate and score > 0 and (best_index is None or score > scores[best_index]):
+                best_index = index
+
+        if best_index is None:
             logger.warning("No agents have sufficient skills for this task")
             return None, 0.0, {}
 
-        # Sort by score descending
-        scored_agents.sort(key=lambda x: x[1], reverse=True)
-
-        best_agent, best_score, best_matches = scored_agents[0]
+        best_agent = matrix.agents[best_index]
+        best_score = scores[best_index]
+        best_matches = matrix.skill_matches(best_index, requirements)
         logger.info(
             f"Best agent for task {task.task_id}: {best_agent.agent_id} "
             f"(score: {best_score:.2f})"
@@ -511,11 +843,10 @@ class DelegationManager:
 
             # Get alternatives
             agents = self.card_registry.list_cards(availability="active")
-            for agent in agents:
-                if agent.agent_id != agent_id:
-                    alt_score, _ = calculate_agent_score(agent, requirements)
-                    if alt_score > 0:
-                        alternatives.append((agent.agent_id, alt_score))
+            matrix = self._get_skill_matrix(agents)
+            for alt_id, alt_score in zip(matrix.agent_ids, matrix.score(requirements), strict=True):
+                if alt_id != agent_id and alt_score > 0:
+                    alternatives.append((alt_id, alt_score))
             alternatives.sort(key=lambda x: x[1], reverse=True)
             alternatives = alternatives[:3]  # Top 3 alternatives
 
@@ -616,6 +947,162 @@ class DelegationManager:
 
         return task, result
 
+    def _get_agent_loads(self, agent_ids: list[str]) -> dict[str, int]:
+        """Get the number of tasks each agent currently has in progress.
+
+        Args:
+            agent_ids: Agents to look up
+
+        Returns:
+            Dictionary mapping agent_id to tasks in progress
+        """
+        try:
+            performance = LearningSystem(self.project_root).get_all_performance()
+        except Exception as e:
+            logger.warning(f"Could not read agent load, assuming idle agents: {e}")
+            performance = {}
+
+        return {
+            agent_id: performance[agent_id].tasks_in_progress if agent_id in performance else 0
+            for agent_id in agent_ids
+        }
+
+    def delegate_batch(
+        self,
+        tasks: list[Task],
+        max_tasks_per_agent: int = DEFAULT_MAX_TASKS_PER_AGENT,
+    ) -> list[DelegationResult]:
+        """Delegate many tasks at once with a load-balanced assignment.
+
+        All tasks are scored against all active agents in one pass. Each
+        agent gets max_tasks_per_agent minus its tasks in progress slots,
+        and every extra task an agent takes costs LOAD_BALANCE_PENALTY, so
+        work spreads across agents with similar scores instead of piling
+        onto the single best one. The assignment is solved optimally
+        (Hungarian algorithm), written in one TaskManager transaction and
+        recorded with one delegation history write.
+
+        Args:
+            tasks: Tasks to delegate
+            max_tasks_per_agent: Maximum concurrent tasks per agent
+
+        Returns:
+            One DelegationResult per task, in the order given. Tasks that
+            could not be placed have success=False.
+
+        Raises:
+            DelegationError: If the assignments cannot be written
+        """
+        if not tasks:
+            return []
+
+        agents = self.card_registry.list_cards(availability="active")
+        matrix = self._get_skill_matrix(agents)
+        requirements = [extract_skills_from_task(task) for task in tasks]
+        scores = matrix.score_batch(
+            [
+                (reqs, PRIORITY_BOOSTS.get(task.priority, 0.0))
+                for reqs, task in zip(requirements, tasks, strict=True)
+            ]
+        )
+
+        # One column per free slot; a slot's cost grows with the agent's load
+        loads = self._get_agent_loads(matrix.agent_ids)
+        slots: list[tuple[int, int]] = []  # (agent index, load when taking the slot)
+        for index, agent_id in enumerate(matrix.agent_ids):
+            load = loads.get(agent_id, 0)
+            for extra in range(max(0, max_tasks_per_agent - load)):
+                slots.append((index, load + extra))
+
+        cost = []
+        for row in scores:
+            task_cost = []
+            for index, load in slots:
+                score = row[index]
+                task_cost.append(
+                    LOAD_BALANCE_PENALTY * load - score if score > 0 else UNASSIGNED_COST
+                )
+            # One dummy column per task lets any task stay unassigned
+            task_cost.extend([UNASSIGNED_COST] * len(tasks))
+            cost.append(task_cost)
+
+        assignment = solve_assignment(cost)
+
+        placements: list[tuple[int, int] | None] = []
+        for t, column in enumerate(assignment):
+            if column < len(slots) and cost[t][column] < UNASSIGNED_COST:
+                placements.append(slots[column])
+            else:
+                placements.append(None)
+
+        assignments = []
+        for task, placement, row in zip(tasks, placements, scores, strict=True):
+            if placement is not None:
+                index, _ = placement
+                assignments.append(
+                    (
+                        task.task_id,
+                        matrix.agent_ids[index],
+                        f"Delegated in batch based on skill match (score: {row[index]:.2f})",
+                    )
+                )
+
+        try:
+            self.task_manager.assign_tasks(assignments)
+        except Exception as e:
+            failures = [
+                DelegationResult(
+                    success=False,
+                    task_id=task.task_id,
+                    reason=f"Failed to assign task batch: {e}",
+                )
+                for task in tasks
+            ]
+            self._record_delegations(failures)
+            raise DelegationError(failures[0].reason) from e
+
+        results = []
+        for task, placement, row, reqs in zip(tasks, placements, scores, requirements, strict=True):
+            if placement is None:
+                reason = (
+                    "No agent capacity left for this task"
+                    if any(score > 0 for score in row)
+                    else "No suitable agent found for this task"
+                )
+                results.append(DelegationResult(success=False, task_id=task.task_id, reason=reason))
+                continue
+
+            index, _ = placement
+            agent_id = matrix.agent_ids[index]
+            alternatives = sorted(
+                (
+                    (alt_id, score)
+                    for alt_id, score in zip(matrix.agent_ids, row, strict=True)
+                    if alt_id != agent_id and score > 0
+                ),
+                key=lambda x: x[1],
+                reverse=True,
+            )[:3]
+            results.append(
+                DelegationResult(
+                    success=True,
+                    task_id=task.task_id,
+                    agent_id=agent_id,
+                    match_score=row[index],
+                    skill_matches=matrix.skill_matches(index, reqs),
+                    reason=f"Task delegated to {agent_id} in batch",
+                    alternatives=alternatives,
+                )
+            )
+
+        self._record_delegations(results)
+
+        logger.info(
+            f"Batch delegated {len(assignments)}/{len(tasks)} task(s) "
+            f"across {len({a[1] for a in assignments})} agent(s)"
+        )
+        return results
+
     def get_delegation_history(
         self,
         task_id: str | None = None,
@@ -656,44 +1143,41 @@ class DelegationManager:
     def get_agent_delegation_stats(self, agent_id: str) -> dict[str, Any]:
         """Get delegation statistics for an agent.
 
+        Served from the incrementally maintained summary file, so the
+        history log is not rescanned.
+
         Args:
             agent_id: Agent identifier
 
         Returns:
             Dictionary with delegation statistics
         """
-        history = self.get_delegation_history(agent_id=agent_id)
+        counters = self._get_summary()["agents"].get(agent_id)
 
-        if not history:
+        if not counters:
             return {
                 "agent_id": agent_id,
                 "total_delegations": 0,
                 "successful": 0,
                 "failed": 0,
+                "acceptance_rate": 0.0,
                 "average_score": 0.0,
                 "common_skills": [],
             }
 
-        successful = [r for r in history if r.success]
-        failed = [r for r in history if not r.success]
-
-        # Calculate average score
-        scores = [r.match_score for r in successful if r.match_score > 0]
-        avg_score = sum(scores) / len(scores) if scores else 0.0
-
-        # Find common skills
-        skill_counts: dict[str, int] = {}
-        for result in successful:
-            for skill in result.skill_matches:
-                skill_counts[skill] = skill_counts.get(skill, 0) + 1
-
-        common_skills = sorted(skill_counts.items(), key=lambda x: -x[1])[:5]
+        total = counters["total"]
+        successful = counters["successful"]
+        avg_score = (
+            counters["score_total"] / counters["score_count"] if counters["score_count"] else 0.0
+        )
+        common_skills = sorted(counters["skill_counts"].items(), key=lambda x: -x[1])[:5]
 
         return {
             "agent_id": agent_id,
-            "total_delegations": len(history),
-            "successful": len(successful),
-            "failed": len(failed),
+            "total_delegations": total,
+            "successful": successful,
+            "failed": counters["failed"],
+            "acceptance_rate": round(successful / total, 3) if total else 0.0,
             "average_score": round(avg_score, 3),
             "common_skills": [skill for skill, _ in common_skills],
         }
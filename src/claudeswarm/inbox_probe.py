@@ -0,0 +1,167 @@
+"""Zero-parse fast path for the check-messages hook.
+
+The check-messages hook runs on every prompt and almost always finds
+nothing new. Answering that the slow way means detecting the agent from
+ACTIVE_AGENTS.json (possibly via tmux), reading the whole message log and
+rewriting the read cursors. Instead, every full check records a tiny state
+file per tmux pane holding:
+- The agent ID detected for the pane, keyed on the registry's stamp
+- The message log's stamp (inode, size, mtime) when the agent last checked
+
+The next check compares both stamps with two stat() calls and exits if
+neither changed. Every message is appended to the log, so an unchanged log
+means nothing new arrived.
+
+This module only imports the standard library and claudeswarm.project so
+the hook can answer before anything heavy is loaded.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from .project import get_active_agents_path, get_messages_log_path
+
+__all__ = [
+    "file_stamp",
+    "get_pane_state_path",
+    "cached_agent_id",
+    "probe_no_new_messages",
+    "save_pane_state",
+]
+
+# Per-pane state files live under <project>/.swarm/
+PANE_STATE_DIRNAME = "panes"
+PANE_STATE_VERSION = 1
+
+
+def file_stamp(path: Path) -> list[int] | None:
+    """Get a file's (inode, size, mtime_ns) stamp.
+
+    Args:
+        path: File to stat
+
+    Returns:
+        Stamp as a JSON-friendly list, or None if the file doesn't exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+
+def get_pane_state_path(project_root: Path, pane_id: str) -> Path | None:
+    """Get the state file for a tmux pane.
+
+    Args:
+        project_root: Project root directory
+        pane_id: tmux pane ID (e.g. "%3")
+
+    Returns:
+        Path to the pane's state file, or None if pane_id is not a pane ID
+    """
+    number = pane_id[1:] if pane_id.startswith("%") else ""
+    if not number.isdigit():
+        return None
+    return project_root / ".swarm" / PANE_STATE_DIRNAME / f"pane-{number}.json"
+
+
+def _load_pane_state(project_root: Path, pane_id: str) -> dict[str, Any] | None:
+    state_path = get_pane_state_path(project_root, pane_id)
+    if state_path is None:
+        return None
+    try:
+        with open(state_path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != PANE_STATE_VERSION:
+        return None
+    return state
+
+
+def _registry_matches(project_root: Path, state: dict[str, Any]) -> bool:
+    stamp = file_stamp(get_active_agents_path(project_root))
+    return stamp is not None and state.get("registry") == stamp
+
+
+def cached_agent_id(project_root: Path, pane_id: str) -> str | None:
+    """Get the agent ID cached for a pane if the registry hasn't changed.
+
+    Args:
+        project_root: Project root directory
+        pane_id: tmux pane ID
+
+    Returns:
+        Cached agent ID, or None if there is no valid cache entry
+    """
+    state = _load_pane_state(project_root, pane_id)
+    if state is None or not _registry_matches(project_root, state):
+        return None
+    return state.get("agent_id")
+
+
+def probe_no_new_messages(project_root: Path, pane_id: str) -> str | None:
+    """Check whether the pane's agent certainly has no new messages.
+
+    Costs one small read and two stat() calls. Any doubt (missing state,
+    changed registry or log) answers None so the caller runs the full check.
+
+    Args:
+        project_root: Project root directory
+        pane_id: tmux pane ID
+
+    Returns:
+        The agent ID if nothing new arrived since its last check, else None
+    """
+    state = _load_pane_state(project_root, pane_id)
+    if state is None or not state.get("agent_id"):
+        return None
+    if not _registry_matches(project_root, state):
+        return None
+    if file_stamp(get_messages_log_path(project_root)) != state.get("log"):
+        return None
+    return state["agent_id"]
+
+
+def save_pane_state(
+    project_root: Path,
+    pane_id: str,
+    agent_id: str,
+    registry_stamp: list[int] | None,
+    log_stamp: list[int] | None,
+) -> None:
+    """Record a completed check for the pane.
+
+    Stamps must be taken before the registry and log were read, so that
+    anything written during the check invalidates the state.
+
+    Args:
+        project_root: Project root directory
+        pane_id: tmux pane ID
+        agent_id: Agent detected for the pane
+        registry_stamp: file_stamp() of ACTIVE_AGENTS.json
+        log_stamp: file_stamp() of agent_messages.log
+    """
+    state_path = get_pane_state_path(project_root, pane_id)
+    if state_path is None or registry_stamp is None:
+        return
+
+    state = {
+        "version": PANE_STATE_VERSION,
+        "agent_id": agent_id,
+        "registry": registry_stamp,
+        "log": log_stamp,
+    }
+    try:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = state_path.with_name(f".{state_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
+    except OSError:
+        pass  # The fast path is an optimization; the full check still works
@@ -20,9 +20,15 @@ The learning system enables:
 
 from __future__ import annotations
 
+import heapq
 import json
+import math
+import os
+import re
 import threading
 import time
+from array import array
+from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -32,25 +38,178 @@ from .agent_cards import AgentCardRegistry
 from .file_lock import FileLock, FileLockTimeout
 from .logging_config import get_logger
 from .project import get_project_root
-from .tasks import Task, TaskStatus
+from .tasks import Task, TaskManager, TaskStatus, get_task_timing
 
 __all__ = [
     "AgentPerformance",
+    "OutcomeWindow",
     "SkillMetrics",
     "LearningSystem",
     "get_learning_data_path",
+    "get_learning_shard_dir",
 ]
 
 # Constants
-LEARNING_DATA_FILENAME = "LEARNING_DATA.json"
+LEARNING_DATA_FILENAME = "LEARNING_DATA.json"  # Aggregated index across agents
+LEARNING_SHARD_DIR = ".learning"  # One file per agent
+LEARNING_INDEX_VERSION = "2.0"
+TEAM_SUMMARY_VERSION = "1.0"  # Bump when the materialized summary layout changes
+TEAM_SUMMARY_TOP_K = 3
+ACTIVE_WINDOW_SECONDS = 86400  # Agents active within this window count as active
 LEARNING_LOCK_TIMEOUT_SECONDS = 5.0
 MAX_HISTORY_ENTRIES_PER_SKILL = 100  # Max outcomes to track per skill
+TREND_MIN_SAMPLES = 10  # Outcomes needed before a trend is reported
+TREND_THRESHOLD = 0.1  # Success rate change that counts as a trend
 EXPONENTIAL_DECAY_WEIGHT = 0.1  # Weight for exponential moving average
 
+# File extension -> skill, used when a task does not list its skills
+FILE_EXTENSION_SKILLS = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".go": "golang",
+}
+
 # Configure logging
 logger = get_logger(__name__)
 
 
+class OutcomeWindow:
+    """Fixed-size ring buffer of the most recent task outcomes.
+
+    Outcomes, completion times and epoch timestamps are kept in parallel
+    arrays, so a full window of MAX_HISTORY_ENTRIES_PER_SKILL entries
+    costs a few kilobytes. Once full, the oldest outcome is overwritten.
+    """
+
+    __slots__ = ("size", "_successes", "_durations", "_timestamps", "_next", "_count")
+
+    def __init__(self, size: int = MAX_HISTORY_ENTRIES_PER_SKILL):
+        """Create an empty window.
+
+        Args:
+            size: Maximum number of outcomes kept
+        """
+        self.size = size
+        self._successes = array("b", bytes(size))
+        self._durations = array("d", bytes(8 * size))  # 0.0 = not measured
+        self._timestamps = array("q", bytes(8 * size))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of outcomes in the window."""
+        return self._count
+
+    def __eq__(self, other: object) -> bool:
+        """Windows are equal if they hold the same outcomes in the same order."""
+        if not isinstance(other, OutcomeWindow):
+            return NotImplemented
+        return self.size == other.size and self.to_dict() == other.to_dict()
+
+    def append(
+        self,
+        success: bool,
+        completion_time: float | None = None,
+        timestamp: int | None = None,
+    ) -> None:
+        """Add an outcome, overwriting the oldest one when full.
+
+        Args:
+            success: Whether the task was successful
+            completion_time: Time to complete the task (seconds)
+            timestamp: Epoch seconds of the outcome (default: now)
+        """
+        self._successes[self._next] = 1 if success else 0
+        self._durations[self._next] = (
+            completion_time if completion_time is not None and completion_time > 0 else 0.0
+        )
+        self._timestamps[self._next] = int(time.time()) if timestamp is None else timestamp
+        self._next = (self._next + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+    def _positions(self, last_n: int | None = None) -> list[int]:
+        """Buffer positions from oldest to newest, optionally only the newest n."""
+        start = (self._next - self._count) % self.size
+        positions = [(start + i) % self.size for i in range(self._count)]
+        if last_n is not None:
+            positions = positions[-last_n:] if last_n > 0 else []
+        return positions
+
+    def success_rate(self, last_n: int | None = None) -> float | None:
+        """Success rate over the window.
+
+        Args:
+            last_n: Only consider the newest n outcomes
+
+        Returns:
+            Success rate, or None if the window is empty
+        """
+        positions = self._positions(last_n)
+        if not positions:
+            return None
+        return sum(self._successes[i] for i in positions) / len(positions)
+
+    def completion_percentile(self, percentile: float, last_n: int | None = None) -> float | None:
+        """Nearest-rank percentile of measured completion times.
+
+        Args:
+            percentile: Percentile between 0 and 100
+            last_n: Only consider the newest n outcomes
+
+        Returns:
+            Completion time in seconds, or None if nothing was measured
+        """
+        durations = sorted(
+            self._durations[i] for i in self._positions(last_n) if self._durations[i] > 0
+        )
+        if not durations:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * len(durations)))
+        return durations[rank - 1]
+
+    def trend(self) -> int:
+        """Compare the newer half of the window against the older half.
+
+        Returns:
+            1 if improving, -1 if declining, 0 if stable or too little data
+        """
+        if self._count < TREND_MIN_SAMPLES:
+            return 0
+        half = self._count // 2
+        positions = self._positions()
+        older = sum(self._successes[i] for i in positions[:half]) / half
+        newer = sum(self._successes[i] for i in positions[-half:]) / half
+        if newer - older > TREND_THRESHOLD:
+            return 1
+        if older - newer > TREND_THRESHOLD:
+            return -1
+        return 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, oldest outcome first."""
+        positions = self._positions()
+        return {
+            "size": self.size,
+            "successes": [self._successes[i] for i in positions],
+            "durations": [self._durations[i] for i in positions],
+            "timestamps": [self._timestamps[i] for i in positions],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> OutcomeWindow:
+        """Create from dictionary."""
+        window = cls(data.get("size", MAX_HISTORY_ENTRIES_PER_SKILL))
+        for success, duration, timestamp in zip(
+            data.get("successes", []),
+            data.get("durations", []),
+            data.get("timestamps", []),
+            strict=True,
+        ):
+            window.append(bool(success), duration, timestamp)
+        return window
+
+
 @dataclass
 class SkillMetrics:
     """Metrics for a specific skill.
@@ -64,6 +223,7 @@ class SkillMetrics:
         avg_completion_time: Average time to complete tasks (seconds)
         last_used: When this skill was last used
         trend: Recent trend direction (-1, 0, or 1)
+        window: Most recent outcomes, for windowed rates and percentiles
     """
 
     skill: str
@@ -74,6 +234,7 @@ class SkillMetrics:
     avg_completion_time: float = 0.0
     last_used: str | None = None
     trend: int = 0  # -1 = declining, 0 = stable, 1 = improving
+    window: OutcomeWindow = field(default_factory=OutcomeWindow)
 
     def record_outcome(
         self,
@@ -112,27 +273,37 @@ class SkillMetrics:
 
         self.last_used = datetime.now(UTC).isoformat()
 
-        # Calculate trend (simple: compare last 5 to previous 5)
-        # This is a simplified trend - could be made more sophisticated
-        if self.total_count >= 10:
-            recent_rate = self.success_rate
-            # Approximate historical rate from counts
-            historical_rate = self.success_count / self.total_count if self.total_count > 0 else 0.5
-            diff = recent_rate - historical_rate
-            if diff > 0.1:
-                self.trend = 1
-            elif diff < -0.1:
-                self.trend = -1
-            else:
-                self.trend = 0
+        self.window.append(success, completion_time)
+        self.trend = self.window.trend()
+
+    @property
+    def recent_success_rate(self) -> float:
+        """Success rate over the outcome window (the EMA rate if empty)."""
+        rate = self.window.success_rate()
+        return self.success_rate if rate is None else rate
+
+    @property
+    def p50_completion_time(self) -> float | None:
+        """Median completion time over the outcome window."""
+        return self.window.completion_percentile(50)
+
+    @property
+    def p90_completion_time(self) -> float | None:
+        """90th percentile completion time over the outcome window."""
+        return self.window.completion_percentile(90)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        data = asdict(self)
+        data["window"] = self.window.to_dict()
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> SkillMetrics:
         """Create from dictionary."""
+        data = dict(data)
+        if isinstance(data.get("window"), dict):
+            data["window"] = OutcomeWindow.from_dict(data["window"])
         return cls(**data)
 
 
@@ -277,11 +448,7 @@ class AgentPerformance:
         Returns:
             List of skill names with positive trend
         """
-        return [
-            skill
-            for skill, metrics in self.skill_metrics.items()
-            if metrics.trend > 0
-        ]
+        return [skill for skill, metrics in self.skill_metrics.items() if metrics.trend > 0]
 
     def get_declining_skills(self) -> list[str]:
         """Get skills that are declining.
@@ -289,11 +456,7 @@ class AgentPerformance:
         Returns:
             List of skill names with negative trend
         """
-        return [
-            skill
-            for skill, metrics in self.skill_metrics.items()
-            if metrics.trend < 0
-        ]
+        return [skill for skill, metrics in self.skill_metrics.items() if metrics.trend < 0]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -331,6 +494,126 @@ class AgentPerformance:
         )
 
 
+# AgentPerformance fields copied into the aggregated index
+INDEXED_METRICS = (
+    "tasks_completed",
+    "tasks_failed",
+    "tasks_in_progress",
+    "overall_success_rate",
+    "avg_response_time",
+    "avg_completion_time",
+)
+
+
+def _index_entry(perf: AgentPerformance) -> dict[str, Any]:
+    """Summarize an agent for the aggregated index."""
+    entry: dict[str, Any] = {metric: getattr(perf, metric) for metric in INDEXED_METRICS}
+    entry["last_active"] = perf.last_active
+    entry["improving"] = bool(perf.get_improving_skills())
+    return entry
+
+
+def _activity_timestamp(last_active: str | None) -> float | None:
+    """Convert an ISO last_active string to epoch seconds."""
+    if not last_active:
+        return None
+    try:
+        return datetime.fromisoformat(last_active).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
+def _top_performers(index: dict[str, dict[str, Any]]) -> list[list[Any]]:
+    """Select the top agents by overall success rate."""
+    top = heapq.nlargest(
+        TEAM_SUMMARY_TOP_K,
+        index.items(),
+        key=lambda item: item[1]["overall_success_rate"],
+    )
+    return [[agent_id, entry["overall_success_rate"]] for agent_id, entry in top]
+
+
+def _build_team_summary(index: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Compute the materialized team summary from index entries."""
+    return {
+        "version": TEAM_SUMMARY_VERSION,
+        "total_tasks_completed": sum(e["tasks_completed"] for e in index.values()),
+        "total_tasks_failed": sum(e["tasks_failed"] for e in index.values()),
+        "top_performers": _top_performers(index),
+        "improving_agents": [agent_id for agent_id, e in index.items() if e["improving"]],
+        "last_active": {
+            agent_id: ts
+            for agent_id, e in index.items()
+            if (ts := _activity_timestamp(e["last_active"])) is not None
+        },
+    }
+
+
+def _update_team_summary(
+    summary: dict[str, Any],
+    agent_id: str,
+    old: dict[str, Any] | None,
+    new: dict[str, Any],
+    index: dict[str, dict[str, Any]],
+) -> None:
+    """Fold one agent's index change into the materialized team summary.
+
+    Args:
+        summary: Summary to update in place
+        agent_id: Agent whose entry changed
+        old: Previous index entry (None for a new agent)
+        new: New index entry, already stored in ``index``
+        index: Full index after the change
+    """
+    summary["total_tasks_completed"] += new["tasks_completed"] - (
+        old["tasks_completed"] if old else 0
+    )
+    summary["total_tasks_failed"] += new["tasks_failed"] - (old["tasks_failed"] if old else 0)
+
+    # Only re-rank when the change can affect the top-k
+    top = summary["top_performers"]
+    if (
+        len(top) < TEAM_SUMMARY_TOP_K
+        or any(entry[0] == agent_id for entry in top)
+        or new["overall_success_rate"] >= top[-1][1]
+    ):
+        summary["top_performers"] = _top_performers(index)
+
+    improving = summary["improving_agents"]
+    if new["improving"] and agent_id not in improving:
+        improving.append(agent_id)
+    elif not new["improving"] and agent_id in improving:
+        improving.remove(agent_id)
+
+    ts = _activity_timestamp(new["last_active"])
+    if ts is not None:
+        summary["last_active"][agent_id] = ts
+
+
+def _skills_from_files(files: list[str]) -> list[str]:
+    """Infer skills from file extensions.
+
+    Args:
+        files: File paths touched by a task
+
+    Returns:
+        Skill names, one per recognized file
+    """
+    skills = []
+    for filepath in files:
+        skill = FILE_EXTENSION_SKILLS.get(Path(filepath).suffix.lower())
+        if skill:
+            skills.append(skill)
+    return skills
+
+
+def _moving_average(current: float, value: float) -> float:
+    """Fold a new sample into an exponential moving average (0 means unset)."""
+    if current == 0:
+        return value
+    return current * (1 - EXPONENTIAL_DECAY_WEIGHT) + value * EXPONENTIAL_DECAY_WEIGHT
+
+
 def get_learning_data_path(project_root: Path | None = None) -> Path:
     """Get the path to the learning data file.
 
@@ -344,11 +627,31 @@ def get_learning_data_path(project_root: Path | None = None) -> Path:
     return root / LEARNING_DATA_FILENAME
 
 
+def get_learning_shard_dir(project_root: Path | None = None) -> Path:
+    """Get the directory holding per-agent learning data.
+
+    Args:
+        project_root: Optional project root directory
+
+    Returns:
+        Path to the .learning directory
+    """
+    root = get_project_root(project_root)
+    return root / LEARNING_SHARD_DIR
+
+
 class LearningSystem:
     """System for learning agent capabilities over time.
 
     Tracks task outcomes, updates skill scores, and provides
     insights into agent performance.
+
+    Each agent's performance lives in its own file under .learning/, and
+    recording an outcome only touches that file, so updates for different
+    agents never contend. LEARNING_DATA.json holds a small per-agent index
+    used by get_leaderboard and get_team_summary. Readers keep it current:
+    it records each shard's (mtime, size) stamp, and only shards whose
+    stamp changed are re-read when the index is next read.
     """
 
     def __init__(self, project_root: Path | None = None):
@@ -359,79 +662,325 @@ class LearningSystem:
         """
         self.project_root = get_project_root(project_root)
         self.data_path = get_learning_data_path(self.project_root)
+        self.shard_dir = get_learning_shard_dir(self.project_root)
         self.card_registry = AgentCardRegistry(self.project_root)
         self._lock = threading.Lock()
         self._task_start_times: dict[str, float] = {}  # task_id -> start_time
+        self._migrate_legacy_data()
 
-    def _read_data(self) -> dict[str, AgentPerformance]:
-        """Read learning data from file.
+    def _get_shard_path(self, agent_id: str) -> Path:
+        """Get the path to an agent's learning file.
+
+        Args:
+            agent_id: Agent identifier
 
         Returns:
-            Dictionary mapping agent_id to AgentPerformance
+            Path to the agent's shard
+
+        Raises:
+            ValueError: If agent_id contains characters unsafe for a file name
         """
-        if not self.data_path.exists():
-            return {}
+        if not re.match(r"^[a-zA-Z0-9_-]+$", agent_id):
+            raise ValueError(
+                f"Invalid agent_id '{agent_id}': must contain only alphanumeric characters, underscores, and hyphens"
+            )
+        return self.shard_dir / f"{agent_id}.json"
+
+    def _migrate_legacy_data(self) -> None:
+        """Split a single-file LEARNING_DATA.json from older versions into shards."""
+        if self.shard_dir.exists() or not self.data_path.exists():
+            return
 
         try:
-            with FileLock(self.data_path, timeout=LEARNING_LOCK_TIMEOUT_SECONDS, shared=True):
-                with open(self.data_path, encoding="utf-8") as f:
-                    data = json.load(f)
+            with open(self.data_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == LEARNING_INDEX_VERSION:
+                return
+            agents = {
+                agent_id: AgentPerformance.from_dict(perf_data)
+                for agent_id, perf_data in data.get("agents", {}).items()
+            }
+        except Exception as e:
+            logger.warning(f"Could not migrate legacy learning data: {e}")
+            return
+
+        with self._lock:
+            self._write_data(agents)
+        logger.info(f"Migrated learning data for {len(agents)} agent(s) to {self.shard_dir}")
+
+    def _read_shard(self, path: Path) -> AgentPerformance | None:
+        """Parse a shard file (caller holds its lock).
+
+        Returns:
+            AgentPerformance, or None if the file is missing, empty or invalid
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+        if not content:
+            return None
+        try:
+            return AgentPerformance.from_dict(json.loads(content))
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Invalid learning data in {path.name}: {e}")
+            return None
+
+    def _write_shard(self, path: Path, perf: AgentPerformance) -> None:
+        """Atomically write a shard file (caller holds its lock)."""
+        temp_path = path.with_suffix(".json.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(perf.to_dict(), f, indent=2)
+        temp_path.replace(path)
+
+    def _load_agent(self, agent_id: str) -> AgentPerformance | None:
+        """Read one agent's performance.
+
+        Args:
+            agent_id: Agent identifier
+
+        Returns:
+            AgentPerformance if stored, None otherwise
+        """
+        path = self._get_shard_path(agent_id)
+        if not path.exists():
+            return None
+
+        try:
+            with FileLock(path, timeout=LEARNING_LOCK_TIMEOUT_SECONDS, shared=True):
+                return self._read_shard(path)
+        except FileLockTimeout:
+            logger.error(f"Timeout acquiring lock on {path}")
+            return None
+        except Exception as e:
+            logger.warning(f"Error reading learning data for {agent_id}: {e}")
+            return None
+
+    def _update_agent(
+        self,
+        agent_id: str,
+        update: Callable[[AgentPerformance], None],
+    ) -> AgentPerformance:
+        """Read-modify-write one agent's shard.
+
+        The index is not touched; readers pick the change up from the
+        shard's stamp.
 
-                return {
-                    agent_id: AgentPerformance.from_dict(perf_data)
-                    for agent_id, perf_data in data.get("agents", {}).items()
-                }
+        Args:
+            agent_id: Agent identifier
+            update: Function applied to the agent's performance in place
+
+        Returns:
+            Updated AgentPerformance
+        """
+        path = self._get_shard_path(agent_id)
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
 
+        with self._lock:
+            try:
+                with FileLock(path, timeout=LEARNING_LOCK_TIMEOUT_SECONDS, shared=False):
+                    perf = self._read_shard(path) or AgentPerformance(agent_id=agent_id)
+                    update(perf)
+                    self._write_shard(path, perf)
+            except FileLockTimeout:
+                logger.error(f"Timeout acquiring write lock on {path}")
+                raise
+
+        return perf
+
+    def _shard_stamps(self) -> dict[str, list[int]]:
+        """Get the (mtime_ns, size) stamp of every shard.
+
+        Returns:
+            Dictionary mapping agent_id to its shard's stamp
+        """
+        stamps = {}
+        try:
+            with os.scandir(self.shard_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    stamps[entry.name[: -len(".json")]] = [stat.st_mtime_ns, stat.st_size]
+        except FileNotFoundError:
+            pass
+        return stamps
+
+    def _load_index_file(self) -> dict[str, Any] | None:
+        """Read LEARNING_DATA.json as written.
+
+        Returns:
+            Index file contents, or None if missing, unreadable or outdated
+        """
+        try:
+            with FileLock(self.data_path, timeout=LEARNING_LOCK_TIMEOUT_SECONDS, shared=True):
+                with open(self.data_path, encoding="utf-8") as f:
+                    content = f.read()
+            data = json.loads(content) if content else None
+        except FileNotFoundError:
+            return None
         except FileLockTimeout:
             logger.error(f"Timeout acquiring lock on {self.data_path}")
-            return {}
+            return None
         except Exception as e:
-            logger.warning(f"Error reading learning data: {e}")
-            return {}
+            logger.warning(f"Error reading learning index: {e}")
+            return None
 
-    def _write_data(self, agents: dict[str, AgentPerformance]) -> None:
-        """Write learning data to file.
+        if not isinstance(data, dict) or data.get("version") != LEARNING_INDEX_VERSION:
+            return None
+        return data
+
+    def _read_index_data(self, rebuild: bool = False) -> dict[str, Any]:
+        """Read the index, folding in shards that changed since it was written.
+
+        Shard stamps are compared with the ones recorded in the index; only
+        new or changed shards are read, and removed shards are dropped. If
+        anything changed, the refreshed index is written back when the
+        index lock is free (a busy lock just skips the write).
 
         Args:
-            agents: Dictionary mapping agent_id to AgentPerformance
+            rebuild: Ignore the stored index and re-read every shard
+
+        Returns:
+            Index file contents ("agents", "stamps" and "summary"), empty if
+            no data
         """
-        self.data_path.parent.mkdir(parents=True, exist_ok=True)
+        stamps = self._shard_stamps()
+        data = None if rebuild else self._load_index_file()
+        if data is None:
+            if not stamps:
+                return {}
+            data = {"agents": {}, "stamps": {}, "summary": None}
+
+        index: dict[str, dict[str, Any]] = data.get("agents", {})
+        stored_stamps: dict[str, list[int]] = data.get("stamps", {})
+        summary: dict[str, Any] | None = data.get("summary")
+
+        changed = [
+            agent_id for agent_id, stamp in stamps.items() if stored_stamps.get(agent_id) != stamp
+        ]
+        removed = [agent_id for agent_id in index if agent_id not in stamps]
+        if not changed and not removed and summary is not None:
+            return data
+
+        rebuild_summary = (
+            summary is None or summary.get("version") != TEAM_SUMMARY_VERSION or bool(removed)
+        )
+        for agent_id in removed:
+            del index[agent_id]
+        new_stamps = {agent_id: stamps[agent_id] for agent_id in stamps if agent_id not in changed}
+        for agent_id in changed:
+            perf = self._load_agent(agent_id)
+            if perf is None:
+                # Empty or invalid shard; recorded so it is not re-read
+                # until it changes
+                if index.pop(agent_id, None) is not None:
+                    rebuild_summary = True
+            else:
+                old_entry = index.get(agent_id)
+                index[agent_id] = _index_entry(perf)
+                if not rebuild_summary:
+                    _update_team_summary(summary, agent_id, old_entry, index[agent_id], index)
+            new_stamps[agent_id] = stamps[agent_id]
 
         data = {
-            "version": "1.0",
+            "version": LEARNING_INDEX_VERSION,
             "updated_at": datetime.now(UTC).isoformat(),
-            "agents": {agent_id: perf.to_dict() for agent_id, perf in agents.items()},
+            "agents": index,
+            "stamps": new_stamps,
+            "summary": _build_team_summary(index) if rebuild_summary else summary,
         }
+        self._write_index_file(data)
+        return data
 
+    def _write_index_file(self, data: dict[str, Any]) -> None:
+        """Write the refreshed index if nobody else is writing it.
+
+        The index is a cache keyed on shard stamps, so losing a race only
+        costs the next reader a few shard reads.
+        """
         try:
-            with FileLock(self.data_path, timeout=LEARNING_LOCK_TIMEOUT_SECONDS, shared=False):
-                temp_path = self.data_path.with_suffix(".json.tmp")
+            with FileLock(self.data_path, timeout=0, shared=False):
+                temp_path = self.data_path.with_suffix(f".json.{os.getpid()}.tmp")
                 with open(temp_path, "w", encoding="utf-8") as f:
                     json.dump(data, f, indent=2)
                 temp_path.replace(self.data_path)
+        except FileLockTimeout:
+            logger.debug(f"Learning index busy, not writing {self.data_path}")
+        except Exception as e:
+            logger.warning(f"Error writing learning index: {e}")
+
+    def _read_index(self) -> dict[str, dict[str, Any]]:
+        """Read the aggregated per-agent index.
+
+        Returns:
+            Dictionary mapping agent_id to its index entry
+        """
+        return self._read_index_data().get("agents", {})
+
+    def _read_data(self) -> dict[str, AgentPerformance]:
+        """Read learning data for every agent.
+
+        Returns:
+            Dictionary mapping agent_id to AgentPerformance
+        """
+        if not self.shard_dir.exists():
+            return {}
+
+        agents = {}
+        for path in sorted(self.shard_dir.glob("*.json")):
+            perf = self._load_agent(path.stem)
+            if perf is not None:
+                agents[perf.agent_id] = perf
+        return agents
+
+    def _write_data(self, agents: dict[str, AgentPerformance]) -> None:
+        """Replace learning data for all agents.
+
+        Shards of agents not in ``agents`` are removed.
+
+        Args:
+            agents: Dictionary mapping agent_id to AgentPerformance
+        """
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            for agent_id, perf in agents.items():
+                path = self._get_shard_path(agent_id)
+                with FileLock(path, timeout=LEARNING_LOCK_TIMEOUT_SECONDS, shared=False):
+                    self._write_shard(path, perf)
+
+            for path in self.shard_dir.glob("*.json"):
+                if path.stem not in agents:
+                    path.unlink(missing_ok=True)
 
         except FileLockTimeout:
-            logger.error(f"Timeout acquiring write lock on {self.data_path}")
+            logger.error(f"Timeout acquiring write lock in {self.shard_dir}")
             raise
         except Exception as e:
             logger.error(f"Error writing learning data: {e}")
             raise
 
     def get_agent_performance(self, agent_id: str) -> AgentPerformance:
-        """Get or create performance data for an agent.
+        """Get performance data for an agent.
+
+        Nothing is written for an unknown agent; its shard is created by
+        the first recorded outcome.
 
         Args:
             agent_id: Agent identifier
 
         Returns:
-            AgentPerformance for the agent
+            AgentPerformance for the agent (empty if nothing is recorded)
         """
-        with self._lock:
-            agents = self._read_data()
-            if agent_id not in agents:
-                agents[agent_id] = AgentPerformance(agent_id=agent_id)
-                self._write_data(agents)
-            return agents[agent_id]
+        perf = self._load_agent(agent_id)
+        if perf is not None:
+            return perf
+        return AgentPerformance(agent_id=agent_id)
 
     def record_task_started(self, task_id: str, agent_id: str) -> None:
         """Record that a task has started.
@@ -442,13 +991,11 @@ class LearningSystem:
         """
         self._task_start_times[task_id] = time.time()
 
-        with self._lock:
-            agents = self._read_data()
-            if agent_id not in agents:
-                agents[agent_id] = AgentPerformance(agent_id=agent_id)
-            agents[agent_id].tasks_in_progress += 1
-            agents[agent_id].last_active = datetime.now(UTC).isoformat()
-            self._write_data(agents)
+        def update(perf: AgentPerformance) -> None:
+            perf.tasks_in_progress += 1
+            perf.last_active = datetime.now(UTC).isoformat()
+
+        self._update_agent(agent_id, update)
 
         logger.debug(f"Recorded task start: {task_id} by {agent_id}")
 
@@ -470,19 +1017,16 @@ class LearningSystem:
             logger.warning(f"Cannot record completion: task {task.task_id} has no assignee")
             return
 
-        # Calculate completion time
-        completion_time = None
-        if task.task_id in self._task_start_times:
-            completion_time = time.time() - self._task_start_times[task.task_id]
-            del self._task_start_times[task.task_id]
-
-        with self._lock:
-            agents = self._read_data()
-            if agent_id not in agents:
-                agents[agent_id] = AgentPerformance(agent_id=agent_id)
-
-            perf = agents[agent_id]
+        # Prefer timing persisted with the task; the in-process start time
+        # only helps when start and completion are recorded by one process
+        timing = get_task_timing(task)
+        response_time = timing.response_time
+        completion_time = timing.work_time
+        start_time = self._task_start_times.pop(task.task_id, None)
+        if completion_time is None and start_time is not None:
+            completion_time = time.time() - start_time
 
+        def update(perf: AgentPerformance) -> None:
             # Decrement in-progress count (prevent negative values)
             perf.tasks_in_progress = max(0, perf.tasks_in_progress - 1)
 
@@ -490,10 +1034,11 @@ class LearningSystem:
             perf.record_task_outcome(
                 success=success,
                 skills=skills,
+                response_time=response_time,
                 completion_time=completion_time,
             )
 
-            self._write_data(agents)
+        self._update_agent(agent_id, update)
 
         # Update agent card with new success rates
         self._sync_to_agent_card(agent_id, skills or [])
@@ -548,14 +1093,16 @@ class LearningSystem:
         Returns:
             List of (agent_id, metric_value) tuples
         """
-        agents = self._read_data()
-
         results = []
-        for agent_id, perf in agents.items():
-            if hasattr(perf, metric):
-                value = getattr(perf, metric)
-                if isinstance(value, (int, float)):
-                    results.append((agent_id, value))
+        if metric in INDEXED_METRICS:
+            for agent_id, entry in self._read_index().items():
+                results.append((agent_id, entry[metric]))
+        else:
+            for agent_id, perf in self._read_data().items():
+                if hasattr(perf, metric):
+                    value = getattr(perf, metric)
+                    if isinstance(value, (int, float)):
+                        results.append((agent_id, value))
 
         results.sort(key=lambda x: x[1], reverse=True)
         return results[:limit]
@@ -583,15 +1130,24 @@ class LearningSystem:
         results.sort(key=lambda x: x[1], reverse=True)
         return results[:limit]
 
-    def get_team_summary(self) -> dict[str, Any]:
+    def get_team_summary(self, fresh: bool = False) -> dict[str, Any]:
         """Get a summary of team performance.
 
+        Served from the summary materialized in the index, which is
+        refreshed from the shards that changed since it was last read.
+
+        Args:
+            fresh: Recompute the summary from every agent's data first
+
         Returns:
             Dictionary with team-level statistics
         """
-        agents = self._read_data()
+        data = self._read_index_data(rebuild=fresh)
 
-        if not agents:
+        agents = data.get("agents", {})
+        summary = data.get("summary")
+
+        if not agents or not summary:
             return {
                 "total_agents": 0,
                 "total_tasks_completed": 0,
@@ -602,31 +1158,13 @@ class LearningSystem:
                 "improving_agents": [],
             }
 
-        total_completed = sum(a.tasks_completed for a in agents.values())
-        total_failed = sum(a.tasks_failed for a in agents.values())
+        total_completed = summary["total_tasks_completed"]
+        total_failed = summary["total_tasks_failed"]
         total = total_completed + total_failed
 
         # Find active agents (active in last 24 hours)
-        now = datetime.now(UTC)
-        active_count = 0
-        for perf in agents.values():
-            if perf.last_active:
-                try:
-                    last_active = datetime.fromisoformat(perf.last_active)
-                    if (now - last_active).total_seconds() < 86400:
-                        active_count += 1
-                except (ValueError, TypeError):
-                    pass
-
-        # Get top performers
-        leaderboard = self.get_leaderboard(limit=3)
-
-        # Find improving agents
-        improving = []
-        for agent_id, perf in agents.items():
-            improving_skills = perf.get_improving_skills()
-            if improving_skills:
-                improving.append(agent_id)
+        cutoff = time.time() - ACTIVE_WINDOW_SECONDS
+        active_count = sum(1 for ts in summary["last_active"].values() if ts > cutoff)
 
         return {
             "total_agents": len(agents),
@@ -634,8 +1172,8 @@ class LearningSystem:
             "total_tasks_failed": total_failed,
             "overall_success_rate": round(total_completed / total, 3) if total > 0 else 0.0,
             "active_agents": active_count,
-            "top_performers": leaderboard,
-            "improving_agents": improving[:5],
+            "top_performers": [tuple(entry) for entry in summary["top_performers"]],
+            "improving_agents": summary["improving_agents"][:5],
         }
 
     def record_task_from_history(self, task: Task) -> None:
@@ -649,72 +1187,92 @@ class LearningSystem:
         if not task.assigned_to:
             return
 
-        # Find relevant history entries
-        assignment_time = None
-        start_time = None
-        completion_time = None
-
-        for entry in task.history:
-            if entry.to_status == TaskStatus.ASSIGNED.value:
-                try:
-                    assignment_time = datetime.fromisoformat(entry.timestamp)
-                except (ValueError, TypeError):
-                    pass
-            elif entry.to_status == TaskStatus.WORKING.value:
-                try:
-                    start_time = datetime.fromisoformat(entry.timestamp)
-                except (ValueError, TypeError):
-                    pass
-            elif entry.to_status in (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value):
-                try:
-                    completion_time = datetime.fromisoformat(entry.timestamp)
-                except (ValueError, TypeError):
-                    pass
-
-        # Calculate times
-        response_time = None
-        if assignment_time and start_time:
-            response_time = (start_time - assignment_time).total_seconds()
-
-        work_time = None
-        if start_time and completion_time:
-            work_time = (completion_time - start_time).total_seconds()
+        timing = get_task_timing(task)
 
         # Determine success
         success = task.status == TaskStatus.COMPLETED
 
-        # Extract skills from task (this would need skill extraction logic)
-        # For now, we'll use file extensions as a proxy
-        skills = []
-        for filepath in task.files:
-            ext = Path(filepath).suffix.lower()
-            # Map extension to skill (simplified)
-            ext_skills = {
-                ".py": "python",
-                ".js": "javascript",
-                ".ts": "typescript",
-                ".go": "golang",
-            }
-            if ext in ext_skills:
-                skills.append(ext_skills[ext])
+        skills = _skills_from_files(task.files)
 
         # Record with full timing
-        with self._lock:
-            agents = self._read_data()
-            if task.assigned_to not in agents:
-                agents[task.assigned_to] = AgentPerformance(agent_id=task.assigned_to)
-
-            perf = agents[task.assigned_to]
-            perf.record_task_outcome(
+        self._update_agent(
+            task.assigned_to,
+            lambda perf: perf.record_task_outcome(
                 success=success,
                 skills=skills if skills else None,
-                response_time=response_time,
-                completion_time=work_time,
-            )
-
-            self._write_data(agents)
+                response_time=timing.response_time,
+                completion_time=timing.work_time,
+            ),
+        )
 
         logger.debug(
             f"Recorded task from history: {task.task_id} by {task.assigned_to} "
             f"(success={success})"
         )
+
+    def backfill_timing(self, tasks: list[Task] | None = None) -> int:
+        """Recompute response and completion times from task history.
+
+        Replays terminal tasks in completion order and replaces the
+        per-agent and per-skill time averages they cover. Outcome counts
+        and success rates are left untouched.
+
+        Args:
+            tasks: Tasks to replay (default: all terminal tasks in
+                TASKS.json and the task archive)
+
+        Returns:
+            Number of tasks with timing data that were replayed
+        """
+        if tasks is None:
+            tasks = TaskManager(self.project_root).list_tasks(
+                include_terminal=True, include_archived=True
+            )
+
+        timed = []
+        for task in tasks:
+            if not task.assigned_to or task.status not in (
+                TaskStatus.COMPLETED,
+                TaskStatus.FAILED,
+            ):
+                continue
+            timing = get_task_timing(task)
+            if timing.finished_at and (timing.response_time or timing.work_time):
+                timed.append((timing.finished_at, task, timing))
+        if not timed:
+            return 0
+        timed.sort(key=lambda item: item[0])
+
+        response_times: dict[str, float] = {}
+        completion_times: dict[str, float] = {}
+        skill_times: dict[tuple[str, str], float] = {}
+        for _, task, timing in timed:
+            agent_id = task.assigned_to
+            response_time = timing.response_time
+            work_time = timing.work_time
+            if response_time is not None and response_time > 0:
+                response_times[agent_id] = _moving_average(
+                    response_times.get(agent_id, 0.0), response_time
+                )
+            if work_time is not None and work_time > 0:
+                completion_times[agent_id] = _moving_average(
+                    completion_times.get(agent_id, 0.0), work_time
+                )
+                for skill in _skills_from_files(task.files):
+                    key = (agent_id, skill)
+                    skill_times[key] = _moving_average(skill_times.get(key, 0.0), work_time)
+
+        def update(perf: AgentPerformance) -> None:
+            if perf.agent_id in response_times:
+                perf.avg_response_time = response_times[perf.agent_id]
+            if perf.agent_id in completion_times:
+                perf.avg_completion_time = completion_times[perf.agent_id]
+            for (agent_id, skill), avg_time in skill_times.items():
+                if agent_id == perf.agent_id:
+                    perf.get_skill_metrics(skill).avg_completion_time = avg_time
+
+        for agent_id in sorted({task.assigned_to for _, task, _ in timed}):
+            self._update_agent(agent_id, update)
+
+        logger.info(f"Backfilled timing from {len(timed)} task(s)")
+        return len(timed)
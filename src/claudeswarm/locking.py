@@ -645,6 +645,73 @@ class LockManager:
             logger.error(f"Failed to release lock on '{filepath}' for {agent_id}: {e}")
             return False
 
+    def transfer_lock(
+        self,
+        filepath: str,
+        from_agent: str,
+        to_agent: str,
+        reason: str = "",
+    ) -> bool:
+        """Hand a lock held by one agent directly to another.
+
+        Used for preemption: the lock never becomes free in between, so no
+        third agent can grab it while ownership changes. The new lock is
+        written to a temp file and renamed over the old one, like a lock
+        refresh.
+
+        Args:
+            filepath: Path of the locked file
+            from_agent: Agent that must currently hold the lock
+            to_agent: Agent that receives the lock
+            reason: Reason recorded on the transferred lock
+
+        Returns:
+            True if the lock was transferred, False if from_agent does not
+            hold it (or the write failed)
+
+        Raises:
+            ValidationError: If inputs are invalid
+        """
+        from_agent = validate_agent_id(from_agent)
+        to_agent = validate_agent_id(to_agent)
+        filepath = str(normalize_path(filepath))
+        lock_path = self._get_lock_path(filepath)
+
+        with self._lock:
+            existing_lock = self._read_lock(lock_path)
+            if not existing_lock or existing_lock.agent_id != from_agent:
+                holder = existing_lock.agent_id if existing_lock else None
+                logger.warning(
+                    f"Cannot transfer lock on '{filepath}': {from_agent} does not hold it "
+                    f"(held by {holder})"
+                )
+                return False
+
+            new_lock = FileLock(
+                agent_id=to_agent,
+                filepath=existing_lock.filepath,
+                locked_at=time.time(),
+                reason=reason,
+            )
+            temp_lock_path = lock_path.with_suffix(".lock.tmp")
+            try:
+                with temp_lock_path.open("w") as f:
+                    json.dump(new_lock.to_dict(), f, indent=2)
+                os.replace(str(temp_lock_path), str(lock_path))
+            except OSError as e:
+                if temp_lock_path.exists():
+                    try:
+                        temp_lock_path.unlink()
+                    except OSError:
+                        pass
+                logger.error(
+                    f"Failed to transfer lock on '{filepath}' from {from_agent} to {to_agent}: {e}"
+                )
+                return False
+
+        logger.info(f"Lock on '{filepath}' transferred from {from_agent} to {to_agent}")
+        return True
+
     def who_has_lock(self, filepath: str) -> FileLock | None:
         """Check who currently holds a lock on a file.
 
@@ -28,7 +28,11 @@ Example memory:
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import heapq
 import json
+import os
 import re
 import threading
 from dataclasses import asdict, dataclass, field
@@ -52,9 +56,11 @@ __all__ = [
 # Constants
 MEMORY_DIR = ".agent_memory"
 MEMORY_LOCK_TIMEOUT_SECONDS = 5.0
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0  # Max delay for write-behind saves
 MAX_TASK_HISTORY = 50
 MAX_PATTERNS = 100
 MAX_KNOWLEDGE_ITEMS = 200
+EFFECTIVE_PATTERN_THRESHOLD = 0.6
 
 # Configure logging
 logger = get_logger(__name__)
@@ -160,6 +166,10 @@ class AgentRelationship:
         notes: Free-form notes about the agent
     """
 
+    # Set by the owning AgentMemory to keep its skill index current.
+    # Deliberately unannotated so it is not a dataclass field.
+    _strength_listener = None
+
     agent_id: str
     trust_score: float = 0.5
     reliability_score: float = 0.5
@@ -210,6 +220,8 @@ class AgentRelationship:
         """
         if strength and strength not in self.strengths:
             self.strengths.append(strength)
+            if self._strength_listener is not None:
+                self._strength_listener(self, strength)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -234,6 +246,14 @@ class AgentMemory:
         preferences: Agent preferences
         created_at: When memory was initialized
         updated_at: Last update time
+
+    Patterns are indexed by (pattern_type, pattern_id) and relationships by
+    their lowercased strengths, so reinforcement and skill lookups do not
+    scan the whole memory. A lazy min-heap of pattern effectiveness picks
+    the pattern to evict once MAX_PATTERNS is exceeded. The indexes are
+    rebuilt on load and kept current by this class's methods; effectiveness
+    assigned directly on a pattern is only seen by the eviction heap after
+    the next reload.
     """
 
     agent_id: str
@@ -244,6 +264,83 @@ class AgentMemory:
     preferences: dict[str, Any] = field(default_factory=dict)
     created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    _pattern_index: dict[str, dict[str, LearnedPattern]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _pattern_order: dict[tuple[str, str], int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _next_pattern_order: int = field(default=0, init=False, repr=False, compare=False)
+    _eviction_heap: list[tuple[float, int, tuple[str, str]]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _skill_index: dict[str, dict[str, AgentRelationship]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Build the pattern and skill indexes."""
+        self._rebuild_pattern_index()
+        for relationship in self.relationships.values():
+            self._index_relationship(relationship)
+
+    def _rebuild_pattern_index(self) -> None:
+        """Rebuild the pattern index and eviction heap from self.patterns."""
+        self._pattern_index = {}
+        self._pattern_order = {}
+        for order, pattern in enumerate(self.patterns):
+            by_id = self._pattern_index.setdefault(pattern.pattern_type, {})
+            by_id[pattern.pattern_id] = pattern
+            self._pattern_order[(pattern.pattern_type, pattern.pattern_id)] = order
+        self._next_pattern_order = len(self.patterns)
+        self._rebuild_eviction_heap()
+
+    def _rebuild_eviction_heap(self) -> None:
+        """Rebuild the eviction heap with one entry per live pattern."""
+        self._eviction_heap = [
+            (self._get_pattern(key).effectiveness, -order, key)
+            for key, order in self._pattern_order.items()
+        ]
+        heapq.heapify(self._eviction_heap)
+
+    def _get_pattern(self, key: tuple[str, str]) -> LearnedPattern | None:
+        """Look up a pattern by (pattern_type, pattern_id)."""
+        pattern_type, pattern_id = key
+        return self._pattern_index.get(pattern_type, {}).get(pattern_id)
+
+    def _push_eviction_entry(self, key: tuple[str, str]) -> None:
+        """Record a pattern's current effectiveness in the eviction heap."""
+        pattern = self._get_pattern(key)
+        heapq.heappush(self._eviction_heap, (pattern.effectiveness, -self._pattern_order[key], key))
+        # Superseded entries are skipped lazily; compact before they pile up
+        if len(self._eviction_heap) > 2 * max(len(self._pattern_order), MAX_PATTERNS):
+            self._rebuild_eviction_heap()
+
+    def _evict_least_effective(self) -> None:
+        """Drop the least effective pattern (newest first among ties)."""
+        while self._eviction_heap:
+            effectiveness, neg_order, key = heapq.heappop(self._eviction_heap)
+            if self._pattern_order.get(key) != -neg_order:
+                continue
+            pattern = self._get_pattern(key)
+            if pattern.effectiveness != effectiveness:
+                heapq.heappush(self._eviction_heap, (pattern.effectiveness, neg_order, key))
+                continue
+            del self._pattern_index[key[0]][key[1]]
+            del self._pattern_order[key]
+            self.patterns.remove(pattern)
+            return
+
+    def _index_relationship(self, relationship: AgentRelationship) -> None:
+        """Add a relationship's strengths to the skill index."""
+        relationship._strength_listener = self._on_strength_added
+        for strength in relationship.strengths:
+            self._on_strength_added(relationship, strength)
+
+    def _on_strength_added(self, relationship: AgentRelationship, strength: str) -> None:
+        """Index a newly added strength of a relationship."""
+        agents = self._skill_index.setdefault(strength.lower(), {})
+        agents[relationship.agent_id] = relationship
 
     def remember_task(
         self,
@@ -307,17 +404,17 @@ class AgentMemory:
         Returns:
             Created or updated LearnedPattern
         """
-        import hashlib
-
         # Generate ID from description
         pattern_id = hashlib.md5(description.encode()).hexdigest()[:12]
+        key = (pattern_type, pattern_id)
 
         # Check if pattern exists
-        for pattern in self.patterns:
-            if pattern.pattern_id == pattern_id:
-                pattern.reinforce(effectiveness > 0.5)
-                self._touch()
-                return pattern
+        pattern = self._get_pattern(key)
+        if pattern is not None:
+            pattern.reinforce(effectiveness > 0.5)
+            self._push_eviction_entry(key)
+            self._touch()
+            return pattern
 
         # Create new pattern
         pattern = LearnedPattern(
@@ -329,12 +426,14 @@ class AgentMemory:
         )
 
         self.patterns.append(pattern)
+        self._pattern_index.setdefault(pattern_type, {})[pattern_id] = pattern
+        self._pattern_order[key] = self._next_pattern_order
+        self._next_pattern_order += 1
+        self._push_eviction_entry(key)
 
         # Trim patterns
         if len(self.patterns) > MAX_PATTERNS:
-            # Remove least effective patterns
-            self.patterns.sort(key=lambda p: p.effectiveness, reverse=True)
-            self.patterns = self.patterns[:MAX_PATTERNS]
+            self._evict_least_effective()
 
         self._touch()
         return pattern
@@ -349,7 +448,9 @@ class AgentMemory:
             AgentRelationship
         """
         if agent_id not in self.relationships:
-            self.relationships[agent_id] = AgentRelationship(agent_id=agent_id)
+            relationship = AgentRelationship(agent_id=agent_id)
+            self.relationships[agent_id] = relationship
+            self._index_relationship(relationship)
         return self.relationships[agent_id]
 
     def record_interaction(
@@ -398,20 +499,28 @@ class AgentMemory:
         """
         return self.knowledge.get(key)
 
-    def get_effective_patterns(self, pattern_type: str | None = None) -> list[LearnedPattern]:
+    def get_effective_patterns(
+        self, pattern_type: str | None = None, limit: int | None = None
+    ) -> list[LearnedPattern]:
         """Get patterns that work well.
 
         Args:
             pattern_type: Optional filter by type
+            limit: Optional maximum number of patterns, most effective first
 
         Returns:
-            List of effective patterns (effectiveness > 0.6)
+            List of effective patterns (effectiveness > 0.6), in learned
+            order unless limit is given
         """
-        patterns = self.patterns
         if pattern_type:
-            patterns = [p for p in patterns if p.pattern_type == pattern_type]
+            patterns = self._pattern_index.get(pattern_type, {}).values()
+        else:
+            patterns = self.patterns
 
-        return [p for p in patterns if p.effectiveness > 0.6]
+        effective = [p for p in patterns if p.effectiveness > EFFECTIVE_PATTERN_THRESHOLD]
+        if limit is not None:
+            return heapq.nlargest(limit, effective, key=lambda p: p.effectiveness)
+        return effective
 
     def get_trusted_agents(self, min_trust: float = 0.6) -> list[str]:
         """Get agents we trust.
@@ -433,13 +542,8 @@ class AgentMemory:
         Returns:
             List of (agent_id, reliability_score) tuples
         """
-        skill_lower = skill.lower()
-        results = []
-
-        for rel in self.relationships.values():
-            if any(s.lower() == skill_lower for s in rel.strengths):
-                results.append((rel.agent_id, rel.reliability_score))
-
+        agents = self._skill_index.get(skill.lower(), {})
+        results = [(rel.agent_id, rel.reliability_score) for rel in agents.values()]
         results.sort(key=lambda x: x[1], reverse=True)
         return results
 
@@ -494,19 +598,99 @@ class MemoryStore:
     """Store for managing agent memories.
 
     Each agent has its own memory file stored in the .agent_memory directory.
+
+    By default every save is written through to disk. Long-lived processes
+    can enable write-behind mode: memories are then cached in-process,
+    saves only mark the agent dirty, and dirty agents are flushed together
+    at most ``flush_interval`` seconds later, on flush()/close(), when the
+    store is used as a context manager, or at interpreter exit. Write-behind
+    assumes this process is the only writer of the agents it caches.
     """
 
-    def __init__(self, project_root: Path | None = None):
+    def __init__(
+        self,
+        project_root: Path | None = None,
+        write_behind: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        fsync: bool = False,
+    ):
         """Initialize the memory store.
 
         Args:
             project_root: Root directory of the project
+            write_behind: Cache memories and coalesce saves into periodic flushes
+            flush_interval: Max seconds a write-behind save stays unflushed
+            fsync: fsync memory files before replacing them
         """
         self.project_root = get_project_root(project_root)
         self.memory_dir = get_memory_path(self.project_root)
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.fsync = fsync
         self._lock = threading.Lock()
+        self._cache: dict[str, AgentMemory] = {}
+        self._dirty: set[str] = set()
+        self._flush_timer: threading.Timer | None = None
         self._ensure_directory()
 
+        if self.write_behind:
+            atexit.register(self.close)
+
+    def __enter__(self) -> MemoryStore:
+        """Use the store as a context manager that flushes on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Flush pending write-behind saves."""
+        self.close()
+
+    def _schedule_flush(self) -> None:
+        """Start the flush timer if none is pending (caller holds the lock)."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> int:
+        """Write all dirty memories to disk.
+
+        Returns:
+            Number of memories written
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            flushed = 0
+            for agent_id in sorted(self._dirty):
+                try:
+                    self._write_memory(self._cache[agent_id])
+                    flushed += 1
+                except Exception as e:
+                    # Keep it dirty so a later flush retries
+                    logger.error(f"Failed to flush memory for {agent_id}: {e}")
+                    continue
+                self._dirty.discard(agent_id)
+
+            if self._dirty:
+                self._schedule_flush()
+
+        if flushed:
+            logger.debug(f"Flushed {flushed} agent memory file(s)")
+        return flushed
+
+    def close(self) -> None:
+        """Flush pending saves and stop the flush timer."""
+        if not self.write_behind:
+            return
+        self.flush()
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        atexit.unregister(self.close)
+
     def _ensure_directory(self) -> None:
         """Ensure the memory directory exists."""
         self.memory_dir.mkdir(parents=True, exist_ok=True)
@@ -589,6 +773,9 @@ class MemoryStore:
                 temp_path = memory_file.with_suffix(".json.tmp")
                 with open(temp_path, "w", encoding="utf-8") as f:
                     json.dump(memory.to_dict(), f, indent=2)
+                    if self.fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
                 temp_path.replace(memory_file)
 
         except FileLockTimeout:
@@ -608,20 +795,40 @@ class MemoryStore:
             AgentMemory (creates new if doesn't exist)
         """
         with self._lock:
+            if self.write_behind and agent_id in self._cache:
+                return self._cache[agent_id]
+
             memory = self._read_memory(agent_id)
             if memory is None:
                 memory = AgentMemory(agent_id=agent_id)
-                self._write_memory(memory)
+                if self.write_behind:
+                    self._get_memory_file(agent_id)  # Validate before caching
+                    self._dirty.add(agent_id)
+                    self._schedule_flush()
+                else:
+                    self._write_memory(memory)
+
+            if self.write_behind:
+                self._cache[agent_id] = memory
             return memory
 
     def save_memory(self, memory: AgentMemory) -> None:
         """Save an agent's memory.
 
+        In write-behind mode the save is deferred to the next flush.
+
         Args:
             memory: AgentMemory to save
         """
         with self._lock:
-            self._write_memory(memory)
+            if not self.write_behind:
+                self._write_memory(memory)
+                return
+
+            self._get_memory_file(memory.agent_id)  # Validate before caching
+            self._cache[memory.agent_id] = memory
+            self._dirty.add(memory.agent_id)
+            self._schedule_flush()
 
     def delete_memory(self, agent_id: str) -> bool:
         """Delete an agent's memory.
@@ -634,8 +841,13 @@ class MemoryStore:
         """
         memory_file = self._get_memory_file(agent_id)
 
+        with self._lock:
+            self._cache.pop(agent_id, None)
+            was_pending = agent_id in self._dirty
+            self._dirty.discard(agent_id)
+
         if not memory_file.exists():
-            return False
+            return was_pending
 
         try:
             memory_file.unlink()
@@ -659,6 +871,10 @@ class MemoryStore:
                 agent_id = file.stem
                 agent_ids.append(agent_id)
 
+        # Include write-behind memories that have not been flushed yet
+        with self._lock:
+            agent_ids.extend(self._dirty.difference(agent_ids))
+
         return sorted(agent_ids)
 
     def remember_task(
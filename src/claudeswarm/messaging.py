@@ -732,7 +732,9 @@ class TmuxMessageDelivery:
             if pane_id in cls._pane_cache:
                 exists, timestamp = cls._pane_cache[pane_id]
                 age = time.time() - timestamp
-                ttl = cls._PANE_CACHE_POSITIVE_TTL_SECONDS if exists else cls._PANE_CACHE_TTL_SECONDS
+                ttl = (
+                    cls._PANE_CACHE_POSITIVE_TTL_SECONDS if exists else cls._PANE_CACHE_TTL_SECONDS
+                )
                 if age < ttl:
                     return exists
                 # Cache expired, remove entry
@@ -1118,6 +1120,35 @@ class MessageLogger:
             # Handle other file locking or I/O errors gracefully
             logger.error(f"Failed to log message {message.msg_id} to {self.log_file}: {e}")
 
+    def log_records(self, records: list[dict]) -> bool:
+        """Append non-message records (e.g. ACK receipts) to the log.
+
+        Records share the log with messages so they are ordered with them.
+        Each record carries a "record" field naming its kind and has no
+        "recipients", so message readers skip it.
+
+        Args:
+            records: Records to append, written in one locked append
+
+        Returns:
+            True if the records were written, False on lock timeout or I/O error
+        """
+        if not records:
+            return True
+
+        content = "".join(json.dumps(record) + "\n" for record in records)
+        try:
+            with FileLock(self.log_file, timeout=MESSAGE_LOG_LOCK_TIMEOUT_SECONDS, shared=False):
+                self._rotate_if_needed()
+                with open(self.log_file, "a") as f:
+                    f.write(content)
+            return True
+        except FileLockTimeout:
+            logger.warning(f"Timeout acquiring lock on {self.log_file} for log records")
+        except (FileLockError, OSError) as e:
+            logger.error(f"Failed to append records to {self.log_file}: {e}")
+        return False
+
     def _rotate_if_needed(self):
         """Rotate log file if it exceeds max size."""
         if not self.log_file.exists():
@@ -1301,7 +1332,13 @@ class MessagingSystem:
             )
 
     def send_message(
-        self, sender_id: str, recipient_id: str, msg_type: MessageType, content: str
+        self,
+        sender_id: str,
+        recipient_id: str,
+        msg_type: MessageType,
+        content: str,
+        msg_id: str | None = None,
+        requires_ack: bool = False,
     ) -> Message:
         """Send a direct message to a specific agent.
 
@@ -1310,6 +1347,8 @@ class MessagingSystem:
             recipient_id: ID of receiving agent
             msg_type: Type of message
             content: Message content
+            msg_id: Pre-generated message ID (default: new UUID)
+            requires_ack: Whether the message is tracked for acknowledgment
 
         Returns:
             Message object if successful
@@ -1342,6 +1381,8 @@ class MessagingSystem:
                 msg_type=msg_type,
                 content=content,
                 recipients=[recipient_id],
+                msg_id=msg_id or str(uuid.uuid4()),
+                requires_ack=requires_ack,
             )
         except ValueError as e:
             raise MessageDeliveryError(f"Invalid message data: {e}") from e
@@ -1732,7 +1773,12 @@ def _get_messaging_system() -> MessagingSystem:
 
 
 def send_message(
-    sender_id: str, recipient_id: str, message_type: MessageType, content: str
+    sender_id: str,
+    recipient_id: str,
+    message_type: MessageType,
+    content: str,
+    msg_id: str | None = None,
+    requires_ack: bool = False,
 ) -> Message | None:
     """Send a direct message to a specific agent.
 
@@ -1747,6 +1793,8 @@ def send_message(
         recipient_id: ID of receiving agent
         message_type: Type of message to send
         content: Message content
+        msg_id: Pre-generated message ID (default: new UUID)
+        requires_ack: Whether the message is tracked for acknowledgment
 
     Returns:
         Message object if successful, None if failed
@@ -1757,7 +1805,9 @@ def send_message(
     """
     try:
         messaging = _get_messaging_system()
-        return messaging.send_message(sender_id, recipient_id, message_type, content)
+        return messaging.send_message(
+            sender_id, recipient_id, message_type, content, msg_id, requires_ack
+        )
     except (RateLimitExceeded, AgentNotFoundError, TmuxError, MessageDeliveryError) as e:
         logger.error(f"send_message failed: {e}")
         return None
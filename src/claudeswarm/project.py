@@ -14,6 +14,7 @@ Priority order:
 4. Current working directory (fallback)
 """
 
+import hashlib
 import os
 from pathlib import Path
 
@@ -23,6 +24,7 @@ __all__ = [
     "get_active_agents_path",
     "get_messages_log_path",
     "get_locks_dir_path",
+    "get_daemon_socket_path",
 ]
 
 # Marker files that indicate a project root
@@ -35,6 +37,11 @@ PROJECT_MARKERS = [
     "package.json",  # Node project
 ]
 
+# Unix socket paths are limited to ~108 bytes (sun_path); longer project
+# paths get their daemon socket in the temp directory instead
+DAEMON_SOCKET_FILENAME = ".claudeswarmd.sock"
+MAX_SOCKET_PATH_LENGTH = 100
+
 
 def find_project_root(start_path: Path | None = None, max_depth: int = 10) -> Path | None:
     """Find project root by searching for marker files.
@@ -153,3 +160,63 @@ def get_locks_dir_path(project_root: Path | None = None) -> Path:
         Path to .agent_locks directory
     """
     return get_project_root(project_root) / ".agent_locks"
+
+
+def get_daemon_socket_path(project_root: Path | None = None) -> Path:
+    """Get the path to the claudeswarmd Unix socket for a project.
+
+    The socket lives in the project root. If that path would be too long
+    for a Unix socket, a per-project name in a private per-user directory
+    is used instead ($XDG_RUNTIME_DIR, or claudeswarm-<uid> in the temp
+    directory), so other local users cannot plant a socket there.
+
+    Args:
+        project_root: Optional project root path
+
+    Returns:
+        Path to the daemon socket
+
+    Raises:
+        PermissionError: If the per-user directory exists but is not
+            private to the current user
+    """
+    root = get_project_root(project_root)
+    socket_path = root / DAEMON_SOCKET_FILENAME
+    if len(os.fsencode(socket_path)) <= MAX_SOCKET_PATH_LENGTH:
+        return socket_path
+
+    digest = hashlib.sha256(os.fsencode(root)).hexdigest()[:16]
+    return _private_runtime_dir() / f"claudeswarmd-{digest}.sock"
+
+
+def _private_runtime_dir() -> Path:
+    """Get (creating if needed) a directory only the current user can use."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and _is_private_dir(Path(runtime_dir)):
+        return Path(runtime_dir)
+
+    import tempfile
+
+    private_dir = Path(tempfile.gettempdir()) / f"claudeswarm-{os.getuid()}"
+    try:
+        private_dir.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    if not _is_private_dir(private_dir):
+        raise PermissionError(f"{private_dir} is not a private directory of the current user")
+    return private_dir
+
+
+def _is_private_dir(path: Path) -> bool:
+    """Check that path is a real directory owned by us with no group/other access."""
+    import stat
+
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and not st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    )
@@ -0,0 +1,345 @@
+"""Matrix-based agent scoring for Claude Swarm delegation.
+
+This module compiles a set of agent cards into a dense agent x skill
+proficiency matrix so that one or many tasks can be scored against every
+agent in a single pass, instead of calling AgentCard.get_skill_proficiency
+once per agent per requirement.
+
+The scores produced here follow delegation.calculate_agent_score exactly:
+- Unavailable agents score 0.0
+- Tasks without requirements score 0.5 + priority boost
+- Requirements below their minimum proficiency are dropped from the weighting
+- Specialization bonus of 0.05 * importance per matching skill, capped at 0.15
+
+NumPy is used when installed. Without it, an array-based fallback keeps
+the same results with plain Python arithmetic.
+
+solve_assignment() provides a dependency-free Hungarian solver used for
+load-balanced batch delegation.
+
+Example usage:
+    matrix = AgentSkillMatrix(registry.list_cards(availability="active"))
+    scores = matrix.score(extract_skills_from_task(task))
+    batch = matrix.score_batch([(reqs_a, 0.0), (reqs_b, 0.1)])
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .agent_cards import AgentCard
+
+if TYPE_CHECKING:
+    from .delegation import SkillRequirement
+
+# Optional NumPy acceleration
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+__all__ = [
+    "AgentSkillMatrix",
+    "HAS_NUMPY",
+    "solve_assignment",
+]
+
+# Scoring constants (mirrors delegation.calculate_agent_score)
+NO_REQUIREMENTS_SCORE = 0.5
+SPECIALIZATION_BONUS_PER_SKILL = 0.05
+MAX_SPECIALIZATION_BONUS = 0.15
+
+
+@lru_cache(maxsize=4096)
+def _skill_key(skill: str) -> str:
+    """Normalize a skill name for matrix lookup."""
+    return skill.lower()
+
+
+class AgentSkillMatrix:
+    """Dense agent x skill proficiency matrix.
+
+    Rows follow the order of the cards passed in, so callers can map
+    scores back to agents by index. Column 0 is reserved for skills that
+    no agent has, which always have proficiency 0.0.
+
+    Attributes:
+        agents: Compiled agent cards, in row order
+        agent_ids: Agent IDs, in row order
+        skill_index: Lowercase skill name -> column index
+    """
+
+    def __init__(self, agents: Sequence[AgentCard]):
+        """Compile agent cards into the proficiency matrix.
+
+        Args:
+            agents: Agent cards to compile
+        """
+        self.agents = list(agents)
+        self.agent_ids = [agent.agent_id for agent in self.agents]
+        self.skill_index: dict[str, int] = {}
+
+        card_skills = []
+        card_specializations = []
+        for agent in self.agents:
+            proficiencies = agent.get_skill_proficiencies()
+            specializations = {_skill_key(s) for s in agent.specializations}
+            for key in (*proficiencies, *specializations):
+                if key not in self.skill_index:
+                    self.skill_index[key] = len(self.skill_index) + 1
+            card_skills.append(proficiencies)
+            card_specializations.append(specializations)
+
+        width = len(self.skill_index) + 1
+        self._available = [agent.is_available() for agent in self.agents]
+        self._proficiency = []
+        self._specialization = []
+        for proficiencies, specializations in zip(card_skills, card_specializations, strict=True):
+            row = array("d", bytes(8 * width))
+            for key, value in proficiencies.items():
+                row[self.skill_index[key]] = value
+            spec_row = array("d", bytes(8 * width))
+            for key in specializations:
+                spec_row[self.skill_index[key]] = 1.0
+            self._proficiency.append(row)
+            self._specialization.append(spec_row)
+
+        if HAS_NUMPY:
+            shape = (len(self.agents), width)
+            self._np_proficiency = np.array(self._proficiency, dtype=np.float64).reshape(shape)
+            self._np_specialization = np.array(self._specialization, dtype=np.float64).reshape(
+                shape
+            )
+            self._np_available = np.array(self._available, dtype=bool)
+
+    def __len__(self) -> int:
+        """Number of compiled agents."""
+        return len(self.agents)
+
+    def _columns(self, requirements: Sequence[SkillRequirement]) -> list[int]:
+        """Map requirements to matrix columns (0 for unknown skills)."""
+        return [self.skill_index.get(_skill_key(req.skill), 0) for req in requirements]
+
+    def score(
+        self,
+        requirements: Sequence[SkillRequirement],
+        priority_boost: float = 0.0,
+    ) -> list[float]:
+        """Score one task against every agent.
+
+        Args:
+            requirements: Skill requirements of the task
+            priority_boost: Additional boost for high-priority tasks
+
+        Returns:
+            Scores in agent row order
+        """
+        return self.score_batch([(requirements, priority_boost)])[0]
+
+    def score_batch(
+        self,
+        tasks: Sequence[tuple[Sequence[SkillRequirement], float]],
+    ) -> list[list[float]]:
+        """Score many tasks against every agent at once.
+
+        Args:
+            tasks: (requirements, priority_boost) pairs, one per task
+
+        Returns:
+            One row of scores per task, in agent row order
+        """
+        if not tasks:
+            return []
+        if not self.agents:
+            return [[] for _ in tasks]
+        if HAS_NUMPY:
+            return self._score_batch_numpy(tasks)
+        return [self._score_python(reqs, boost) for reqs, boost in tasks]
+
+    def _score_batch_numpy(
+        self,
+        tasks: Sequence[tuple[Sequence[SkillRequirement], float]],
+    ) -> list[list[float]]:
+        """Vectorized scoring over an agents x tasks x requirements tensor."""
+        width = max(len(reqs) for reqs, _ in tasks) or 1
+        columns = np.zeros((len(tasks), width), dtype=np.intp)
+        weights = np.zeros((len(tasks), width), dtype=np.float64)
+        minimums = np.zeros((len(tasks), width), dtype=np.float64)
+        boosts = np.array([boost for _, boost in tasks], dtype=np.float64)
+        has_requirements = np.array([bool(reqs) for reqs, _ in tasks], dtype=bool)
+
+        for t, (reqs, _) in enumerate(tasks):
+            if not reqs:
+                continue
+            columns[t, : len(reqs)] = self._columns(reqs)
+            weights[t, : len(reqs)] = [req.importance for req in reqs]
+            minimums[t, : len(reqs)] = [req.minimum_proficiency for req in reqs]
+
+        # agents x tasks x requirements
+        proficiency = self._np_proficiency[:, columns]
+        passed = proficiency >= minimums[np.newaxis, :, :]
+        weights = np.broadcast_to(weights, proficiency.shape)
+        passed_weights = np.where(passed, weights, 0.0)
+
+        total_score = (proficiency * passed_weights).sum(axis=2)
+        total_weight = passed_weights.sum(axis=2)
+        base_score = np.divide(
+            total_score,
+            total_weight,
+            out=np.full_like(total_score, NO_REQUIREMENTS_SCORE),
+            where=total_weight > 0,
+        )
+
+        specialization = self._np_specialization[:, columns]
+        bonus = (SPECIALIZATION_BONUS_PER_SKILL * weights * specialization).sum(axis=2)
+        bonus = np.minimum(bonus, MAX_SPECIALIZATION_BONUS)
+
+        scores = np.minimum(1.0, base_score + bonus + boosts[np.newaxis, :])
+        scores = np.where(
+            has_requirements[np.newaxis, :],
+            scores,
+            NO_REQUIREMENTS_SCORE + boosts[np.newaxis, :],
+        )
+        scores = np.where(self._np_available[:, np.newaxis], scores, 0.0)
+        return scores.T.tolist()
+
+    def _score_python(
+        self,
+        requirements: Sequence[SkillRequirement],
+        priority_boost: float,
+    ) -> list[float]:
+        """Fallback scoring using the array-backed rows."""
+        columns = self._columns(requirements)
+        scores = []
+        for available, row, spec_row in zip(
+            self._available, self._proficiency, self._specialization, strict=True
+        ):
+            if not available:
+                scores.append(0.0)
+                continue
+            if not requirements:
+                scores.append(NO_REQUIREMENTS_SCORE + priority_boost)
+                continue
+
+            total_score = 0.0
+            total_weight = 0.0
+            bonus = 0.0
+            for req, column in zip(requirements, columns, strict=True):
+                proficiency = row[column]
+                if proficiency >= req.minimum_proficiency:
+                    total_score += proficiency * req.importance
+                    total_weight += req.importance
+                if spec_row[column]:
+                    bonus += SPECIALIZATION_BONUS_PER_SKILL * req.importance
+
+            base_score = total_score / total_weight if total_weight > 0 else NO_REQUIREMENTS_SCORE
+            bonus = min(bonus, MAX_SPECIALIZATION_BONUS)
+            scores.append(min(1.0, base_score + bonus + priority_boost))
+        return scores
+
+    def skill_matches(
+        self,
+        agent_index: int,
+        requirements: Sequence[SkillRequirement],
+    ) -> dict[str, float]:
+        """Get per-skill proficiencies for one agent.
+
+        Args:
+            agent_index: Row index of the agent
+            requirements: Skill requirements of the task
+
+        Returns:
+            Skill -> proficiency, 0.0 where below the minimum proficiency
+        """
+        if not self._available[agent_index]:
+            return {}
+
+        row = self._proficiency[agent_index]
+        matches = {}
+        for req, column in zip(requirements, self._columns(requirements), strict=True):
+            proficiency = row[column]
+            matches[req.skill] = proficiency if proficiency >= req.minimum_proficiency else 0.0
+        return matches
+
+
+def solve_assignment(cost: Sequence[Sequence[float]]) -> list[int]:
+    """Solve a rectangular minimum-cost assignment (Hungarian algorithm).
+
+    Every row is assigned to a distinct column so that the total cost is
+    minimal. Rows must not outnumber columns; callers that allow rows to
+    stay unassigned should add dummy columns.
+
+    Args:
+        cost: Cost matrix with one row per item and one column per slot
+
+    Returns:
+        Column index assigned to each row
+
+    Raises:
+        ValueError: If there are more rows than columns
+    """
+    rows = len(cost)
+    if rows == 0:
+        return []
+    cols = len(cost[0])
+    if rows > cols:
+        raise ValueError(f"Cannot assign {rows} rows to {cols} columns")
+
+    inf = float("inf")
+    # Potentials and matching are 1-indexed; index 0 is a virtual column
+    u = [0.0] * (rows + 1)
+    v = [0.0] * (cols + 1)
+    match = [0] * (cols + 1)  # column -> row
+    way = [0] * (cols + 1)
+
+    for row in range(1, rows + 1):
+        match[0] = row
+        col0 = 0
+        min_reduced = [inf] * (cols + 1)
+        used = [False] * (cols + 1)
+
+        while True:
+            used[col0] = True
+            row0 = match[col0]
+            row_cost = cost[row0 - 1]
+            delta = inf
+            col1 = 0
+            for col in range(1, cols + 1):
+                if used[col]:
+                    continue
+                reduced = row_cost[col - 1] - u[row0] - v[col]
+                if reduced < min_reduced[col]:
+                    min_reduced[col] = reduced
+                    way[col] = col0
+                if min_reduced[col] < delta:
+                    delta = min_reduced[col]
+                    col1 = col
+
+            for col in range(cols + 1):
+                if used[col]:
+                    u[match[col]] += delta
+                    v[col] -= delta
+                else:
+                    min_reduced[col] -= delta
+
+            col0 = col1
+            if match[col0] == 0:
+                break
+
+        # Augment along the alternating path
+        while col0:
+            col1 = way[col0]
+            match[col0] = match[col1]
+            col0 = col1
+
+    assignment = [-1] * rows
+    for col in range(1, cols + 1):
+        if match[col]:
+            assignment[match[col] - 1] = col - 1
+    return assignment
@@ -33,11 +33,12 @@ Example task:
 
 from __future__ import annotations
 
+import gzip
 import json
 import threading
 import uuid
 from dataclasses import asdict, dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -51,15 +52,24 @@ __all__ = [
     "TaskPriority",
     "Task",
     "TaskHistoryEntry",
+    "TaskTiming",
     "TaskManager",
     "TaskNotFoundError",
     "InvalidTransitionError",
     "get_tasks_path",
+    "get_task_archive_path",
+    "get_task_timing",
 ]
 
 # Constants
 TASKS_FILENAME = "TASKS.json"
 TASK_LOCK_TIMEOUT_SECONDS = 5.0
+TASK_ARCHIVE_DIR = ".task_archive"
+TASK_ARCHIVE_PREFIX = "tasks-"
+TASK_ARCHIVE_SUFFIX = ".json.gz"
+DEFAULT_ARCHIVE_AFTER_DAYS = 7
+MAX_HISTORY_ENTRIES_PER_TASK = 50
+TIMING_METADATA_KEY = "timing"
 
 # Configure logging
 logger = get_logger(__name__)
@@ -133,6 +143,15 @@ VALID_TRANSITIONS: dict[TaskStatus, set[TaskStatus]] = {
     TaskStatus.CANCELLED: set(),  # Terminal state
 }
 
+# Transitions that update TaskTiming
+TIMED_STATUSES = {
+    TaskStatus.ASSIGNED,
+    TaskStatus.WORKING,
+    TaskStatus.COMPLETED,
+    TaskStatus.FAILED,
+    TaskStatus.CANCELLED,
+}
+
 
 @dataclass
 class TaskHistoryEntry:
@@ -164,6 +183,98 @@ class TaskHistoryEntry:
         return cls(**data)
 
 
+@dataclass
+class TaskTiming:
+    """Lifecycle timestamps of a task.
+
+    Attributes:
+        assigned_at: When the task was last assigned
+        started_at: When work started after that assignment
+        finished_at: When the task reached a terminal state
+    """
+
+    assigned_at: str | None = None
+    started_at: str | None = None
+    finished_at: str | None = None
+
+    @staticmethod
+    def _seconds_between(start: str | None, end: str | None) -> float | None:
+        """Seconds between two ISO timestamps, or None if either is missing."""
+        if not start or not end:
+            return None
+        start_dt = _parse_timestamp(start)
+        end_dt = _parse_timestamp(end)
+        if start_dt is None or end_dt is None:
+            return None
+        return (end_dt - start_dt).total_seconds()
+
+    @property
+    def response_time(self) -> float | None:
+        """Seconds from assignment to start of work."""
+        return self._seconds_between(self.assigned_at, self.started_at)
+
+    @property
+    def work_time(self) -> float | None:
+        """Seconds from start of work to completion."""
+        return self._seconds_between(self.started_at, self.finished_at)
+
+    @property
+    def turnaround_time(self) -> float | None:
+        """Seconds from assignment to completion."""
+        return self._seconds_between(self.assigned_at, self.finished_at)
+
+    def record(self, status: TaskStatus, timestamp: str) -> None:
+        """Update the timestamps for a status transition.
+
+        Args:
+            status: Status the task moved to
+            timestamp: When the transition happened
+        """
+        if status == TaskStatus.ASSIGNED:
+            if self.started_at is None or self.finished_at is not None:
+                # New assignment cycle; returning from BLOCKED keeps the start
+                self.assigned_at = timestamp
+                self.started_at = None
+                self.finished_at = None
+        elif status == TaskStatus.WORKING:
+            if self.started_at is None:
+                self.started_at = timestamp
+        elif status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED):
+            self.finished_at = timestamp
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TaskTiming:
+        """Create from dictionary."""
+        return cls(
+            assigned_at=data.get("assigned_at"),
+            started_at=data.get("started_at"),
+            finished_at=data.get("finished_at"),
+        )
+
+    @classmethod
+    def from_history(cls, history: list[TaskHistoryEntry]) -> TaskTiming:
+        """Derive timing by replaying history transitions.
+
+        Args:
+            history: Task history entries, oldest first
+
+        Returns:
+            TaskTiming for the task
+        """
+        timing = cls()
+        for entry in history:
+            try:
+                status = TaskStatus(entry.to_status)
+            except ValueError:
+                continue
+            timing.record(status, entry.timestamp)
+        return timing
+
+
 @dataclass
 class Task:
     """Represents a delegatable task.
@@ -260,6 +371,12 @@ class Task:
         )
         self.history.append(entry)
 
+        # Keep timing with the task so it survives history compaction
+        if new_status in TIMED_STATUSES:
+            timing = get_task_timing(self)
+            timing.record(new_status, entry.timestamp)
+            self.metadata[TIMING_METADATA_KEY] = timing.to_dict()
+
         # Update status
         old_status = self.status
         self.status = new_status
@@ -366,6 +483,23 @@ class Task:
         """
         return self.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
 
+    def compact_history(self, max_entries: int = MAX_HISTORY_ENTRIES_PER_TASK) -> int:
+        """Cap the in-line history, keeping the creation entry and the newest entries.
+
+        Args:
+            max_entries: Maximum number of history entries to keep
+
+        Returns:
+            Number of entries dropped
+        """
+        if max_entries < 2 or len(self.history) <= max_entries:
+            return 0
+
+        dropped = len(self.history) - max_entries
+        self.history = [self.history[0]] + self.history[-(max_entries - 1) :]
+        self.metadata["history_dropped"] = self.metadata.get("history_dropped", 0) + dropped
+        return dropped
+
     def is_active(self) -> bool:
         """Check if task is actively being worked on.
 
@@ -410,21 +544,77 @@ def get_tasks_path(project_root: Path | None = None) -> Path:
     return root / TASKS_FILENAME
 
 
+def get_task_archive_path(project_root: Path | None = None) -> Path:
+    """Get the path to the task archive directory.
+
+    Args:
+        project_root: Optional project root directory
+
+    Returns:
+        Path to the archive directory in project root
+    """
+    root = get_project_root(project_root)
+    return root / TASK_ARCHIVE_DIR
+
+
+def get_task_timing(task: Task) -> TaskTiming:
+    """Get lifecycle timing for a task.
+
+    Uses the timing stored in the task metadata, falling back to replaying
+    the task history for tasks written before timing was stored.
+
+    Args:
+        task: Task to inspect
+
+    Returns:
+        TaskTiming for the task
+    """
+    stored = getattr(task, "metadata", {}).get(TIMING_METADATA_KEY)
+    if stored:
+        return TaskTiming.from_dict(stored)
+    return TaskTiming.from_history(getattr(task, "history", []))
+
+
+def _parse_timestamp(value: str) -> datetime | None:
+    """Parse an ISO timestamp, returning None if it is malformed."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
 class TaskManager:
     """Manages task lifecycle and persistence.
 
     Provides thread-safe operations for creating, updating,
     and querying tasks with file-based persistence.
+
+    Terminal tasks can be moved out of TASKS.json into gzip-compressed,
+    date-partitioned archive files with archive_tasks(). Archived tasks
+    are only read when a query explicitly asks for them.
     """
 
-    def __init__(self, project_root: Path | None = None):
+    def __init__(
+        self,
+        project_root: Path | None = None,
+        archive_after_days: float = DEFAULT_ARCHIVE_AFTER_DAYS,
+        max_history_entries: int = MAX_HISTORY_ENTRIES_PER_TASK,
+    ):
         """Initialize the task manager.
 
         Args:
             project_root: Root directory of the project
+            archive_after_days: Age in days after which terminal tasks are archived
+            max_history_entries: Maximum history entries kept in-line per task
         """
         self.project_root = get_project_root(project_root)
         self.tasks_path = get_tasks_path(self.project_root)
+        self.archive_dir = get_task_archive_path(self.project_root)
+        self.archive_after_days = archive_after_days
+        self.max_history_entries = max_history_entries
         self._lock = threading.Lock()
 
     def _read_tasks(self) -> dict[str, Task]:
@@ -469,6 +659,9 @@ class TaskManager:
         """
         self.tasks_path.parent.mkdir(parents=True, exist_ok=True)
 
+        for task in tasks.values():
+            task.compact_history(self.max_history_entries)
+
         data = {
             "version": "1.0",
             "updated_at": datetime.now(UTC).isoformat(),
@@ -609,6 +802,7 @@ class TaskManager:
         context_id: str | None = None,
         priority: TaskPriority | None = None,
         include_terminal: bool = False,
+        include_archived: bool = False,
     ) -> list[Task]:
         """List tasks with optional filtering.
 
@@ -619,11 +813,15 @@ class TaskManager:
             context_id: Filter by context
             priority: Filter by priority
             include_terminal: Include completed/failed/cancelled tasks
+            include_archived: Also search archived tasks (requires include_terminal)
 
         Returns:
             List of matching tasks
         """
         tasks = self._read_tasks()
+        if include_terminal and include_archived:
+            for task_id, task in self._read_archived_tasks().items():
+                tasks.setdefault(task_id, task)
         result = list(tasks.values())
 
         if status is not None:
@@ -723,6 +921,42 @@ class TaskManager:
         logger.info(f"Assigned task {task_id} to {agent_id}")
         return task
 
+    def assign_tasks(
+        self,
+        assignments: list[tuple[str, str, str]],
+    ) -> list[Task]:
+        """Assign several tasks in a single read-modify-write.
+
+        Either all assignments are written or none are.
+
+        Args:
+            assignments: (task_id, agent_id, message) tuples
+
+        Returns:
+            Updated tasks, in the order given
+
+        Raises:
+            TaskNotFoundError: If any task is not found
+        """
+        with self._lock:
+            tasks = self._read_tasks()
+
+            for task_id, _, _ in assignments:
+                if task_id not in tasks:
+                    raise TaskNotFoundError(f"Task not found: {task_id}")
+
+            updated = []
+            for task_id, agent_id, message in assignments:
+                task = tasks[task_id]
+                task.assign_to(agent_id, message)
+                updated.append(task)
+
+            if updated:
+                self._write_tasks(tasks)
+
+        logger.info(f"Assigned {len(updated)} task(s) in one batch")
+        return updated
+
     def transition_task(
         self,
         task_id: str,
@@ -844,13 +1078,20 @@ class TaskManager:
         tasks = self._read_tasks()
         return [t for t in tasks.values() if t.parent_task_id == parent_task_id]
 
-    def get_task_stats(self) -> dict[str, int]:
+    def get_task_stats(self, include_archived: bool = False) -> dict[str, int]:
         """Get task statistics.
 
+        Args:
+            include_archived: Also count archived tasks
+
         Returns:
             Dictionary with counts per status
         """
         tasks = self._read_tasks()
+        if include_archived:
+            for task_id, task in self._read_archived_tasks().items():
+                tasks.setdefault(task_id, task)
+
         stats = {status.value: 0 for status in TaskStatus}
 
         for task in tasks.values():
@@ -858,3 +1099,120 @@ class TaskManager:
 
         stats["total"] = len(tasks)
         return stats
+
+    def _archive_partition_path(self, day: str) -> Path:
+        """Get the archive file for a given day (YYYY-MM-DD)."""
+        return self.archive_dir / f"{TASK_ARCHIVE_PREFIX}{day}{TASK_ARCHIVE_SUFFIX}"
+
+    def _read_archive_partition(self, path: Path) -> dict[str, Task]:
+        """Read one archive partition.
+
+        Args:
+            path: Path to a compressed archive file
+
+        Returns:
+            Dictionary mapping task_id to Task
+        """
+        try:
+            with FileLock(path, timeout=TASK_LOCK_TIMEOUT_SECONDS, shared=True):
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    data = json.load(f)
+        except FileLockTimeout:
+            logger.error(f"Timeout acquiring lock on {path}")
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Invalid task archive {path}: {e}")
+            return {}
+
+        tasks = {}
+        for task_id, task_data in data.get("tasks", {}).items():
+            try:
+                tasks[task_id] = Task.from_dict(task_data)
+            except Exception as e:
+                logger.warning(f"Invalid archived task {task_id}: {e}")
+        return tasks
+
+    def _write_archive_partition(self, path: Path, tasks: dict[str, Task]) -> None:
+        """Write one archive partition atomically.
+
+        Args:
+            path: Path to the compressed archive file
+            tasks: Dictionary mapping task_id to Task
+        """
+        data = {
+            "version": "1.0",
+            "updated_at": datetime.now(UTC).isoformat(),
+            "tasks": {task_id: task.to_dict() for task_id, task in tasks.items()},
+        }
+
+        with FileLock(path, timeout=TASK_LOCK_TIMEOUT_SECONDS, shared=False):
+            temp_path = path.with_name(path.name + ".tmp")
+            with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            temp_path.replace(path)
+
+    def _read_archived_tasks(self) -> dict[str, Task]:
+        """Read all archived tasks.
+
+        Returns:
+            Dictionary mapping task_id to Task
+        """
+        if not self.archive_dir.is_dir():
+            return {}
+
+        tasks: dict[str, Task] = {}
+        for path in sorted(self.archive_dir.glob(f"{TASK_ARCHIVE_PREFIX}*{TASK_ARCHIVE_SUFFIX}")):
+            tasks.update(self._read_archive_partition(path))
+        return tasks
+
+    def archive_tasks(
+        self,
+        older_than_days: float | None = None,
+        now: datetime | None = None,
+    ) -> int:
+        """Move old terminal tasks out of TASKS.json into the archive.
+
+        Tasks are partitioned by the day they were last updated, one
+        compressed file per day.
+
+        Args:
+            older_than_days: Minimum age in days (default: archive_after_days)
+            now: Reference time (default: current UTC time)
+
+        Returns:
+            Number of tasks archived
+        """
+        if older_than_days is None:
+            older_than_days = self.archive_after_days
+        cutoff = (now or datetime.now(UTC)) - timedelta(days=older_than_days)
+
+        with self._lock:
+            tasks = self._read_tasks()
+
+            partitions: dict[str, dict[str, Task]] = {}
+            for task_id, task in tasks.items():
+                if not task.is_terminal():
+                    continue
+                updated = _parse_timestamp(task.updated_at)
+                if updated is None or updated > cutoff:
+                    continue
+                partitions.setdefault(updated.date().isoformat(), {})[task_id] = task
+
+            if not partitions:
+                return 0
+
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            archived = 0
+            for day, day_tasks in sorted(partitions.items()):
+                path = self._archive_partition_path(day)
+                existing = self._read_archive_partition(path) if path.exists() else {}
+                existing.update(day_tasks)
+                self._write_archive_partition(path, existing)
+                for task_id in day_tasks:
+                    del tasks[task_id]
+                archived += len(day_tasks)
+
+            self._write_tasks(tasks)
+
+        logger.info(f"Archived {archived} terminal task(s) older than {older_than_days} days")
+        return archived
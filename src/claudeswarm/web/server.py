@@ -261,6 +261,8 @@ def tail_log_file(file_path: Path, limit: int = 50) -> list[dict[str, Any]]:
                 if line:
                     try:
                         msg = json.loads(line)
+                        if "record" in msg:
+                            continue  # ACK receipts, not messages
                         messages.append(msg)
                     except json.JSONDecodeError:
                         # Skip malformed lines
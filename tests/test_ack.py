@@ -8,10 +8,12 @@ Tests cover:
 - Timeout calculation
 - Escalation after max retries
 - Integration with messaging system
+- ACK receipts in the message log and rebuilding from it
 """
 
 import json
 import tempfile
+import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -27,7 +29,28 @@ from claudeswarm.ack import (
     receive_ack,
     send_with_ack,
 )
-from claudeswarm.messaging import Message, MessageType
+from claudeswarm.messaging import Message, MessageLogger, MessageType
+from claudeswarm.utils import save_json
+
+
+def _delivered(
+    sender_id: str,
+    recipient_id: str,
+    msg_type: MessageType,
+    content: str,
+    msg_id: str | None = None,
+    requires_ack: bool = False,
+) -> Message:
+    """Stand-in for send_message that delivers under the pre-generated ID."""
+    return Message(
+        sender_id=sender_id,
+        timestamp=datetime.now(),
+        msg_type=msg_type,
+        content=content,
+        recipients=[recipient_id],
+        msg_id=msg_id,
+        requires_ack=requires_ack,
+    )
 
 
 class TestPendingAck:
@@ -133,7 +156,11 @@ class TestAckSystem:
         # Check file contains empty list with version
         with open(ack_system.pending_file) as f:
             data = json.load(f)
-        assert data == {"version": 0, "pending_acks": []}
+        assert data["version"] == 0
+        assert data["pending_acks"] == []
+
+        # Written with the header, so readers never need a full load
+        assert ack_system._read_header() == (None, 0, tuple(data["log_cursor"]))
 
     def test_ensure_pending_file_idempotent(self, ack_system: AckSystem) -> None:
         """Test that _ensure_pending_file is idempotent."""
@@ -144,41 +171,62 @@ class TestAckSystem:
         # Should still have empty list with version
         with open(ack_system.pending_file) as f:
             data = json.load(f)
-        assert data == {"version": 0, "pending_acks": []}
+        assert data["version"] == 0
+        assert data["pending_acks"] == []
+
+    def test_headerless_file_is_upgraded(self, temp_dir: Path) -> None:
+        """Test that an empty file from older versions gets the header once."""
+        pending_file = temp_dir / "PENDING_ACKS.json"
+        pending_file.write_text(json.dumps({"version": 3, "pending_acks": []}))
+
+        ack_system = AckSystem(pending_file=pending_file)
+        next_due, version, cursor = ack_system._read_header()
+        assert (next_due, version) == (None, 4)
+        assert cursor is not None
+
+        with patch.object(AckSystem, "_load_snapshot") as mock_load:
+            AckSystem(pending_file=pending_file)
+        mock_load.assert_not_called()
+
+    def test_default_files_live_in_project_root(self, temp_dir: Path, monkeypatch) -> None:
+        """Test that the default pending file is resolved like the rest of the package."""
+        monkeypatch.setenv("CLAUDESWARM_ROOT", str(temp_dir))
+
+        ack_system = AckSystem()
+
+        assert ack_system.pending_file == temp_dir / "PENDING_ACKS.json"
+        assert ack_system.log_file == temp_dir / "agent_messages.log"
+        assert ack_system.pending_file.exists()
 
     @patch("claudeswarm.ack.send_message")
     def test_send_with_ack_success(self, mock_send: MagicMock, ack_system: AckSystem) -> None:
         """Test sending a message with ACK requirement."""
-        # Mock send_message to return a Message
-        now = datetime.now()
-        mock_msg = Message(
-            sender_id="agent-1",
-            timestamp=now,
-            msg_type=MessageType.QUESTION,
-            content="[REQUIRES-ACK] Test message",
-            recipients=["agent-2"],
-            msg_id="test-msg-id",
-        )
-        mock_send.return_value = mock_msg
+        mock_send.side_effect = _delivered
 
         # Send with ACK
         msg_id = ack_system.send_with_ack(
             "agent-1", "agent-2", MessageType.QUESTION, "Test message", timeout=30
         )
 
-        assert msg_id == "test-msg-id"
+        assert msg_id is not None
 
-        # Verify send_message was called with [REQUIRES-ACK] prefix
+        # Verify send_message was called with [REQUIRES-ACK] prefix and the pre-generated ID
         mock_send.assert_called_once_with(
-            "agent-1", "agent-2", MessageType.QUESTION, "[REQUIRES-ACK] Test message"
+            "agent-1",
+            "agent-2",
+            MessageType.QUESTION,
+            "[REQUIRES-ACK] Test message",
+            msg_id=msg_id,
+            requires_ack=True,
         )
 
         # Verify pending ACK was added
         pending = ack_system.check_pending_acks()
         assert len(pending) == 1
-        assert pending[0].msg_id == "test-msg-id"
+        assert pending[0].msg_id == msg_id
         assert pending[0].sender_id == "agent-1"
         assert pending[0].recipient_id == "agent-2"
+        assert pending[0].message["content"] == "[REQUIRES-ACK] Test message"
 
     @patch("claudeswarm.ack.send_message")
     def test_send_with_ack_failure(self, mock_send: MagicMock, ack_system: AckSystem) -> None:
@@ -441,6 +489,97 @@ class TestAckSystem:
         pending = ack_system.check_pending_acks()
         assert len(pending) == 1
 
+    def _make_ack(self, msg_id: str, next_retry_at: datetime, retry_count: int = 0) -> PendingAck:
+        """Build a pending ACK for a QUESTION from agent-1 to agent-2."""
+        msg = Message(
+            sender_id="agent-1",
+            timestamp=datetime.now(),
+            msg_type=MessageType.QUESTION,
+            content=f"Test {msg_id}",
+            recipients=["agent-2"],
+            msg_id=msg_id,
+        )
+        return PendingAck(
+            msg_id=msg_id,
+            sender_id="agent-1",
+            recipient_id="agent-2",
+            message=msg.to_dict(),
+            sent_at=datetime.now().isoformat(),
+            retry_count=retry_count,
+            next_retry_at=next_retry_at.isoformat(),
+        )
+
+    def test_pending_acks_saved_in_due_order(self, ack_system: AckSystem) -> None:
+        """Test that ACKs are stored sorted by due time behind a next_due_at header."""
+        now = datetime.now()
+        acks = [
+            self._make_ack("late", now + timedelta(seconds=90)),
+            self._make_ack("early", now + timedelta(seconds=10)),
+            self._make_ack("middle", now + timedelta(seconds=30)),
+        ]
+        ack_system._save_pending_acks(acks)
+
+        with open(ack_system.pending_file) as f:
+            data = json.load(f)
+        assert next(iter(data)) == "next_due_at"
+        assert data["next_due_at"] == acks[1].next_retry_at
+        assert [a["msg_id"] for a in data["pending_acks"]] == ["early", "middle", "late"]
+        assert ack_system._peek_next_due() == now + timedelta(seconds=10)
+
+        ack_system._save_pending_acks([])
+        assert ack_system._peek_next_due() is None
+
+    def test_process_retries_nothing_due_skips_load(self, ack_system: AckSystem) -> None:
+        """Test that the nothing-due path never loads the pending ACK list."""
+        acks = [
+            self._make_ack(f"msg-{i}", datetime.now() + timedelta(seconds=30)) for i in range(5)
+        ]
+        ack_system._save_pending_acks(acks)
+
+        with patch.object(ack_system, "_load_pending_acks") as mock_load:
+            assert ack_system.process_retries() == 0
+        mock_load.assert_not_called()
+
+    @patch("claudeswarm.ack.broadcast_message")
+    @patch("claudeswarm.ack.send_message")
+    def test_process_retries_batches_into_one_write(
+        self, mock_send: MagicMock, mock_broadcast: MagicMock, ack_system: AckSystem
+    ) -> None:
+        """Test that all due retries and escalations are claimed in a single save."""
+        past = datetime.now() - timedelta(seconds=5)
+        ack_system._save_pending_acks(
+            [
+                self._make_ack("retry-1", past),
+                self._make_ack("retry-2", past),
+                self._make_ack("escalate", past, retry_count=AckSystem.MAX_RETRIES),
+                self._make_ack("later", datetime.now() + timedelta(seconds=30)),
+            ]
+        )
+
+        with patch("claudeswarm.ack.save_json", wraps=save_json) as mock_save:
+            count = ack_system.process_retries()
+
+        assert count == 3
+        assert mock_save.call_count == 1
+        assert mock_send.call_count == 2
+        mock_broadcast.assert_called_once()
+
+        pending = {ack.msg_id: ack for ack in ack_system.check_pending_acks()}
+        assert set(pending) == {"retry-1", "retry-2", "later"}
+        assert pending["retry-1"].retry_count == 1
+
+    @patch("claudeswarm.ack.send_message")
+    def test_process_retries_legacy_file_without_header(
+        self, mock_send: MagicMock, ack_system: AckSystem
+    ) -> None:
+        """Test that files written without next_due_at are still processed."""
+        ack = self._make_ack("legacy", datetime.now() - timedelta(seconds=5))
+        with open(ack_system.pending_file, "w") as f:
+            json.dump({"version": 3, "pending_acks": [ack.to_dict()]}, f)
+
+        assert ack_system.process_retries() == 1
+        mock_send.assert_called_once()
+
     def test_get_pending_count(self, ack_system: AckSystem) -> None:
         """Test getting pending ACK count."""
         assert ack_system.get_pending_count() == 0
@@ -658,56 +797,184 @@ class TestAckSystem:
                 result = ack_system.receive_ack(f"msg-{agent_num}-{i}", f"agent-{agent_num}")
                 assert result is True
 
-    def test_cryptographic_temp_id(self, ack_system: AckSystem) -> None:
-        """Test that temporary message IDs use cryptographically secure random values."""
-        from unittest.mock import MagicMock, patch
+    @patch("claudeswarm.ack.send_message")
+    def test_pending_ack_recorded_with_single_write(
+        self, mock_send: MagicMock, ack_system: AckSystem
+    ) -> None:
+        """Test that the ACK is recorded once, under its final ID, before sending."""
+        recorded_before_send = []
 
-        with patch("claudeswarm.ack.send_message") as mock_send:
-            now = datetime.now()
-            mock_msg = Message(
-                sender_id="agent-1",
-                timestamp=now,
-                msg_type=MessageType.QUESTION,
-                content="[REQUIRES-ACK] Test",
-                recipients=["agent-2"],
-                msg_id="real-msg-id",
+        def deliver(*args, msg_id=None, requires_ack=False):
+            recorded_before_send.append(
+                [ack.msg_id for ack in ack_system.check_pending_acks()] == [msg_id]
             )
-            mock_send.return_value = mock_msg
+            return _delivered(*args, msg_id=msg_id, requires_ack=requires_ack)
 
-            # Send multiple messages and verify temp IDs are unpredictable
-            temp_ids = []
+        mock_send.side_effect = deliver
 
-            # Track temporary IDs by checking what's added to pending before send completes
-            original_save = ack_system._save_pending_acks
+        with patch("claudeswarm.ack.save_json", wraps=save_json) as mock_save:
+            msg_id = ack_system.send_with_ack("agent-1", "agent-2", MessageType.QUESTION, "Test")
 
-            def capture_temp_id(acks, expected_version=None):
-                if acks:
-                    msg_id = acks[-1].msg_id
-                    # Only capture IDs that start with "temp-"
-                    if msg_id.startswith("temp-"):
-                        temp_ids.append(msg_id)
-                return original_save(acks, expected_version)
+        assert recorded_before_send == [True]
+        assert mock_save.call_count == 1
+        assert str(uuid.UUID(msg_id)) == msg_id
 
-            with patch.object(ack_system, "_save_pending_acks", side_effect=capture_temp_id):
-                for i in range(5):
-                    ack_system.send_with_ack(
-                        "agent-1", "agent-2", MessageType.QUESTION, f"Test {i}"
-                    )
+    @patch("claudeswarm.ack.send_message")
+    def test_message_ids_are_unique(self, mock_send: MagicMock, ack_system: AckSystem) -> None:
+        """Test that pre-generated message IDs are unpredictable and unique."""
+        mock_send.side_effect = _delivered
+
+        msg_ids = [
+            ack_system.send_with_ack("agent-1", "agent-2", MessageType.QUESTION, f"Test {i}")
+            for i in range(5)
+        ]
+
+        assert len(set(msg_ids)) == 5
+        assert {ack.msg_id for ack in ack_system.check_pending_acks()} == set(msg_ids)
+
+    def test_save_version_conflict(self, ack_system: AckSystem) -> None:
+        """Test that a stale expected version is rejected without writing."""
+        ack_system._save_pending_acks([])
+        _, version = ack_system._load_pending_acks()
+
+        assert ack_system._save_pending_acks([], expected_version=version - 1) is False
+        assert ack_system._save_pending_acks([], expected_version=version) is True
+        assert ack_system._load_pending_acks()[1] == version + 1
+        assert ack_system.lock_file.exists()
+
+
+class TestAckLog:
+    """Test ACK receipts carried in the message log."""
+
+    @pytest.fixture
+    def temp_dir(self) -> Path:
+        """Create temporary directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def ack_system(self, temp_dir: Path) -> AckSystem:
+        """Create AckSystem instance with its message log in temp_dir."""
+        return AckSystem(temp_dir / "PENDING_ACKS.json")
+
+    def _log_request(self, ack_system: AckSystem, msg_id: str, sent_at: datetime) -> PendingAck:
+        """Log a requires_ack message and record its pending ACK."""
+        msg = Message(
+            sender_id="agent-1",
+            timestamp=sent_at,
+            msg_type=MessageType.QUESTION,
+            content=f"[REQUIRES-ACK] {msg_id}",
+            recipients=["agent-2"],
+            msg_id=msg_id,
+            requires_ack=True,
+        )
+        MessageLogger(log_file=ack_system.log_file).log_message(msg, {"agent-2": True})
+        ack = PendingAck(
+            msg_id=msg_id,
+            sender_id="agent-1",
+            recipient_id="agent-2",
+            message=msg.to_dict(),
+            sent_at=sent_at.isoformat(),
+            next_retry_at=(sent_at + timedelta(seconds=30)).isoformat(),
+        )
+        acks, _ = ack_system._load_pending_acks()
+        ack_system._save_pending_acks(acks + [ack])
+        return ack
+
+    def _log_lines(self, ack_system: AckSystem) -> list[dict]:
+        """Read every entry of the message log."""
+        return [json.loads(line) for line in ack_system.log_file.read_text().splitlines()]
+
+    def test_receive_ack_appends_receipt(self, ack_system: AckSystem) -> None:
+        """Test that receive_ack appends to the log instead of rewriting PENDING_ACKS.json."""
+        self._log_request(ack_system, "msg-1", datetime.now())
+        before = ack_system.pending_file.read_bytes()
+
+        with patch("claudeswarm.ack.save_json") as mock_save:
+            assert ack_system.receive_ack("msg-1", "agent-2") is True
+        mock_save.assert_not_called()
+
+        assert ack_system.pending_file.read_bytes() == before
+        receipt = self._log_lines(ack_system)[-1]
+        assert receipt["record"] == "ack"
+        assert receipt["msg_id"] == "msg-1"
+        assert receipt["agent_id"] == "agent-2"
+        assert ack_system.check_pending_acks() == []
+
+    def test_receipt_visible_to_other_instances(
+        self, ack_system: AckSystem, temp_dir: Path
+    ) -> None:
+        """Test that another AckSystem derives the same pending view from the log."""
+        self._log_request(ack_system, "msg-1", datetime.now())
+        self._log_request(ack_system, "msg-2", datetime.now())
+        other = AckSystem(temp_dir / "PENDING_ACKS.json")
+        assert other.get_pending_count() == 2
+
+        ack_system.receive_ack("msg-1", "agent-2")
+
+        assert [ack.msg_id for ack in other.check_pending_acks()] == ["msg-2"]
+        assert other.receive_ack("msg-1", "agent-2") is False
+
+    def test_next_write_compacts_receipts(self, ack_system: AckSystem) -> None:
+        """Test that a stale ACK list never resurrects an acknowledged message."""
+        self._log_request(ack_system, "msg-1", datetime.now())
+        stale, _ = ack_system._load_pending_acks()
+        ack_system.receive_ack("msg-1", "agent-2")
+
+        ack_system._save_pending_acks(stale)
+
+        acks, _, cursor = ack_system._load_snapshot()
+        assert acks == []
+        assert cursor == (ack_system.log_file.stat().st_ino, ack_system.log_file.stat().st_size)
+
+    def test_spoofed_receipt_ignored(self, ack_system: AckSystem) -> None:
+        """Test that a receipt from the wrong agent does not close the ACK."""
+        self._log_request(ack_system, "msg-1", datetime.now())
+        MessageLogger(log_file=ack_system.log_file).log_records(
+            [{"record": "ack", "msg_id": "msg-1", "agent_id": "agent-3"}]
+        )
 
-            # Should have captured 5 temp IDs
-            assert len(temp_ids) == 5
+        assert ack_system.get_pending_count() == 1
 
-            # Verify temp IDs start with "temp-" prefix
-            for temp_id in temp_ids:
-                assert temp_id.startswith("temp-")
-                # Verify the rest is hex (32 chars from token_hex(16))
-                hex_part = temp_id.split("temp-")[1]
-                assert len(hex_part) == 32
-                # Verify it's valid hex
-                int(hex_part, 16)
+    def test_receipts_survive_log_rotation(self, ack_system: AckSystem) -> None:
+        """Test that receipts written before a rotation are still applied."""
+        self._log_request(ack_system, "msg-1", datetime.now())
+        ack_system.receive_ack("msg-1", "agent-2")
+        ack_system.log_file.rename(ack_system.log_file.with_suffix(".log.old"))
+        ack_system.log_file.touch()
 
-            # Verify temp IDs are unique (high entropy)
-            assert len(set(temp_ids)) == len(temp_ids)
+        acks, _ = ack_system._load_pending_acks()
+        assert acks == []
+
+    @patch("claudeswarm.ack.broadcast_message")
+    @patch("claudeswarm.ack.send_message")
+    def test_rebuild_from_log(
+        self, mock_send: MagicMock, mock_broadcast: MagicMock, ack_system: AckSystem
+    ) -> None:
+        """Test rebuilding the pending ACKs after PENDING_ACKS.json is lost."""
+        now = datetime.now()
+        self._log_request(ack_system, "acked", now)
+        self._log_request(ack_system, "open", now - timedelta(seconds=10))
+        expired = self._log_request(ack_system, "expired", now - timedelta(seconds=60))
+        expired.retry_count = AckSystem.MAX_RETRIES
+        expired.next_retry_at = (now - timedelta(seconds=1)).isoformat()
+        acks, _ = ack_system._load_pending_acks()
+        ack_system._save_pending_acks([a for a in acks if a.msg_id != "expired"] + [expired])
+        ack_system.receive_ack("acked", "agent-2")
+        assert ack_system.process_retries() == 1
+
+        ack_system.pending_file.unlink()
+        rebuilt = AckSystem(ack_system.pending_file)
+
+        assert rebuilt.rebuild_from_log() == 1
+        (ack,) = rebuilt.check_pending_acks()
+        assert ack.msg_id == "open"
+        assert ack.recipient_id == "agent-2"
+        assert ack.retry_count == 0
+        # The log records when the message was logged
+        assert ack.get_next_retry_datetime() - ack.get_sent_datetime() == timedelta(
+            seconds=AckSystem.RETRY_DELAYS[0]
+        )
 
 
 class TestModuleFunctions:
@@ -727,19 +994,10 @@ class TestModuleFunctions:
 
         ack_module._default_ack_system = AckSystem(temp_dir / "PENDING_ACKS.json")
 
-        now = datetime.now()
-        mock_msg = Message(
-            sender_id="agent-1",
-            timestamp=now,
-            msg_type=MessageType.QUESTION,
-            content="[REQUIRES-ACK] Test",
-            recipients=["agent-2"],
-            msg_id="test-id",
-        )
-        mock_send.return_value = mock_msg
+        mock_send.side_effect = _delivered
 
         msg_id = send_with_ack("agent-1", "agent-2", MessageType.QUESTION, "Test")
-        assert msg_id == "test-id"
+        assert msg_id == mock_send.call_args.kwargs["msg_id"]
 
     def test_acknowledge_message_function(self, temp_dir: Path) -> None:
         """Test module-level acknowledge_message function."""
@@ -870,25 +1128,16 @@ class TestIntegration:
     ) -> None:
         """Test complete workflow: send -> receive ACK."""
         # Mock successful send
-        now = datetime.now()
-        mock_msg = Message(
-            sender_id="agent-1",
-            timestamp=now,
-            msg_type=MessageType.QUESTION,
-            content="[REQUIRES-ACK] Help needed",
-            recipients=["agent-2"],
-            msg_id="workflow-test",
-        )
-        mock_send.return_value = mock_msg
+        mock_send.side_effect = _delivered
 
         # Send with ACK
         msg_id = ack_system.send_with_ack("agent-1", "agent-2", MessageType.QUESTION, "Help needed")
 
-        assert msg_id == "workflow-test"
+        assert msg_id is not None
         assert ack_system.get_pending_count() == 1
 
         # Receive ACK
-        result = ack_system.receive_ack("workflow-test", "agent-2")
+        result = ack_system.receive_ack(msg_id, "agent-2")
         assert result is True
         assert ack_system.get_pending_count() == 0
 
@@ -27,6 +27,7 @@ from claudeswarm.agent_cards import (
     CARD_LOCK_TIMEOUT_SECONDS,
     AgentCard,
     AgentCardRegistry,
+    CardIndex,
     CardNotFoundError,
     CardValidationError,
     SkillMatch,
@@ -374,6 +375,35 @@ class TestGetAgentCardsPath:
         assert isinstance(path, Path)
 
 
+class TestCardIndex:
+    """Tests for the CardIndex snapshot."""
+
+    def test_skill_proficiencies(self):
+        """Test that skill proficiencies match per-skill lookups."""
+        card = AgentCard(
+            agent_id="agent-0",
+            skills=["Python", "testing"],
+            success_rates={"PYTHON": 0.8, "rust": 0.4},
+        )
+
+        assert card.get_skill_proficiencies() == {"python": 0.8, "testing": 0.5}
+        for skill, proficiency in card.get_skill_proficiencies().items():
+            assert card.get_skill_proficiency(skill) == proficiency
+
+    def test_build(self):
+        """Test that skill postings are sorted by proficiency."""
+        cards = {
+            "a": AgentCard(agent_id="a", skills=["python"], tools=["Bash"]),
+            "b": AgentCard(agent_id="b", skills=["python"], success_rates={"python": 0.9}),
+        }
+
+        index = CardIndex.build(cards)
+
+        assert index.agents_with_skill("Python") == (("b", 0.9), ("a", 0.5))
+        assert index.agents_with_skill("java") == ()
+        assert index.tools["Bash"] == frozenset({"a"})
+
+
 class TestAgentCardRegistry:
     """Tests for AgentCardRegistry class."""
 
@@ -462,18 +492,17 @@ class TestAgentCardRegistry:
         assert card is None
 
     def test_get_card_uses_cache(self, registry):
-        """Test that get_card uses caching."""
+        """Test that get_card does not re-read an unchanged file."""
         registry.register_agent(agent_id="agent-0")
 
         # First call populates cache
         card1 = registry.get_card("agent-0")
 
-        # Manually modify file to check cache is used
-        registry.cards_path.unlink()
+        with patch.object(registry, "_read_cards") as mock_read:
+            card2 = registry.get_card("agent-0")
 
-        # Should still return cached value within TTL
-        card2 = registry.get_card("agent-0")
-        assert card2 is not None
+        mock_read.assert_not_called()
+        assert card2 is card1
 
     def test_update_card_all_fields(self, registry):
         """Test updating all card fields."""
@@ -770,6 +799,54 @@ class TestAgentCardRegistry:
         assert len(matches) == 1
         assert matches[0][1] == 0.5  # Default proficiency
 
+    def test_find_agents_with_skill_matches_full_scan(self, registry):
+        """Test that indexed lookups match scanning every card."""
+        registry.register_agent(agent_id="agent-0", skills=["Python"], tools=["Bash"])
+        registry.register_agent(agent_id="agent-1", skills=["rust"], tools=["Read"])
+        registry.register_agent(agent_id="agent-2", skills=["python", "rust"], tools=["Bash"])
+        registry.register_agent(agent_id="agent-3", skills=["python"])
+        registry.update_card("agent-0", success_rates={"python": 0.9})
+        registry.update_card("agent-2", success_rates={"PYTHON": 0.0})
+        registry.update_card("agent-3", availability="busy")
+
+        cards = list(registry._read_cards().values())
+        for skill in ("python", "RUST", "java"):
+            for available_only in (True, False):
+                for min_proficiency in (0.0, 0.5):
+                    expected = [
+                        (card, card.get_skill_proficiency(skill))
+                        for card in cards
+                        if (not available_only or card.is_available())
+                        and card.get_skill_proficiency(skill) >= min_proficiency
+                    ]
+                    expected.sort(key=lambda x: x[1], reverse=True)
+
+                    matches = registry.find_agents_with_skill(
+                        skill, min_proficiency=min_proficiency, available_only=available_only
+                    )
+
+                    assert [(c.agent_id, p) for c, p in matches] == [
+                        (c.agent_id, p) for c, p in expected
+                    ]
+
+        assert [c.agent_id for c in registry.list_cards(skill="PYTHON")] == [
+            "agent-0",
+            "agent-2",
+            "agent-3",
+        ]
+        assert [c.agent_id for c in registry.list_cards(tool="Bash")] == ["agent-0", "agent-2"]
+        assert [c.agent_id for c in registry.list_cards(skill="rust", tool="Bash")] == ["agent-2"]
+
+    def test_cached_cards_are_read_only(self, registry):
+        """Test that the cache is shared as a read-only view, not copied."""
+        registry.register_agent(agent_id="agent-0")
+
+        cards = registry._get_cached_cards()
+
+        assert registry._get_cached_cards() is cards
+        with pytest.raises(TypeError):
+            cards["agent-1"] = AgentCard(agent_id="agent-1")
+
     def test_update_skill_success_existing_agent(self, registry):
         """Test updating skill success for existing agent."""
         registry.register_agent(agent_id="agent-0", skills=["python"])
@@ -870,26 +947,25 @@ class TestAgentCardRegistry:
         # But the actual file should exist
         assert registry.cards_path.exists()
 
-    def test_cache_ttl_expiration(self, registry):
-        """Test that cache expires after TTL."""
+    def test_cache_sees_writes_from_other_registries(self, temp_project_dir):
+        """Test that a cache is invalidated by another process's write."""
+        registry = AgentCardRegistry(temp_project_dir)
+        other = AgentCardRegistry(temp_project_dir)
         registry.register_agent(agent_id="agent-0")
+        assert registry.get_card("agent-0").availability == "active"
 
-        # First read populates cache
-        card1 = registry.get_card("agent-0")
-        assert card1 is not None
+        other.set_availability("agent-0", "busy")
 
-        # Wait for cache to expire
-        time.sleep(registry._cache_ttl + 0.1)
+        assert registry.get_card("agent-0").availability == "busy"
 
-        # Clear cache to force re-read
-        registry.clear_cache()
+    def test_cache_sees_file_removal(self, registry):
+        """Test that deleting the cards file invalidates the cache."""
+        registry.register_agent(agent_id="agent-0")
+        assert registry.get_card("agent-0") is not None
 
-        # Modify file directly
         registry.cards_path.unlink()
 
-        # Should read from file since cache was cleared
-        card2 = registry.get_card("agent-0")
-        assert card2 is None
+        assert registry.get_card("agent-0") is None
 
     def test_concurrent_registration(self, registry):
         """Test that concurrent registrations are handled safely."""
@@ -927,6 +1003,25 @@ class TestAgentCardRegistry:
             cards = registry._read_cards()
             assert cards == {}
 
+    def test_lock_timeout_is_not_cached(self, registry):
+        """Test that a read that timed out once is retried on the next lookup."""
+        from claudeswarm.file_lock import FileLock, FileLockTimeout
+
+        registry.register_agent(agent_id="agent-0", name="Test Agent")
+        reader = AgentCardRegistry(registry.project_root)
+
+        calls = []
+
+        def flaky_lock(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise FileLockTimeout("Timeout")
+            return FileLock(*args, **kwargs)
+
+        with patch("claudeswarm.agent_cards.FileLock", side_effect=flaky_lock):
+            assert reader.list_cards() == []
+            assert [card.agent_id for card in reader.list_cards()] == ["agent-0"]
+
     def test_file_lock_timeout_on_write(self, registry):
         """Test that write raises on file lock timeout."""
         from claudeswarm.file_lock import FileLockTimeout
@@ -73,7 +73,7 @@ class TestAcquireFileLock:
             reason="testing",
         )
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.acquire_lock.return_value = (True, None)
             mock_manager_class.return_value = mock_manager
@@ -101,7 +101,7 @@ class TestAcquireFileLock:
         mock_conflict.locked_at = datetime(2021, 1, 1, 0, 0, 0, tzinfo=UTC)
         mock_conflict.reason = "other reason"
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.acquire_lock.return_value = (False, mock_conflict)
             mock_manager_class.return_value = mock_manager
@@ -123,7 +123,7 @@ class TestAcquireFileLock:
             reason=None,
         )
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.acquire_lock.return_value = (True, None)
             mock_manager_class.return_value = mock_manager
@@ -173,7 +173,7 @@ class TestAcquireFileLock:
                 # Mock os.kill to simulate that the agent's PID (12345) is alive
                 with patch("os.kill") as mock_kill:
                     mock_kill.return_value = None  # Simulate process exists
-                    with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+                    with patch("claudeswarm.locking.LockManager") as mock_manager_class:
                         mock_manager = Mock()
                         mock_manager.acquire_lock.return_value = (True, None)
                         mock_manager_class.return_value = mock_manager
@@ -217,7 +217,7 @@ class TestReleaseFileLock:
             agent_id="agent-1",
         )
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.release_lock.return_value = True
             mock_manager_class.return_value = mock_manager
@@ -237,7 +237,7 @@ class TestReleaseFileLock:
             agent_id="agent-1",
         )
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.release_lock.return_value = False
             mock_manager_class.return_value = mock_manager
@@ -283,7 +283,7 @@ class TestReleaseFileLock:
                 # Mock os.kill to simulate that the agent's PID (12345) is alive
                 with patch("os.kill") as mock_kill:
                     mock_kill.return_value = None  # Simulate process exists
-                    with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+                    with patch("claudeswarm.locking.LockManager") as mock_manager_class:
                         mock_manager = Mock()
                         mock_manager.release_lock.return_value = True
                         mock_manager_class.return_value = mock_manager
@@ -330,7 +330,7 @@ class TestWhoHasLock:
         mock_lock.reason = "testing"
         mock_lock.age_seconds.return_value = 30.5
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.who_has_lock.return_value = mock_lock
             mock_manager_class.return_value = mock_manager
@@ -352,7 +352,7 @@ class TestWhoHasLock:
             json=False,
         )
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.who_has_lock.return_value = None
             mock_manager_class.return_value = mock_manager
@@ -379,7 +379,7 @@ class TestWhoHasLock:
         mock_lock.age_seconds.return_value = 30.5
         mock_lock.to_dict.return_value = {"agent_id": "agent-1", "locked_at": 1609459200.0}
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.who_has_lock.return_value = mock_lock
             mock_manager_class.return_value = mock_manager
@@ -403,7 +403,7 @@ class TestListAllLocks:
             json=False,
         )
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.list_all_locks.return_value = []
             mock_manager_class.return_value = mock_manager
@@ -439,7 +439,7 @@ class TestListAllLocks:
         mock_lock2.age_seconds.return_value = 20.0
         mock_lock2.is_stale.return_value = False
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.list_all_locks.return_value = [mock_lock1, mock_lock2]
             mock_manager_class.return_value = mock_manager
@@ -469,7 +469,7 @@ class TestListAllLocks:
         mock_lock.age_seconds.return_value = 1000.0
         mock_lock.is_stale.return_value = True
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.list_all_locks.return_value = [mock_lock]
             mock_manager_class.return_value = mock_manager
@@ -498,7 +498,7 @@ class TestListAllLocks:
         mock_lock.is_stale.return_value = False
         mock_lock.to_dict.return_value = {"filepath": "file1.txt", "agent_id": "agent-1"}
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.list_all_locks.return_value = [mock_lock]
             mock_manager_class.return_value = mock_manager
@@ -518,7 +518,7 @@ class TestCleanupStaleLocks:
         """Test cleanup when no stale locks exist."""
         args = argparse.Namespace(project_root=Path("/test/root"))
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.cleanup_stale_locks.return_value = 0
             mock_manager_class.return_value = mock_manager
@@ -534,7 +534,7 @@ class TestCleanupStaleLocks:
         """Test cleanup of multiple stale locks."""
         args = argparse.Namespace(project_root=Path("/test/root"))
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.cleanup_stale_locks.return_value = 3
             mock_manager_class.return_value = mock_manager
@@ -569,7 +569,7 @@ class TestDiscoverAgents:
         mock_registry.updated_at = "2021-01-01T00:00:00"
         mock_registry.agents = [mock_agent]
 
-        with patch("claudeswarm.cli.refresh_registry") as mock_refresh:
+        with patch("claudeswarm.discovery.refresh_registry") as mock_refresh:
             mock_refresh.return_value = mock_registry
 
             with pytest.raises(SystemExit) as exc_info:
@@ -595,7 +595,7 @@ class TestDiscoverAgents:
             "agents": [],
         }
 
-        with patch("claudeswarm.cli.refresh_registry") as mock_refresh:
+        with patch("claudeswarm.discovery.refresh_registry") as mock_refresh:
             mock_refresh.return_value = mock_registry
 
             with pytest.raises(SystemExit) as exc_info:
@@ -621,7 +621,7 @@ class TestDiscoverAgents:
         mock_registry.updated_at = "2021-01-01T00:00:00"
         mock_registry.agents = []
 
-        with patch("claudeswarm.cli.refresh_registry") as mock_refresh:
+        with patch("claudeswarm.discovery.refresh_registry") as mock_refresh:
             mock_refresh.return_value = mock_registry
 
             with patch("time.sleep") as mock_sleep:
@@ -644,7 +644,7 @@ class TestDiscoverAgents:
             stale_threshold=60,
         )
 
-        with patch("claudeswarm.cli.refresh_registry") as mock_refresh:
+        with patch("claudeswarm.discovery.refresh_registry") as mock_refresh:
             mock_refresh.side_effect = RuntimeError("Test error")
 
             with pytest.raises(SystemExit) as exc_info:
@@ -668,7 +668,7 @@ class TestListAgents:
         mock_agent.pid = 12345
         mock_agent.status = "active"
 
-        with patch("claudeswarm.cli.list_active_agents") as mock_list:
+        with patch("claudeswarm.discovery.list_active_agents") as mock_list:
             mock_list.return_value = [mock_agent]
 
             with pytest.raises(SystemExit) as exc_info:
@@ -683,7 +683,7 @@ class TestListAgents:
         """Test listing when no agents exist."""
         args = argparse.Namespace(json=False)
 
-        with patch("claudeswarm.cli.list_active_agents") as mock_list:
+        with patch("claudeswarm.discovery.list_active_agents") as mock_list:
             mock_list.return_value = []
 
             with pytest.raises(SystemExit) as exc_info:
@@ -704,7 +704,7 @@ class TestListAgents:
             "pid": 12345,
         }
 
-        with patch("claudeswarm.cli.list_active_agents") as mock_list:
+        with patch("claudeswarm.discovery.list_active_agents") as mock_list:
             mock_list.return_value = [mock_agent]
 
             with pytest.raises(SystemExit) as exc_info:
@@ -728,7 +728,7 @@ class TestStartMonitoring:
             no_tmux=False,
         )
 
-        with patch("claudeswarm.cli.start_monitoring") as mock_start:
+        with patch("claudeswarm.monitoring.start_monitoring") as mock_start:
             with pytest.raises(SystemExit) as exc_info:
                 cmd_start_monitoring(args)
 
@@ -747,7 +747,7 @@ class TestStartMonitoring:
             no_tmux=False,
         )
 
-        with patch("claudeswarm.cli.start_monitoring") as mock_start:
+        with patch("claudeswarm.monitoring.start_monitoring") as mock_start:
             with pytest.raises(SystemExit) as exc_info:
                 cmd_start_monitoring(args)
 
@@ -766,7 +766,7 @@ class TestStartMonitoring:
             no_tmux=True,
         )
 
-        with patch("claudeswarm.cli.start_monitoring") as mock_start:
+        with patch("claudeswarm.monitoring.start_monitoring") as mock_start:
             with pytest.raises(SystemExit) as exc_info:
                 cmd_start_monitoring(args)
 
@@ -785,7 +785,7 @@ class TestStartMonitoring:
             no_tmux=False,
         )
 
-        with patch("claudeswarm.cli.start_monitoring") as mock_start:
+        with patch("claudeswarm.monitoring.start_monitoring") as mock_start:
             mock_start.side_effect = RuntimeError("Test error")
 
             with pytest.raises(SystemExit) as exc_info:
@@ -815,7 +815,7 @@ class TestMain:
         mock_registry.agents = []
 
         with patch("sys.argv", ["claudeswarm", "discover-agents"]):
-            with patch("claudeswarm.cli.refresh_registry") as mock_refresh:
+            with patch("claudeswarm.discovery.refresh_registry") as mock_refresh:
                 mock_refresh.return_value = mock_registry
 
                 with pytest.raises(SystemExit) as exc_info:
@@ -826,7 +826,7 @@ class TestMain:
     def test_main_list_agents(self):
         """Test main with list-agents command."""
         with patch("sys.argv", ["claudeswarm", "list-agents"]):
-            with patch("claudeswarm.cli.list_active_agents") as mock_list:
+            with patch("claudeswarm.discovery.list_active_agents") as mock_list:
                 mock_list.return_value = []
 
                 with pytest.raises(SystemExit) as exc_info:
@@ -839,7 +839,7 @@ class TestMain:
         with patch(
             "sys.argv", ["claudeswarm", "acquire-file-lock", "test.txt", "--agent-id", "agent-1"]
         ):
-            with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+            with patch("claudeswarm.locking.LockManager") as mock_manager_class:
                 mock_manager = Mock()
                 mock_manager.acquire_lock.return_value = (True, None)
                 mock_manager_class.return_value = mock_manager
@@ -854,7 +854,7 @@ class TestMain:
         with patch(
             "sys.argv", ["claudeswarm", "release-file-lock", "test.txt", "--agent-id", "agent-1"]
         ):
-            with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+            with patch("claudeswarm.locking.LockManager") as mock_manager_class:
                 mock_manager = Mock()
                 mock_manager.release_lock.return_value = True
                 mock_manager_class.return_value = mock_manager
@@ -867,7 +867,7 @@ class TestMain:
     def test_main_who_has_lock(self):
         """Test main with who-has-lock command."""
         with patch("sys.argv", ["claudeswarm", "who-has-lock", "test.txt"]):
-            with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+            with patch("claudeswarm.locking.LockManager") as mock_manager_class:
                 mock_manager = Mock()
                 mock_manager.who_has_lock.return_value = None
                 mock_manager_class.return_value = mock_manager
@@ -880,7 +880,7 @@ class TestMain:
     def test_main_list_all_locks(self):
         """Test main with list-all-locks command."""
         with patch("sys.argv", ["claudeswarm", "list-all-locks"]):
-            with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+            with patch("claudeswarm.locking.LockManager") as mock_manager_class:
                 mock_manager = Mock()
                 mock_manager.list_all_locks.return_value = []
                 mock_manager_class.return_value = mock_manager
@@ -893,7 +893,7 @@ class TestMain:
     def test_main_cleanup_stale_locks(self):
         """Test main with cleanup-stale-locks command."""
         with patch("sys.argv", ["claudeswarm", "cleanup-stale-locks"]):
-            with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+            with patch("claudeswarm.locking.LockManager") as mock_manager_class:
                 mock_manager = Mock()
                 mock_manager.cleanup_stale_locks.return_value = 0
                 mock_manager_class.return_value = mock_manager
@@ -906,7 +906,7 @@ class TestMain:
     def test_main_start_monitoring(self):
         """Test main with start-monitoring command."""
         with patch("sys.argv", ["claudeswarm", "start-monitoring"]):
-            with patch("claudeswarm.cli.start_monitoring"):
+            with patch("claudeswarm.monitoring.start_monitoring"):
                 with pytest.raises(SystemExit) as exc_info:
                     main()
 
@@ -334,7 +334,7 @@ class TestAutoDetectInLockCommands:
         with patch.dict(os.environ, {"TMUX_PANE": "%2"}):
             with patch("claudeswarm.project.get_active_agents_path", return_value=registry_path):
                 with mock_pid_alive():
-                    with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+                    with patch("claudeswarm.locking.LockManager") as mock_manager_class:
                         mock_manager = Mock()
                         mock_manager.acquire_lock.return_value = (True, None)
                         mock_manager_class.return_value = mock_manager
@@ -393,7 +393,7 @@ class TestAutoDetectInLockCommands:
         with patch.dict(os.environ, {"TMUX_PANE": "%2"}):
             with patch("claudeswarm.project.get_active_agents_path", return_value=registry_path):
                 with mock_pid_alive():
-                    with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+                    with patch("claudeswarm.locking.LockManager") as mock_manager_class:
                         mock_manager = Mock()
                         mock_manager.release_lock.return_value = True
                         mock_manager_class.return_value = mock_manager
@@ -430,7 +430,7 @@ class TestAutoDetectInLockCommands:
             reason="testing",
         )
 
-        with patch("claudeswarm.cli.LockManager") as mock_manager_class:
+        with patch("claudeswarm.locking.LockManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.acquire_lock.return_value = (True, None)
             mock_manager_class.return_value = mock_manager
@@ -0,0 +1,269 @@
+"""Unit tests for the conflict resolution module.
+
+Tests cover:
+- Append-only conflict event log
+- Indexed view of unresolved conflicts by resource and agent
+- Incremental statistics
+- Picking up events written by other resolvers
+- Log compaction and legacy CONFLICT_LOG.json migration
+- Priority preemption of file locks
+"""
+
+import json
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claudeswarm import conflict_resolution
+from claudeswarm.conflict_resolution import (
+    CONFLICT_LOG_FILENAME,
+    LEGACY_CONFLICT_LOG_FILENAME,
+    Conflict,
+    ConflictResolver,
+    ConflictType,
+    NegotiationMessage,
+)
+from claudeswarm.locking import LockConflict
+from claudeswarm.tasks import Task, TaskPriority
+
+
+@pytest.fixture
+def temp_project():
+    """Create a temporary project directory for testing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def resolver(temp_project):
+    """Create a conflict resolver for the temporary project."""
+    return ConflictResolver(project_root=temp_project)
+
+
+def _lock_conflict(holder: str = "agent-2", filepath: str = "src/a.py") -> LockConflict:
+    return LockConflict(
+        filepath=filepath,
+        current_holder=holder,
+        locked_at=datetime.now(UTC),
+        reason="editing",
+    )
+
+
+def _read_events(project: Path) -> list[dict]:
+    with open(project / CONFLICT_LOG_FILENAME, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class TestConflictLog:
+    """Tests for the append-only conflict log."""
+
+    def test_events_are_appended(self, resolver, temp_project):
+        """Test that detection, negotiation and resolution are separate events."""
+        conflict = resolver.detect_file_lock_conflict("src/a.py", "agent-1", _lock_conflict())
+        message = NegotiationMessage(
+            from_agent="agent-1",
+            to_agent="agent-2",
+            conflict_id=conflict.conflict_id,
+            round_number=1,
+            action="yield",
+        )
+        resolver.negotiate(conflict, message)
+        resolver.resolve_conflict(conflict)
+
+        events = _read_events(temp_project)
+        assert [e["event"] for e in events] == ["detected", "negotiated", "resolved"]
+        assert events[2]["resolution"]["winner"] == "agent-2"
+
+        history = resolver.get_conflict_history()
+        assert history[0].status == "resolved"
+        assert history[0].negotiations[0].action == "yield"
+
+    def test_active_conflicts_indexed(self, resolver):
+        """Test filtering unresolved conflicts by resource and agent."""
+        first = resolver.detect_file_lock_conflict("src/a.py", "agent-1", _lock_conflict())
+        resolver.detect_file_lock_conflict(
+            "src/b.py", "agent-3", _lock_conflict(filepath="src/b.py")
+        )
+        resolver.resolve_conflict(first)
+
+        assert [c.resource for c in resolver.get_active_conflicts()] == ["src/b.py"]
+        assert resolver.get_active_conflicts(resource="src/a.py") == []
+        assert [c.resource for c in resolver.get_active_conflicts(agent_id="agent-2")] == [
+            "src/b.py"
+        ]
+        assert resolver.get_active_conflicts(resource="src/b.py", agent_id="agent-1") == []
+
+    def test_stats_are_incremental(self, resolver):
+        """Test that stats are served without re-reading the conflicts."""
+        conflict = resolver.detect_file_lock_conflict("src/a.py", "agent-1", _lock_conflict())
+        resolver.detect_file_lock_conflict("src/b.py", "agent-1", _lock_conflict())
+        resolver.resolve_conflict(conflict)
+
+        with patch.object(conflict_resolution.Conflict, "from_dict") as mock_from_dict:
+            stats = resolver.get_conflict_stats()
+        mock_from_dict.assert_not_called()
+
+        assert stats["total_conflicts"] == 2
+        assert stats["resolved"] == 1
+        assert stats["pending"] == 1
+        assert stats["resolution_strategies"] == {"seniority": 1}
+        assert stats["conflict_types"] == {"file_lock": 2}
+
+    def test_sees_events_from_other_resolvers(self, resolver, temp_project):
+        """Test that a resolver picks up conflicts logged by another process."""
+        assert resolver.get_active_conflicts() == []
+
+        other = ConflictResolver(project_root=temp_project)
+        conflict = other.detect_file_lock_conflict("src/a.py", "agent-1", _lock_conflict())
+        assert [c.conflict_id for c in resolver.get_active_conflicts()] == [conflict.conflict_id]
+
+        other.resolve_conflict(conflict)
+        assert resolver.get_active_conflicts() == []
+        assert resolver.get_conflict_stats()["resolved"] == 1
+
+    def test_update_unknown_conflict_records_it(self, resolver):
+        """Test that updating a conflict that was never logged records it in full."""
+        conflict = Conflict(
+            conflict_id="c-1",
+            conflict_type=ConflictType.RESOURCE,
+            agents_involved=["agent-1"],
+            resource="db",
+            status="escalated",
+        )
+        resolver._update_conflict(conflict)
+
+        assert resolver.get_conflict_history()[0].status == "escalated"
+        assert resolver.get_conflict_stats()["escalated"] == 1
+
+    def test_update_recorded_elsewhere_is_not_duplicated(self, resolver, temp_project):
+        """Test that the recorded check sees conflicts logged by another resolver."""
+        conflict = Conflict(
+            conflict_id="c-1",
+            conflict_type=ConflictType.RESOURCE,
+            agents_involved=["agent-1"],
+            resource="db",
+        )
+        resolver._update_conflict(conflict)
+
+        other = ConflictResolver(project_root=temp_project)
+        message = NegotiationMessage(
+            from_agent="agent-1",
+            to_agent="agent-2",
+            conflict_id="c-1",
+            round_number=1,
+            action="yield",
+        )
+        other._record_negotiation(conflict, message)
+        conflict.status = "resolved"
+        other._update_conflict(conflict)
+
+        events = _read_events(temp_project)
+        assert [e["event"] for e in events] == ["detected", "negotiated", "resolved"]
+        assert resolver.get_conflict_history()[0].negotiations[0].action == "yield"
+
+    def test_log_is_compacted(self, resolver, temp_project):
+        """Test that the log is rewritten as snapshots of the retained conflicts."""
+        with (
+            patch.object(conflict_resolution, "MAX_CONFLICT_LOG_ENTRIES", 3),
+            patch.object(conflict_resolution, "CONFLICT_LOG_COMPACT_AT", 6),
+        ):
+            for i in range(5):
+                resolver.detect_file_lock_conflict(f"src/{i}.py", "agent-1", _lock_conflict())
+
+            events = _read_events(temp_project)
+            assert len(events) < 6
+            assert resolver.get_conflict_stats()["total_conflicts"] == 3
+            assert [c.resource for c in resolver.get_conflict_history()] == [
+                "src/4.py",
+                "src/3.py",
+                "src/2.py",
+            ]
+
+    def test_legacy_log_migrated(self, temp_project):
+        """Test that CONFLICT_LOG.json is converted to the event log."""
+        legacy = Conflict(
+            conflict_id="old-1",
+            conflict_type=ConflictType.FILE_LOCK,
+            agents_involved=["agent-1", "agent-2"],
+            resource="src/a.py",
+        )
+        with open(temp_project / LEGACY_CONFLICT_LOG_FILENAME, "w", encoding="utf-8") as f:
+            json.dump({"version": "1.0", "conflicts": [legacy.to_dict()]}, f)
+
+        resolver = ConflictResolver(project_root=temp_project)
+
+        assert [c.conflict_id for c in resolver.get_active_conflicts()] == ["old-1"]
+        assert not (temp_project / LEGACY_CONFLICT_LOG_FILENAME).exists()
+        assert _read_events(temp_project)[0]["event"] == "snapshot"
+
+
+class TestPreemption:
+    """Tests for priority-based lock preemption."""
+
+    @pytest.fixture
+    def held_lock(self, resolver):
+        """Lock src/a.py for agent-2 and return the resulting conflict for agent-1."""
+        resolver.lock_manager.acquire_lock("src/a.py", "agent-2", "cleanup")
+        _, conflict = resolver.lock_manager.acquire_lock("src/a.py", "agent-1", "hotfix")
+        return conflict
+
+    def _with_tasks(self, resolver, requesting: TaskPriority, holding: TaskPriority):
+        tasks = {
+            "agent-1": Task(task_id="t-1", objective="hotfix", priority=requesting),
+            "agent-2": Task(task_id="t-2", objective="cleanup", priority=holding),
+        }
+        return patch.object(resolver, "_get_agent_task", side_effect=tasks.get)
+
+    def test_critical_preempts_low(self, resolver, held_lock):
+        """Test that a CRITICAL requester takes the lock from a LOW holder."""
+        with (
+            self._with_tasks(resolver, TaskPriority.CRITICAL, TaskPriority.LOW),
+            patch.object(conflict_resolution, "send_message", return_value=object()) as send,
+        ):
+            resolution = resolver.handle_lock_conflict("src/a.py", "agent-1", held_lock)
+
+        assert resolution.winner == "agent-1"
+        assert resolution.metadata["preempted"] is True
+        assert resolver.lock_manager.who_has_lock("src/a.py").agent_id == "agent-1"
+        assert sorted(call.args[1] for call in send.call_args_list) == ["agent-1", "agent-2"]
+        assert resolution.metadata["notified"] == ["agent-2", "agent-1"]
+
+        logged = resolver.get_conflict_history()[0].resolution
+        assert logged.metadata["preempted"] is True
+
+    def test_small_priority_gap_does_not_preempt(self, resolver, held_lock):
+        """Test that a HIGH requester only wins the decision against a NORMAL holder."""
+        with (
+            self._with_tasks(resolver, TaskPriority.HIGH, TaskPriority.NORMAL),
+            patch.object(conflict_resolution, "send_message") as send,
+        ):
+            resolution = resolver.handle_lock_conflict("src/a.py", "agent-1", held_lock)
+
+        assert resolution.winner == "agent-1"
+        assert "preempted" not in resolution.metadata
+        assert resolver.lock_manager.who_has_lock("src/a.py").agent_id == "agent-2"
+        send.assert_not_called()
+
+    def test_preempt_disabled(self, resolver, held_lock):
+        """Test that preemption can be turned off per call."""
+        with self._with_tasks(resolver, TaskPriority.CRITICAL, TaskPriority.LOW):
+            resolver.handle_lock_conflict("src/a.py", "agent-1", held_lock, preempt=False)
+
+        assert resolver.lock_manager.who_has_lock("src/a.py").agent_id == "agent-2"
+
+    def test_released_lock_is_not_preempted(self, resolver, held_lock):
+        """Test that nothing is transferred once the holder has let go."""
+        resolver.lock_manager.release_lock("src/a.py", "agent-2")
+
+        with (
+            self._with_tasks(resolver, TaskPriority.CRITICAL, TaskPriority.LOW),
+            patch.object(conflict_resolution, "send_message") as send,
+        ):
+            resolution = resolver.handle_lock_conflict("src/a.py", "agent-1", held_lock)
+
+        assert resolution.metadata["preempted"] is False
+        assert resolver.lock_manager.who_has_lock("src/a.py") is None
+        send.assert_not_called()
@@ -5,7 +5,9 @@ Tests cover:
 - Decision tracking
 - File tracking with path validation
 - ContextStore CRUD operations
+- Per-context sharded storage and legacy migration
 - Context linking and search
+- BM25 search index
 """
 
 import json
@@ -16,10 +18,12 @@ from unittest.mock import MagicMock, Mock, mock_open, patch
 import pytest
 
 from claudeswarm.context import (
+    CONTEXT_INDEX_VERSION,
     CONTEXTS_FILENAME,
     MAX_DECISIONS_PER_CONTEXT,
     MAX_FILES_PER_CONTEXT,
     ContextDecision,
+    ContextSearchIndex,
     ContextStore,
     SharedContext,
     get_contexts_path,
@@ -106,7 +110,7 @@ class TestSharedContext:
         assert ctx.summary == ""
         assert ctx.status == "active"
         assert ctx.decisions == []
-        assert ctx.files_touched == []
+        assert ctx.files_touched == ()
         assert ctx.related_contexts == []
         assert ctx.agents_involved == []
 
@@ -206,6 +210,57 @@ class TestSharedContext:
         # Most recent should be kept
         assert f"file{MAX_FILES_PER_CONTEXT}.py" in ctx.files_touched
 
+    def test_add_file_readds_trimmed_file(self):
+        """Test that a file trimmed from the set can be recorded again."""
+        ctx = SharedContext(context_id="test-ctx", name="Test Context")
+        for i in range(MAX_FILES_PER_CONTEXT + 1):
+            ctx.add_file(f"file{i}.py")
+
+        ctx.add_file("file0.py")
+
+        assert ctx.files_touched[-1] == "file0.py"
+        assert ctx.files_touched.count("file0.py") == 1
+        assert len(ctx.files_touched) == MAX_FILES_PER_CONTEXT
+
+    def test_files_touched_is_read_only(self):
+        """Test that files can only be recorded through add_file."""
+        ctx = SharedContext(context_id="test-ctx", name="Test Context")
+        ctx.add_file("src/a.py")
+
+        with pytest.raises(AttributeError):
+            ctx.files_touched = ["src/b.py"]
+        assert ctx.files_touched == ("src/a.py",)
+
+    def test_files_touched_round_trip(self):
+        """Test that files_touched is serialized as a list and keeps its order."""
+        ctx = SharedContext(context_id="test-ctx", name="Test Context")
+        for name in ("src/b.py", "src/a.py", "src/c.py"):
+            ctx.add_file(name)
+
+        data = ctx.to_dict()
+        assert data["files_touched"] == ["src/b.py", "src/a.py", "src/c.py"]
+        assert "_files" not in data
+        assert SharedContext.from_dict(data).files_touched == ctx.files_touched
+
+    def test_add_file_trim_with_loaded_duplicates(self):
+        """Test that duplicates in stored data collapse and eviction stays consistent."""
+        files = ["dup.py"] + [f"file{i}.py" for i in range(MAX_FILES_PER_CONTEXT - 2)]
+        ctx = SharedContext.from_dict(
+            {"context_id": "test-ctx", "name": "Test Context", "files_touched": files + ["dup.py"]}
+        )
+
+        assert len(ctx.files_touched) == MAX_FILES_PER_CONTEXT - 1
+
+        ctx.add_file("new.py")
+        ctx.add_file("dup.py")
+        assert ctx.files_touched[-1] == "new.py"
+
+        # The oldest file is evicted once the context is full
+        ctx.add_file("new2.py")
+        assert ctx.files_touched[0] == "file0.py"
+        assert ctx.files_touched.count("dup.py") == 0
+        assert len(ctx.files_touched) == MAX_FILES_PER_CONTEXT
+
     def test_add_related_context(self):
         """Test adding a related context."""
         ctx = SharedContext(context_id="test-ctx", name="Test Context")
@@ -314,7 +369,7 @@ class TestSharedContext:
         assert ctx.name == "Test Context"
         assert len(ctx.decisions) == 1
         assert isinstance(ctx.decisions[0], ContextDecision)
-        assert ctx.files_touched == ["src/main.py"]
+        assert ctx.files_touched == ("src/main.py",)
         assert ctx.related_contexts == ["other-ctx"]
 
 
@@ -708,6 +763,80 @@ class TestContextStore:
 
         assert len(result) == 1
 
+    def test_search_contexts_includes_decisions(self, store):
+        """Test that decision text is searchable and ranks matches."""
+        store.create_context("Auth Feature", "agent-0", context_id="ctx-1")
+        store.create_context("Cache Layer", "agent-0", context_id="ctx-2")
+        store.add_decision("ctx-2", "Use Redis for sessions", "agent-0", reason="Fast expiry")
+        store.create_context("Redis cluster", "agent-0", context_id="ctx-3")
+        store.add_decision("ctx-3", "Run Redis in cluster mode", "agent-0")
+
+        result = store.search_contexts("redis")
+
+        assert [c.context_id for c in result] == ["ctx-3", "ctx-2"]
+        assert store.search_contexts("redis", limit=1)[0].context_id == "ctx-3"
+
+    def test_search_decisions(self, store):
+        """Test finding individual decisions across contexts."""
+        store.create_context("Auth", "agent-0", context_id="ctx-1")
+        store.add_decision("ctx-1", "Use HS256", "agent-0", alternatives=["RS256 signing"])
+        store.add_decision("ctx-1", "Store tokens in cookies", "agent-1")
+
+        result = store.search_decisions("rs256")
+
+        assert len(result) == 1
+        context_id, decision = result[0]
+        assert context_id == "ctx-1"
+        assert decision.decision == "Use HS256"
+
+    def test_search_excludes_archived(self, store):
+        """Test that archived contexts are only searched on request."""
+        store.create_context("Old auth", "agent-0", context_id="ctx-1")
+        store.add_decision("ctx-1", "Use sessions", "agent-0")
+        store.archive_context("ctx-1")
+
+        assert store.search_contexts("auth") == []
+        assert store.search_decisions("sessions") == []
+        assert len(store.search_contexts("auth", include_archived=True)) == 1
+        assert len(store.search_decisions("sessions", include_archived=True)) == 1
+
+    def test_search_index_updated_in_place(self, store):
+        """Test that writes through the store update the index without re-reading files."""
+        store.create_context("Auth Feature", "agent-0", context_id="ctx-1")
+        store.search_contexts("auth")
+
+        store.add_decision("ctx-1", "Adopt OAuth device flow", "agent-0")
+        ctx = store.get_context("ctx-1")
+        ctx.summary = "Login for the CLI"
+        store.update_context(ctx)
+        store.delete_context("missing")
+        store.create_context("Billing", "agent-0", context_id="ctx-2")
+        store.delete_context("ctx-2")
+
+        with patch.object(store, "_load_shard", wraps=store._load_shard) as loads:
+            assert [c.context_id for c in store.search_contexts("oauth")] == ["ctx-1"]
+            assert store.search_contexts("login")[0].summary == "Login for the CLI"
+            assert store.search_contexts("billing") == []
+
+        loads.assert_not_called()
+
+    def test_search_sees_writes_from_other_stores(self, store, temp_project):
+        """Test that another store's write invalidates the index."""
+        store.create_context("Auth Feature", "agent-0", context_id="ctx-1")
+        assert store.search_contexts("payments") == []
+
+        ContextStore(temp_project).create_context("Payments", "agent-1", context_id="ctx-2")
+
+        assert [c.context_id for c in store.search_contexts("payments")] == ["ctx-2"]
+
+    def test_search_results_are_copies(self, store):
+        """Test that mutating a search result does not affect later searches."""
+        store.create_context("Auth Feature", "agent-0", context_id="ctx-1")
+
+        store.search_contexts("auth")[0].name = "Changed"
+
+        assert store.search_contexts("auth")[0].name == "Auth Feature"
+
     def test_get_context_summary(self, store):
         """Test getting a context summary."""
         ctx = store.create_context("Test Context", "agent-0", context_id="ctx-1")
@@ -732,6 +861,92 @@ class TestContextStore:
 
         assert result is None
 
+    def test_contexts_stored_one_file_each(self, store):
+        """Test that each context has its own file and the index lists them."""
+        store.create_context("Auth", "agent-0", context_id="ctx-1")
+        store.create_context("Billing", "agent-0", context_id="ctx-2")
+
+        assert sorted(p.name for p in store.shard_dir.glob("*.json")) == [
+            "ctx-1.json",
+            "ctx-2.json",
+        ]
+        with open(store.contexts_path) as f:
+            index = json.load(f)
+        assert index["version"] == CONTEXT_INDEX_VERSION
+        assert index["contexts"] == {
+            "ctx-1": {"name": "Auth", "status": "active"},
+            "ctx-2": {"name": "Billing", "status": "active"},
+        }
+
+    def test_updates_only_touch_their_context(self, store):
+        """Test that decisions and files rewrite neither other contexts nor the index."""
+        store.create_context("Auth", "agent-0", context_id="ctx-1")
+        store.create_context("Billing", "agent-0", context_id="ctx-2")
+        index_before = store.contexts_path.read_bytes()
+        other_before = (store.shard_dir / "ctx-2.json").read_bytes()
+
+        with patch.object(store, "_update_index") as update_index:
+            store.add_decision("ctx-1", "Use JWT", "agent-0")
+            store.touch_file("ctx-1", "src/auth.py", "agent-1")
+
+        update_index.assert_not_called()
+        assert store.contexts_path.read_bytes() == index_before
+        assert (store.shard_dir / "ctx-2.json").read_bytes() == other_before
+        assert store.get_context("ctx-1").files_touched == ("src/auth.py",)
+
+    def test_status_changes_update_index(self, store):
+        """Test that list filters see status changes through the index."""
+        store.create_context("Auth", "agent-0", context_id="ctx-1")
+        store.create_context("Billing", "agent-0", context_id="ctx-2")
+        store.complete_context("ctx-1", "agent-0")
+        store.archive_context("ctx-2")
+
+        with open(store.contexts_path) as f:
+            index = json.load(f)["contexts"]
+        assert index["ctx-1"]["status"] == "completed"
+        assert index["ctx-2"]["status"] == "archived"
+        assert [c.context_id for c in store.list_contexts(status="completed")] == ["ctx-1"]
+        assert store.list_contexts(status="active") == []
+
+    def test_index_rebuilt_when_missing(self, store):
+        """Test that a lost index is rebuilt from the context files."""
+        store.create_context("Auth", "agent-0", context_id="ctx-1")
+        store.contexts_path.unlink()
+        store.create_context("Billing", "agent-0", context_id="ctx-2")
+
+        result = store.list_contexts()
+
+        assert sorted(c.context_id for c in result) == ["ctx-1", "ctx-2"]
+        with open(store.contexts_path) as f:
+            assert set(json.load(f)["contexts"]) == {"ctx-1", "ctx-2"}
+
+    def test_unsafe_context_id_maps_to_one_file(self, store):
+        """Test that IDs with path characters stay inside the shard directory."""
+        store.create_context("Odd", "agent-0", context_id="../feature/auth")
+
+        files = list(store.shard_dir.iterdir())
+
+        assert len(files) == 1
+        assert files[0].parent == store.shard_dir
+        assert store.get_context("../feature/auth").name == "Odd"
+        assert store.delete_context("../feature/auth") is True
+        assert list(store.shard_dir.iterdir()) == []
+
+    def test_migrates_legacy_single_file(self, temp_project):
+        """Test that a CONTEXTS.json from older versions is split into files."""
+        legacy = SharedContext(context_id="ctx-1", name="Auth", summary="JWT auth")
+        legacy.add_decision("Use HS256", "agent-0")
+        with open(temp_project / CONTEXTS_FILENAME, "w") as f:
+            json.dump({"version": "1.0", "contexts": {"ctx-1": legacy.to_dict()}}, f)
+
+        store = ContextStore(temp_project)
+
+        assert (store.shard_dir / "ctx-1.json").exists()
+        assert store.get_context("ctx-1") == legacy
+        with open(store.contexts_path) as f:
+            assert json.load(f)["version"] == CONTEXT_INDEX_VERSION
+        assert [c.context_id for c in store.search_contexts("hs256")] == ["ctx-1"]
+
     @patch("claudeswarm.context.FileLock")
     def test_read_contexts_handles_lock_timeout(self, mock_filelock, store):
         """Test that read_contexts handles lock timeout gracefully."""
@@ -753,3 +968,52 @@ class TestContextStore:
 
         assert result == {}
         assert not store.contexts_path.exists()
+
+
+class TestContextSearchIndex:
+    """Tests for ContextSearchIndex."""
+
+    def test_rare_terms_rank_higher(self):
+        """Test that BM25 favours documents matching rarer terms."""
+        index = ContextSearchIndex()
+        index.add("a", "redis cache")
+        index.add("b", "postgres cache")
+        index.add("c", "cache warmup")
+
+        result = index.search("redis cache")
+
+        assert result[0][0] == "a"
+        assert len(result) == 3
+
+    def test_prefix_match(self):
+        """Test that query terms match longer indexed terms."""
+        index = ContextSearchIndex()
+        index.add("a", "Authentication flow")
+        index.add("b", "Author notes")
+        index.add("c", "Database")
+
+        assert {doc_id for doc_id, _ in index.search("auth")} == {"a", "b"}
+
+    def test_replace_and_remove(self):
+        """Test that re-adding replaces a document and removal drops its terms."""
+        index = ContextSearchIndex()
+        index.add("a", "redis")
+        index.add("a", "postgres")
+
+        assert index.search("redis") == []
+        assert [doc_id for doc_id, _ in index.search("postgres")] == ["a"]
+
+        index.remove("a")
+
+        assert len(index) == 0
+        assert index.search("postgres") == []
+        assert index._vocabulary == []
+
+    def test_limit_and_empty_query(self):
+        """Test result limits and queries without terms."""
+        index = ContextSearchIndex()
+        for i in range(5):
+            index.add(i, f"deploy step {i}")
+
+        assert len(index.search("deploy", limit=2)) == 2
+        assert index.search("  --  ") == []
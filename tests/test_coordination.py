@@ -9,12 +9,14 @@ Tests cover:
 - Concurrent updates
 - Query functions
 - Helper functions for adding items
+- Section span index and in-lock appends
 """
 
 import tempfile
 import threading
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -218,6 +220,7 @@ class TestLockIntegration:
             project_root=initialized_coord.project_root,
             agent_id="agent-2",
             lock_manager=initialized_coord.lock_manager,
+            lock_wait=0.2,
         )
 
         # Acquire lock manually
@@ -236,6 +239,49 @@ class TestLockIntegration:
                 str(initialized_coord.filepath), initialized_coord.agent_id
             )
 
+    def test_update_waits_for_holder(self, initialized_coord):
+        """Test that an update queues behind the holder instead of failing."""
+        coord2 = CoordinationFile(
+            project_root=initialized_coord.project_root,
+            agent_id="agent-2",
+            lock_manager=initialized_coord.lock_manager,
+        )
+        filepath = str(initialized_coord.filepath)
+        initialized_coord.lock_manager.acquire_lock(filepath, "test-agent", "testing")
+        timer = threading.Timer(
+            0.2, initialized_coord.lock_manager.release_lock, args=(filepath, "test-agent")
+        )
+        timer.start()
+
+        try:
+            start = time.monotonic()
+            assert coord2.update_section("Sprint Goals", "- Waited goal") is True
+            assert time.monotonic() - start >= 0.15
+        finally:
+            timer.join()
+
+        assert coord2.get_section("Sprint Goals") == "- Waited goal"
+
+    def test_lock_wait_deadline(self, initialized_coord):
+        """Test that waiting gives up at the deadline and keeps the append out."""
+        coord2 = CoordinationFile(
+            project_root=initialized_coord.project_root,
+            agent_id="agent-2",
+            lock_manager=initialized_coord.lock_manager,
+            lock_wait=0.1,
+        )
+        filepath = str(initialized_coord.filepath)
+        initialized_coord.lock_manager.acquire_lock(filepath, "test-agent", "testing")
+
+        try:
+            with pytest.raises(RuntimeError, match="within 0.1s"):
+                coord2.append_to_section("Sprint Goals", "- Too late")
+        finally:
+            initialized_coord.lock_manager.release_lock(filepath, "test-agent")
+
+        assert coord2._queue.pending == []
+        assert "- Too late" not in initialized_coord.read_file()
+
     def test_same_agent_can_reacquire_lock(self, initialized_coord):
         """Test that same agent can update multiple times."""
         # First update
@@ -387,6 +433,25 @@ class TestHelperFunctions:
         work_items = get_current_work(project_root=temp_project)
         assert any("test-agent" in item and "Implement feature X" in item for item in work_items)
 
+    def test_add_current_work_multiple_tasks(self, temp_project):
+        """Test adding several work items in one call."""
+        init_coordination_file(project_root=temp_project)
+
+        result = add_current_work(
+            agent="test-agent",
+            task=["Task A", "Task B", "Task C"],
+            agent_id="test-agent",
+            project_root=temp_project,
+        )
+
+        assert result is True
+        work_items = get_current_work(project_root=temp_project)
+        assert [item.split("|")[2].strip() for item in work_items[-3:]] == [
+            "Task A",
+            "Task B",
+            "Task C",
+        ]
+
     def test_add_blocked_item(self, temp_project):
         """Test adding a blocked item."""
         init_coordination_file(project_root=temp_project)
@@ -548,6 +613,112 @@ Additional notes:
         assert "Second line" in content
 
 
+class TestSectionIndex:
+    """Tests for the section span index and spliced appends."""
+
+    def test_append_leaves_other_sections_untouched(self, initialized_coord):
+        """Test that appending only rewrites the target section's bytes."""
+        content = initialized_coord.read_file().replace(
+            "## Decisions\n", "## Decisions\n\n\n<!-- keep this spacing -->\n"
+        )
+        initialized_coord.filepath.write_text(content)
+
+        initialized_coord.append_lines("Sprint Goals", ["- Goal A", "- Goal B"])
+
+        updated = initialized_coord.read_file()
+        tail = content[content.index("## Current Work") :]
+        assert updated.endswith(tail)
+        assert initialized_coord.get_section("Sprint Goals").endswith("- Goal A\n- Goal B")
+
+    def test_append_matches_parsed_sections(self, initialized_coord):
+        """Test that spliced content parses the same way as get_section returns it."""
+        initialized_coord.update_section("Blocked Items", "")
+        initialized_coord.append_to_section("Blocked Items", "- First")
+        initialized_coord.append_to_section("Decisions", "- Last")
+        initialized_coord.append_to_section("New Section", "- Added")
+
+        sections = initialized_coord._parse_sections(initialized_coord.read_file())
+        for name, section in sections.items():
+            assert initialized_coord.get_section(name) == section.content
+        assert sections["Blocked Items"].content == "- First"
+        assert sections["New Section"].content == "- Added"
+
+    def test_append_to_trailing_header_without_newline(self, initialized_coord):
+        """Test appending to an empty last section with no trailing newline."""
+        initialized_coord.filepath.write_text("# Title\n\n## Notes")
+
+        initialized_coord.append_to_section("Notes", "- note")
+
+        assert initialized_coord.read_file() == "# Title\n\n## Notes\n\n- note\n"
+
+    def test_index_cached_until_file_changes(self, initialized_coord):
+        """Test that the span index is reused until the file changes on disk."""
+        with patch.object(
+            CoordinationFile, "_scan_sections", wraps=CoordinationFile._scan_sections
+        ) as mock_scan:
+            initialized_coord.get_section("Sprint Goals")
+            initialized_coord.get_section("Decisions")
+            assert mock_scan.call_count == 1
+
+            content = initialized_coord.read_file().replace("Add sprint goals here", "Changed")
+            initialized_coord.filepath.write_text(content)
+            assert "Changed" in initialized_coord.get_section("Sprint Goals")
+            assert mock_scan.call_count == 2
+
+    def test_queued_appends_coalesce_into_one_write(self, initialized_coord):
+        """Test that appends queued while the lock is busy share a single write."""
+        other = CoordinationFile(
+            project_root=initialized_coord.project_root, agent_id="other-agent"
+        )
+        filepath = str(initialized_coord.filepath)
+        initialized_coord.lock_manager.acquire_lock(filepath, "other-agent", "testing")
+
+        def append(i):
+            initialized_coord.append_to_section("Sprint Goals", f"- Goal {i}")
+
+        threads = [threading.Thread(target=append, args=(i,)) for i in range(8)]
+        with (
+            patch.object(
+                CoordinationFile,
+                "_write_indexed",
+                autospec=True,
+                side_effect=CoordinationFile._write_indexed,
+            ) as mock_write,
+            patch.object(
+                initialized_coord.lock_manager,
+                "release_lock",
+                wraps=initialized_coord.lock_manager.release_lock,
+            ) as mock_release,
+        ):
+            for t in threads:
+                t.start()
+            time.sleep(0.2)
+            other.lock_manager.release_lock(filepath, "other-agent")
+            for t in threads:
+                t.join(timeout=10)
+
+        content = initialized_coord.get_section("Sprint Goals")
+        assert all(f"- Goal {i}" in content for i in range(8))
+        assert mock_write.call_count < 8
+        # Callers whose append was already applied never take the file lock
+        assert mock_release.call_count == mock_write.call_count
+
+    def test_concurrent_appends_keep_every_line(self, initialized_coord):
+        """Test that appends from many threads are all kept."""
+
+        def append(i):
+            initialized_coord.append_to_section("Sprint Goals", f"- Goal {i}")
+
+        threads = [threading.Thread(target=append, args=(i,)) for i in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+        content = initialized_coord.get_section("Sprint Goals")
+        assert all(f"- Goal {i}" in content for i in range(10))
+
+
 class TestRebuildContent:
     """Tests for content rebuilding functionality."""
 
@@ -0,0 +1,199 @@
+"""Unit tests for the claudeswarmd daemon and its client.
+
+Tests cover:
+- Ping and request dispatch over the Unix socket
+- Lock acquisition and release through the daemon
+- Incremental message index and read cursors
+- Agent identity lookup by tmux pane
+- Client fallback when no daemon is serving the project
+"""
+
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from claudeswarm.daemon import SwarmDaemon
+from claudeswarm.daemon_client import (
+    DISABLE_DAEMON_ENV,
+    DaemonRequestError,
+    DaemonUnavailableError,
+    daemon_request,
+)
+from claudeswarm.project import get_daemon_socket_path
+
+
+@pytest.fixture
+def temp_project(monkeypatch):
+    """Create a short-pathed temporary project directory."""
+    monkeypatch.delenv(DISABLE_DAEMON_ENV, raising=False)
+    with tempfile.TemporaryDirectory(dir="/tmp") as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def daemon(temp_project):
+    """Run a daemon for the temporary project in a background thread."""
+    swarmd = SwarmDaemon(project_root=temp_project)
+    thread = threading.Thread(target=swarmd.serve_forever, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 5.0
+    while not swarmd.socket_path.exists():
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+
+    yield swarmd
+    swarmd.stop()
+    thread.join(timeout=5.0)
+
+
+def _append_message(project: Path, recipients: list[str], content: str, timestamp: str) -> None:
+    entry = {
+        "sender": "agent-9",
+        "recipients": recipients,
+        "msg_type": "INFO",
+        "content": content,
+        "timestamp": timestamp,
+        "msg_id": content,
+    }
+    with open(project / "agent_messages.log", "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+class TestDaemon:
+    """Tests for requests served by a running daemon."""
+
+    def test_ping(self, daemon, temp_project):
+        """Test that the daemon reports the project it serves."""
+        result = daemon_request("ping", project_root=temp_project)
+        assert result["project_root"] == str(temp_project)
+        assert result["pid"] == os.getpid()
+
+    def test_unknown_method(self, daemon, temp_project):
+        """Test that unknown methods are reported as request errors."""
+        with pytest.raises(DaemonRequestError, match="Unknown method"):
+            daemon_request("frobnicate", project_root=temp_project)
+
+    def test_lock_round_trip(self, daemon, temp_project):
+        """Test acquiring, conflicting on and releasing a lock."""
+        params = {"filepath": "src/a.py", "agent_id": "agent-1", "reason": "editing"}
+        assert daemon_request("acquire_lock", params, project_root=temp_project)["acquired"]
+        assert (temp_project / ".agent_locks").is_dir()
+
+        result = daemon_request(
+            "acquire_lock",
+            {"filepath": "src/a.py", "agent_id": "agent-2"},
+            project_root=temp_project,
+        )
+        assert result["acquired"] is False
+        assert result["conflict"]["current_holder"] == "agent-1"
+        assert result["conflict"]["reason"] == "editing"
+
+        released = daemon_request(
+            "release_lock",
+            {"filepath": "src/a.py", "agent_id": "agent-1"},
+            project_root=temp_project,
+        )
+        assert released == {"released": True}
+
+    def test_check_messages_tracks_cursor(self, daemon, temp_project):
+        """Test that new-only queries see each message once, including appends."""
+        params = {"agent_id": "agent-1", "new_only": True}
+        assert daemon_request("check_messages", params, project_root=temp_project)["messages"] == []
+
+        _append_message(temp_project, ["agent-1"], "first", "2026-01-01T00:00:01")
+        _append_message(temp_project, ["agent-2"], "other", "2026-01-01T00:00:02")
+        _append_message(temp_project, ["all"], "broadcast", "2026-01-01T00:00:03")
+
+        result = daemon_request("check_messages", params, project_root=temp_project)
+        assert [m["content"] for m in result["messages"]] == ["first", "broadcast"]
+        assert daemon_request("check_messages", params, project_root=temp_project)["messages"] == []
+
+        _append_message(temp_project, ["agent-1"], "second", "2026-01-01T00:00:04")
+        result = daemon_request("check_messages", params, project_root=temp_project)
+        assert [m["content"] for m in result["messages"]] == ["second"]
+
+        # The cursor is shared with direct (non-daemon) check-messages
+        with open(temp_project / ".swarm" / "last_read_messages.json", encoding="utf-8") as f:
+            assert json.load(f) == {"agent-1": "2026-01-01T00:00:04"}
+
+    def test_whoami(self, daemon, temp_project):
+        """Test mapping a tmux pane to its registered agent."""
+        registry = {
+            "agents": [
+                {"id": "agent-1", "tmux_pane_id": "%1", "status": "active", "pid": os.getpid()},
+                {"id": "agent-2", "tmux_pane_id": "%2", "status": "stale"},
+            ]
+        }
+        with open(temp_project / "ACTIVE_AGENTS.json", "w", encoding="utf-8") as f:
+            json.dump(registry, f)
+
+        result = daemon_request("whoami", {"pane_id": "%1"}, project_root=temp_project)
+        assert result["agent_id"] == "agent-1"
+        result = daemon_request("whoami", {"pane_id": "%2"}, project_root=temp_project)
+        assert result["agent_id"] is None
+
+    def test_shutdown(self, daemon, temp_project):
+        """Test that a shutdown request stops the daemon and removes its socket."""
+        daemon_request("shutdown", project_root=temp_project)
+
+        deadline = time.monotonic() + 5.0
+        while daemon.socket_path.exists():
+            assert time.monotonic() < deadline, "daemon did not stop"
+            time.sleep(0.01)
+        with pytest.raises(DaemonUnavailableError):
+            daemon_request("ping", project_root=temp_project)
+
+
+class TestDaemonClient:
+    """Tests for the client's fallback behaviour."""
+
+    def test_no_daemon(self, temp_project):
+        """Test that a missing socket means the daemon is unavailable."""
+        with pytest.raises(DaemonUnavailableError):
+            daemon_request("ping", project_root=temp_project)
+
+    def test_stale_socket(self, temp_project):
+        """Test that a socket file nobody listens on is treated as unavailable."""
+        get_daemon_socket_path(temp_project).touch()
+        with pytest.raises(DaemonUnavailableError):
+            daemon_request("ping", project_root=temp_project)
+
+    def test_foreign_socket_is_refused(self, daemon, temp_project, monkeypatch):
+        """Test that a socket owned by another user is never connected to."""
+        real_uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: real_uid + 1)
+        with pytest.raises(DaemonUnavailableError, match="untrusted"):
+            daemon_request("ping", project_root=temp_project)
+
+    def test_disabled_by_environment(self, daemon, temp_project, monkeypatch):
+        """Test that the environment switch bypasses a running daemon."""
+        monkeypatch.setenv(DISABLE_DAEMON_ENV, "1")
+        with pytest.raises(DaemonUnavailableError):
+            daemon_request("ping", project_root=temp_project)
+
+    def test_long_project_path_uses_private_dir(self, monkeypatch):
+        """Test that socket paths too long for AF_UNIX move to a per-user directory."""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        deep_root = Path("/tmp") / ("x" * 120)
+        socket_path = get_daemon_socket_path(deep_root)
+
+        assert socket_path.parent == Path(tempfile.gettempdir()) / f"claudeswarm-{os.getuid()}"
+        assert stat.S_IMODE(socket_path.parent.stat().st_mode) == 0o700
+        assert socket_path == get_daemon_socket_path(deep_root)
+
+    def test_shared_runtime_dir_is_rejected(self, temp_project, monkeypatch):
+        """Test that a runtime directory others can write to is not used."""
+        shared = temp_project / "shared"
+        shared.mkdir(mode=0o777)
+        shared.chmod(0o777)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(shared))
+
+        socket_path = get_daemon_socket_path(Path("/tmp") / ("x" * 120))
+        assert socket_path.parent != shared
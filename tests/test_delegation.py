@@ -10,17 +10,22 @@ Tests cover:
 - Edge cases (no available agents, empty skills)
 """
 
+import json
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from claudeswarm import delegation as delegation_module
 from claudeswarm.agent_cards import AgentCard, AgentCardRegistry
 from claudeswarm.delegation import (
     DELEGATION_HISTORY_FILENAME,
+    DELEGATION_HISTORY_ROTATE_AT,
     FILE_EXTENSION_SKILLS,
     KEYWORD_SKILLS,
+    MAX_DELEGATION_HISTORY,
     DelegationError,
     DelegationManager,
     DelegationResult,
@@ -31,6 +36,7 @@ from claudeswarm.delegation import (
     find_best_agent,
     get_delegation_history_path,
 )
+from claudeswarm.file_lock import FileLock
 from claudeswarm.tasks import Task, TaskPriority, TaskStatus
 
 
@@ -480,6 +486,43 @@ class TestExtractSkillsFromTask:
             ), "Skills should be sorted by importance descending"
 
 
+    def test_compiled_matcher_matches_substring_semantics(self):
+        """Test that the compiled keyword matcher finds exactly the substring matches."""
+        import random
+
+        rng = random.Random(11)
+        fragments = list(KEYWORD_SKILLS) + ["feedback", "speci", "specific", "latest", " ", "x"]
+
+        for _ in range(300):
+            text = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 8)))
+            found = set()
+            for match in delegation_module._KEYWORD_PATTERN.finditer(text):
+                found |= delegation_module._KEYWORD_CLOSURE[match.group(1)]
+
+            assert found == {k for k in KEYWORD_SKILLS if k in text}, text
+
+    def test_extraction_is_cached(self):
+        """Test that re-extracting the same task reuses the cached result."""
+        task = Task(
+            task_id="task-10",
+            objective="Fix the login bug in the api",
+            created_by="agent-0",
+            constraints=["Add unit tests"],
+            files=["src/api.py"],
+        )
+        delegation_module._extract_skills.cache_clear()
+
+        first = extract_skills_from_task(task)
+        second = extract_skills_from_task(task)
+
+        info = delegation_module._extract_skills.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        assert first == second
+        assert first is not second
+        assert first[0] is not second[0]
+
+
 class TestCalculateAgentScore:
     """Tests for calculate_agent_score function."""
 
@@ -699,6 +742,134 @@ class TestDelegationManagerHistoryOperations:
         assert len(history) == 1
         assert history[0].task_id == "task-1"
 
+    def test_record_appends_to_log(self, delegation_manager):
+        """Test that recording appends lines instead of rewriting the log."""
+        for i in range(3):
+            delegation_manager._record_delegation(
+                DelegationResult(success=True, task_id=f"task-{i}", agent_id="agent-1")
+            )
+
+        lines = delegation_manager.history_path.read_text().splitlines()
+        assert [json.loads(line)["task_id"] for line in lines] == ["task-0", "task-1", "task-2"]
+
+    def test_log_rotation_keeps_lifetime_counters(self, delegation_manager):
+        """Test that rotation trims the log but not the per-agent summary."""
+        results = [
+            DelegationResult(success=True, task_id=f"task-{i}", agent_id="agent-1")
+            for i in range(DELEGATION_HISTORY_ROTATE_AT)
+        ]
+
+        delegation_manager._record_delegations(results)
+
+        lines = delegation_manager.history_path.read_text().splitlines()
+        assert len(lines) == MAX_DELEGATION_HISTORY + 1
+        assert json.loads(lines[-1])["task_id"] == f"task-{DELEGATION_HISTORY_ROTATE_AT - 1}"
+        stats = delegation_manager.get_agent_delegation_stats("agent-1")
+        assert stats["total_delegations"] == DELEGATION_HISTORY_ROTATE_AT
+
+    def test_rebuilt_summary_keeps_rotated_counters(self, delegation_manager):
+        """Test that rebuilding the summary after rotation still counts trimmed entries."""
+        results = [
+            DelegationResult(success=i % 2 == 0, task_id=f"task-{i}", agent_id="agent-1")
+            for i in range(DELEGATION_HISTORY_ROTATE_AT)
+        ]
+        delegation_manager._record_delegations(results)
+        before = delegation_manager.get_agent_delegation_stats("agent-1")
+
+        delegation_manager.summary_path.unlink()
+        after = delegation_manager.get_agent_delegation_stats("agent-1")
+
+        assert after == before
+        assert after["total_delegations"] == DELEGATION_HISTORY_ROTATE_AT
+        assert len(delegation_manager._read_history()) == MAX_DELEGATION_HISTORY
+
+    def test_write_history_counts_trimmed_entries(self, delegation_manager):
+        """Test that entries trimmed by _write_history survive a summary rebuild."""
+        results = [
+            DelegationResult(success=True, task_id=f"task-{i}", agent_id="agent-1")
+            for i in range(MAX_DELEGATION_HISTORY + 10)
+        ]
+        delegation_manager._write_history(results)
+        delegation_manager.summary_path.unlink()
+
+        stats = delegation_manager.get_agent_delegation_stats("agent-1")
+        assert stats["total_delegations"] == MAX_DELEGATION_HISTORY + 10
+
+    def test_summary_matches_recompute(self, delegation_manager):
+        """Test that incremental summary updates equal a rebuild from the log."""
+        for i in range(6):
+            delegation_manager._record_delegation(
+                DelegationResult(
+                    success=i % 3 != 0,
+                    task_id=f"task-{i}",
+                    agent_id=f"agent-{i % 2}",
+                    match_score=0.1 * i,
+                    skill_matches={"python": 0.8},
+                )
+            )
+
+        incremental = delegation_manager._read_summary()["agents"]
+        with FileLock(delegation_manager.history_path):
+            rebuilt = delegation_manager._rebuild_summary()["agents"]
+
+        assert incremental.keys() == rebuilt.keys()
+        for agent_id, counters in rebuilt.items():
+            assert incremental[agent_id]["score_total"] == pytest.approx(counters["score_total"])
+            assert {k: v for k, v in incremental[agent_id].items() if k != "score_total"} == {
+                k: v for k, v in counters.items() if k != "score_total"
+            }
+
+    def test_stale_summary_is_rebuilt(self, delegation_manager):
+        """Test that entries appended behind the summary's back are counted."""
+        delegation_manager._record_delegation(
+            DelegationResult(success=True, task_id="task-1", agent_id="agent-1")
+        )
+        extra = DelegationResult(success=False, task_id="task-2", agent_id="agent-1")
+        with open(delegation_manager.history_path, "a") as f:
+            f.write(json.dumps(extra.to_dict()) + "\n")
+
+        stats = delegation_manager.get_agent_delegation_stats("agent-1")
+
+        assert stats["total_delegations"] == 2
+        assert stats["failed"] == 1
+
+    def test_legacy_history_is_migrated(self, delegation_manager):
+        """Test that a DELEGATION_HISTORY.json file is converted to the log."""
+        legacy = DelegationResult(success=True, task_id="old-task", agent_id="agent-1")
+        delegation_manager.legacy_history_path.write_text(
+            json.dumps({"history": [legacy.to_dict()]})
+        )
+
+        history = delegation_manager._read_history()
+
+        assert [r.task_id for r in history] == ["old-task"]
+        assert not delegation_manager.legacy_history_path.exists()
+        assert delegation_manager.get_agent_delegation_stats("agent-1")["total_delegations"] == 1
+
+    def test_concurrent_migration_runs_once(self, delegation_manager):
+        """Test that racing migrations neither fail nor duplicate entries."""
+        legacy = DelegationResult(success=True, task_id="old-task", agent_id="agent-1")
+        delegation_manager.legacy_history_path.write_text(
+            json.dumps({"history": [legacy.to_dict()]})
+        )
+        errors = []
+
+        def migrate():
+            try:
+                delegation_manager._migrate_legacy_history()
+            except Exception as e:  # pragma: no cover - failure path
+                errors.append(e)
+
+        threads = [threading.Thread(target=migrate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [r.task_id for r in delegation_manager._read_history()] == ["old-task"]
+        assert delegation_manager.legacy_history_path.with_suffix(".json.migrated").exists()
+
 
 class TestDelegationManagerFindBestAgent:
     """Tests for finding the best agent for a task."""
@@ -972,6 +1143,104 @@ class TestDelegationManagerDelegateTask:
         assert history[0].task_id == sample_task.task_id
 
 
+class TestDelegationManagerDelegateBatch:
+    """Tests for load-balanced batch delegation."""
+
+    @staticmethod
+    def _python_tasks(count):
+        return [
+            Task(
+                task_id=f"task-{i}",
+                objective=f"Write python module {i}",
+                created_by="planner",
+                files=[f"src/module_{i}.py"],
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _python_peer(agent, agent_id):
+        return AgentCard(
+            agent_id=agent_id,
+            skills=agent.skills,
+            tools=agent.tools,
+            success_rates={"python": 0.85, "backend": 0.8},
+            specializations=agent.specializations,
+        )
+
+    def test_delegate_batch_spreads_load(self, delegation_manager, python_agent):
+        """Test that similar agents share a batch instead of the top agent taking all."""
+        peer = self._python_peer(python_agent, "python-agent-2")
+        delegation_manager.card_registry.list_cards.return_value = [python_agent, peer]
+        delegation_manager.task_manager.assign_tasks = Mock()
+
+        with patch.object(delegation_manager, "_get_agent_loads", return_value={}):
+            results = delegation_manager.delegate_batch(self._python_tasks(4))
+
+        assert all(r.success for r in results)
+        counts = {}
+        for r in results:
+            counts[r.agent_id] = counts.get(r.agent_id, 0) + 1
+        assert counts == {"python-agent": 2, "python-agent-2": 2}
+
+    def test_delegate_batch_single_write(self, delegation_manager, python_agent):
+        """Test that assignments and history are each written once."""
+        delegation_manager.card_registry.list_cards.return_value = [python_agent]
+        delegation_manager.task_manager.assign_tasks = Mock()
+
+        with patch.object(delegation_manager, "_get_agent_loads", return_value={}):
+            with patch.object(delegation_manager, "_record_delegations") as mock_write:
+                delegation_manager.delegate_batch(self._python_tasks(3))
+
+        delegation_manager.task_manager.assign_tasks.assert_called_once()
+        assignments = delegation_manager.task_manager.assign_tasks.call_args[0][0]
+        assert [a[0] for a in assignments] == ["task-0", "task-1", "task-2"]
+        mock_write.assert_called_once()
+        assert len(mock_write.call_args[0][0]) == 3
+
+    def test_delegate_batch_respects_capacity(self, delegation_manager, python_agent):
+        """Test that agents are not given more than their free capacity."""
+        delegation_manager.card_registry.list_cards.return_value = [python_agent]
+        delegation_manager.task_manager.assign_tasks = Mock()
+
+        with patch.object(
+            delegation_manager, "_get_agent_loads", return_value={"python-agent": 3}
+        ):
+            results = delegation_manager.delegate_batch(
+                self._python_tasks(4), max_tasks_per_agent=5
+            )
+
+        assert [r.success for r in results] == [True, True, False, False]
+        assert results[2].reason == "No agent capacity left for this task"
+
+    def test_delegate_batch_prefers_idle_agent(self, delegation_manager, python_agent):
+        """Test that in-progress load shifts work to a slightly weaker idle agent."""
+        peer = self._python_peer(python_agent, "python-agent-2")
+        delegation_manager.card_registry.list_cards.return_value = [python_agent, peer]
+        delegation_manager.task_manager.assign_tasks = Mock()
+
+        with patch.object(
+            delegation_manager, "_get_agent_loads", return_value={"python-agent": 2}
+        ):
+            results = delegation_manager.delegate_batch(self._python_tasks(1))
+
+        assert results[0].agent_id == "python-agent-2"
+
+    def test_delegate_batch_no_agents(self, delegation_manager):
+        """Test that tasks fail cleanly when nobody is active."""
+        delegation_manager.card_registry.list_cards.return_value = []
+        delegation_manager.task_manager.assign_tasks = Mock()
+
+        results = delegation_manager.delegate_batch(self._python_tasks(2))
+
+        assert [r.success for r in results] == [False, False]
+        assert results[0].reason == "No suitable agent found for this task"
+
+    def test_delegate_batch_empty(self, delegation_manager):
+        """Test that an empty batch is a no-op."""
+        assert delegation_manager.delegate_batch([]) == []
+
+
 class TestDelegationManagerDelegateToBest:
     """Tests for delegate_to_best convenience method."""
 
@@ -0,0 +1,144 @@
+"""Unit tests for the check-messages hook fast path.
+
+Tests cover:
+- Per-pane state files and agent identity caching
+- Detecting that nothing was appended to the message log
+- check-messages exiting without parsing the log
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claudeswarm import cli
+from claudeswarm.daemon_client import DISABLE_DAEMON_ENV
+from claudeswarm.inbox_probe import (
+    cached_agent_id,
+    file_stamp,
+    get_pane_state_path,
+    probe_no_new_messages,
+    save_pane_state,
+)
+
+
+@pytest.fixture
+def temp_project():
+    """Create a project with a registry and an empty message log."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project = Path(tmpdir)
+        with open(project / "ACTIVE_AGENTS.json", "w", encoding="utf-8") as f:
+            json.dump({"agents": [{"id": "agent-1", "tmux_pane_id": "%1"}]}, f)
+        (project / "agent_messages.log").touch()
+        yield project
+
+
+def _append_message(project: Path, recipient: str, content: str, timestamp: str) -> None:
+    entry = {
+        "sender": "agent-2",
+        "recipients": [recipient],
+        "msg_type": "INFO",
+        "content": content,
+        "timestamp": timestamp,
+        "msg_id": content,
+    }
+    with open(project / "agent_messages.log", "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def _save(project: Path, pane_id: str = "%1") -> None:
+    save_pane_state(
+        project,
+        pane_id,
+        "agent-1",
+        file_stamp(project / "ACTIVE_AGENTS.json"),
+        file_stamp(project / "agent_messages.log"),
+    )
+
+
+class TestPaneState:
+    """Tests for the per-pane state file."""
+
+    def test_pane_state_path(self, temp_project):
+        """Test that only real pane IDs get a state file."""
+        assert get_pane_state_path(temp_project, "%12").name == "pane-12.json"
+        assert get_pane_state_path(temp_project, "12") is None
+        assert get_pane_state_path(temp_project, "%../x") is None
+
+    def test_unchanged_log_has_no_new_messages(self, temp_project):
+        """Test that the probe answers from the stamps alone."""
+        assert probe_no_new_messages(temp_project, "%1") is None
+
+        _save(temp_project)
+        assert probe_no_new_messages(temp_project, "%1") == "agent-1"
+        assert probe_no_new_messages(temp_project, "%2") is None
+
+    def test_appended_message_invalidates(self, temp_project):
+        """Test that any append to the log forces the full check."""
+        _save(temp_project)
+        _append_message(temp_project, "agent-3", "hello", "2026-01-01T00:00:01")
+
+        assert probe_no_new_messages(temp_project, "%1") is None
+
+    def test_registry_change_invalidates_identity(self, temp_project):
+        """Test that the cached agent ID is keyed on the registry stamp."""
+        _save(temp_project)
+        assert cached_agent_id(temp_project, "%1") == "agent-1"
+
+        with open(temp_project / "ACTIVE_AGENTS.json", "w", encoding="utf-8") as f:
+            json.dump({"agents": [{"id": "agent-9", "tmux_pane_id": "%1"}]}, f)
+
+        assert cached_agent_id(temp_project, "%1") is None
+        assert probe_no_new_messages(temp_project, "%1") is None
+
+
+class TestCheckMessagesFastPath:
+    """Tests for check-messages using the pane state."""
+
+    @pytest.fixture
+    def run_check(self, temp_project, monkeypatch, capsys):
+        """Run check-messages --new-only --quiet from pane %1."""
+        # Keep files written by the ACK retry pass after the check out of the tree
+        monkeypatch.chdir(temp_project)
+        monkeypatch.setenv("CLAUDESWARM_ROOT", str(temp_project))
+        monkeypatch.setenv("TMUX_PANE", "%1")
+        monkeypatch.setenv(DISABLE_DAEMON_ENV, "1")
+        args = argparse.Namespace(
+            agent_id=None, new_only=True, quiet=True, limit=None, project_root=None
+        )
+
+        def run() -> str:
+            with pytest.raises(SystemExit) as exc_info:
+                cli.cmd_check_messages(args)
+            assert exc_info.value.code == 0
+            return capsys.readouterr().out
+
+        return run
+
+    def test_second_check_skips_parsing(self, temp_project, run_check):
+        """Test that a repeated check neither detects the agent nor reads the log."""
+        _append_message(temp_project, "agent-1", "hello", "2026-01-01T00:00:01")
+
+        with patch.object(cli, "_detect_current_agent", return_value=("agent-1", {})):
+            assert run_check() == "[agent-2:INFO] hello\n"
+
+        with (
+            patch.object(cli, "_detect_current_agent") as mock_detect,
+            patch.object(cli, "_collect_messages_direct") as mock_collect,
+        ):
+            assert run_check() == ""
+        mock_detect.assert_not_called()
+        mock_collect.assert_not_called()
+
+    def test_new_message_uses_cached_identity(self, temp_project, run_check):
+        """Test that a changed log is read without re-detecting the agent."""
+        with patch.object(cli, "_detect_current_agent", return_value=("agent-1", {})):
+            assert run_check() == ""
+
+        _append_message(temp_project, "agent-1", "again", "2026-01-01T00:00:02")
+        with patch.object(cli, "_detect_current_agent") as mock_detect:
+            assert run_check() == "[agent-2:INFO] again\n"
+        mock_detect.assert_not_called()
@@ -20,12 +20,15 @@ import pytest
 from claudeswarm.learning import (
     EXPONENTIAL_DECAY_WEIGHT,
     LEARNING_DATA_FILENAME,
+    LEARNING_SHARD_DIR,
+    TREND_MIN_SAMPLES,
     AgentPerformance,
     LearningSystem,
+    OutcomeWindow,
     SkillMetrics,
     get_learning_data_path,
 )
-from claudeswarm.tasks import Task, TaskStatus
+from claudeswarm.tasks import Task, TaskHistoryEntry, TaskManager, TaskStatus
 
 
 class TestSkillMetrics:
@@ -133,6 +136,68 @@ class TestSkillMetrics:
         assert metrics.success_rate == 0.7
 
 
+class TestOutcomeWindow:
+    """Tests for the OutcomeWindow ring buffer."""
+
+    def test_overwrites_oldest_when_full(self):
+        """Test that the window keeps only the newest outcomes."""
+        window = OutcomeWindow(size=4)
+        for i in range(6):
+            window.append(success=i >= 2, completion_time=float(i + 1), timestamp=i)
+
+        assert len(window) == 4
+        assert window.to_dict()["timestamps"] == [2, 3, 4, 5]
+        assert window.success_rate() == 1.0
+        assert window.success_rate(last_n=2) == 1.0
+
+    def test_completion_percentiles(self):
+        """Test nearest-rank percentiles, ignoring unmeasured outcomes."""
+        window = OutcomeWindow()
+        for duration in [10.0, 20.0, 30.0, 40.0, None, 50.0, 60.0, 70.0, 80.0, 90.0, 100.0]:
+            window.append(success=True, completion_time=duration)
+
+        assert window.completion_percentile(50) == 50.0
+        assert window.completion_percentile(90) == 90.0
+        assert window.completion_percentile(50, last_n=3) == 90.0
+        assert OutcomeWindow().completion_percentile(50) is None
+
+    def test_trend(self):
+        """Test that trend compares the newer half against the older half."""
+        improving = OutcomeWindow()
+        declining = OutcomeWindow()
+        for i in range(TREND_MIN_SAMPLES):
+            improving.append(success=i >= TREND_MIN_SAMPLES // 2)
+            declining.append(success=i < TREND_MIN_SAMPLES // 2)
+
+        assert improving.trend() == 1
+        assert declining.trend() == -1
+        assert OutcomeWindow().trend() == 0
+
+    def test_serialization_roundtrip(self):
+        """Test that to_dict/from_dict preserve order after wrapping."""
+        window = OutcomeWindow(size=3)
+        for i in range(5):
+            window.append(success=i % 2 == 0, completion_time=i * 1.5, timestamp=1000 + i)
+
+        restored = OutcomeWindow.from_dict(json.loads(json.dumps(window.to_dict())))
+
+        assert restored == window
+        restored.append(success=True, timestamp=2000)
+        assert restored.to_dict()["timestamps"] == [1003, 1004, 2000]
+
+    def test_skill_metrics_use_window(self):
+        """Test that SkillMetrics exposes windowed metrics and persists them."""
+        metrics = SkillMetrics(skill="python")
+        for i in range(12):
+            metrics.record_outcome(success=i >= 6, completion_time=10.0 * (i + 1))
+
+        assert metrics.trend == 1
+        assert metrics.recent_success_rate == 0.5
+        assert metrics.p50_completion_time == 60.0
+        assert metrics.p90_completion_time == 110.0
+        assert SkillMetrics.from_dict(metrics.to_dict()) == metrics
+
+
 class TestAgentPerformance:
     """Tests for AgentPerformance dataclass."""
 
@@ -408,13 +473,14 @@ class TestLearningSystem:
         assert perf.agent_id == "agent-0"
         assert perf.tasks_completed == 0
 
-        # Should be persisted
-        assert system.data_path.exists()
+        # Reading must not write anything
+        assert not system.shard_dir.exists()
+        assert not system.data_path.exists()
 
     def test_get_agent_performance_existing(self, system):
         """Test getting performance for existing agent."""
         # Create performance
-        perf1 = system.get_agent_performance("agent-0")
+        system.record_task_started("task-1", "agent-0")
 
         # Modify it directly (simulating external modification)
         with system._lock:
@@ -524,8 +590,8 @@ class TestLearningSystem:
     def test_get_all_performance(self, system):
         """Test getting all performance data."""
         # Create performance for multiple agents
-        system.get_agent_performance("agent-0")
-        system.get_agent_performance("agent-1")
+        system.record_task_started("task-1", "agent-0")
+        system.record_task_started("task-2", "agent-1")
 
         result = system.get_all_performance()
 
@@ -561,12 +627,13 @@ class TestLearningSystem:
     def test_get_leaderboard_with_limit(self, system):
         """Test getting leaderboard with limit."""
         # Create 3 agents
+        agents = {}
         for i in range(3):
             perf = system.get_agent_performance(f"agent-{i}")
             perf.overall_success_rate = 0.5 + (i * 0.1)
+            agents[perf.agent_id] = perf
 
         with system._lock:
-            agents = system._read_data()
             system._write_data(agents)
 
         leaderboard = system.get_leaderboard(limit=2)
@@ -650,6 +717,71 @@ class TestLearningSystem:
         assert summary["active_agents"] == 2
         assert len(summary["top_performers"]) <= 3
 
+    def test_team_summary_incremental_matches_fresh(self, system):
+        """Test that the materialized summary equals a full recompute."""
+        for i in range(20):
+            task = Task(task_id=f"task-{i}", objective="Fix bug", created_by="agent-0")
+            task.assigned_to = f"agent-{i % 5}"
+            system.record_task_completed(task, success=i % 3 != 0, skills=["python"])
+
+        incremental = system.get_team_summary()
+        fresh = system.get_team_summary(fresh=True)
+
+        assert incremental == fresh
+        assert incremental["total_tasks_completed"] == 13
+        assert len(incremental["top_performers"]) == 3
+
+    def test_team_summary_rereads_changed_shards(self, system):
+        """Test that the index picks up shards changed behind its back."""
+        system.record_task_started("task-1", "agent-0")
+        assert system.get_team_summary()["total_tasks_completed"] == 0
+
+        shard = system.shard_dir / "agent-0.json"
+        data = json.loads(shard.read_text())
+        data["tasks_completed"] = 7
+        shard.write_text(json.dumps(data, indent=4))
+
+        assert system.get_team_summary()["total_tasks_completed"] == 7
+        assert system.get_team_summary(fresh=True)["total_tasks_completed"] == 7
+
+    def test_index_only_rereads_changed_shards(self, system):
+        """Test that recording never touches the index and reads stay incremental."""
+        system.record_task_started("task-1", "agent-0")
+        system.record_task_started("task-2", "agent-1")
+        assert not system.data_path.exists()
+
+        assert len(system.get_leaderboard()) == 2
+        assert system.data_path.exists()
+
+        system.record_task_started("task-3", "agent-1")
+        with patch.object(system, "_load_agent", wraps=system._load_agent) as mock_load:
+            system.get_team_summary()
+        assert [call.args[0] for call in mock_load.call_args_list] == ["agent-1"]
+
+    def test_removed_shard_dropped_from_index(self, system):
+        """Test that deleting an agent's shard removes it from the summary."""
+        system.record_task_started("task-1", "agent-0")
+        system.record_task_started("task-2", "agent-1")
+        assert system.get_team_summary()["total_agents"] == 2
+
+        (system.shard_dir / "agent-1.json").unlink()
+        assert system.get_team_summary()["total_agents"] == 1
+
+    def test_team_summary_rebuilt_on_layout_change(self, system):
+        """Test that a summary with an old layout version is recomputed."""
+        system.record_task_started("task-1", "agent-0")
+        system.get_team_summary()
+        data = json.loads(system.data_path.read_text())
+        data["summary"]["version"] = "0"
+        data["summary"]["total_tasks_failed"] = 99
+        system.data_path.write_text(json.dumps(data))
+
+        system.record_task_started("task-2", "agent-1")
+
+        summary = system.get_team_summary()
+        assert summary["total_tasks_failed"] == 0
+        assert summary["total_agents"] == 2
+
     def test_record_task_from_history(self, system):
         """Test recording task from history."""
         # Create a task with history
@@ -686,6 +818,23 @@ class TestLearningSystem:
         # Should have calculated response and work times
         assert perf.avg_response_time > 0 or perf.avg_completion_time > 0
 
+    def test_record_task_completed_uses_task_timing(self, system):
+        """Test that completion time comes from the task, not process state."""
+        task = Task(task_id="task-1", objective="Fix bug", created_by="agent-0")
+        task.assign_to("agent-0")
+        task.start_work("agent-0")
+        task.metadata["timing"]["started_at"] = "2024-01-01T00:00:00+00:00"
+        task.metadata["timing"]["assigned_at"] = "2023-12-31T23:59:00+00:00"
+        task.metadata["timing"]["finished_at"] = "2024-01-01T00:02:00+00:00"
+        task.status = TaskStatus.COMPLETED
+
+        system.record_task_completed(task, success=True, skills=["python"])
+
+        perf = system.get_agent_performance("agent-0")
+        assert perf.avg_completion_time == 120.0
+        assert perf.avg_response_time == 60.0
+        assert perf.skill_metrics["python"].avg_completion_time == 120.0
+
     def test_record_task_from_history_no_assignee(self, system):
         """Test recording task from history with no assignee."""
         task = Mock(spec=Task)
@@ -705,7 +854,7 @@ class TestLearningSystem:
         from claudeswarm.file_lock import FileLockTimeout
 
         # Create data file
-        system.get_agent_performance("agent-0")
+        system.record_task_started("task-1", "agent-0")
 
         # Make FileLock raise timeout
         mock_filelock.side_effect = FileLockTimeout("Timeout")
@@ -752,3 +901,100 @@ class TestLearningSystem:
 
         # Should return empty list
         assert leaderboard == []
+
+    @staticmethod
+    def _finished_task(task_id: str, started: str, finished: str) -> Task:
+        task = Task(
+            task_id=task_id,
+            objective="Fix bug",
+            created_by="agent-0",
+            assigned_to="agent-0",
+            status=TaskStatus.COMPLETED,
+            files=["src/main.py"],
+        )
+        task.history = [
+            TaskHistoryEntry(started, "pending", "assigned", "agent-0"),
+            TaskHistoryEntry(started, "assigned", "working", "agent-0"),
+            TaskHistoryEntry(finished, "working", "completed", "agent-0"),
+        ]
+        return task
+
+    def test_backfill_timing(self, system):
+        """Test that backfill replays task history into time averages."""
+        tasks = [
+            self._finished_task("task-2", "2024-01-02T00:00:00+00:00", "2024-01-02T00:00:20+00:00"),
+            self._finished_task("task-1", "2024-01-01T00:00:00+00:00", "2024-01-01T00:00:10+00:00"),
+        ]
+        system.get_agent_performance("agent-0")
+
+        count = system.backfill_timing(tasks)
+
+        perf = system.get_agent_performance("agent-0")
+        expected = 10.0 * (1 - EXPONENTIAL_DECAY_WEIGHT) + 20.0 * EXPONENTIAL_DECAY_WEIGHT
+        assert count == 2
+        assert perf.avg_completion_time == pytest.approx(expected)
+        assert perf.skill_metrics["python"].avg_completion_time == pytest.approx(expected)
+        assert perf.tasks_completed == 0  # Outcome counts are not replayed
+
+    def test_backfill_timing_reads_task_file(self, system, temp_project):
+        """Test that backfill loads terminal tasks from TASKS.json by default."""
+        manager = TaskManager(temp_project)
+        task = manager.create_task(objective="Fix bug", created_by="agent-0")
+        manager.assign_task(task.task_id, "agent-0")
+        manager.transition_task(task.task_id, TaskStatus.WORKING, "agent-0")
+        manager.complete_task(task.task_id, "agent-0")
+        manager.create_task(objective="Still pending", created_by="agent-0")
+
+        assert system.backfill_timing() == 1
+
+    def test_backfill_timing_no_tasks(self, system):
+        """Test that backfill without timed tasks changes nothing."""
+        assert system.backfill_timing([]) == 0
+        assert not system.data_path.exists()
+
+    def test_updates_touch_only_one_shard(self, system):
+        """Test that recording for one agent leaves other shards alone."""
+        system.record_task_started("task-1", "agent-0")
+        system.record_task_started("task-2", "agent-1")
+        other_shard = system.shard_dir / "agent-1.json"
+        before = other_shard.stat().st_mtime_ns
+
+        system.record_task_started("task-3", "agent-0")
+
+        assert other_shard.stat().st_mtime_ns == before
+        assert system.get_agent_performance("agent-0").tasks_in_progress == 2
+        assert system._read_index()["agent-0"]["tasks_in_progress"] == 2
+
+    def test_missing_index_is_rebuilt(self, system):
+        """Test that the index is rebuilt from shards when deleted."""
+        system.record_task_started("task-1", "agent-0")
+        system.record_task_started("task-2", "agent-1")
+        system.get_team_summary()
+        system.data_path.unlink()
+
+        summary = system.get_team_summary()
+
+        assert summary["total_agents"] == 2
+        assert system.data_path.exists()
+
+    def test_migrates_legacy_data_file(self, temp_project):
+        """Test that a single-file LEARNING_DATA.json is split into shards."""
+        legacy = {
+            "version": "1.0",
+            "agents": {
+                "agent-0": AgentPerformance(agent_id="agent-0", tasks_completed=4).to_dict(),
+                "agent-1": AgentPerformance(agent_id="agent-1", tasks_failed=2).to_dict(),
+            },
+        }
+        (temp_project / LEARNING_DATA_FILENAME).write_text(json.dumps(legacy))
+
+        system = LearningSystem(temp_project)
+
+        assert (temp_project / LEARNING_SHARD_DIR / "agent-0.json").exists()
+        assert system.get_agent_performance("agent-0").tasks_completed == 4
+        assert system.get_team_summary()["total_tasks_failed"] == 2
+
+    def test_invalid_agent_id_rejected(self, system):
+        """Test that agent IDs cannot escape the shard directory."""
+        with pytest.raises(ValueError):
+            system.get_agent_performance("../agent-0")
@@ -7,6 +7,7 @@ Tests cover:
 - Concurrent lock attempts (race conditions)
 - Glob pattern matching
 - Lock file corruption handling
+- Lock transfer between agents
 - Retry logic with exponential backoff and jitter
 """
 
@@ -462,6 +463,26 @@ class TestLockManager:
         # Filename should be a .lock file
         assert filename1.endswith(".lock")
 
+    def test_transfer_lock(self, lock_manager):
+        """Test that a lock can be handed directly from its holder to another agent."""
+        lock_manager.acquire_lock("test.py", "agent-1", "low priority work")
+
+        assert lock_manager.transfer_lock("test.py", "agent-1", "agent-2", "preempted")
+
+        lock = lock_manager.who_has_lock("test.py")
+        assert lock.agent_id == "agent-2"
+        assert lock.reason == "preempted"
+        assert not lock_manager.release_lock("test.py", "agent-1")
+        assert list(lock_manager.lock_dir.glob("*.tmp")) == []
+
+    def test_transfer_lock_requires_holder(self, lock_manager):
+        """Test that only the current holder's lock can be transferred."""
+        assert not lock_manager.transfer_lock("test.py", "agent-1", "agent-2")
+
+        lock_manager.acquire_lock("test.py", "agent-3", "working")
+        assert not lock_manager.transfer_lock("test.py", "agent-1", "agent-2")
+        assert lock_manager.who_has_lock("test.py").agent_id == "agent-3"
+
 
 class TestConcurrency:
     """Tests for concurrent lock scenarios."""
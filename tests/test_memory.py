@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import json
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -573,6 +574,74 @@ class TestAgentMemory:
         assert result[0] == ("agent-2", 0.9)
         assert result[1] == ("agent-1", 0.8)
 
+    def test_learn_pattern_keyed_by_type(self):
+        """Test that the same description under another type is a separate pattern."""
+        memory = AgentMemory(agent_id="agent-0")
+
+        approach = memory.learn_pattern("approach", "Refactor first")
+        anti = memory.learn_pattern("anti-pattern", "Refactor first")
+
+        assert approach is not anti
+        assert len(memory.patterns) == 2
+        assert memory.learn_pattern("approach", "Refactor first") is approach
+        assert approach.occurrences == 2
+
+    def test_learn_pattern_evicts_least_effective(self):
+        """Test that trimming drops the least effective pattern after reinforcement."""
+        memory = AgentMemory(agent_id="agent-0")
+        for i in range(MAX_PATTERNS):
+            memory.learn_pattern("approach", f"Pattern {i}", effectiveness=0.7)
+
+        # Weaken one pattern through reinforcement only
+        for _ in range(5):
+            memory.learn_pattern("approach", "Pattern 42", effectiveness=0.0)
+        memory.learn_pattern("approach", "Newcomer", effectiveness=0.7)
+
+        descriptions = [p.description for p in memory.patterns]
+        assert len(memory.patterns) == MAX_PATTERNS
+        assert "Pattern 42" not in descriptions
+        assert descriptions[-1] == "Newcomer"
+
+        # The evicted pattern is learned afresh
+        assert memory.learn_pattern("approach", "Pattern 42").occurrences == 1
+
+    def test_get_effective_patterns_limit(self):
+        """Test that a limit returns the most effective patterns first."""
+        memory = AgentMemory(agent_id="agent-0")
+        for i, effectiveness in enumerate([0.7, 0.95, 0.5, 0.8]):
+            memory.learn_pattern("approach", f"Pattern {i}", effectiveness=effectiveness)
+
+        result = memory.get_effective_patterns(limit=2)
+
+        assert [p.description for p in result] == ["Pattern 1", "Pattern 3"]
+
+    def test_skill_index_survives_round_trip(self):
+        """Test that skills are indexed on load and when added later."""
+        memory = AgentMemory(agent_id="agent-0")
+        memory.get_relationship("agent-1").add_strength("Python")
+        restored = AgentMemory.from_dict(memory.to_dict())
+
+        restored.get_relationship("agent-2").add_strength("python")
+        restored.get_relationship("agent-2").reliability_score = 0.9
+
+        assert restored.get_best_agents_for_skill("PYTHON") == [
+            ("agent-2", 0.9),
+            ("agent-1", 0.5),
+        ]
+        assert restored.get_best_agents_for_skill("rust") == []
+
+    def test_pattern_index_survives_round_trip(self):
+        """Test that a restored memory reinforces instead of duplicating."""
+        memory = AgentMemory(agent_id="agent-0")
+        memory.learn_pattern("approach", "Use type hints")
+
+        restored = AgentMemory.from_dict(memory.to_dict())
+        pattern = restored.learn_pattern("approach", "Use type hints")
+
+        assert len(restored.patterns) == 1
+        assert pattern.occurrences == 2
+        assert restored == AgentMemory.from_dict(restored.to_dict())
+
     def test_to_dict(self):
         """Test conversion to dictionary."""
         memory = AgentMemory(agent_id="agent-0")
@@ -858,3 +927,74 @@ class TestMemoryStore:
         result = store._read_memory("nonexistent")
 
         assert result is None
+
+    def test_write_through_by_default(self, store):
+        """Test that the default store writes every save to disk."""
+        store.learn_pattern("agent-0", "approach", "Write tests first")
+
+        data = json.loads((store.memory_dir / "agent-0.json").read_text())
+        assert len(data["patterns"]) == 1
+
+
+class TestMemoryStoreWriteBehind:
+    """Tests for MemoryStore write-behind mode."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a write-behind MemoryStore with a long flush interval."""
+        store = MemoryStore(tmp_path, write_behind=True, flush_interval=60.0)
+        yield store
+        store.close()
+
+    def test_saves_are_coalesced(self, store):
+        """Test that a burst of saves is written once on flush."""
+        with patch.object(store, "_write_memory", wraps=store._write_memory) as mock_write:
+            for i in range(5):
+                store.learn_pattern("agent-0", "approach", f"Pattern {i}")
+            store.record_interaction("agent-0", "agent-1", positive=True)
+
+            assert mock_write.call_count == 0
+            assert store.flush() == 1
+
+        assert mock_write.call_count == 1
+        data = json.loads((store.memory_dir / "agent-0.json").read_text())
+        assert len(data["patterns"]) == 5
+        assert "agent-1" in data["relationships"]
+
+    def test_reads_see_unflushed_saves(self, store):
+        """Test that cached memories are returned before they are flushed."""
+        store.learn_pattern("agent-0", "approach", "Pair on reviews")
+
+        assert not (store.memory_dir / "agent-0.json").exists()
+        assert len(store.get_memory("agent-0").patterns) == 1
+        assert store.list_agents_with_memory() == ["agent-0"]
+
+    def test_flushes_after_interval(self, tmp_path):
+        """Test that dirty memories are flushed by the timer."""
+        store = MemoryStore(tmp_path, write_behind=True, flush_interval=0.05)
+        store.learn_pattern("agent-0", "approach", "Small commits")
+
+        memory_file = store.memory_dir / "agent-0.json"
+        deadline = time.time() + 5.0
+        while not memory_file.exists() and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert memory_file.exists()
+        store.close()
+
+    def test_context_manager_flushes_on_exit(self, tmp_path):
+        """Test that leaving the context manager flushes pending saves."""
+        with MemoryStore(tmp_path, write_behind=True, flush_interval=60.0) as store:
+            store.remember_task("agent-0", "task-1", "Fix bug", "success")
+
+        data = json.loads((store.memory_dir / "agent-0.json").read_text())
+        assert data["task_history"][0]["task_id"] == "task-1"
+
+    def test_delete_discards_pending_save(self, store):
+        """Test that deleting an agent drops its unflushed memory."""
+        store.learn_pattern("agent-0", "approach", "Spike first")
+
+        assert store.delete_memory("agent-0") is True
+        store.flush()
+
+        assert not (store.memory_dir / "agent-0.json").exists()
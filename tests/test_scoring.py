@@ -0,0 +1,151 @@
+"""Unit tests for the matrix-based agent scoring engine.
+
+Tests cover:
+- Parity with delegation.calculate_agent_score (NumPy and fallback paths)
+- Batch scoring of many tasks
+- Unknown skills, unavailable agents and empty requirements
+- Per-agent skill match extraction
+- Hungarian assignment solver
+"""
+
+import itertools
+import random
+from unittest.mock import patch
+
+import pytest
+
+from claudeswarm import scoring
+from claudeswarm.agent_cards import AgentCard
+from claudeswarm.delegation import SkillRequirement, calculate_agent_score
+from claudeswarm.scoring import AgentSkillMatrix, solve_assignment
+
+SKILL_POOL = ["python", "Backend", "testing", "react", "css", "database", "security", "rust"]
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def numpy_mode(request):
+    """Run a test with and without NumPy acceleration."""
+    if request.param == "numpy":
+        if not scoring.HAS_NUMPY:
+            pytest.skip("NumPy not installed")
+        yield
+    else:
+        with patch.object(scoring, "HAS_NUMPY", False):
+            yield
+
+
+def _random_agent(rng: random.Random, index: int) -> AgentCard:
+    skills = rng.sample(SKILL_POOL, rng.randint(0, 5))
+    rates = {s.upper() if rng.random() < 0.3 else s: round(rng.random(), 2) for s in skills}
+    return AgentCard(
+        agent_id=f"agent-{index}",
+        skills=skills,
+        availability=rng.choice(["active", "active", "busy"]),
+        success_rates=rates,
+        specializations=rng.sample(SKILL_POOL, rng.randint(0, 3)),
+    )
+
+
+def _random_requirements(rng: random.Random) -> list[SkillRequirement]:
+    return [
+        SkillRequirement(
+            skill=skill,
+            importance=round(rng.random(), 2),
+            minimum_proficiency=rng.choice([0.0, 0.0, 0.5]),
+        )
+        for skill in rng.sample(SKILL_POOL + ["unknown-skill"], rng.randint(0, 6))
+    ]
+
+
+class TestAgentSkillMatrix:
+    """Tests for AgentSkillMatrix."""
+
+    def test_matches_calculate_agent_score(self, numpy_mode):
+        """Test that matrix scores equal the per-agent reference implementation."""
+        rng = random.Random(42)
+        agents = [_random_agent(rng, i) for i in range(20)]
+        matrix = AgentSkillMatrix(agents)
+
+        for _ in range(50):
+            requirements = _random_requirements(rng)
+            boost = rng.choice([-0.05, 0.0, 0.05, 0.1])
+            scores = matrix.score(requirements, boost)
+
+            for index, agent in enumerate(agents):
+                expected, expected_matches = calculate_agent_score(agent, requirements, boost)
+                assert scores[index] == pytest.approx(expected, abs=1e-12)
+                if requirements:
+                    assert matrix.skill_matches(index, requirements) == pytest.approx(
+                        expected_matches
+                    )
+
+    def test_score_batch_matches_single_scoring(self, numpy_mode):
+        """Test that batch scoring returns the same rows as one-by-one scoring."""
+        rng = random.Random(7)
+        agents = [_random_agent(rng, i) for i in range(10)]
+        matrix = AgentSkillMatrix(agents)
+        batch = [(_random_requirements(rng), rng.choice([0.0, 0.1])) for _ in range(15)]
+
+        rows = matrix.score_batch(batch)
+
+        assert len(rows) == 15
+        for row, (requirements, boost) in zip(rows, batch, strict=True):
+            assert row == pytest.approx(matrix._score_python(requirements, boost), abs=1e-12)
+
+    def test_unavailable_agent_scores_zero(self, numpy_mode):
+        """Test that busy agents never score."""
+        busy = AgentCard(agent_id="busy", skills=["python"], availability="busy")
+        matrix = AgentSkillMatrix([busy])
+
+        assert matrix.score([SkillRequirement(skill="python")]) == [0.0]
+        assert matrix.skill_matches(0, [SkillRequirement(skill="python")]) == {}
+
+    def test_no_requirements(self, numpy_mode):
+        """Test that tasks without requirements score 0.5 plus boost."""
+        agent = AgentCard(agent_id="a", skills=["python"])
+        matrix = AgentSkillMatrix([agent])
+
+        assert matrix.score([], 0.1) == [pytest.approx(0.6)]
+
+    def test_skill_lookup_is_case_insensitive(self, numpy_mode):
+        """Test that skills and rates are matched regardless of case."""
+        agent = AgentCard(agent_id="a", skills=["Python"], success_rates={"PYTHON": 0.9})
+        matrix = AgentSkillMatrix([agent])
+
+        assert matrix.skill_index == {"python": 1}
+        assert matrix.score([SkillRequirement(skill="python")]) == [pytest.approx(0.9)]
+
+    def test_empty_inputs(self, numpy_mode):
+        """Test scoring with no agents or no tasks."""
+        assert AgentSkillMatrix([]).score_batch([([], 0.0)]) == [[]]
+        assert AgentSkillMatrix([AgentCard(agent_id="a")]).score_batch([]) == []
+
+
+class TestSolveAssignment:
+    """Tests for the Hungarian assignment solver."""
+
+    def test_matches_brute_force(self):
+        """Test that the solver finds the optimal assignment."""
+        rng = random.Random(3)
+        for _ in range(100):
+            rows = rng.randint(1, 4)
+            cols = rng.randint(rows, 6)
+            cost = [[rng.uniform(-1, 1) for _ in range(cols)] for _ in range(rows)]
+
+            assignment = solve_assignment(cost)
+
+            best = min(
+                sum(cost[r][perm[r]] for r in range(rows))
+                for perm in itertools.permutations(range(cols), rows)
+            )
+            assert len(set(assignment)) == rows
+            assert sum(cost[r][assignment[r]] for r in range(rows)) == pytest.approx(best)
+
+    def test_empty(self):
+        """Test that no rows yields no assignment."""
+        assert solve_assignment([]) == []
+
+    def test_more_rows_than_columns(self):
+        """Test that an infeasible shape is rejected."""
+        with pytest.raises(ValueError):
+            solve_assignment([[1.0], [2.0]])
@@ -12,9 +12,11 @@ Tests cover:
 - Task filtering and querying
 """
 
+import gzip
 import json
 import tempfile
 import time
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -29,7 +31,9 @@ from claudeswarm.tasks import (
     TaskNotFoundError,
     TaskPriority,
     TaskStatus,
+    TaskTiming,
     VALID_TRANSITIONS,
+    get_task_timing,
     get_tasks_path,
 )
 
@@ -560,6 +564,73 @@ class TestTask:
         assert isinstance(task.history[0], TaskHistoryEntry)
 
 
+class TestTaskTiming:
+    """Tests for task lifecycle timing."""
+
+    @staticmethod
+    def _entry(to_status: TaskStatus, timestamp: str) -> TaskHistoryEntry:
+        return TaskHistoryEntry(
+            timestamp=timestamp, from_status=None, to_status=to_status.value, agent_id="agent-1"
+        )
+
+    def test_transitions_store_timing(self, sample_task):
+        """Test that assign, start and complete are stamped into metadata."""
+        sample_task.assign_to("agent-1")
+        sample_task.start_work("agent-1")
+        sample_task.complete("agent-1")
+
+        stored = sample_task.metadata["timing"]
+        assert stored["assigned_at"] == sample_task.history[0].timestamp
+        assert stored["started_at"] == sample_task.history[1].timestamp
+        assert stored["finished_at"] == sample_task.history[2].timestamp
+        assert get_task_timing(sample_task).work_time >= 0
+
+    def test_timing_survives_history_compaction(self, sample_task):
+        """Test that stored timing outlives the history entries it came from."""
+        sample_task.assign_to("agent-1")
+        sample_task.start_work("agent-1")
+        for _ in range(10):
+            sample_task.block("agent-1", ["other"])
+            sample_task.unblock("agent-1")
+        sample_task.compact_history(max_entries=4)
+
+        timing = get_task_timing(sample_task)
+
+        assert timing.started_at is not None
+        assert timing.response_time is not None
+
+    def test_from_history(self):
+        """Test deriving timing from history for tasks without stored timing."""
+        timing = TaskTiming.from_history(
+            [
+                self._entry(TaskStatus.ASSIGNED, "2024-01-01T00:00:00+00:00"),
+                self._entry(TaskStatus.WORKING, "2024-01-01T00:00:30+00:00"),
+                self._entry(TaskStatus.REVIEW, "2024-01-01T00:01:00+00:00"),
+                self._entry(TaskStatus.COMPLETED, "2024-01-01T00:02:00+00:00"),
+            ]
+        )
+
+        assert timing.response_time == 30.0
+        assert timing.work_time == 90.0
+        assert timing.turnaround_time == 120.0
+
+    def test_retry_starts_new_cycle(self):
+        """Test that reassigning a failed task resets the timing."""
+        timing = TaskTiming.from_history(
+            [
+                self._entry(TaskStatus.ASSIGNED, "2024-01-01T00:00:00+00:00"),
+                self._entry(TaskStatus.WORKING, "2024-01-01T00:00:10+00:00"),
+                self._entry(TaskStatus.FAILED, "2024-01-01T00:00:20+00:00"),
+                self._entry(TaskStatus.PENDING, "2024-01-01T00:01:00+00:00"),
+                self._entry(TaskStatus.ASSIGNED, "2024-01-01T00:02:00+00:00"),
+            ]
+        )
+
+        assert timing.assigned_at == "2024-01-01T00:02:00+00:00"
+        assert timing.started_at is None
+        assert timing.work_time is None
+
+
 class TestGetTasksPath:
     """Tests for get_tasks_path function."""
 
@@ -822,6 +893,30 @@ class TestTaskManager:
         assert tasks[2].task_id == task_normal.task_id
         assert tasks[3].task_id == task_low.task_id
 
+    def test_assign_tasks_batch(self, task_manager):
+        """Test assigning several tasks in one transaction."""
+        task1 = task_manager.create_task("Task 1", "agent-0")
+        task2 = task_manager.create_task("Task 2", "agent-0")
+
+        updated = task_manager.assign_tasks(
+            [(task1.task_id, "agent-1", "batch"), (task2.task_id, "agent-2", "batch")]
+        )
+
+        assert [t.assigned_to for t in updated] == ["agent-1", "agent-2"]
+        assert task_manager.get_task(task1.task_id).status == TaskStatus.ASSIGNED
+        assert task_manager.get_task(task2.task_id).assigned_to == "agent-2"
+
+    def test_assign_tasks_batch_is_all_or_nothing(self, task_manager):
+        """Test that an unknown task aborts the whole batch."""
+        task = task_manager.create_task("Task 1", "agent-0")
+
+        with pytest.raises(TaskNotFoundError):
+            task_manager.assign_tasks(
+                [(task.task_id, "agent-1", ""), ("missing", "agent-1", "")]
+            )
+
+        assert task_manager.get_task(task.task_id).assigned_to is None
+
     def test_get_pending_tasks(self, task_manager):
         """Test getting pending tasks."""
         task1 = task_manager.create_task("Task 1", "agent-1")
@@ -1303,3 +1398,116 @@ class TestTaskWorkflows:
         task_manager.transition_task(task3.task_id, TaskStatus.WORKING, "agent-1")
         task_manager.transition_task(task3.task_id, TaskStatus.CANCELLED, "agent-1", "Obsolete")
         assert task_manager.get_task(task3.task_id).status == TaskStatus.CANCELLED
+
+
+class TestTaskArchival:
+    """Tests for history compaction and the task archive tier."""
+
+    def test_compact_history_keeps_creation_and_newest(self, sample_task):
+        """Test that compaction keeps the first entry and the most recent ones."""
+        for i in range(10):
+            sample_task.history.append(
+                TaskHistoryEntry(
+                    timestamp=f"2025-01-01T00:00:{i:02d}+00:00",
+                    from_status="working",
+                    to_status="working",
+                    agent_id="agent-1",
+                    message=f"entry {i}",
+                )
+            )
+
+        dropped = sample_task.compact_history(max_entries=4)
+
+        assert dropped == 6
+        assert len(sample_task.history) == 4
+        assert sample_task.history[0].message == "entry 0"
+        assert [h.message for h in sample_task.history[1:]] == ["entry 7", "entry 8", "entry 9"]
+        assert sample_task.metadata["history_dropped"] == 6
+
+    def test_compact_history_noop_when_under_cap(self, sample_task):
+        """Test that short histories are untouched."""
+        assert sample_task.compact_history(max_entries=4) == 0
+        assert "history_dropped" not in sample_task.metadata
+
+    def test_write_caps_history(self, temp_project_dir):
+        """Test that persisted tasks respect max_history_entries."""
+        manager = TaskManager(project_root=temp_project_dir, max_history_entries=3)
+        task = manager.create_task("Flaky task", "agent-0")
+        manager.assign_task(task.task_id, "agent-1")
+        manager.transition_task(task.task_id, TaskStatus.WORKING, "agent-1")
+        manager.transition_task(task.task_id, TaskStatus.REVIEW, "agent-1")
+        manager.transition_task(task.task_id, TaskStatus.WORKING, "agent-1")
+
+        stored = manager.get_task(task.task_id)
+        assert len(stored.history) == 3
+        assert stored.history[0].message == "Task created"
+        assert stored.history[-1].to_status == "working"
+
+    def test_archive_moves_old_terminal_tasks(self, task_manager):
+        """Test that only old terminal tasks are moved to date partitions."""
+        done = task_manager.create_task("Done", "agent-0")
+        task_manager.transition_task(done.task_id, TaskStatus.CANCELLED, "agent-0")
+        active = task_manager.create_task("Active", "agent-0")
+
+        future = datetime.now(UTC) + timedelta(days=30)
+        archived = task_manager.archive_tasks(older_than_days=7, now=future)
+
+        assert archived == 1
+        assert task_manager.get_task(done.task_id) is None
+        assert task_manager.get_task(active.task_id) is not None
+
+        partitions = list(task_manager.archive_dir.glob("tasks-*.json.gz"))
+        assert len(partitions) == 1
+        with gzip.open(partitions[0], "rt", encoding="utf-8") as f:
+            assert done.task_id in json.load(f)["tasks"]
+
+    def test_archive_skips_recent_tasks(self, task_manager):
+        """Test that recently finished tasks stay in TASKS.json."""
+        done = task_manager.create_task("Done", "agent-0")
+        task_manager.transition_task(done.task_id, TaskStatus.CANCELLED, "agent-0")
+
+        assert task_manager.archive_tasks(older_than_days=7) == 0
+        assert task_manager.get_task(done.task_id) is not None
+        assert not task_manager.archive_dir.exists()
+
+    def test_archive_merges_into_existing_partition(self, task_manager):
+        """Test that archiving twice on the same day keeps both tasks."""
+        future = datetime.now(UTC) + timedelta(days=30)
+        first = task_manager.create_task("First", "agent-0")
+        task_manager.transition_task(first.task_id, TaskStatus.CANCELLED, "agent-0")
+        task_manager.archive_tasks(older_than_days=7, now=future)
+
+        second = task_manager.create_task("Second", "agent-0")
+        task_manager.transition_task(second.task_id, TaskStatus.CANCELLED, "agent-0")
+        task_manager.archive_tasks(older_than_days=7, now=future)
+
+        archived = task_manager.list_tasks(include_terminal=True, include_archived=True)
+        assert {t.task_id for t in archived} == {first.task_id, second.task_id}
+
+    def test_list_tasks_reads_archive_only_when_asked(self, task_manager):
+        """Test that archived tasks are hidden unless include_archived is set."""
+        done = task_manager.create_task("Done", "agent-0")
+        task_manager.transition_task(done.task_id, TaskStatus.CANCELLED, "agent-0")
+        task_manager.archive_tasks(older_than_days=7, now=datetime.now(UTC) + timedelta(days=30))
+
+        with patch.object(task_manager, "_read_archived_tasks") as mock_archive:
+            assert task_manager.list_tasks(include_terminal=True) == []
+            mock_archive.assert_not_called()
+
+        tasks = task_manager.list_tasks(include_terminal=True, include_archived=True)
+        assert [t.task_id for t in tasks] == [done.task_id]
+
+    def test_get_task_stats_include_archived(self, task_manager):
+        """Test that stats count archived tasks only when asked."""
+        done = task_manager.create_task("Done", "agent-0")
+        task_manager.transition_task(done.task_id, TaskStatus.CANCELLED, "agent-0")
+        task_manager.create_task("Pending", "agent-0")
+        task_manager.archive_tasks(older_than_days=7, now=datetime.now(UTC) + timedelta(days=30))
+
+        live = task_manager.get_task_stats()
+        assert live["total"] == 1
+        assert live["cancelled"] == 0
+
+        full = task_manager.get_task_stats(include_archived=True)
+        assert full["total"] == 2
+        assert full["cancelled"] == 1